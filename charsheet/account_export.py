@@ -0,0 +1,318 @@
+"""Streaming account export and bulk import of the full character graph."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+
+from .magic_sync import mark_magic_dirty
+from .models import (
+    Character,
+    CharacterAttribute,
+    CharacterCreature,
+    CharacterDiaryEntry,
+    CharacterItem,
+    CharacterLanguage,
+    CharacterSchool,
+    CharacterSkill,
+    CharacterSpell,
+    CharacterTechnique,
+    CharacterTrait,
+    ItemRune,
+    Rune,
+)
+from .weight_ledger import create_weight_ledgers
+
+ACCOUNT_EXPORT_SCHEMA_VERSION = 2
+ACCOUNT_EXPORT_FORMATS = ("json", "ndjson")
+ACCOUNT_EXPORT_CHUNK_SIZE = 500
+# Uploads above this size are rejected before parsing.
+ACCOUNT_IMPORT_MAX_BYTES = 20 * 1024 * 1024
+ACCOUNT_SECTION_HEADER = "account"
+
+
+class AccountImportError(ValueError):
+    """Raised when an uploaded account export cannot be read."""
+
+
+@dataclass(frozen=True)
+class ExportSection:
+    """One exported model: its owner path, catalog references, and links to earlier sections."""
+
+    name: str
+    model: type[models.Model]
+    # Path from the row to its character; empty for the characters themselves.
+    character_field: str
+    # Catalog foreign keys written as "field": natural key, resolved by that lookup on import.
+    references: dict[str, str] = field(default_factory=dict)
+    # Extra lookups limiting which catalog rows a reference may resolve to on import.
+    reference_filters: dict[str, dict[str, object]] = field(default_factory=dict)
+    # Foreign keys to rows of an earlier section, written as that row's exported id.
+    parents: dict[str, str] = field(default_factory=dict)
+    exclude: tuple[str, ...] = ()
+    before_create: Callable[[list[models.Model]], None] | None = None
+
+    def value_fields(self) -> list[str]:
+        """Return the plain editable columns exported for this model."""
+        linked = {self.character_field.split("__")[0], *self.references, *self.parents, *self.exclude}
+        return [
+            model_field.name
+            for model_field in self.model._meta.concrete_fields
+            if model_field.editable
+            and not model_field.primary_key
+            and not model_field.is_relation
+            and not isinstance(model_field, models.FileField)
+            and model_field.name not in linked
+        ]
+
+
+def _allow_rune_duplicates(rows: list[models.Model]) -> None:
+    """Copy the rune's duplicate flag, which ItemRune.save would set for single creates."""
+    repeatable = set(
+        Rune.objects.filter(pk__in={row.rune_id for row in rows}, allow_multiple=True).values_list("pk", flat=True)
+    )
+    for row in rows:
+        row.allows_duplicate = row.rune_id in repeatable
+
+
+# Ordered so every parent section comes before the rows linking to it.
+ACCOUNT_EXPORT_SECTIONS = (
+    ExportSection(
+        "characters",
+        Character,
+        "",
+        references={"race": "name"},
+        exclude=("last_opened_at",),
+    ),
+    ExportSection("attributes", CharacterAttribute, "character", references={"attribute": "short_name"}),
+    ExportSection("skills", CharacterSkill, "character", references={"skill": "slug"}),
+    ExportSection("traits", CharacterTrait, "owner", references={"trait": "slug"}),
+    ExportSection("languages", CharacterLanguage, "owner", references={"language": "slug"}),
+    ExportSection("schools", CharacterSchool, "character", references={"school": "name"}),
+    # Techniques and items have no unique natural key; they are matched by id within one deployment.
+    ExportSection("techniques", CharacterTechnique, "character", references={"technique": "pk"}),
+    ExportSection("spells", CharacterSpell, "character", references={"spell": "slug"}),
+    ExportSection(
+        "items",
+        CharacterItem,
+        "owner",
+        references={
+            "item": "pk",
+            "quality": "pk",
+            "weapon_type_override": "pk",
+            "weapon_damage_source_override": "pk",
+        },
+        # Group catalog items stay private to their group, as in the shop.
+        reference_filters={"item": {"catalog_group__isnull": True}},
+    ),
+    ExportSection(
+        "item_runes",
+        ItemRune,
+        "item__owner",
+        references={"rune": "slug"},
+        parents={"item": "items"},
+        before_create=_allow_rune_duplicates,
+    ),
+    ExportSection(
+        "creatures",
+        CharacterCreature,
+        "owner",
+        references={"creature": "slug", "quality": "pk"},
+        parents={"source_character_item": "items", "source_character_technique": "techniques"},
+    ),
+    ExportSection("diary_entries", CharacterDiaryEntry, "character"),
+)
+
+
+def _section_rows(section: ExportSection, user) -> Iterator[dict[str, object]]:
+    """Yield one section's rows for every character of the user from a single query."""
+    if section.character_field:
+        queryset = section.model.objects.filter(**{f"{section.character_field}__owner": user})
+        character_column = f"{section.character_field}_id"
+    else:
+        queryset = section.model.objects.filter(owner=user)
+        character_column = ""
+    columns = {"id": "pk"}
+    if character_column:
+        columns["character"] = character_column
+    columns.update({name: f"{name}__{lookup}" for name, lookup in section.references.items()})
+    columns.update({name: f"{name}_id" for name in section.parents})
+    columns.update({name: name for name in section.value_fields()})
+    rows = queryset.order_by(*([character_column] if character_column else []), "pk").values_list(*columns.values())
+    for values in rows.iterator(chunk_size=ACCOUNT_EXPORT_CHUNK_SIZE):
+        yield dict(zip(columns, values))
+
+
+def _header(user) -> dict[str, object]:
+    return {
+        "schema": ACCOUNT_EXPORT_SCHEMA_VERSION,
+        "exported_at": timezone.now().isoformat(),
+        "user": {"username": user.get_username(), "email": user.email or ""},
+    }
+
+
+def _dumps(value, **kwargs) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str, **kwargs)
+
+
+def iter_account_json(user) -> Iterator[str]:
+    """Yield the account export as one JSON document, one row per line."""
+    header = _dumps(_header(user))
+    yield header[:-1]
+    for section in ACCOUNT_EXPORT_SECTIONS:
+        yield f',\n"{section.name}": ['
+        separator = "\n"
+        for row in _section_rows(section, user):
+            yield f"{separator}{_dumps(row)}"
+            separator = ",\n"
+        yield "\n]"
+    yield "\n}\n"
+
+
+def iter_account_ndjson(user) -> Iterator[str]:
+    """Yield the account export as newline-delimited JSON records tagged with their section."""
+    yield f"{_dumps({'section': ACCOUNT_SECTION_HEADER, 'data': _header(user)})}\n"
+    for section in ACCOUNT_EXPORT_SECTIONS:
+        for row in _section_rows(section, user):
+            yield f"{_dumps({'section': section.name, 'data': row})}\n"
+
+
+def parse_account_export(raw: bytes) -> dict[str, list[dict[str, object]]]:
+    """Read a JSON or NDJSON account export into rows per section."""
+    if len(raw) > ACCOUNT_IMPORT_MAX_BYTES:
+        raise AccountImportError("Die Datei ist zu groß.")
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise AccountImportError("Die Datei ist nicht UTF-8-kodiert.") from exc
+    lines = [line for line in text.splitlines() if line.strip()]
+    try:
+        first = json.loads(lines[0]) if lines else None
+    except json.JSONDecodeError:
+        first = None
+    sections: dict[str, list[dict[str, object]]] = {section.name: [] for section in ACCOUNT_EXPORT_SECTIONS}
+    try:
+        if isinstance(first, dict) and first.get("section") == ACCOUNT_SECTION_HEADER:
+            payload = first.get("data") or {}
+            for line in lines[1:]:
+                record = json.loads(line)
+                if record.get("section") in sections and isinstance(record.get("data"), dict):
+                    sections[record["section"]].append(record["data"])
+        else:
+            payload = json.loads(text)
+            for name, rows in sections.items():
+                rows.extend(row for row in payload.get(name) or [] if isinstance(row, dict))
+    except (json.JSONDecodeError, AttributeError, TypeError) as exc:
+        raise AccountImportError("Die Datei ist kein gültiger Account-Export.") from exc
+    if not isinstance(payload, dict) or payload.get("schema") != ACCOUNT_EXPORT_SCHEMA_VERSION:
+        raise AccountImportError("Dieses Exportformat wird nicht unterstützt.")
+    return sections
+
+
+def _resolve_references(section: ExportSection, rows: Iterable[dict[str, object]]) -> dict[str, dict[object, int]]:
+    """Map every referenced natural key of one section to a catalog pk, one query per reference."""
+    resolved: dict[str, dict[object, int]] = {}
+    for name, lookup in section.references.items():
+        wanted = {row.get(name) for row in rows} - {None, ""}
+        related_model = section.model._meta.get_field(name).related_model
+        resolved[name] = (
+            {
+                str(key): pk
+                for key, pk in related_model.objects.filter(
+                    **{f"{lookup}__in": wanted},
+                    **section.reference_filters.get(name, {}),
+                ).values_list(lookup, "pk")
+            }
+            if wanted
+            else {}
+        )
+    return resolved
+
+
+def _unique_names(user, names: list[str]) -> list[str]:
+    """Return the names with a suffix wherever the account already uses them."""
+    taken = set(Character.objects.filter(owner=user).values_list("name", flat=True))
+    unique = []
+    for name in names:
+        candidate, counter = name, 1
+        while candidate in taken:
+            counter += 1
+            candidate = f"{name} ({counter})"
+        taken.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
+def import_account_rows(user, sections: dict[str, list[dict[str, object]]]) -> dict[str, int]:
+    """Bulk-create the exported characters and their rows for the user; return created and skipped counts."""
+    created_ids: dict[str, dict[object, int]] = {}
+    counts = {"skipped": 0}
+    with transaction.atomic():
+        for section in ACCOUNT_EXPORT_SECTIONS:
+            rows = sections.get(section.name) or []
+            references = _resolve_references(section, rows)
+            characters = created_ids.get("characters", {})
+            value_fields = section.value_fields()
+            relation_fields = [
+                model_field.name for model_field in section.model._meta.concrete_fields if model_field.is_relation
+            ]
+            pending: list[tuple[object, models.Model]] = []
+            for row in rows:
+                attributes = {name: row[name] for name in value_fields if name in row}
+                if section.character_field:
+                    character_id = characters.get(row.get("character"))
+                    if character_id is None:
+                        counts["skipped"] += 1
+                        continue
+                    if "__" not in section.character_field:
+                        attributes[f"{section.character_field}_id"] = character_id
+                else:
+                    attributes["owner"] = user
+                missing = False
+                for name in section.references:
+                    key = row.get(name)
+                    if key in (None, ""):
+                        missing = missing or not section.model._meta.get_field(name).null
+                        continue
+                    if str(key) not in references[name]:
+                        missing = True
+                        continue
+                    attributes[f"{name}_id"] = references[name][str(key)]
+                for name, parent_section in section.parents.items():
+                    parent_id = created_ids.get(parent_section, {}).get(row.get(name))
+                    if row.get(name) is not None and parent_id is None:
+                        missing = True
+                    attributes[f"{name}_id"] = parent_id
+                if missing:
+                    counts["skipped"] += 1
+                    continue
+                if section.model is CharacterItem:
+                    attributes["original_owner_character_id"] = attributes["owner_id"]
+                obj = section.model(**attributes)
+                # Field checks only: clean() rules look at rows that are rebuilt
+                # after commit (aspects, granted spells) and would reject valid exports.
+                try:
+                    obj.clean_fields(exclude=relation_fields)
+                except (ValidationError, TypeError, ValueError):
+                    counts["skipped"] += 1
+                    continue
+                pending.append((row.get("id"), obj))
+            if not section.character_field:
+                for (_, character), name in zip(pending, _unique_names(user, [obj.name for _, obj in pending])):
+                    character.name = name
+            objects = [obj for _, obj in pending]
+            if section.before_create is not None and objects:
+                section.before_create(objects)
+            section.model.objects.bulk_create(objects, batch_size=ACCOUNT_EXPORT_CHUNK_SIZE)
+            created_ids[section.name] = {old_id: obj.pk for old_id, obj in pending}
+            counts[section.name] = len(objects)
+        # bulk_create skips the signals that create weight ledgers and keep them in step.
+        create_weight_ledgers(*created_ids.get("characters", {}).values())
+        # Derived aspects and granted spells follow the imported schools and traits after commit.
+        mark_magic_dirty(*created_ids.get("characters", {}).values())
+    return counts
@@ -8,3 +8,15 @@ class CharsheetConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "charsheet"
+
+    def ready(self):
+        """Connect the catalog invalidation, magic synchronization, weight ledger, and item stack signals."""
+        from . import (  # noqa: F401
+            creature_stat_blocks,
+            item_stacks,
+            magic_catalog,
+            magic_sync,
+            rules_catalog,
+            shop_catalog,
+            weight_ledger,
+        )
@@ -0,0 +1,16 @@
+"""Shared monitoring counters kept in the default cache."""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+
+
+def increment_cache_counter(key: str, amount: int = 1) -> None:
+    """Add to one monitoring counter, creating it on first use."""
+    if cache.add(key, amount, timeout=None):
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # The counter was evicted between add and incr.
+        cache.set(key, amount, timeout=None)
@@ -0,0 +1,42 @@
+"""Shared version tokens for caches that are rebuilt from admin-edited tables."""
+
+from __future__ import annotations
+
+import time
+from functools import partial
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def cache_version(key: str) -> int:
+    """Return the version token stored under one key, seeding it on first use."""
+    return cache_versions([key])[key]
+
+
+def cache_versions(keys: Iterable[str]) -> dict[str, int]:
+    """Return the version tokens of several keys with one cache round trip."""
+    keys = list(dict.fromkeys(keys))
+    versions = cache.get_many(keys)
+    for key in keys:
+        if versions.get(key) is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return {key: int(versions[key]) for key in keys}
+
+
+def bump_cache_versions(*keys: str) -> None:
+    """Renew the given version tokens once the current transaction has committed."""
+    keys = tuple(dict.fromkeys(key for key in keys if key))
+    if keys:
+        # A token renewed before commit lets a concurrent request rebuild from
+        # the old rows and store them under the new token until the next bump.
+        transaction.on_commit(partial(_renew_cache_versions, keys))
+
+
+def _renew_cache_versions(keys: tuple[str, ...]) -> None:
+    """Store fresh tokens for the given keys."""
+    # A fresh token instead of a counter stays unique even after cache eviction.
+    version = time.time_ns()
+    cache.set_many({key: version for key in keys}, timeout=None)
@@ -0,0 +1,291 @@
+"""Versioned cache for compiled creature stat blocks and creature card contexts."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from codex_arcana.versioning import get_application_version
+
+from .cache_versions import bump_cache_versions, cache_version, cache_versions
+from .engine.creature_engine import CreatureEngine
+from .models import (
+    Character,
+    CharacterCreature,
+    Creature,
+    CreatureSpecialSkillSemanticEffect,
+    CreatureTraitChoiceDefinition,
+    CreatureTraitSemanticEffect,
+    VampireTraitSemanticEffect,
+)
+from .rules_catalog import rules_catalog_version
+from .shop_catalog import shop_catalog_version
+from .view_utils import format_modifier
+
+logger = logging.getLogger(__name__)
+
+CREATURE_STAT_BLOCK_CACHE_PREFIX = "charsheet:creature-stat-block"
+CREATURE_CATALOG_VERSION_KEY = f"{CREATURE_STAT_BLOCK_CACHE_PREFIX}:version"
+CREATURE_STAT_BLOCK_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Admin-edited definition tables shared by many creatures; saving or deleting a
+# row bumps the catalog version of every creature.
+CREATURE_CATALOG_SOURCES = (
+    "charsheet.CreatureType",
+    "charsheet.CreatureAttackType",
+    "charsheet.CreatureSpecialSkill",
+    "charsheet.CreatureSpecialSkillSemanticEffect",
+    "charsheet.CreatureCommand",
+    "charsheet.CreatureCommandPrerequisite",
+    "charsheet.CreatureTraitDefinition",
+    "charsheet.CreatureTraitChoiceDefinition",
+    "charsheet.CreatureTraitSemanticEffect",
+    "charsheet.VampireTrait",
+    "charsheet.VampirePower",
+    "charsheet.VampireTraitSemanticEffect",
+)
+
+# Template rows owned by one creature, mapped to the attribute path of its id;
+# saving or deleting a row only bumps that creature's template version.
+CREATURE_TEMPLATE_SOURCES = {
+    "charsheet.Creature": ("pk",),
+    "charsheet.CreatureAttribute": ("creature_id",),
+    "charsheet.CreatureAttack": ("creature_id",),
+    "charsheet.CreatureSkill": ("creature_id",),
+    "charsheet.CreatureLanguage": ("creature_id",),
+    "charsheet.CreatureSpecialSkillValue": ("creature_id",),
+    "charsheet.CreatureCommandReference": ("creature_id",),
+    "charsheet.CreatureTrait": ("creature_id",),
+    "charsheet.CreatureTraitChoice": ("creature_trait", "creature_id"),
+    "charsheet.CreatureSourceBinding": ("creature_id",),
+    "charsheet.CreatureDaemonicPower": ("creature_id",),
+    "charsheet.CreatureVampireTrait": ("creature_id",),
+    "charsheet.CreatureVampirePower": ("creature_id",),
+}
+
+# Template M2M relations that change compiled values without a row save.
+CREATURE_CATALOG_M2M_SOURCES = (
+    CreatureTraitChoiceDefinition.allowed_attributes,
+    CreatureTraitChoiceDefinition.allowed_skill_categories,
+    CreatureTraitChoiceDefinition.allowed_skills,
+    CreatureTraitChoiceDefinition.allowed_creature_special_skills,
+    CreatureTraitSemanticEffect.target_skills,
+    CreatureSpecialSkillSemanticEffect.target_skills,
+    VampireTraitSemanticEffect.target_skills,
+    VampireTraitSemanticEffect.target_schools,
+)
+
+# Card entries that hold model-bound file objects; they are read from the live source on every hit.
+CARD_CONTEXT_INSTANCE_KEYS = ("image", "default_image")
+
+
+def creature_catalog_version() -> int:
+    """Return the shared creature-definition version, seeding it on first use."""
+    return cache_version(CREATURE_CATALOG_VERSION_KEY)
+
+
+def bump_creature_catalog_version() -> None:
+    """Invalidate every cached creature stat block and card context once the change commits."""
+    bump_cache_versions(CREATURE_CATALOG_VERSION_KEY)
+
+
+def creature_template_version_key(creature_id: int) -> str:
+    """Return the cache key of one creature template's version token."""
+    return f"{CREATURE_STAT_BLOCK_CACHE_PREFIX}:template:{int(creature_id)}:version"
+
+
+def bump_creature_template_version(*creature_ids) -> None:
+    """Invalidate the cached payloads built from the given templates once the change commits."""
+    bump_cache_versions(
+        *(creature_template_version_key(creature_id) for creature_id in creature_ids if creature_id)
+    )
+
+
+def creature_catalog_versions() -> str:
+    """Return the combined creature-definition, rules, item, and deployment versions a stat block depends on."""
+    return (
+        f"{creature_catalog_version()}:{rules_catalog_version()}"
+        f":{shop_catalog_version()}:{get_application_version()}"
+    )
+
+
+def _template_id(source: Creature | CharacterCreature) -> int:
+    """Return the id of the creature template a source is built from."""
+    return source.creature_id if isinstance(source, CharacterCreature) else source.pk
+
+
+def creature_stat_block_cache_key(
+    source: Creature | CharacterCreature,
+    revision: int,
+    template_version: int,
+    scope: str,
+    versions: str,
+) -> str:
+    """Return the cache key for one creature source, instance revision, and payload scope."""
+    # Character creatures are instance deltas over their template: every override
+    # row bumps the owner's sheet revision, so (owner, revision) versions the delta.
+    if isinstance(source, CharacterCreature):
+        instance_part = f"character:{int(source.pk)}:{int(source.owner_id)}:{int(revision)}"
+    else:
+        instance_part = f"template:{int(source.pk)}"
+    return f"{CREATURE_STAT_BLOCK_CACHE_PREFIX}:{scope}:{instance_part}:{int(template_version)}:{versions}"
+
+
+def compile_creature_stat_block(engine: CreatureEngine) -> dict:
+    """Resolve the values the SL screen shows for one creature source."""
+    from charsheet.engine.vampire_engine import VampireRules
+
+    has_bp = bool(engine.creature.has_bp)
+    initiative = engine.initiative()
+    return {
+        "wound_rows": engine.wound_rows(),
+        "incapacitating_wound_stages": engine.incapacitating_wound_stages(),
+        "attributes": {
+            row["label"]: {
+                "value": "-" if row["value"] is None else int(row["value"]) + 5,
+                "modifier": row["display"],
+            }
+            for row in engine.attribute_rows()
+        },
+        "movement_display": engine.movement_display(),
+        "has_bp": has_bp,
+        "kp": engine.bp() if has_bp else engine.kp(),
+        "potential": VampireRules(engine.source).potential() if has_bp else engine.potential(),
+        "size_class": engine.size_class(),
+        "vw": engine.vw(),
+        "gw": engine.gw(),
+        "sr": engine.sr(),
+        "total_armor": engine.armor_totals().total_rs,
+        "initiative": initiative,
+        "initiative_display": format_modifier(initiative),
+    }
+
+
+def _source_revisions(sources: list) -> dict[int, int | None]:
+    """Read the persisted sheet revision of every owning character in one query."""
+    owner_ids = {source.owner_id for source in sources if isinstance(source, CharacterCreature)}
+    if not owner_ids:
+        return {}
+    return dict(Character.objects.filter(pk__in=owner_ids).values_list("pk", "sheet_revision"))
+
+
+def _cached_creature_payloads(sources: list, scope: str, build) -> list[dict]:
+    """Return one payload per source, building and storing only the cache misses."""
+    revisions = _source_revisions(sources)
+    versions = creature_catalog_versions()
+    template_versions = cache_versions(creature_template_version_key(_template_id(source)) for source in sources)
+    keys = [
+        creature_stat_block_cache_key(
+            source,
+            revisions.get(getattr(source, "owner_id", None)) or 0,
+            template_versions[creature_template_version_key(_template_id(source))],
+            scope,
+            versions,
+        )
+        for source in sources
+    ]
+    cached = cache.get_many(set(keys))
+    payloads = []
+    misses = {}
+    for source, key in zip(sources, keys):
+        payload = cached.get(key)
+        if payload is None:
+            payload = build(CreatureEngine(source))
+            misses[key] = (source, payload)
+        payloads.append(payload)
+    if misses:
+        # Building can synchronize rows; entries whose revision moved meanwhile are not stored.
+        current = _source_revisions([source for source, _payload in misses.values()])
+        storable = {
+            key: payload
+            for key, (source, payload) in misses.items()
+            if current.get(getattr(source, "owner_id", None)) == revisions.get(getattr(source, "owner_id", None))
+        }
+        try:
+            cache.set_many(storable, timeout=CREATURE_STAT_BLOCK_CACHE_TIMEOUT)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.warning("Creature %s payloads could not be cached.", scope, exc_info=True)
+    return payloads
+
+
+def get_creature_stat_blocks(sources: list) -> list[dict]:
+    """Return the compiled stat blocks for several creature sources with one cache round trip."""
+    return _cached_creature_payloads(list(sources), "screen", compile_creature_stat_block)
+
+
+def get_creature_stat_block(source: Creature | CharacterCreature) -> dict:
+    """Return the compiled stat block for one template creature or character creature."""
+    return get_creature_stat_blocks([source])[0]
+
+
+def _uncached_card_context(engine: CreatureEngine) -> dict:
+    """Build the cacheable part of one creature card context."""
+    return {
+        key: value
+        for key, value in engine.card_context().items()
+        if key not in CARD_CONTEXT_INSTANCE_KEYS
+    }
+
+
+def get_creature_card_contexts(sources: list) -> list[dict]:
+    """Return the creature card contexts for several sources, reusing those built for the current revisions."""
+    sources = list(sources)
+    contexts = _cached_creature_payloads(sources, "card", _uncached_card_context)
+    return [
+        {**context, "image": source.image, "default_image": CreatureEngine(source).creature.image}
+        for source, context in zip(sources, contexts)
+    ]
+
+
+def get_creature_card_context(source: Creature | CharacterCreature) -> dict:
+    """Return the card context for one template creature or character creature."""
+    return get_creature_card_contexts([source])[0]
+
+
+def _template_creature_id(instance, path: tuple[str, ...]):
+    """Resolve the owning creature id of one template row."""
+    value = instance
+    try:
+        for attribute in path:
+            value = getattr(value, attribute)
+            if value is None:
+                return None
+    except ObjectDoesNotExist:
+        return None
+    return value
+
+
+def _bump_creature_catalog_for_instance(sender, instance=None, raw=False, **kwargs):
+    """Bump the template or catalog version after a creature row changed."""
+    if raw:
+        return
+    path = CREATURE_TEMPLATE_SOURCES.get(sender._meta.label)
+    if path is None:
+        bump_creature_catalog_version()
+    else:
+        # A row whose parent is already gone was removed by a cascade whose
+        # parent delete bumps the same template.
+        bump_creature_template_version(_template_creature_id(instance, path))
+
+
+for _sender_label in (*CREATURE_CATALOG_SOURCES, *CREATURE_TEMPLATE_SOURCES):
+    post_save.connect(
+        _bump_creature_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"creature_catalog_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _bump_creature_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"creature_catalog_delete:{_sender_label}",
+    )
+for _relation in CREATURE_CATALOG_M2M_SOURCES:
+    m2m_changed.connect(
+        _bump_creature_catalog_for_instance,
+        sender=_relation.through,
+        dispatch_uid=f"creature_catalog_m2m:{_relation.through._meta.label}",
+    )
@@ -1,4 +1,5 @@
 from .character_engine import CharacterEngine
+from .character_bulk_loader import load_character_engines
 from .character_creation_engine import CharacterCreationEngine
 from .battle_calculator_engine import BattleCalculatorEngine
 from .item_engine import ItemEngine
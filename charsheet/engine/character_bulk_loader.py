@@ -0,0 +1,172 @@
+"""Preload the persisted rows of many character engines in a fixed number of queries."""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+from charsheet.models import (
+    Character,
+    CharacterAttribute,
+    CharacterItem,
+    CharacterLanguage,
+    CharacterSchool,
+    CharacterSchoolPath,
+    CharacterSkill,
+    CharacterTechnique,
+    CharacterTrait,
+)
+from charsheet.modifiers.engine import compile_trait_entry_modifiers
+from charsheet.rules_catalog import get_rules_catalog
+
+from .character_engine import (
+    CharacterEngine,
+    equipped_item_rune_queryset,
+    equipped_rune_ids_from_rows,
+    group_rows,
+    race_choice_queryset,
+    semantic_effect_item_queryset,
+    skill_levels_from_entries,
+    skills_map_from_entries,
+    technique_choice_queryset,
+    trait_choice_queryset,
+)
+from .character_equipment import equipped_armor_queryset, equipped_shield_queryset
+
+
+def load_character_engines(
+    characters: Iterable[Character],
+    *,
+    runtime_attribute_adjustments: Mapping[int, Mapping[str, int]] | None = None,
+) -> dict[int, CharacterEngine]:
+    """Build fresh engines for all characters and seed their row caches in bulk.
+
+    Every engine is also stored as the character's cached engine, so later
+    ``character.engine`` lookups reuse the preloaded state. Static rule data
+    comes from the shared rules catalog; caches that are not seeded here keep
+    loading lazily per character.
+    """
+    characters = [character for character in characters if character.pk is not None]
+    if not characters:
+        return {}
+    adjustments = runtime_attribute_adjustments or {}
+    catalog = get_rules_catalog()
+    engines = {
+        character.pk: character.get_engine(
+            refresh=True,
+            runtime_attribute_adjustments=dict(adjustments.get(character.pk, {})),
+        )
+        for character in characters
+    }
+    character_ids = list(engines)
+
+    attributes = group_rows(
+        CharacterAttribute.objects.filter(character_id__in=character_ids).select_related("attribute"),
+        lambda entry: entry.character_id,
+    )
+    skills = group_rows(
+        CharacterSkill.objects.filter(character_id__in=character_ids).select_related(
+            "skill",
+            "skill__category",
+            "skill__attribute",
+        ),
+        lambda entry: entry.character_id,
+    )
+    languages = group_rows(
+        CharacterLanguage.objects.filter(owner_id__in=character_ids).select_related("language"),
+        lambda entry: entry.owner_id,
+    )
+    schools = group_rows(
+        CharacterSchool.objects.filter(character_id__in=character_ids).select_related("school", "school__type"),
+        lambda entry: entry.character_id,
+    )
+    paths = group_rows(
+        CharacterSchoolPath.objects.filter(character_id__in=character_ids).select_related("school", "path"),
+        lambda entry: entry.character_id,
+    )
+    learned_techniques = group_rows(
+        CharacterTechnique.objects.filter(character_id__in=character_ids).select_related("technique"),
+        lambda entry: entry.character_id,
+    )
+    technique_choices = group_rows(
+        technique_choice_queryset().filter(character_id__in=character_ids),
+        lambda choice: choice.character_id,
+    )
+    race_choices = group_rows(
+        race_choice_queryset().filter(character_id__in=character_ids),
+        lambda choice: choice.character_id,
+    )
+    trait_choices = group_rows(
+        trait_choice_queryset().filter(character_trait__owner_id__in=character_ids),
+        lambda choice: choice.character_trait.owner_id,
+    )
+    traits = group_rows(
+        CharacterTrait.objects.filter(owner_id__in=character_ids)
+        .select_related("trait")
+        .order_by("trait__slug"),
+        lambda entry: entry.owner_id,
+    )
+    item_runes = group_rows(
+        equipped_item_rune_queryset().filter(item__owner_id__in=character_ids),
+        lambda item_rune: item_rune.item.owner_id,
+    )
+    extra_rune_ids = group_rows(
+        CharacterItem.runes.through.objects.filter(
+            characteritem__owner_id__in=character_ids,
+            characteritem__equipped=True,
+        ).values_list("characteritem__owner_id", "rune_id"),
+        lambda row: row[0],
+    )
+    semantic_items = group_rows(
+        semantic_effect_item_queryset().filter(owner_id__in=character_ids),
+        lambda entry: entry.owner_id,
+    )
+    armor_items = group_rows(
+        equipped_armor_queryset().filter(owner_id__in=character_ids),
+        lambda entry: entry.owner_id,
+    )
+    shield_items = group_rows(
+        equipped_shield_queryset().filter(owner_id__in=character_ids),
+        lambda entry: entry.owner_id,
+    )
+    for character in characters:
+        engine = engines[character.pk]
+        seeded = engine.__dict__
+        seeded["_rules_catalog"] = catalog
+        seeded["_attributes_map"] = {
+            entry.attribute.short_name: entry.base_value for entry in attributes.get(character.pk, [])
+        }
+        skill_entries = skills.get(character.pk, [])
+        seeded["_skills_map"] = skills_map_from_entries(skill_entries)
+        seeded["_skill_levels_by_id"] = skill_levels_from_entries(skill_entries)
+        seeded["_languages_map"] = {entry.language.slug: entry for entry in languages.get(character.pk, [])}
+        school_entries = {entry.school_id: entry for entry in schools.get(character.pk, [])}
+        seeded["_school_entries"] = school_entries
+        seeded["_selected_paths"] = {entry.school_id: entry for entry in paths.get(character.pk, [])}
+        learned = learned_techniques.get(character.pk, [])
+        seeded["_manual_learned_technique_ids"] = {row.technique_id for row in learned}
+        seeded["_learned_techniques_by_id"] = {row.technique_id: row for row in learned}
+        seeded["_technique_choices_by_technique_id"] = group_rows(
+            technique_choices.get(character.pk, []), lambda choice: choice.technique_id
+        )
+        seeded["_race_choices_by_definition_id"] = group_rows(
+            race_choices.get(character.pk, []), lambda choice: choice.definition_id
+        )
+        seeded["_trait_choices_by_definition_id"] = group_rows(
+            trait_choices.get(character.pk, []), lambda choice: choice.definition_id
+        )
+        trait_entries = traits.get(character.pk, [])
+        seeded["_trait_levels"] = {entry.trait_id: entry.trait_level for entry in trait_entries}
+        seeded["_trait_levels_by_slug"] = {entry.trait.slug: entry.trait_level for entry in trait_entries}
+        character_item_runes = item_runes.get(character.pk, [])
+        seeded["_equipped_item_runes"] = character_item_runes
+        seeded["_equipped_rune_ids"] = equipped_rune_ids_from_rows(
+            [row[1] for row in extra_rune_ids.get(character.pk, [])],
+            character_item_runes,
+        )
+        seeded["_equipped_items_for_semantic_effects"] = semantic_items.get(character.pk, [])
+        seeded["_equipment_cache"] = {
+            "armor_items": armor_items.get(character.pk, []),
+            "shield_items": shield_items.get(character.pk, []),
+        }
+        engine.modifier_engine.__dict__["_active_trait_modifiers"] = compile_trait_entry_modifiers(trait_entries, catalog)
+    return engines
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from functools import cached_property
-from typing import DefaultDict, Mapping, TypedDict
+from typing import Callable, DefaultDict, Iterable, Mapping, TypedDict
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model, Prefetch, Q
+from django.db.models import Model, Q
 
 from . import character_combat, character_equipment, character_learning, character_progression
 from .item_engine import ItemEngine
 from charsheet.constants import ATTR_SPEC, GK_AVERAGE, GK_MODS, infer_weapon_type
 from charsheet.modifiers import ModifierEngine, ModifierResolutionMode, TargetDomain
+from charsheet.profiling import profiled_cached_property
+from charsheet.rules_catalog import RulesCatalog, get_rules_catalog
 from charsheet.models import (
     Character,
     CharacterItem,
@@ -31,7 +32,6 @@ from charsheet.models import (
     ProgressionRule,
     Race,
     RaceChoiceDefinition,
-    RaceTechnique,
     Rune,
     School,
     SchoolPath,
@@ -40,12 +40,202 @@ from charsheet.models import (
     Technique,
     TechniqueChoiceBlock,
     TechniqueChoiceDefinition,
-    TechniqueExclusion,
-    TechniqueRequirement,
     Trait,
 )
 
 
+# Cache nodes owned by the bound ModifierEngine or Character carry a prefix.
+_MODIFIER_CACHE_PREFIX = "modifier_engine."
+_CHARACTER_CACHE_PREFIX = "character."
+# Per-technique memo dictionaries created in CharacterEngine.__init__.
+_TECHNIQUE_MEMO_CACHES = frozenset(
+    {
+        "_technique_learned_cache",
+        "_technique_available_cache",
+        "_technique_requirement_cache",
+        "_technique_exclusion_cache",
+    }
+)
+_TECHNIQUE_STATE_CACHES = (
+    *sorted(_TECHNIQUE_MEMO_CACHES),
+    "_technique_states_cache",
+    "_technique_state_map",
+    "_choice_block_states_cache",
+    "_choice_skill_bonus_by_skill_id",
+    "modifier_engine._active_technique_semantic_modifiers",
+    "modifier_engine._active_daemonic_power_modifiers",
+)
+
+# Engine caches mapped to the caches derived from them. Invalidating one node
+# drops every node reachable from it and nothing else.
+ENGINE_CACHE_DEPENDENTS: dict[str, tuple[str, ...]] = {
+    "_attributes_map": ("_equipment_cache",),
+    "_skills_map": ("_equipment_cache",),
+    "_skill_levels_by_id": _TECHNIQUE_STATE_CACHES,
+    "_languages_map": (),
+    "_trait_levels": _TECHNIQUE_STATE_CACHES,
+    "_trait_levels_by_slug": ("modifier_engine._active_modifiers_cache",),
+    "_school_entries": (
+        "_weapon_master_school_entry",
+        "_specialization_definitions_by_school_id",
+        "_character_school_technique_list",
+        "_technique_choice_blocks_by_id",
+        "_progression_rules_by_type",
+        "modifier_engine._active_school_semantic_modifiers",
+        *_TECHNIQUE_STATE_CACHES,
+    ),
+    "_selected_paths": _TECHNIQUE_STATE_CACHES,
+    "_weapon_mastery_entries_by_type": ("_equipment_cache",),
+    "_weapon_mastery_entries_by_item_id": ("_equipment_cache",),
+    "_weapon_mastery_arcana_entries": ("_equipment_cache",),
+    "_specialization_entries_by_school_id": ("_learned_specialization_ids_by_school_id",),
+    "_learned_specialization_ids_by_school_id": ("_equipment_cache",),
+    "_manual_learned_technique_ids": _TECHNIQUE_STATE_CACHES,
+    "_learned_techniques_by_id": _TECHNIQUE_STATE_CACHES,
+    "_specialization_slot_counts_by_school_id": (),
+    "_character_school_technique_list": (
+        "_computed_technique_ids",
+        "_techniques_by_id",
+        "_techniques_by_choice_block_id",
+        "_choice_bonus_techniques",
+        *_TECHNIQUE_STATE_CACHES,
+    ),
+    "_race_technique_list": ("_race_technique_ids", "_computed_technique_ids", *_TECHNIQUE_STATE_CACHES),
+    "_technique_choice_blocks_by_id": ("_choice_block_states_cache",),
+    "_techniques_by_choice_block_id": ("_choice_block_states_cache",),
+    "_choice_bonus_techniques": ("_choice_skill_bonus_by_skill_id",),
+    "_technique_choices_by_technique_id": (
+        "_technique_choices_by_definition_id",
+        "modifier_engine._active_modifiers_cache",
+        *_TECHNIQUE_STATE_CACHES,
+    ),
+    "_technique_choices_by_definition_id": ("modifier_engine._active_modifiers_cache",),
+    "_race_choices_by_definition_id": ("modifier_engine._active_modifiers_cache",),
+    "_trait_choices_by_definition_id": ("modifier_engine._active_modifiers_cache",),
+    "_technique_states_cache": ("_technique_state_map", "_choice_skill_bonus_by_skill_id"),
+    "_choice_skill_bonus_by_skill_id": ("_equipment_cache",),
+    "_equipped_item_runes": ("_equipped_rune_ids", "modifier_engine._active_item_rune_modifiers"),
+    "_equipped_rune_ids": ("modifier_engine._active_modifiers_cache",),
+    "_equipped_items_for_semantic_effects": ("modifier_engine._active_item_semantic_modifiers",),
+    "modifier_engine._active_race_semantic_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_school_semantic_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_trait_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_item_rune_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_item_semantic_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_technique_semantic_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_daemonic_power_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_vampire_trait_modifiers": ("modifier_engine._active_modifiers_cache",),
+    "modifier_engine._active_modifiers_cache": ("_equipment_cache",),
+    "character._is_vampire_cache": ("modifier_engine._active_vampire_trait_modifiers",),
+}
+
+# Persisted mutation kinds mapped to the caches read directly from the mutated rows.
+ENGINE_MUTATION_ROOTS: dict[str, tuple[str, ...]] = {
+    "damage": (),
+    "money": (),
+    "arcane_power": (),
+    "attributes": ("_attributes_map",),
+    "skills": ("_skills_map", "_skill_levels_by_id"),
+    "languages": ("_languages_map",),
+    "traits": (
+        "_trait_levels",
+        "_trait_levels_by_slug",
+        "character._is_vampire_cache",
+        "modifier_engine._active_trait_modifiers",
+    ),
+    "trait_choices": ("_trait_choices_by_definition_id",),
+    "race_choices": ("_race_choices_by_definition_id",),
+    "schools": ("_school_entries", "_selected_paths"),
+    "specializations": ("_specialization_entries_by_school_id",),
+    "weapon_masteries": (
+        "_weapon_mastery_entries_by_type",
+        "_weapon_mastery_entries_by_item_id",
+        "_weapon_mastery_arcana_entries",
+    ),
+    "techniques": (
+        "_manual_learned_technique_ids",
+        "_learned_techniques_by_id",
+        "_specialization_slot_counts_by_school_id",
+    ),
+    "technique_choices": ("_technique_choices_by_technique_id",),
+    "daemonic_powers": ("modifier_engine._active_daemonic_power_modifiers",),
+    "vampire": ("modifier_engine._active_vampire_trait_modifiers",),
+    "equipment": (
+        "_equipped_item_runes",
+        "_equipped_items_for_semantic_effects",
+        "_equipment_cache",
+    ),
+    "runes": ("_equipped_item_runes",),
+    "item_effects": ("_equipped_items_for_semantic_effects",),
+}
+
+
+def technique_choice_queryset():
+    """Return persisted technique choices with the relations the engine reads."""
+    return CharacterTechniqueChoice.objects.select_related(
+        "technique",
+        "definition",
+        "selected_skill",
+        "selected_skill_category",
+        "selected_item",
+        "selected_specialization",
+        "selected_content_type",
+    ).order_by("technique__school__name", "technique__level", "technique__name", "id")
+
+
+def race_choice_queryset():
+    """Return persisted race choices with the relations the engine reads."""
+    return CharacterRaceChoice.objects.select_related(
+        "definition",
+        "definition__race",
+        "selected_skill",
+        "selected_skill_category",
+        "selected_item",
+        "selected_specialization",
+        "selected_content_type",
+    ).order_by("definition__race__name", "definition__sort_order", "definition__name", "id")
+
+
+def trait_choice_queryset():
+    """Return persisted trait choices with the relations the engine reads."""
+    return CharacterTraitChoice.objects.select_related(
+        "character_trait",
+        "character_trait__owner",
+        "character_trait__trait",
+        "definition",
+        "selected_attribute",
+        "selected_skill",
+        "selected_skill_category",
+        "selected_item",
+        "selected_specialization",
+        "selected_content_type",
+    ).order_by("character_trait__trait__name", "definition__sort_order", "id")
+
+
+def equipped_item_rune_queryset():
+    """Return active rune assignments on equipped items."""
+    return (
+        ItemRune.objects.filter(item__equipped=True, is_active=True)
+        .select_related("item", "item__item", "rune")
+    )
+
+
+def semantic_effect_item_queryset():
+    """Return equipped items that can contribute item semantic effects."""
+    return (
+        CharacterItem.objects.filter(equipped=True)
+        .select_related("item")
+        .filter(
+            Q(item__is_magic=True)
+            | Q(item__item_type__in=Item.magic_item_type_values())
+            | Q(is_magic=True)
+            | Q(item__semantic_effects__isnull=False)
+            | Q(semantic_effects__isnull=False)
+        )
+        .distinct()
+    )
+
+
 class SkillInfo(TypedDict):
     """Serialized base skill metadata used during calculations."""
 
@@ -161,6 +351,46 @@ class TechniqueState(TypedDict):
     activation: TechniqueActivationData | None
 
 
+# Row-to-cache derivations shared by the lazy engine properties and the bulk
+# loader, so both paths seed identical caches from the same persisted rows.
+def group_rows(rows: Iterable, key: Callable) -> dict:
+    """Group rows by one key while keeping the query order."""
+    grouped: DefaultDict = defaultdict(list)
+    for row in rows:
+        grouped[key(row)].append(row)
+    return dict(grouped)
+
+
+def skills_map_from_entries(entries: Iterable) -> dict[str, SkillInfo]:
+    """Map learned skill rows by slug, keeping the highest level per skill."""
+    skills: dict[str, SkillInfo] = {}
+    for entry in entries:
+        existing = skills.get(entry.skill.slug)
+        if existing is not None and int(existing["level"]) >= int(entry.level):
+            continue
+        skills[entry.skill.slug] = {
+            "skill_id": entry.skill_id,
+            "level": entry.level,
+            "category": entry.skill.category.slug,
+            "attribute": entry.skill.attribute.short_name,
+        }
+    return skills
+
+
+def skill_levels_from_entries(entries: Iterable) -> dict[int, int]:
+    """Return the highest learned level per skill id."""
+    skill_levels: dict[int, int] = {}
+    for entry in entries:
+        skill_levels[entry.skill_id] = max(skill_levels.get(entry.skill_id, 0), int(entry.level))
+    return skill_levels
+
+
+def equipped_rune_ids_from_rows(extra_rune_ids: Iterable, item_runes: Iterable) -> set[int]:
+    """Merge directly attached rune ids and active rune assignments of equipped items."""
+    assignment_rune_ids = {item_rune.rune_id for item_rune in item_runes}
+    return {int(rune_id) for rune_id in set(extra_rune_ids) | assignment_rune_ids if rune_id is not None}
+
+
 class CharacterEngine:
     """Calculate derived character values from persisted model data."""
 
@@ -183,66 +413,84 @@ class CharacterEngine:
         self._technique_requirement_cache: dict[int, bool] = {}
         self._technique_exclusion_cache: dict[int, bool] = {}
 
-    @cached_property
+    def invalidate(self, *mutations: str) -> set[str]:
+        """Drop only the caches that depend on the given persisted mutation kinds."""
+        pending: list[str] = []
+        for mutation in mutations:
+            if mutation not in ENGINE_MUTATION_ROOTS:
+                raise ValueError(f"Unknown engine mutation: {mutation}")
+            pending.extend(ENGINE_MUTATION_ROOTS[mutation])
+        dropped: set[str] = set()
+        while pending:
+            node = pending.pop()
+            if node in dropped:
+                continue
+            dropped.add(node)
+            pending.extend(ENGINE_CACHE_DEPENDENTS.get(node, ()))
+        modifier_engine = self.__dict__.get("modifier_engine")
+        for node in dropped:
+            if node.startswith(_MODIFIER_CACHE_PREFIX):
+                if modifier_engine is not None:
+                    modifier_engine.invalidate_cache(node[len(_MODIFIER_CACHE_PREFIX):])
+            elif node.startswith(_CHARACTER_CACHE_PREFIX):
+                self.character.__dict__.pop(node[len(_CHARACTER_CACHE_PREFIX):], None)
+            elif node in _TECHNIQUE_MEMO_CACHES:
+                getattr(self, node).clear()
+            else:
+                self.__dict__.pop(node, None)
+        return dropped
+
+    @profiled_cached_property
+    def _rules_catalog(self) -> RulesCatalog:
+        """Return the process-wide rules catalog once per engine instance."""
+        return get_rules_catalog()
+
+    @profiled_cached_property
     def _attributes_map(self) -> dict[str, int]:
         """Cache character attributes by short name."""
         qs = self.character.characterattribute_set.select_related("attribute")
         return {entry.attribute.short_name: entry.base_value for entry in qs}
 
-    @cached_property
+    @profiled_cached_property
     def _skills_map(self) -> dict[str, SkillInfo]:
         """Cache learned skills with their category and governing attribute."""
-        qs = self.character.characterskill_set.select_related(
-            "skill",
-            "skill__category",
-            "skill__attribute",
+        return skills_map_from_entries(
+            self.character.characterskill_set.select_related(
+                "skill",
+                "skill__category",
+                "skill__attribute",
+            )
         )
-        skills: dict[str, SkillInfo] = {}
-        for entry in qs:
-            existing = skills.get(entry.skill.slug)
-            if existing is not None and int(existing["level"]) >= int(entry.level):
-                continue
-            skills[entry.skill.slug] = {
-                "skill_id": entry.skill_id,
-                "level": entry.level,
-                "category": entry.skill.category.slug,
-                "attribute": entry.skill.attribute.short_name,
-            }
-        return skills
 
-    @cached_property
-    def _skill_definitions_by_slug(self) -> dict[str, Skill]:
-        """Cache all skill definitions keyed by slug for unlearned-skill resolution."""
-        return {
-            skill.slug: skill
-            for skill in Skill.objects.select_related("category", "attribute").order_by("slug")
-        }
+    @profiled_cached_property
+    def _skill_definitions_by_slug(self) -> Mapping[str, Skill]:
+        """Return all skill definitions keyed by slug for unlearned-skill resolution."""
+        return self._rules_catalog.skills_by_slug
 
-    @cached_property
+    @profiled_cached_property
     def _languages_map(self) -> dict[str, CharacterLanguage]:
         """Cache learned languages keyed by language slug."""
         qs = self.character.characterlanguage_set.select_related("language")
         return {entry.language.slug: entry for entry in qs}
 
-    @cached_property
+    @profiled_cached_property
     def _school_entries(self) -> dict[int, CharacterSchool]:
         """Cache learned schools keyed by school id."""
         qs = self.character.schools.select_related("school", "school__type")
         return {entry.school_id: entry for entry in qs}
 
-    @cached_property
+    @profiled_cached_property
     def _selected_paths(self) -> dict[int, CharacterSchoolPath]:
         """Cache selected school paths keyed by school id."""
         qs = self.character.selected_school_paths.select_related("school", "path")
         return {entry.school_id: entry for entry in qs}
 
-    @cached_property
+    @profiled_cached_property
     def _weapon_master_school(self) -> School | None:
         """Return the Waffenmeister school definition when it exists."""
-        school = School.objects.filter(name__iexact="Waffenmeister").select_related("type").first()
-        return school
+        return self._rules_catalog.weapon_master_school
 
-    @cached_property
+    @profiled_cached_property
     def _weapon_master_school_entry(self) -> CharacterSchool | None:
         """Return the character's learned Waffenmeister school entry, if any."""
         school = self._weapon_master_school
@@ -250,7 +498,7 @@ class CharacterEngine:
             return None
         return self._school_entries.get(school.id)
 
-    @cached_property
+    @profiled_cached_property
     def _weapon_mastery_entries_by_type(self) -> dict[str, CharacterWeaponMastery]:
         """Cache weapon masteries keyed by weapon type."""
         school = self._weapon_master_school
@@ -267,7 +515,7 @@ class CharacterEngine:
             if entry.effective_weapon_type()
         }
 
-    @cached_property
+    @profiled_cached_property
     def _weapon_mastery_entries_by_item_id(self) -> dict[int, CharacterWeaponMastery]:
         """Cache legacy concrete weapon masteries keyed by weapon item id."""
         school = self._weapon_master_school
@@ -280,7 +528,7 @@ class CharacterEngine:
         )
         return {entry.weapon_item_id: entry for entry in queryset}
 
-    @cached_property
+    @profiled_cached_property
     def _weapon_mastery_arcana_entries(self) -> list[CharacterWeaponMasteryArcana]:
         """Cache all persisted rune/bonus-capacity arcana purchases."""
         school = self._weapon_master_school
@@ -292,7 +540,7 @@ class CharacterEngine:
             .order_by("id")
         )
 
-    @cached_property
+    @profiled_cached_property
     def _specialization_entries_by_school_id(self) -> dict[int, list[CharacterSpecialization]]:
         """Cache learned character specializations keyed by school id."""
         grouped: DefaultDict[int, list[CharacterSpecialization]] = defaultdict(list)
@@ -313,7 +561,7 @@ class CharacterEngine:
             grouped[entry.specialization.school_id].append(entry)
         return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _learned_specialization_ids_by_school_id(self) -> dict[int, set[int]]:
         """Cache learned specialization ids per school for fast exclusion checks."""
         return {
@@ -321,7 +569,7 @@ class CharacterEngine:
             for school_id, entries in self._specialization_entries_by_school_id.items()
         }
 
-    @cached_property
+    @profiled_cached_property
     def _specialization_definitions_by_school_id(self) -> dict[int, list[Specialization]]:
         """Cache specialization definitions of learned schools keyed by school id."""
         school_ids = list(self._school_entries.keys())
@@ -338,14 +586,14 @@ class CharacterEngine:
             grouped[specialization.school_id].append(specialization)
         return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _manual_learned_technique_ids(self) -> set[int]:
         """Cache explicitly learned technique ids."""
         return set(
             self.character.learned_techniques.values_list("technique_id", flat=True)
         )
 
-    @cached_property
+    @profiled_cached_property
     def _learned_techniques_by_id(self) -> dict[int, CharacterTechnique]:
         """Cache explicit learned technique rows keyed by technique id."""
         return {
@@ -353,27 +601,15 @@ class CharacterEngine:
             for row in self.character.learned_techniques.select_related("technique")
         }
 
-    @cached_property
+    @profiled_cached_property
     def _technique_choices_by_technique_id(self) -> dict[int, list[CharacterTechniqueChoice]]:
         """Cache persisted technique choices grouped by technique id."""
-        grouped: DefaultDict[int, list[CharacterTechniqueChoice]] = defaultdict(list)
-        queryset = (
-            self.character.technique_choices.select_related(
-                "technique",
-                "definition",
-                "selected_skill",
-                "selected_skill_category",
-                "selected_item",
-                "selected_specialization",
-                "selected_content_type",
-            )
-            .order_by("technique__school__name", "technique__level", "technique__name", "id")
+        return group_rows(
+            technique_choice_queryset().filter(character=self.character),
+            lambda choice: choice.technique_id,
         )
-        for choice in queryset:
-            grouped[choice.technique_id].append(choice)
-        return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _technique_choices_by_definition_id(self) -> dict[int, list[CharacterTechniqueChoice]]:
         """Cache persisted technique choices grouped by explicit choice definition id."""
         grouped: DefaultDict[int, list[CharacterTechniqueChoice]] = defaultdict(list)
@@ -383,51 +619,23 @@ class CharacterEngine:
                     grouped[choice.definition_id].append(choice)
         return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _race_choices_by_definition_id(self) -> dict[int, list[CharacterRaceChoice]]:
         """Cache persisted race choices grouped by explicit race choice definition id."""
-        grouped: DefaultDict[int, list[CharacterRaceChoice]] = defaultdict(list)
-        queryset = (
-            self.character.race_choices.select_related(
-                "definition",
-                "definition__race",
-                "selected_skill",
-                "selected_skill_category",
-                "selected_item",
-                "selected_specialization",
-                "selected_content_type",
-            )
-            .order_by("definition__race__name", "definition__sort_order", "definition__name", "id")
+        return group_rows(
+            race_choice_queryset().filter(character=self.character),
+            lambda choice: choice.definition_id,
         )
-        for choice in queryset:
-            grouped[choice.definition_id].append(choice)
-        return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _trait_choices_by_definition_id(self) -> dict[int, list[CharacterTraitChoice]]:
         """Cache persisted trait choices grouped by explicit trait choice definition id."""
-        grouped: DefaultDict[int, list[CharacterTraitChoice]] = defaultdict(list)
-        queryset = (
-            CharacterTraitChoice.objects.filter(character_trait__owner=self.character)
-            .select_related(
-                "character_trait",
-                "character_trait__owner",
-                "character_trait__trait",
-                "definition",
-                "selected_attribute",
-                "selected_skill",
-                "selected_skill_category",
-                "selected_item",
-                "selected_specialization",
-                "selected_content_type",
-            )
-            .order_by("character_trait__trait__name", "definition__sort_order", "id")
+        return group_rows(
+            trait_choice_queryset().filter(character_trait__owner=self.character),
+            lambda choice: choice.definition_id,
         )
-        for choice in queryset:
-            grouped[choice.definition_id].append(choice)
-        return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _choice_bonus_techniques(self) -> list[Technique]:
         """Cache computed passive techniques with explicit choice bonuses; choice_group is ignored here."""
         return [
@@ -437,7 +645,7 @@ class CharacterEngine:
             and technique.choice_target_kind != Technique.ChoiceTargetKind.NONE
         ]
 
-    @cached_property
+    @profiled_cached_property
     def _choice_skill_bonus_by_skill_id(self) -> dict[int, int]:
         """Index fixed choice-based bonuses by selected skill id."""
         totals: DefaultDict[int, int] = defaultdict(int)
@@ -456,15 +664,12 @@ class CharacterEngine:
                     totals[choice.selected_skill_id] += technique.choice_bonus_value
         return dict(totals)
 
-    @cached_property
+    @profiled_cached_property
     def _skill_levels_by_id(self) -> dict[int, int]:
         """Cache learned skill levels keyed by skill id for requirement checks."""
-        skill_levels: dict[int, int] = {}
-        for entry in self.character.characterskill_set.only("skill_id", "level"):
-            skill_levels[entry.skill_id] = max(skill_levels.get(entry.skill_id, 0), int(entry.level))
-        return skill_levels
+        return skill_levels_from_entries(self.character.characterskill_set.only("skill_id", "level"))
 
-    @cached_property
+    @profiled_cached_property
     def _trait_levels(self) -> dict[int, int]:
         """Cache learned trait levels keyed by trait id."""
         return {
@@ -472,7 +677,7 @@ class CharacterEngine:
             for entry in self.character.charactertrait_set.select_related("trait")
         }
 
-    @cached_property
+    @profiled_cached_property
     def _trait_levels_by_slug(self) -> dict[str, int]:
         """Cache learned trait levels keyed by trait slug for semantic scaling."""
         return {
@@ -480,89 +685,36 @@ class CharacterEngine:
             for entry in self.character.charactertrait_set.select_related("trait")
         }
 
-    @cached_property
+    @profiled_cached_property
     def _equipped_rune_ids(self) -> set[int]:
         """Cache unique rune ids attached to equipped owned items."""
         equipped_items = CharacterItem.objects.filter(owner=self.character, equipped=True)
-        extra_rune_ids = set(
-            equipped_items.filter(runes__isnull=False).values_list("runes", flat=True)
+        return equipped_rune_ids_from_rows(
+            equipped_items.filter(runes__isnull=False).values_list("runes", flat=True),
+            self._equipped_item_runes,
         )
-        assignment_rune_ids = set(self._equipped_item_runes.values_list("rune_id", flat=True))
-        return {int(rune_id) for rune_id in extra_rune_ids | assignment_rune_ids if rune_id is not None}
 
-    @cached_property
+    @profiled_cached_property
     def _equipped_item_runes(self):
         """Cache active concrete rune assignments on equipped items."""
-        return (
-            ItemRune.objects.filter(item__owner=self.character, item__equipped=True, is_active=True)
-            .select_related("item", "item__item", "rune")
-            .prefetch_related("rune__semantic_effects")
-        )
+        return equipped_item_rune_queryset().filter(item__owner=self.character)
 
-    @cached_property
+    @profiled_cached_property
     def _equipped_items_for_semantic_effects(self):
         """Cache equipped owned items that can contribute item semantic effects."""
-        return (
-            CharacterItem.objects.filter(owner=self.character, equipped=True)
-            .select_related("item")
-            .filter(
-                Q(item__is_magic=True)
-                | Q(item__item_type__in=Item.magic_item_type_values())
-                | Q(is_magic=True)
-                | Q(item__semantic_effects__isnull=False)
-                | Q(semantic_effects__isnull=False)
-            )
-            .distinct()
-        )
+        return semantic_effect_item_queryset().filter(owner=self.character)
 
     def is_rune_equipped(self, rune: Rune | int) -> bool:
         """Return whether this rune is attached to any currently equipped owned item."""
         rune_id = rune.id if isinstance(rune, Rune) else int(rune)
         return rune_id in self._equipped_rune_ids
 
-    @cached_property
+    @profiled_cached_property
     def _character_school_technique_list(self) -> list[Technique]:
-        """Load all techniques of learned schools with required relations eagerly loaded."""
-        school_ids = list(self._school_entries.keys())
-        if not school_ids:
-            return []
+        """Return all catalog techniques of learned schools with required relations eagerly loaded."""
+        return self._rules_catalog.techniques_for_schools(self._school_entries)
 
-        requirement_queryset = TechniqueRequirement.objects.select_related(
-            "required_technique__school",
-            "required_technique__path",
-            "required_path",
-            "required_skill",
-            "required_trait",
-        )
-        exclusions_queryset = TechniqueExclusion.objects.select_related(
-            "excluded_technique__school",
-            "excluded_technique__path",
-        )
-        excluded_by_queryset = TechniqueExclusion.objects.select_related(
-            "technique__school",
-            "technique__path",
-        )
-        choice_definition_queryset = TechniqueChoiceDefinition.objects.order_by("sort_order", "name", "id")
-
-        return list(
-            Technique.objects.filter(school_id__in=school_ids)
-            .select_related(
-                "school",
-                "path",
-                "choice_block",
-                "choice_block__path",
-                "granted_daemonic_power_tier",
-            )
-            .prefetch_related(
-                Prefetch("requirements", queryset=requirement_queryset),
-                Prefetch("exclusions", queryset=exclusions_queryset),
-                Prefetch("excluded_by", queryset=excluded_by_queryset),
-                Prefetch("choice_definitions", queryset=choice_definition_queryset),
-            )
-            .order_by("school__name", "level", "name")
-        )
-
-    @cached_property
+    @profiled_cached_property
     def _computed_technique_ids(self) -> set[int]:
         """Cache technique ids whose effects may be resolved automatically."""
         return {
@@ -574,40 +726,32 @@ class CharacterEngine:
             if self._technique_effect_is_computed(technique)
         }
 
-    @cached_property
+    @profiled_cached_property
     def _race_technique_list(self) -> list[Technique]:
-        """Load all techniques granted directly by the character's race."""
-        return [
-            relation.technique
-            for relation in (
-                RaceTechnique.objects
-                .filter(race_id=self.character.race_id)
-                .select_related("technique")
-                .order_by("technique__name")
-            )
-        ]
+        """Return all catalog techniques granted directly by the character's race."""
+        return list(self._rules_catalog.race_techniques_by_race_id.get(self.character.race_id, ()))
 
-    @cached_property
+    @profiled_cached_property
     def _race_technique_ids(self) -> set[int]:
         """Cache technique ids that come from the character's race."""
         return {technique.id for technique in self._race_technique_list}
 
-    @cached_property
+    @profiled_cached_property
     def _techniques_by_id(self) -> dict[int, Technique]:
         """Index preloaded school techniques by id for fast reuse."""
         return {technique.id: technique for technique in self._character_school_technique_list}
 
-    @cached_property
+    @profiled_cached_property
     def _technique_states_cache(self) -> list[TechniqueState]:
         """Build technique states once per engine instance and reuse them everywhere."""
         return [self._build_technique_state(technique) for technique in self._character_school_technique_list]
 
-    @cached_property
+    @profiled_cached_property
     def _technique_state_map(self) -> dict[int, TechniqueState]:
         """Index cached technique states by technique id."""
         return {state["technique_id"]: state for state in self._technique_states_cache}
 
-    @cached_property
+    @profiled_cached_property
     def _technique_choice_blocks_by_id(self) -> dict[int, TechniqueChoiceBlock]:
         """Load choice blocks of learned schools keyed by block id."""
         school_ids = list(self._school_entries.keys())
@@ -620,7 +764,7 @@ class CharacterEngine:
             .order_by("school__name", "level", "sort_order", "name", "id")
         }
 
-    @cached_property
+    @profiled_cached_property
     def _techniques_by_choice_block_id(self) -> dict[int, list[Technique]]:
         """Group learned-school techniques by explicit choice block."""
         grouped: DefaultDict[int, list[Technique]] = defaultdict(list)
@@ -629,12 +773,12 @@ class CharacterEngine:
                 grouped[technique.choice_block_id].append(technique)
         return dict(grouped)
 
-    @cached_property
+    @profiled_cached_property
     def _choice_block_states_cache(self) -> list[TechniqueChoiceBlockState]:
         """Build rule states for all choice blocks of learned schools."""
         return [self._build_choice_block_state(block) for block in self._technique_choice_blocks_by_id.values()]
 
-    @cached_property
+    @profiled_cached_property
     def _specialization_slot_counts_by_school_id(self) -> dict[int, int]:
         """Cache granted specialization slots per school from explicit CharacterTechnique rows."""
         totals: DefaultDict[int, int] = defaultdict(int)
@@ -648,7 +792,7 @@ class CharacterEngine:
             totals[learned_technique.technique.school_id] += learned_technique.technique.specialization_slot_grants
         return dict(totals)
 
-    @cached_property
+    @profiled_cached_property
     def _progression_rules_by_type(self) -> dict[int, list[ProgressionRule]]:
         """Group relevant progression rules by school type for reuse."""
         school_type_ids = {entry.school.type_id for entry in self._school_entries.values()}
@@ -894,7 +1038,7 @@ class CharacterEngine:
         content_type = ContentType.objects.get_for_model(entity, for_concrete_model=False)
         return self.modifier_engine.resolve_numeric_total(TargetDomain.ENTITY, f"{content_type.id}:{entity.pk}")
 
-    @cached_property
+    @profiled_cached_property
     def modifier_engine(self) -> ModifierEngine:
         """Return the central modifier engine bound to this character engine."""
         return ModifierEngine(self, resolution_mode=self.modifier_resolution_mode)
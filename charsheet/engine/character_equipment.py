@@ -75,20 +75,22 @@ def equipped_weapon_items(engine) -> list[CharacterItem]:
     )
 
 
+def equipped_armor_queryset():
+    """Return equipped armor items of all owners with required relations loaded."""
+    return (
+        CharacterItem.objects.filter(equipped=True)
+        .filter(Q(item__item_type__in=Item.armor_item_type_values()) | Q(item__armorstats__isnull=False))
+        .select_related("item", "item__armorstats")
+        .prefetch_related("item__runes", "runes", "item_runes__rune")
+    )
+
+
 def equipped_armor_items(engine) -> list[CharacterItem]:
     """Return all currently equipped armor items of the character."""
     return _cached_equipment_list(
         engine,
         "armor_items",
-        lambda: (
-            CharacterItem.objects.filter(
-                owner=engine.character,
-                equipped=True,
-            )
-            .filter(Q(item__item_type__in=Item.armor_item_type_values()) | Q(item__armorstats__isnull=False))
-            .select_related("item", "item__armorstats")
-            .prefetch_related("item__runes", "runes", "item_runes__rune")
-        )
+        lambda: equipped_armor_queryset().filter(owner=engine.character),
     )
 
 
@@ -140,20 +142,21 @@ def equipped_magic_item_items(engine) -> list[CharacterItem]:
     )
 
 
+def equipped_shield_queryset():
+    """Return equipped shields of all owners with required relations loaded."""
+    return (
+        CharacterItem.objects.filter(equipped=True, item__item_type=Item.ItemType.SHIELD)
+        .select_related("item", "item__shieldstats", "item__shieldstats__weapon_type")
+        .prefetch_related("item__runes", "runes", "item_runes__rune")
+    )
+
+
 def equipped_shield_items(engine) -> list[CharacterItem]:
     """Return all currently equipped shields of the character."""
     return _cached_equipment_list(
         engine,
         "shield_items",
-        lambda: (
-            CharacterItem.objects.filter(
-                owner=engine.character,
-                equipped=True,
-                item__item_type=Item.ItemType.SHIELD,
-            )
-            .select_related("item", "item__shieldstats", "item__shieldstats__weapon_type")
-            .prefetch_related("item__runes", "runes", "item_runes__rune")
-        )
+        lambda: equipped_shield_queryset().filter(owner=engine.character),
     )
 
 
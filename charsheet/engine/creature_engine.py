@@ -53,11 +53,12 @@ from charsheet.models.creatures import (
 )
 from charsheet.models.daemonic_powers import DaemonicPowerSemanticEffect
 from charsheet.models.vampirism import VampireTraitSemanticEffect
-from charsheet.models.character import CharacterItem
+from charsheet.models.character import CharacterItem, bump_sheet_revision
 from charsheet.models.techniques import CharacterTechnique
 from charsheet.modifiers.definitions import ModifierOperator, StackBehavior, TargetDomain
 from charsheet.models.creatures import CREATURE_CARD_QUALITY_TRAINING_BUDGETS
 from charsheet.models.items import Quality
+from charsheet.rules_catalog import get_rules_catalog
 from .item_engine import ItemEngine
 
 
@@ -1131,6 +1132,14 @@ class CreatureEngine:
             return not self.can_act_while_out_of_action()
         return False
 
+    def incapacitating_wound_stages(self) -> list[str]:
+        """Return the wound stage labels that put this creature out of action."""
+        return [
+            stage
+            for stage in ("Koma", "Ausser Gefecht", "Außer Gefecht")
+            if self.is_wound_incapacitated(stage)
+        ]
+
     def wound_rows(self) -> list[dict[str, Any]]:
         explicit_thresholds = self._wound_thresholds_override()
         if explicit_thresholds:
@@ -1781,7 +1790,7 @@ class CreatureEngine:
                 "advantage_points": CREATURE_CARD_QUALITY_TRAINING_BUDGETS.get(row.code, (0, 0))[0],
                 "disadvantage_points": CREATURE_CARD_QUALITY_TRAINING_BUDGETS.get(row.code, (0, 0))[1],
             }
-            for row in Quality.objects.all()
+            for row in get_rules_catalog().qualities
         ]
         context = {
             "id": self.instance.pk if self.instance else self.creature.pk,
@@ -2320,12 +2329,16 @@ def sync_character_creatures(character) -> list[CharacterCreature]:
         source_binding__selection_mode=CreatureSourceBinding.SelectionMode.CHARACTER_CHOICE,
     ).exclude(pk__in=active_creature_ids)
     stale_choice_creatures.delete()
-    existing_creatures.exclude(pk__in=active_creature_ids).filter(active=True).update(active=False)
+    deactivated = existing_creatures.exclude(pk__in=active_creature_ids).filter(active=True).update(active=False)
     semantic_creatures = CharacterCreature.objects.filter(owner=character).exclude(semantic_effect_key="")
     semantic_creatures.filter(semantic_effect_is_choice=True).exclude(
         semantic_effect_key__in=active_semantic_keys
     ).delete()
-    semantic_creatures.exclude(semantic_effect_key__in=active_semantic_keys).filter(active=True).update(active=False)
+    deactivated += semantic_creatures.exclude(semantic_effect_key__in=active_semantic_keys).filter(active=True).update(
+        active=False
+    )
+    if deactivated:
+        bump_sheet_revision(character.pk)
     return list(
         CharacterCreature.objects.filter(owner=character, active=True).filter(
             Q(source_binding__isnull=False) | ~Q(semantic_effect_key="")
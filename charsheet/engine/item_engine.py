@@ -28,6 +28,7 @@ from charsheet.constants import (
     WEAPON_SYMBOL_DESCRIPTIONS,
 )
 from charsheet.models import ArmorStats, CharacterItem, Item, Quality, RangedWeaponStats, ShieldStats, WeaponStats
+from charsheet.weight_ledger import weight_ledger_for
 
 
 WEAPON_DAMAGE_QUALITY_BONUSES = {
@@ -674,17 +675,13 @@ class ItemEngine:
         include_stored: bool = True,
         include_equipped: bool = True,
     ) -> Decimal:
-        """Return the summed weight of the character's owned items."""
-        total_weight = Decimal("0")
-        character_items = CharacterItem.objects.filter(owner=character).exclude(
-            transfers__status="pending"
-        ).select_related("item").distinct()
-        for character_item in character_items:
-            if not include_stored and character_item.stored:
-                continue
-            if not include_equipped and character_item.equipped:
-                continue
-            total_weight += cls(character_item).get_weight()
+        """Return the summed weight of the character's owned items from the weight ledger."""
+        ledger = weight_ledger_for(character.pk)
+        total_weight = ledger.carried_weight
+        if include_stored:
+            total_weight += ledger.stored_weight
+        if include_equipped:
+            total_weight += ledger.equipped_weight
         return total_weight
 
     @classmethod
@@ -19,10 +19,11 @@ from charsheet.models import (
     CharacterSpellSource,
     DivineEntity,
     DruidCultAspect,
-    School,
     Spell,
     Trait,
 )
+from charsheet.profiling import profiled
+from charsheet.rules_catalog import get_rules_catalog
 
 
 BONUS_SPELL_TRAIT_SLUGS = (
@@ -666,7 +667,7 @@ class MagicEngine:
         rows: list[dict[str, object]] = []
         arcane_school_ids = [
             school.id
-            for school in School.objects.select_related("type").all()
+            for school in get_rules_catalog().schools
             if self._school_matches_magic_type(school, SCHOOL_ARCANE)
         ]
         for entity in self._divine_arcane_grant_entities():
@@ -1237,6 +1238,7 @@ class MagicEngine:
         *,
         previous_max: int | None = None,
         persist: bool = True,
+        engine=None,
     ) -> dict[str, int | bool]:
         """Shift current KP alongside max changes and never allow values above max."""
         from .vampire_engine import VampireRules
@@ -1250,7 +1252,9 @@ class MagicEngine:
                 "changed": False,
                 "resource_type": "blood",
             }
-        current_max = max(0, int(self.character.get_engine(refresh=True).calculate_arcane_power()))
+        # Callers that keep the character engine invalidated per mutation pass it to skip the rebuild.
+        engine = engine or self.character.get_engine(refresh=True)
+        current_max = max(0, int(engine.calculate_arcane_power()))
         stored_current = self.character.current_arcane_power
 
         if stored_current is None:
@@ -1334,6 +1338,7 @@ class MagicEngine:
                 "resource_type": normalized_arcane_power.get("resource_type", "arcane_power"),
             }
 
+    @profiled("MagicEngine.spell_panel")
     def get_spell_panel_data(self) -> dict[str, object]:
         known_entries = self.get_known_spells()
         school_entries = self._school_entries()
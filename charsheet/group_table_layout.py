@@ -0,0 +1,103 @@
+"""Resolved span and width layout of SL-screen data tables, stored with each table revision."""
+
+from __future__ import annotations
+
+from .models import GameGroupTable
+
+GROUP_TABLE_LAYOUT_SCHEMA = 1
+DEFAULT_PREVIEW_COLUMN_WIDTH = 140
+MIN_EDITOR_COLUMN_WIDTH = 180
+EDITOR_ROW_ACTION_WIDTH = 92
+
+
+def compute_table_layout(revision: int, columns: list, rows: list, cells_by_row: dict[int, list]) -> dict:
+    """Resolve widths, effective spans and covered cells of one table."""
+    # Spans are clipped at the table edge and shrunk, columns first, until they
+    # no longer overlap a cell an earlier span covers. Each cell maps to
+    # [row_index, column_index, row_span, column_span]; covered cells get spans of 0.
+    column_index_by_id = {column.id: index for index, column in enumerate(columns)}
+    occupied: set[tuple[int, int]] = set()
+    cells: dict[str, list[int]] = {}
+    for row_index, row in enumerate(rows):
+        row_cells = sorted(
+            (
+                (column_index_by_id[cell.column_id], cell)
+                for cell in cells_by_row.get(row.id, ())
+                if cell.column_id in column_index_by_id
+            ),
+            key=lambda entry: entry[0],
+        )
+        for column_index, cell in row_cells:
+            if (row_index, column_index) in occupied:
+                cells[str(cell.id)] = [row_index, column_index, 0, 0]
+                continue
+            row_span = min(max(1, int(cell.row_span or 1)), len(rows) - row_index)
+            column_span = min(max(1, int(cell.column_span or 1)), len(columns) - column_index)
+            while any(
+                (covered_row, covered_column) in occupied
+                for covered_row in range(row_index, row_index + row_span)
+                for covered_column in range(column_index, column_index + column_span)
+            ):
+                if column_span > 1:
+                    column_span -= 1
+                elif row_span > 1:
+                    row_span -= 1
+                else:
+                    break
+            cells[str(cell.id)] = [row_index, column_index, row_span, column_span]
+            occupied.update(
+                (covered_row, covered_column)
+                for covered_row in range(row_index, row_index + row_span)
+                for covered_column in range(column_index, column_index + column_span)
+            )
+    widths = [
+        [
+            column.id,
+            column.width or DEFAULT_PREVIEW_COLUMN_WIDTH,
+            max(column.width or MIN_EDITOR_COLUMN_WIDTH, MIN_EDITOR_COLUMN_WIDTH),
+        ]
+        for column in columns
+    ]
+    return {
+        "schema": GROUP_TABLE_LAYOUT_SCHEMA,
+        "revision": int(revision),
+        "rows": [row.id for row in rows],
+        "columns": widths,
+        "preview_width": sum(width[1] for width in widths),
+        "editor_width": sum(width[2] for width in widths) + EDITOR_ROW_ACTION_WIDTH,
+        "cells": cells,
+    }
+
+
+def layout_matches(layout, revision: int, columns: list, rows: list, cells_by_row: dict[int, list]) -> bool:
+    """Return whether a stored layout still describes the loaded table."""
+    if not (
+        isinstance(layout, dict)
+        and layout.get("schema") == GROUP_TABLE_LAYOUT_SCHEMA
+        and layout.get("revision") == int(revision)
+        and layout.get("rows") == [row.id for row in rows]
+        and [width[0] for width in layout.get("columns", ())] == [column.id for column in columns]
+    ):
+        return False
+    cell_ids = {str(cell.id) for cells in cells_by_row.values() for cell in cells}
+    return cell_ids <= layout["cells"].keys()
+
+
+def store_table_layout(data_table: GameGroupTable, columns: list, rows: list, cells_by_row: dict[int, list]) -> dict:
+    """Compute and persist the layout, unless a newer revision was saved meanwhile."""
+    layout = compute_table_layout(data_table.revision, columns, rows, cells_by_row)
+    GameGroupTable.objects.filter(pk=data_table.pk, revision=data_table.revision).update(layout=layout)
+    data_table.layout = layout
+    return layout
+
+
+def refresh_table_layout(data_table: GameGroupTable) -> dict:
+    """Rebuild the stored layout after an edit from freshly loaded rows, columns and cells."""
+    columns = list(data_table.columns.all())
+    rows = list(data_table.rows.prefetch_related("cells"))
+    return store_table_layout(
+        data_table,
+        columns,
+        rows,
+        {row.id: list(row.cells.all()) for row in rows},
+    )
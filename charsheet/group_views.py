@@ -4,20 +4,25 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from datetime import timedelta
 from decimal import Decimal, InvalidOperation
 from html import escape
 from html.parser import HTMLParser
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
-from django.db.models import F, Max, Q
-from django.http import JsonResponse
+from django.db.models import F, Max, Min, Q
+from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils import timezone
 from django.views.decorators.http import require_GET, require_POST
 
 from charsheet.game_groups import (
@@ -47,7 +52,9 @@ from charsheet.item_transfers import (
     create_group_transfer,
     recall_group_transfer,
 )
-from charsheet.engine import ItemEngine
+from charsheet.creature_stat_blocks import get_creature_stat_block, get_creature_stat_blocks
+from charsheet.group_table_layout import layout_matches, refresh_table_layout, store_table_layout
+from charsheet.engine import CharacterEngine, ItemEngine, load_character_engines
 from charsheet.engine.creature_engine import CreatureEngine
 from charsheet.models import (
     ArmorStats,
@@ -62,6 +69,7 @@ from charsheet.models import (
     GameGroupInvitation,
     GameGroupMembership,
     GameGroupRole,
+    GameGroupScreenChange,
     GameGroupTable,
     GameGroupTableCell,
     GameGroupTableColumn,
@@ -94,18 +102,42 @@ from charsheet.shop import (
     _save_magic_modifiers,
     create_custom_shop_item,
 )
+from charsheet.sheet_cache import current_sheet_revision, sheet_etag
+from charsheet.shop_catalog import get_group_catalog_items
 from charsheet.sheet_context import (
     _load_character_item_modifier_payloads,
     _merge_magic_effect_payloads,
 )
 from charsheet.views import (
     _build_sheet_context_for_request,
+    _not_modified_response,
+    _read_json_payload,
     _serialize_diary_entry,
+    _sheet_etag_for_request,
+    _sheet_tooltip_response,
+    _tag_sheet_response,
     _temporary_attribute_adjustments,
     _temporary_attribute_response,
 )
 from charsheet.view_utils import format_modifier
 
+GROUP_SCREEN_CHANGE_BATCH_SIZE = 200
+GROUP_SCREEN_CHANGE_POLL_INTERVAL_SECONDS = 1
+GROUP_SCREEN_CHANGE_RETENTION_SECONDS = 3600
+# Long-polls of all workers prune a group's change log at most this often.
+GROUP_SCREEN_CHANGE_PRUNE_INTERVAL_SECONDS = 300
+# Everything the table editor can change on a cell; written together by the bulk updates.
+TABLE_CELL_CONTENT_FIELDS = [
+    "value_type",
+    "text_value",
+    "number_value",
+    "number_show_plus",
+    "number_suffix",
+    "alignment",
+    "row_span",
+    "column_span",
+]
+
 
 def _request_wants_json(request) -> bool:
     return (
@@ -400,13 +432,9 @@ def delete_game_group(request, group_id: int):
     return redirect("dashboard")
 
 
-@login_required
-@require_GET
-def game_master_screen(request, group_id: int):
-    group = get_object_or_404(GameGroup, pk=group_id)
-    require_game_master(request.user, group)
-    roster = []
-    memberships = (
+def _screen_membership_queryset(group: GameGroup):
+    """Return the active member characters shown as SL-screen cards."""
+    return (
         group.memberships.filter(
             status=GameGroupMembership.Status.ACTIVE,
             character__is_archived=False,
@@ -418,308 +446,336 @@ def game_master_screen(request, group_id: int):
             "id",
         )
     )
-    for membership in memberships:
-        character = membership.character
-        runtime_attribute_adjustments = _temporary_attribute_adjustments(request, character.pk)
-        engine = character.get_engine(
-            refresh=True,
-            runtime_attribute_adjustments=runtime_attribute_adjustments,
-        )
-        thresholds = engine.wound_thresholds()
-        max_lp = max(thresholds, default=0)
-        stun_damage = max(0, int(character.current_stun_damage or 0))
-        lethal_damage = max(0, int(character.current_lethal_damage or 0))
-        displayed_stun_damage = min(stun_damage, max_lp)
-        displayed_lethal_damage = min(lethal_damage, max(0, max_lp - displayed_stun_damage))
-        from charsheet.engine.vampire_engine import VampireRules
 
-        character_vampire = VampireRules(character)
-        character_is_vampire = character_vampire.is_vampire()
-        character_blood = character_vampire.resource_state() if character_is_vampire else None
-        max_kp = character_blood.maximum if character_blood else max(0, int(engine.calculate_arcane_power()))
-        current_kp = (
-            character_blood.total
-            if character_blood
-            else min(max_kp, max(0, int(character.current_arcane_power or 0)))
-        )
-        initiative = int(engine.calculate_initiative())
-        armor_load_penalty = int(engine.load_penalty())
-        carry_state = ItemEngine.carry_state_for_character(character)
-        carry_penalty = int(carry_state["penalty"]) if character.carry_load_enabled else 0
-        load_penalty = armor_load_penalty + carry_penalty
-        wound_stage, _wound_stage_penalty = engine.current_wound_stage()
-        wound_penalty = engine.current_wound_penalty()
-        is_dead = wound_stage == "Tod"
-        is_incapacitated = engine.is_wound_incapacitated(wound_stage)
-        attributes = engine.attributes()
-        subtitle = character.race.name
-        if character_is_vampire:
-            subtitle += f" · Vampir · Alter {character_vampire.age_cycle()}"
-        if wound_stage != "-":
-            subtitle += f" · {wound_stage}"
-            if format_modifier(wound_penalty) != "0":
-                subtitle += f" ({format_modifier(wound_penalty)})"
-        roster.append(
-            {
-                "card_kind": "character",
-                "card_id": f"character:{membership.id}",
-                "screen_position": membership.screen_position,
-                "screen_is_collapsed": membership.screen_is_collapsed,
-                "screen_state_url": reverse(
-                    "set_group_membership_screen_state",
-                    args=[group.id, membership.id],
-                ),
-                "kind_label": "Charakter",
-                "name": character.name,
-                "subtitle": subtitle,
-                "image": character.char_picture,
-                "fallback_letter": character.name[:1],
-                "potential_label": "Pot",
-                "resource_label": "BP" if character_is_vampire else "KP",
-                "show_arcane": True,
-                "footer_label": "Vollständigen Bogen öffnen",
-                "detail_url": reverse(
-                    "game_master_character_sheet",
-                    args=[group.id, character.id],
-                ),
-                "membership": membership,
-                "character": character,
-                "attributes": {
-                    key: {
-                        "value": value,
-                        "modifier": format_modifier(engine.attribute_modifier(key)),
-                        "runtime_adjustment": int(runtime_attribute_adjustments.get(key, 0)),
-                    }
-                    for key, value in attributes.items()
-                },
-                "vw": engine.vw(),
-                "gw": engine.gw(),
-                "sr": engine.sr(),
-                "potential": character_blood.potential if character_blood else engine.calculate_potential(),
-                "total_armor": engine.get_grs(),
-                "initiative": initiative,
-                "initiative_with_load": initiative + load_penalty,
-                "initiative_display": format_modifier(initiative),
-                "initiative_with_load_display": format_modifier(
-                    initiative + load_penalty
-                ),
-                "load_penalty": load_penalty,
-                "wound_stage": wound_stage,
-                "wound_penalty_display": format_modifier(wound_penalty),
-                "is_incapacitated": is_incapacitated,
-                "is_dead": is_dead,
-                "current_kp": current_kp,
-                "max_kp": max_kp,
-                "max_lp": max_lp,
-                "current_lp": max(0, max_lp - stun_damage - lethal_damage),
-                "stun_damage": stun_damage,
-                "lethal_damage": lethal_damage,
-                "aggravated_damage": int(character.current_aggravated_damage or 0),
-                "is_vampire": character_is_vampire,
-                "intelligent_blood": character_blood.intelligent if character_blood else 0,
-                "animal_blood": character_blood.animal if character_blood else 0,
-                "intelligent_blood_percent": (
-                    f"{character_blood.intelligent / character_blood.maximum * 100:.4f}"
-                    if character_blood and character_blood.maximum
-                    else "0"
-                ),
-                "animal_blood_percent": (
-                    f"{character_blood.animal / character_blood.maximum * 100:.4f}"
-                    if character_blood and character_blood.maximum
-                    else "0"
-                ),
-                "vampire_warnings": character_vampire.warnings(),
-                "stun_damage_percent": f"{displayed_stun_damage / max_lp * 100:.4f}" if max_lp else "0",
-                "lethal_damage_percent": f"{displayed_lethal_damage / max_lp * 100:.4f}" if max_lp else "0",
-                "runtime_attribute_adjustments": runtime_attribute_adjustments,
-            }
-        )
-    creature_cards = list(
-        group.screen_creatures.select_related(
-            "creature",
-            "creature__quality",
-            "character_creature",
-            "character_creature__owner",
-            "character_creature__creature",
-            "character_creature__quality",
-            "character_creature__source_binding",
-        ).prefetch_related(
-            "creature__attributes__attribute",
-        )
+
+def _screen_creature_queryset(group: GameGroup):
+    """Return the creature cards placed on the SL screen."""
+    return group.screen_creatures.select_related(
+        "creature",
+        "creature__quality",
+        "character_creature",
+        "character_creature__owner",
+        "character_creature__creature",
+        "character_creature__quality",
+        "character_creature__source_binding",
+    ).prefetch_related(
+        "creature__attributes__attribute",
     )
-    for creature_card in creature_cards:
-        creature = creature_card.creature
-        character_creature = creature_card.character_creature
-        creature_source = character_creature or creature
-        engine = CreatureEngine(creature_source)
-        from charsheet.engine.vampire_engine import VampireRules
 
-        vampire_rules = VampireRules(creature_card)
-        is_vampire = vampire_rules.is_vampire()
-        vampire_resource = vampire_rules.resource_state() if is_vampire else None
-        base_creature = engine.creature
-        wound_rows = engine.wound_rows()
-        max_lp = wound_rows[-1]["threshold"] if wound_rows else 0
-        stun_damage = max(0, int(creature_card.current_stun_damage or 0))
-        lethal_damage = max(0, int(creature_card.current_lethal_damage or 0))
-        current_damage = stun_damage + lethal_damage
-        displayed_stun_damage = min(stun_damage, max_lp)
-        displayed_lethal_damage = min(
-            lethal_damage,
-            max(0, max_lp - displayed_stun_damage),
-        )
-        wound_stage = "-"
-        wound_penalty = 0
-        for wound_row in wound_rows:
-            if current_damage < int(wound_row["threshold"]):
-                break
-            wound_stage = wound_row["label"]
-            wound_penalty = int(wound_row["penalty"])
-        if max_lp and current_damage > max_lp:
-            if is_vampire:
-                wound_stage = VAMPIRE_STATE_UI_LABELS.get(creature_card.vampire_state, creature_card.vampire_state)
-            else:
-                wound_stage = "Tod"
-                wound_penalty = 0
-        is_dead = wound_stage == "Tod"
-        is_incapacitated = engine.is_wound_incapacitated(wound_stage)
-        creature_attributes = {}
-        for attribute in engine.attribute_rows():
-            modifier = attribute["value"]
-            creature_attributes[attribute["label"]] = {
-                "value": "-" if modifier is None else int(modifier) + 5,
-                "modifier": attribute["display"],
-            }
-        subtitle_parts = []
-        if character_creature:
-            subtitle_parts.append(character_creature.owner.name)
-        if wound_stage != "-":
-            wound_status = wound_stage
-            if format_modifier(wound_penalty) != "0":
-                wound_status += f" ({format_modifier(wound_penalty)})"
-            subtitle_parts.append(wound_status)
-        subtitle = " · ".join(subtitle_parts)
-        movement = engine.movement_display()
-        movement_values = [
-            movement.get(key)
-            for key in ("combat", "march", "sprint")
-            if movement.get(key) not in (None, "")
-        ]
-        creature_kp = (
-            vampire_resource.maximum
-            if vampire_resource
-            else engine.bp()
-            if engine.creature.has_bp
-            else engine.kp()
-        )
-        creature_potential = (
-            vampire_resource.potential
-            if vampire_resource
-            else VampireRules(engine.source).potential()
-            if engine.creature.has_bp
-            else engine.potential()
-        )
-        has_creature_kp = creature_kp is not None
-        creature_kp_max = max(0, int(creature_kp or 0))
-        creature_current_kp = (
-            vampire_resource.intelligent
-            if vampire_resource
-            else creature_kp_max
-            if creature_card.current_kp is None
-            else max(0, min(creature_kp_max, int(creature_card.current_kp)))
-        )
-        roster.append(
-            {
-                "card_kind": "creature",
-                "card_id": f"creature:{creature_card.id}",
-                "screen_position": creature_card.screen_position,
-                "screen_is_collapsed": creature_card.screen_is_collapsed,
-                "screen_state_url": reverse(
-                    "set_group_creature_screen_state",
-                    args=[group.id, creature_card.id],
-                ),
-                "kind_label": (
-                    character_creature.source_binding.choice_label
-                    if character_creature
-                    and character_creature.source_binding
-                    and character_creature.source_binding.choice_label
-                    else "Kreatur"
-                ),
-                "name": creature_source.display_name,
-                "subtitle": subtitle,
-                "image": creature_source.image,
-                "fallback_letter": creature_source.display_name[:1],
-                "potential_label": "Pot" if has_creature_kp else "GK",
-                "show_arcane": has_creature_kp,
-                "resource_label": "BP" if is_vampire or engine.creature.has_bp else "KP",
-                "secondary_status_label": "Bewegung",
-                "secondary_status_value": " / ".join(movement_values) or "–",
-                "creature_damage_rows": (
-                    ("B", stun_damage),
-                    ("T", lethal_damage),
-                    *((("S", int(creature_card.current_aggravated_damage or 0)),) if is_vampire else ()),
-                ),
-                "footer_label": (
-                    base_creature.organization.strip()
-                    or f"Kreatur · {character_creature.quality.name if character_creature else base_creature.quality.name}"
-                ),
-                "detail_url": "",
-                "group_creature": creature_card,
-                "creature": creature,
-                "character_creature": character_creature,
-                "attributes": creature_attributes,
-                "vw": engine.vw(),
-                "gw": engine.gw(),
-                "sr": engine.sr(),
-                "potential": creature_potential if has_creature_kp else engine.size_class(),
-                "total_armor": engine.armor_totals().total_rs,
-                "initiative": engine.initiative(),
-                "initiative_with_load": engine.initiative(),
-                "initiative_display": format_modifier(engine.initiative()),
-                "initiative_with_load_display": format_modifier(engine.initiative()),
-                "load_penalty": 0,
-                "wound_stage": wound_stage,
-                "wound_penalty_display": format_modifier(wound_penalty),
-                "is_incapacitated": is_incapacitated,
-                "is_dead": is_dead,
-                "current_kp": creature_current_kp,
-                "max_kp": creature_kp_max,
-                "is_vampire": is_vampire,
-                "vampire_state": VAMPIRE_STATE_UI_LABELS.get(creature_card.vampire_state, creature_card.vampire_state) if is_vampire else "",
-                "animal_blood": vampire_resource.animal if vampire_resource else 0,
-                "vampire_age_cycle": vampire_rules.age_cycle() if is_vampire else 0,
-                "vampire_traits": (
-                    [
-                        {
-                            "name": entry.trait.name,
-                            "rank": entry.rank,
-                            "type": entry.trait.get_trait_type_display(),
-                        }
-                        for entry in vampire_rules.effective_traits(include_weaknesses=True)
-                    ] + [
-                        {"name": entry.power.name, "rank": 1, "type": "Power"}
-                        for entry in vampire_rules.effective_powers()
-                    ]
-                    if is_vampire
-                    else []
-                ),
-                "vampire_warnings": vampire_rules.warnings(),
-                "max_lp": max_lp,
-                "current_lp": max(0, max_lp - current_damage),
-                "stun_damage": stun_damage,
-                "lethal_damage": lethal_damage,
-                "stun_damage_percent": (
-                    f"{displayed_stun_damage / max_lp * 100:.4f}"
-                    if max_lp
-                    else "0"
-                ),
-                "lethal_damage_percent": (
-                    f"{displayed_lethal_damage / max_lp * 100:.4f}"
-                    if max_lp
-                    else "0"
-                ),
+
+def _character_screen_cards(request, group: GameGroup, memberships) -> list[dict]:
+    """Build the SL-screen card rows for member characters from one bulk engine load."""
+    memberships = list(memberships)
+    engines = load_character_engines(
+        [membership.character for membership in memberships],
+        runtime_attribute_adjustments={
+            membership.character_id: _temporary_attribute_adjustments(request, membership.character_id)
+            for membership in memberships
+        },
+    )
+    return [
+        _character_screen_card(request, group, membership, engines[membership.character_id])
+        for membership in memberships
+    ]
+
+
+def _character_screen_card(
+    request,
+    group: GameGroup,
+    membership: GameGroupMembership,
+    engine: CharacterEngine,
+) -> dict:
+    """Build the SL-screen card row for one active member character."""
+    character = membership.character
+    runtime_attribute_adjustments = engine.runtime_attribute_adjustments
+    thresholds = engine.wound_thresholds()
+    max_lp = max(thresholds, default=0)
+    stun_damage = max(0, int(character.current_stun_damage or 0))
+    lethal_damage = max(0, int(character.current_lethal_damage or 0))
+    displayed_stun_damage = min(stun_damage, max_lp)
+    displayed_lethal_damage = min(lethal_damage, max(0, max_lp - displayed_stun_damage))
+    from charsheet.engine.vampire_engine import VampireRules
+
+    character_vampire = VampireRules(character)
+    character_is_vampire = character_vampire.is_vampire()
+    character_blood = character_vampire.resource_state() if character_is_vampire else None
+    max_kp = character_blood.maximum if character_blood else max(0, int(engine.calculate_arcane_power()))
+    current_kp = (
+        character_blood.total
+        if character_blood
+        else min(max_kp, max(0, int(character.current_arcane_power or 0)))
+    )
+    initiative = int(engine.calculate_initiative())
+    armor_load_penalty = int(engine.load_penalty())
+    carry_state = ItemEngine.carry_state_for_character(character)
+    carry_penalty = int(carry_state["penalty"]) if character.carry_load_enabled else 0
+    load_penalty = armor_load_penalty + carry_penalty
+    wound_stage, _wound_stage_penalty = engine.current_wound_stage()
+    wound_penalty = engine.current_wound_penalty()
+    is_dead = wound_stage == "Tod"
+    is_incapacitated = engine.is_wound_incapacitated(wound_stage)
+    attributes = engine.attributes()
+    subtitle = character.race.name
+    if character_is_vampire:
+        subtitle += f" · Vampir · Alter {character_vampire.age_cycle()}"
+    if wound_stage != "-":
+        subtitle += f" · {wound_stage}"
+        if format_modifier(wound_penalty) != "0":
+            subtitle += f" ({format_modifier(wound_penalty)})"
+    return {
+        "card_kind": "character",
+        "card_id": f"character:{membership.id}",
+        "screen_card_url": reverse("group_screen_card", args=[group.id, "character", membership.id]),
+        "screen_position": membership.screen_position,
+        "screen_is_collapsed": membership.screen_is_collapsed,
+        "screen_state_url": reverse(
+            "set_group_membership_screen_state",
+            args=[group.id, membership.id],
+        ),
+        "kind_label": "Charakter",
+        "name": character.name,
+        "subtitle": subtitle,
+        "image": character.char_picture,
+        "fallback_letter": character.name[:1],
+        "potential_label": "Pot",
+        "resource_label": "BP" if character_is_vampire else "KP",
+        "show_arcane": True,
+        "footer_label": "Vollständigen Bogen öffnen",
+        "detail_url": reverse(
+            "game_master_character_sheet",
+            args=[group.id, character.id],
+        ),
+        "membership": membership,
+        "character": character,
+        "attributes": {
+            key: {
+                "value": value,
+                "modifier": format_modifier(engine.attribute_modifier(key)),
+                "runtime_adjustment": int(runtime_attribute_adjustments.get(key, 0)),
             }
-        )
+            for key, value in attributes.items()
+        },
+        "vw": engine.vw(),
+        "gw": engine.gw(),
+        "sr": engine.sr(),
+        "potential": character_blood.potential if character_blood else engine.calculate_potential(),
+        "total_armor": engine.get_grs(),
+        "initiative": initiative,
+        "initiative_with_load": initiative + load_penalty,
+        "initiative_display": format_modifier(initiative),
+        "initiative_with_load_display": format_modifier(
+            initiative + load_penalty
+        ),
+        "load_penalty": load_penalty,
+        "wound_stage": wound_stage,
+        "wound_penalty_display": format_modifier(wound_penalty),
+        "is_incapacitated": is_incapacitated,
+        "is_dead": is_dead,
+        "current_kp": current_kp,
+        "max_kp": max_kp,
+        "max_lp": max_lp,
+        "current_lp": max(0, max_lp - stun_damage - lethal_damage),
+        "stun_damage": stun_damage,
+        "lethal_damage": lethal_damage,
+        "aggravated_damage": int(character.current_aggravated_damage or 0),
+        "is_vampire": character_is_vampire,
+        "intelligent_blood": character_blood.intelligent if character_blood else 0,
+        "animal_blood": character_blood.animal if character_blood else 0,
+        "intelligent_blood_percent": (
+            f"{character_blood.intelligent / character_blood.maximum * 100:.4f}"
+            if character_blood and character_blood.maximum
+            else "0"
+        ),
+        "animal_blood_percent": (
+            f"{character_blood.animal / character_blood.maximum * 100:.4f}"
+            if character_blood and character_blood.maximum
+            else "0"
+        ),
+        "vampire_warnings": character_vampire.warnings(),
+        "stun_damage_percent": f"{displayed_stun_damage / max_lp * 100:.4f}" if max_lp else "0",
+        "lethal_damage_percent": f"{displayed_lethal_damage / max_lp * 100:.4f}" if max_lp else "0",
+        "runtime_attribute_adjustments": runtime_attribute_adjustments,
+    }
+
+
+def _creature_screen_card(
+    group: GameGroup,
+    creature_card: GameGroupCreature,
+    stat_block: dict | None = None,
+) -> dict:
+    """Build the SL-screen card row for one placed creature."""
+    creature = creature_card.creature
+    character_creature = creature_card.character_creature
+    creature_source = character_creature or creature
+    if stat_block is None:
+        stat_block = get_creature_stat_block(creature_source)
+    from charsheet.engine.vampire_engine import VampireRules
+
+    # The compiled stat block covers template and character-creature values;
+    # damage, KP and vampire state of the placed card are layered on per render.
+    vampire_rules = VampireRules(creature_card)
+    is_vampire = vampire_rules.is_vampire()
+    vampire_resource = vampire_rules.resource_state() if is_vampire else None
+    base_creature = CreatureEngine(creature_source).creature
+    wound_rows = stat_block["wound_rows"]
+    max_lp = wound_rows[-1]["threshold"] if wound_rows else 0
+    stun_damage = max(0, int(creature_card.current_stun_damage or 0))
+    lethal_damage = max(0, int(creature_card.current_lethal_damage or 0))
+    current_damage = stun_damage + lethal_damage
+    displayed_stun_damage = min(stun_damage, max_lp)
+    displayed_lethal_damage = min(
+        lethal_damage,
+        max(0, max_lp - displayed_stun_damage),
+    )
+    wound_stage = "-"
+    wound_penalty = 0
+    for wound_row in wound_rows:
+        if current_damage < int(wound_row["threshold"]):
+            break
+        wound_stage = wound_row["label"]
+        wound_penalty = int(wound_row["penalty"])
+    if max_lp and current_damage > max_lp:
+        if is_vampire:
+            wound_stage = VAMPIRE_STATE_UI_LABELS.get(creature_card.vampire_state, creature_card.vampire_state)
+        else:
+            wound_stage = "Tod"
+            wound_penalty = 0
+    is_dead = wound_stage == "Tod"
+    is_incapacitated = wound_stage in stat_block["incapacitating_wound_stages"]
+    subtitle_parts = []
+    if character_creature:
+        subtitle_parts.append(character_creature.owner.name)
+    if wound_stage != "-":
+        wound_status = wound_stage
+        if format_modifier(wound_penalty) != "0":
+            wound_status += f" ({format_modifier(wound_penalty)})"
+        subtitle_parts.append(wound_status)
+    subtitle = " · ".join(subtitle_parts)
+    movement = stat_block["movement_display"]
+    movement_values = [
+        movement.get(key)
+        for key in ("combat", "march", "sprint")
+        if movement.get(key) not in (None, "")
+    ]
+    creature_kp = vampire_resource.maximum if vampire_resource else stat_block["kp"]
+    creature_potential = vampire_resource.potential if vampire_resource else stat_block["potential"]
+    has_creature_kp = creature_kp is not None
+    creature_kp_max = max(0, int(creature_kp or 0))
+    creature_current_kp = (
+        vampire_resource.intelligent
+        if vampire_resource
+        else creature_kp_max
+        if creature_card.current_kp is None
+        else max(0, min(creature_kp_max, int(creature_card.current_kp)))
+    )
+    return {
+        "card_kind": "creature",
+        "card_id": f"creature:{creature_card.id}",
+        "screen_card_url": reverse("group_screen_card", args=[group.id, "creature", creature_card.id]),
+        "screen_position": creature_card.screen_position,
+        "screen_is_collapsed": creature_card.screen_is_collapsed,
+        "screen_state_url": reverse(
+            "set_group_creature_screen_state",
+            args=[group.id, creature_card.id],
+        ),
+        "kind_label": (
+            character_creature.source_binding.choice_label
+            if character_creature
+            and character_creature.source_binding
+            and character_creature.source_binding.choice_label
+            else "Kreatur"
+        ),
+        "name": creature_source.display_name,
+        "subtitle": subtitle,
+        "image": creature_source.image,
+        "fallback_letter": creature_source.display_name[:1],
+        "potential_label": "Pot" if has_creature_kp else "GK",
+        "show_arcane": has_creature_kp,
+        "resource_label": "BP" if is_vampire or stat_block["has_bp"] else "KP",
+        "secondary_status_label": "Bewegung",
+        "secondary_status_value": " / ".join(movement_values) or "–",
+        "creature_damage_rows": (
+            ("B", stun_damage),
+            ("T", lethal_damage),
+            *((("S", int(creature_card.current_aggravated_damage or 0)),) if is_vampire else ()),
+        ),
+        "footer_label": (
+            base_creature.organization.strip()
+            or f"Kreatur · {character_creature.quality.name if character_creature else base_creature.quality.name}"
+        ),
+        "detail_url": "",
+        "group_creature": creature_card,
+        "creature": creature,
+        "character_creature": character_creature,
+        "attributes": stat_block["attributes"],
+        "vw": stat_block["vw"],
+        "gw": stat_block["gw"],
+        "sr": stat_block["sr"],
+        "potential": creature_potential if has_creature_kp else stat_block["size_class"],
+        "total_armor": stat_block["total_armor"],
+        "initiative": stat_block["initiative"],
+        "initiative_with_load": stat_block["initiative"],
+        "initiative_display": stat_block["initiative_display"],
+        "initiative_with_load_display": stat_block["initiative_display"],
+        "load_penalty": 0,
+        "wound_stage": wound_stage,
+        "wound_penalty_display": format_modifier(wound_penalty),
+        "is_incapacitated": is_incapacitated,
+        "is_dead": is_dead,
+        "current_kp": creature_current_kp,
+        "max_kp": creature_kp_max,
+        "is_vampire": is_vampire,
+        "vampire_state": VAMPIRE_STATE_UI_LABELS.get(creature_card.vampire_state, creature_card.vampire_state) if is_vampire else "",
+        "animal_blood": vampire_resource.animal if vampire_resource else 0,
+        "vampire_age_cycle": vampire_rules.age_cycle() if is_vampire else 0,
+        "vampire_traits": (
+            [
+                {
+                    "name": entry.trait.name,
+                    "rank": entry.rank,
+                    "type": entry.trait.get_trait_type_display(),
+                }
+                for entry in vampire_rules.effective_traits(include_weaknesses=True)
+            ] + [
+                {"name": entry.power.name, "rank": 1, "type": "Power"}
+                for entry in vampire_rules.effective_powers()
+            ]
+            if is_vampire
+            else []
+        ),
+        "vampire_warnings": vampire_rules.warnings(),
+        "max_lp": max_lp,
+        "current_lp": max(0, max_lp - current_damage),
+        "stun_damage": stun_damage,
+        "lethal_damage": lethal_damage,
+        "stun_damage_percent": (
+            f"{displayed_stun_damage / max_lp * 100:.4f}"
+            if max_lp
+            else "0"
+        ),
+        "lethal_damage_percent": (
+            f"{displayed_lethal_damage / max_lp * 100:.4f}"
+            if max_lp
+            else "0"
+        ),
+    }
+
+
+@login_required
+@require_GET
+def game_master_screen(request, group_id: int):
+    group = get_object_or_404(GameGroup, pk=group_id)
+    require_game_master(request.user, group)
+    memberships = _screen_membership_queryset(group)
+    roster = _character_screen_cards(request, group, memberships)
+    creature_cards = list(_screen_creature_queryset(group))
+    stat_blocks = get_creature_stat_blocks(
+        creature_card.character_creature or creature_card.creature for creature_card in creature_cards
+    )
+    roster.extend(
+        _creature_screen_card(group, creature_card, stat_block)
+        for creature_card, stat_block in zip(creature_cards, stat_blocks)
+    )
     roster.sort(
         key=lambda row: (
             row["screen_position"] is None,
@@ -836,33 +892,12 @@ def game_master_screen(request, group_id: int):
         inventory_item.sl_pending_transfer = pending_transfer_by_item_id.get(
             inventory_item.id
         )
-    screen_state_signature = "|".join(
-        [
-            ",".join(str(transfer.id) for transfer in pending_transfers),
-            ";".join(
-                f"{row['character'].id}:{row['character'].current_stun_damage}:"
-                f"{row['character'].current_lethal_damage}:"
-                f"{row['character'].current_arcane_power}:"
-                f"{row['character'].vampire_intelligent_blood}:"
-                f"{row['character'].vampire_animal_blood}:"
-                f"{row['load_penalty']}:{row['total_armor']}:"
-                f"{int(row['character'].carry_load_enabled)}:"
-                + ",".join(
-                    f"{key}={value}"
-                    for key, value in sorted(row["runtime_attribute_adjustments"].items())
-                )
-                for row in roster
-                if row["card_kind"] == "character"
-            ),
-        ]
-    )
     inventory_row = {
         "group": group,
         "memberships": list(memberships),
         "inventory_items": inventory_items,
-        "catalog_items": list(Item.objects.filter(catalog_group=group).order_by("name")),
+        "catalog_items": get_group_catalog_items(group.id),
         "pending_transfers": pending_transfers,
-        "screen_state_signature": screen_state_signature,
     }
     all_data_tables = list(
         GameGroupTable.objects.filter(
@@ -930,6 +965,7 @@ def game_master_screen(request, group_id: int):
         {
             "group": group,
             "roster": roster,
+            "screen_change_cursor": _prune_screen_changes(group),
             "character_count": len(memberships),
             "creature_count": len(creature_cards),
             "creature_options": (
@@ -1051,8 +1087,7 @@ def add_group_creature(request, group_id: int):
             for value in (membership_position, creature_position, -1)
             if value is not None
         )
-        source_engine = CreatureEngine(character_creature or creature)
-        creature_kp = source_engine.bp() if source_engine.creature.has_bp else source_engine.kp()
+        creature_kp = get_creature_stat_block(character_creature or creature)["kp"]
         source_actor = character_creature or creature
         from charsheet.engine.vampire_engine import VampireRules
         from charsheet.models import (
@@ -1146,10 +1181,10 @@ def delete_group_creature(request, group_id: int, creature_card_id: int):
 
 def _group_creature_vital_payload(
     creature_card: GameGroupCreature,
-    engine: CreatureEngine,
+    stat_block: dict,
 ) -> dict:
     """Return the complete client-side state after a creature damage change."""
-    wound_rows = engine.wound_rows()
+    wound_rows = stat_block["wound_rows"]
     max_lp = int(wound_rows[-1]["threshold"]) if wound_rows else 0
     stun_damage = max(0, int(creature_card.current_stun_damage or 0))
     lethal_damage = max(0, int(creature_card.current_lethal_damage or 0))
@@ -1198,7 +1233,7 @@ def _group_creature_vital_payload(
         ),
         "subtitle": " · ".join(subtitle_parts),
         "is_dead": wound_stage == "Tod",
-        "is_incapacitated": engine.is_wound_incapacitated(wound_stage),
+        "is_incapacitated": wound_stage in stat_block["incapacitating_wound_stages"],
     }
 
 
@@ -1228,9 +1263,8 @@ def adjust_group_creature_damage(request, group_id: int, creature_card_id: int):
             amount = max(1, int(request.POST.get("amount", "1")))
         except (TypeError, ValueError):
             amount = 1
-        wound_rows = CreatureEngine(
-            creature_card.character_creature or creature_card.creature
-        ).wound_rows()
+        stat_block = get_creature_stat_block(creature_card.character_creature or creature_card.creature)
+        wound_rows = stat_block["wound_rows"]
         max_lp = int(wound_rows[-1]["threshold"]) if wound_rows else 0
         if damage_type in {"B", "T", "S"} and action in {"damage", "heal"}:
             creature_card.adjust_damage(
@@ -1249,12 +1283,7 @@ def adjust_group_creature_damage(request, group_id: int, creature_card_id: int):
             )
             if VampireRules(creature_card).is_vampire():
                 VampireRules(creature_card).evaluate_life_state()
-        payload = _group_creature_vital_payload(
-            creature_card,
-            CreatureEngine(
-                creature_card.character_creature or creature_card.creature
-            ),
-        )
+        payload = _group_creature_vital_payload(creature_card, stat_block)
 
     if _request_wants_json(request):
         return JsonResponse(payload)
@@ -1291,10 +1320,7 @@ def adjust_group_creature_kp(request, group_id: int, creature_card_id: int):
             maximum = blood.maximum
             current_kp = blood.intelligent
         else:
-            source_engine = CreatureEngine(
-                creature_card.character_creature or creature_card.creature
-            )
-            maximum = source_engine.bp() if source_engine.creature.has_bp else source_engine.kp()
+            maximum = get_creature_stat_block(creature_card.character_creature or creature_card.creature)["kp"]
         if maximum is not None:
             try:
                 amount = max(1, int(request.POST.get("amount", "1")))
@@ -1690,28 +1716,43 @@ def _require_table_owner(user, data_table: GameGroupTable):
 def _prepare_data_table_for_render(data_table: GameGroupTable):
     data_table.render_columns = list(data_table.columns.all())
     data_table.render_rows = list(data_table.rows.all())
+    cells_by_row = {
+        data_row.id: list(data_row.cells.all())
+        for data_row in data_table.render_rows
+    }
+    layout = data_table.layout
+    if not layout_matches(
+        layout,
+        data_table.revision,
+        data_table.render_columns,
+        data_table.render_rows,
+        cells_by_row,
+    ):
+        layout = store_table_layout(
+            data_table,
+            data_table.render_columns,
+            data_table.render_rows,
+            cells_by_row,
+        )
     data_table.has_custom_column_widths = any(
         column.width is not None
         for column in data_table.render_columns
     )
+    column_widths = {
+        column_id: (preview_width, editor_width)
+        for column_id, preview_width, editor_width in layout["columns"]
+    }
     for column in data_table.render_columns:
-        column.render_preview_width = column.width or 140
-        column.render_editor_width = max(column.width or 180, 180)
+        (
+            column.render_preview_width,
+            column.render_editor_width,
+        ) = column_widths[column.id]
         (
             column.render_heading,
             column.render_heading_title,
         ) = _table_column_heading_parts(column.heading)
-    data_table.render_preview_table_width = sum(
-        column.render_preview_width
-        for column in data_table.render_columns
-    )
-    data_table.render_editor_table_width = (
-        sum(
-            column.render_editor_width
-            for column in data_table.render_columns
-        )
-        + 92
-    )
+    data_table.render_preview_table_width = layout["preview_width"]
+    data_table.render_editor_table_width = layout["editor_width"]
     data_table.render_automatic_editor_width = max(
         1,
         data_table.render_editor_table_width + 2,
@@ -1726,62 +1767,31 @@ def _prepare_data_table_for_render(data_table: GameGroupTable):
     data_table.render_editor_width = (
         data_table.window_width or data_table.render_automatic_editor_width
     )
-    occupied_coordinates = set()
     for data_row in data_table.render_rows:
         cells_by_column = {
             cell.column_id: cell
-            for cell in data_row.cells.all()
+            for cell in cells_by_row[data_row.id]
         }
         data_row.render_cells = [
             cells_by_column.get(column.id)
             for column in data_table.render_columns
         ]
-    for row_index, data_row in enumerate(data_table.render_rows):
         data_row.render_display_cells = []
-        for column_index, cell in enumerate(data_row.render_cells):
+        for cell in data_row.render_cells:
             if cell is None:
                 continue
-            cell.render_row_index = row_index
-            cell.render_column_index = column_index
-            cell.render_is_covered = (
-                row_index,
-                column_index,
-            ) in occupied_coordinates
+            (
+                cell.render_row_index,
+                cell.render_column_index,
+                row_span,
+                column_span,
+            ) = layout["cells"][str(cell.id)]
+            cell.render_is_covered = row_span == 0
             if cell.render_is_covered:
                 continue
-            row_span = min(
-                max(1, int(cell.row_span or 1)),
-                len(data_table.render_rows) - row_index,
-            )
-            column_span = min(
-                max(1, int(cell.column_span or 1)),
-                len(data_table.render_columns) - column_index,
-            )
-            while any(
-                (covered_row, covered_column) in occupied_coordinates
-                for covered_row in range(row_index, row_index + row_span)
-                for covered_column in range(
-                    column_index,
-                    column_index + column_span,
-                )
-            ):
-                if column_span > 1:
-                    column_span -= 1
-                elif row_span > 1:
-                    row_span -= 1
-                else:
-                    break
             cell.render_row_span = row_span
             cell.render_column_span = column_span
             data_row.render_display_cells.append(cell)
-            occupied_coordinates.update(
-                (covered_row, covered_column)
-                for covered_row in range(row_index, row_index + row_span)
-                for covered_column in range(
-                    column_index,
-                    column_index + column_span,
-                )
-            )
     return data_table
 
 
@@ -1883,14 +1893,55 @@ def _parse_markdown_table(raw_markdown: str) -> tuple[list[str], list[list[str]]
     return normalized_headings, rows
 
 
+def _renumber_table_positions(model, ordered_objects: list) -> bool:
+    """Give ordered rows or columns the positions 0..n-1 with two bulk updates."""
+    changed = [
+        candidate
+        for position, candidate in enumerate(ordered_objects)
+        if candidate.position != position
+    ]
+    if not changed:
+        return False
+    # Park the moved entries above every used position first, so the unique
+    # (table, position) constraint never sees two entries on one slot.
+    parking_position = max(candidate.position for candidate in ordered_objects) + 1
+    for offset, candidate in enumerate(changed):
+        candidate.position = parking_position + offset
+    model.objects.bulk_update(changed, ["position"])
+    for position, candidate in enumerate(ordered_objects):
+        candidate.position = position
+    model.objects.bulk_update(changed, ["position"])
+    return True
+
+
 def _replace_group_table_from_markdown(
     data_table: GameGroupTable,
     raw_markdown: str,
 ) -> None:
     headings, imported_rows = _parse_markdown_table(raw_markdown)
-    data_table.rows.all().delete()
-    data_table.columns.all().delete()
-    columns = GameGroupTableColumn.objects.bulk_create(
+    # Reuse the existing rows, columns and cells in place and only create or
+    # delete the difference in size.
+    columns = list(data_table.columns.order_by("position", "id"))
+    rows = list(data_table.rows.order_by("position", "id"))
+    GameGroupTableColumn.objects.filter(
+        pk__in=[column.pk for column in columns[len(headings):]]
+    ).delete()
+    GameGroupTableRow.objects.filter(
+        pk__in=[row.pk for row in rows[len(imported_rows):]]
+    ).delete()
+    columns = columns[:len(headings)]
+    rows = rows[:len(imported_rows)]
+    existing_cells = {
+        (cell.row_id, cell.column_id): cell
+        for cell in GameGroupTableCell.objects.filter(row__in=rows, column__in=columns)
+    }
+    _renumber_table_positions(GameGroupTableColumn, columns)
+    _renumber_table_positions(GameGroupTableRow, rows)
+    for column in columns:
+        column.heading = headings[column.position]
+        column.width = None
+    GameGroupTableColumn.objects.bulk_update(columns, ["heading", "width"])
+    columns += GameGroupTableColumn.objects.bulk_create(
         [
             GameGroupTableColumn(
                 table=data_table,
@@ -1898,25 +1949,35 @@ def _replace_group_table_from_markdown(
                 position=position,
             )
             for position, heading in enumerate(headings)
+            if position >= len(columns)
         ]
     )
-    rows = GameGroupTableRow.objects.bulk_create(
+    rows += GameGroupTableRow.objects.bulk_create(
         [
             GameGroupTableRow(table=data_table, position=position)
-            for position in range(len(imported_rows))
-        ]
-    )
-    GameGroupTableCell.objects.bulk_create(
-        [
-            GameGroupTableCell(
-                row=row,
-                column=column,
-                text_value=imported_rows[row_index][column_index],
-            )
-            for row_index, row in enumerate(rows)
-            for column_index, column in enumerate(columns)
+            for position in range(len(rows), len(imported_rows))
         ]
     )
+    changed_cells = []
+    new_cells = []
+    for row_index, row in enumerate(rows):
+        for column_index, column in enumerate(columns):
+            cell = existing_cells.get((row.id, column.id))
+            if cell is None:
+                new_cells.append(
+                    GameGroupTableCell(
+                        row=row,
+                        column=column,
+                        text_value=imported_rows[row_index][column_index],
+                    )
+                )
+                continue
+            for field_name in TABLE_CELL_CONTENT_FIELDS:
+                setattr(cell, field_name, GameGroupTableCell._meta.get_field(field_name).get_default())
+            cell.text_value = imported_rows[row_index][column_index]
+            changed_cells.append(cell)
+    GameGroupTableCell.objects.bulk_update(changed_cells, TABLE_CELL_CONTENT_FIELDS)
+    GameGroupTableCell.objects.bulk_create(new_cells)
 
 
 def _optional_bounded_table_width(raw_value) -> int | None:
@@ -1955,6 +2016,175 @@ def _bounded_cell_span(raw_value) -> int:
     return max(1, min(value, 20))
 
 
+def _validate_table_cell(cell: GameGroupTableCell) -> None:
+    """Validate one edited cell without the per-cell uniqueness queries of full_clean."""
+    try:
+        cell.full_clean(
+            exclude=["row", "column"],
+            validate_unique=False,
+            validate_constraints=False,
+        )
+    except ValidationError as exc:
+        raise GroupError("invalid_table_cell", "Ein Tabellenwert ist ungültig.") from exc
+
+
+def _bump_table_revision(data_table: GameGroupTable) -> int:
+    """Advance the revision that concurrent editors compare before patching."""
+    GameGroupTable.objects.filter(pk=data_table.pk).update(
+        revision=F("revision") + 1,
+        updated_at=timezone.now(),
+    )
+    data_table.refresh_from_db(fields=["revision", "updated_at"])
+    refresh_table_layout(data_table)
+    return data_table.revision
+
+
+def _table_patch_entries(payload: dict, key: str) -> list[dict]:
+    entries = payload.get(key) or []
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise GroupError("invalid_table_patch", "Die Tabellenänderung ist ungültig.")
+    return entries
+
+
+def _table_patch_id(raw_value) -> int | None:
+    try:
+        return int(raw_value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _apply_group_table_patch(data_table: GameGroupTable, payload: dict) -> bool:
+    """Validate one editor delta completely, then write it with bulk queries."""
+    columns = {column.id: column for column in data_table.columns.all()}
+    rows = list(data_table.rows.all())
+    rows_by_id = {row.id: row for row in rows}
+    cells = {
+        (cell.row_id, cell.column_id): cell
+        for cell in GameGroupTableCell.objects.filter(row__table=data_table)
+    }
+
+    table_fields = []
+    if "title" in payload:
+        data_table.title = _normalized_table_title(payload.get("title"))
+        table_fields.append("title")
+    if "is_shared" in payload:
+        data_table.is_shared = bool(payload.get("is_shared"))
+        table_fields.append("is_shared")
+    if "window_width" in payload:
+        data_table.window_width = _optional_bounded_table_width(payload.get("window_width"))
+        table_fields.append("window_width")
+
+    changed_columns = {}
+    for entry in _table_patch_entries(payload, "columns"):
+        column = columns.get(_table_patch_id(entry.get("id")))
+        if column is None:
+            raise GroupError("invalid_table_column", "Die Tabellenspalte ist ungültig.")
+        if "heading" in entry:
+            heading = " ".join(str(entry.get("heading") or "").split())[:100]
+            column.heading = heading or f"Spalte {column.position + 1}"
+        if "width" in entry:
+            column.width = _optional_bounded_column_width(entry.get("width"))
+        column.full_clean(exclude=["table"], validate_unique=False, validate_constraints=False)
+        changed_columns[column.id] = column
+
+    valid_alignments = set(GameGroupTableCell.Alignment.values)
+    changed_cells = {}
+    new_cells = {}
+    for entry in _table_patch_entries(payload, "cells"):
+        key = (_table_patch_id(entry.get("row")), _table_patch_id(entry.get("column")))
+        if key[0] not in rows_by_id or key[1] not in columns:
+            raise GroupError("invalid_table_cell", "Die Tabellenzelle wurde nicht gefunden.")
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = new_cells[key] = GameGroupTableCell()
+        elif cell.pk not in changed_cells:
+            changed_cells[cell.pk] = cell
+        cell.row, cell.column = rows_by_id[key[0]], columns[key[1]]
+        if "value" in entry:
+            _set_table_cell_value(cell, str(entry.get("value") or "").strip())
+        if "alignment" in entry:
+            cell.alignment = (
+                entry["alignment"]
+                if entry["alignment"] in valid_alignments
+                else GameGroupTableCell.Alignment.LEFT
+            )
+        if "row_span" in entry:
+            cell.row_span = _bounded_cell_span(entry.get("row_span"))
+        if "column_span" in entry:
+            cell.column_span = _bounded_cell_span(entry.get("column_span"))
+        _validate_table_cell(cell)
+
+    row_moves = _table_patch_entries(payload, "row_moves")
+    ordered_rows = list(rows)
+    for entry in row_moves:
+        row_id = _table_patch_id(entry.get("row"))
+        target_index = _table_patch_id(entry.get("position"))
+        row_index = next(
+            (index for index, candidate in enumerate(ordered_rows) if candidate.id == row_id),
+            None,
+        )
+        if row_index is None or target_index is None:
+            raise GroupError("invalid_table_row", "Die Tabellenzeile wurde nicht gefunden.")
+        ordered_rows.insert(
+            max(0, min(target_index, len(ordered_rows) - 1)),
+            ordered_rows.pop(row_index),
+        )
+
+    if table_fields:
+        data_table.full_clean()
+        data_table.save(update_fields=[*table_fields, "updated_at"])
+    GameGroupTableColumn.objects.bulk_update(changed_columns.values(), ["heading", "width"])
+    GameGroupTableCell.objects.bulk_update(changed_cells.values(), TABLE_CELL_CONTENT_FIELDS)
+    GameGroupTableCell.objects.bulk_create(new_cells.values())
+    rows_moved = bool(row_moves) and _renumber_table_positions(GameGroupTableRow, ordered_rows)
+    return bool(table_fields or changed_columns or changed_cells or new_cells or rows_moved)
+
+
+def _set_table_cell_value(cell: GameGroupTableCell, raw_value: str) -> None:
+    """Store one editor input as a number or as text on the cell."""
+    number_match = (
+        re.fullmatch(
+            r"([+-]?)(\d+(?:[.,]\d+)?)\s*(.*)",
+            raw_value,
+        )
+        if raw_value
+        else None
+    )
+    # A bare number followed by words is usually ordinary table
+    # text (for example, "1 Zusatzaktion"), not a numeric value
+    # with a suffix.  Require an explicit sign for that suffix
+    # form; plain numbers and signed values remain numeric.
+    if (
+        number_match
+        and number_match.group(3).strip()
+        and not number_match.group(1)
+    ):
+        number_match = None
+    if number_match:
+        try:
+            cell.number_value = Decimal(
+                f"{number_match.group(1)}{number_match.group(2)}".replace(
+                    ",",
+                    ".",
+                )
+            )
+        except InvalidOperation as exc:
+            raise GroupError(
+                "invalid_table_number",
+                f"„{raw_value}“ ist keine gültige Zahl.",
+            ) from exc
+        cell.value_type = GameGroupTableCell.ValueType.NUMBER
+        cell.text_value = ""
+        cell.number_show_plus = number_match.group(1) == "+"
+        cell.number_suffix = number_match.group(3).strip()[:100]
+    else:
+        cell.value_type = GameGroupTableCell.ValueType.TEXT
+        cell.text_value = raw_value
+        cell.number_value = None
+        cell.number_show_plus = False
+        cell.number_suffix = ""
+
+
 @login_required
 @require_POST
 @_group_action
@@ -1997,6 +2227,7 @@ def create_group_table(request, group_id: int):
                 for column in columns
             ]
         )
+        refresh_table_layout(data_table)
     return _table_screen_redirect(group_id)
 
 
@@ -2189,6 +2420,7 @@ def update_group_table(request, group_id: int, table_id: int):
                 data_table,
                 request.POST.get("markdown_table", ""),
             )
+            _bump_table_revision(data_table)
             return _table_screen_redirect(
                 group_id,
                 edit_table_id=data_table.id,
@@ -2197,7 +2429,6 @@ def update_group_table(request, group_id: int, table_id: int):
         columns = list(data_table.columns.all())
         rows = list(data_table.rows.all())
         for column in columns:
-            update_fields = ["heading"]
             heading = " ".join(
                 str(request.POST.get(f"column_{column.id}_heading", "")).split()
             )[:100]
@@ -2207,9 +2438,12 @@ def update_group_table(request, group_id: int, table_id: int):
                 column.width = _optional_bounded_column_width(
                     request.POST.get(width_field_name)
                 )
-                update_fields.append("width")
-            column.full_clean()
-            column.save(update_fields=update_fields)
+            column.full_clean(
+                exclude=["table"],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        GameGroupTableColumn.objects.bulk_update(columns, ["heading", "width"])
 
         existing_cells = {
             (cell.row_id, cell.column_id): cell
@@ -2218,11 +2452,16 @@ def update_group_table(request, group_id: int, table_id: int):
                 column__table=data_table,
             )
         }
+        changed_cells = []
+        new_cells = []
         for row in rows:
             for column in columns:
                 cell = existing_cells.get((row.id, column.id))
                 if cell is None:
                     cell = GameGroupTableCell(row=row, column=column)
+                else:
+                    # Reuse the loaded row and column for the table check in clean().
+                    cell.row, cell.column = row, column
                 field_prefix = f"cell_{row.id}_{column.id}"
                 if (
                     f"{field_prefix}_alignment" not in request.POST
@@ -2250,52 +2489,11 @@ def update_group_table(request, group_id: int, table_id: int):
                 cell.column_span = _bounded_cell_span(
                     request.POST.get(f"{field_prefix}_colspan")
                 )
-                number_match = (
-                    re.fullmatch(
-                        r"([+-]?)(\d+(?:[.,]\d+)?)\s*(.*)",
-                        raw_value,
-                    )
-                    if raw_value
-                    else None
-                )
-                # A bare number followed by words is usually ordinary table
-                # text (for example, "1 Zusatzaktion"), not a numeric value
-                # with a suffix.  Require an explicit sign for that suffix
-                # form; plain numbers and signed values remain numeric.
-                if (
-                    number_match
-                    and number_match.group(3).strip()
-                    and not number_match.group(1)
-                ):
-                    number_match = None
-                if number_match:
-                    try:
-                        cell.number_value = Decimal(
-                            f"{number_match.group(1)}{number_match.group(2)}".replace(
-                                ",",
-                                ".",
-                            )
-                        )
-                    except InvalidOperation as exc:
-                        raise GroupError(
-                            "invalid_table_number",
-                            f"„{raw_value}“ ist keine gültige Zahl.",
-                        ) from exc
-                    cell.value_type = GameGroupTableCell.ValueType.NUMBER
-                    cell.text_value = ""
-                    cell.number_show_plus = number_match.group(1) == "+"
-                    cell.number_suffix = number_match.group(3).strip()[:100]
-                else:
-                    cell.value_type = GameGroupTableCell.ValueType.TEXT
-                    cell.text_value = raw_value
-                    cell.number_value = None
-                    cell.number_show_plus = False
-                    cell.number_suffix = ""
-                try:
-                    cell.full_clean()
-                except ValidationError as exc:
-                    raise GroupError("invalid_table_cell", "Ein Tabellenwert ist ungültig.") from exc
-                cell.save()
+                _set_table_cell_value(cell, raw_value)
+                _validate_table_cell(cell)
+                (new_cells if cell.pk is None else changed_cells).append(cell)
+        GameGroupTableCell.objects.bulk_update(changed_cells, TABLE_CELL_CONTENT_FIELDS)
+        GameGroupTableCell.objects.bulk_create(new_cells)
         if table_action == "add_row":
             if data_table.rows.count() >= 20:
                 raise GroupError("table_row_limit", "Eine Tabelle kann höchstens 20 Zeilen enthalten.")
@@ -2370,12 +2568,40 @@ def update_group_table(request, group_id: int, table_id: int):
                 target_row.save(update_fields=["position"])
                 moving_row.position = target_position
                 moving_row.save(update_fields=["position"])
+        _bump_table_revision(data_table)
     return _table_screen_redirect(
         group_id,
         edit_table_id=data_table.id if table_action else None,
     )
 
 
+@login_required
+@require_POST
+@_group_action
+def patch_group_table(request, group_id: int, table_id: int):
+    payload = _read_json_payload(request)
+    with transaction.atomic():
+        group = GameGroup.objects.select_for_update().get(pk=group_id)
+        require_game_master(request.user, group, write=True)
+        data_table = get_object_or_404(
+            GameGroupTable.objects.select_for_update(),
+            pk=table_id,
+        )
+        _require_table_owner(request.user, data_table)
+        if _table_patch_id(payload.get("revision")) != data_table.revision:
+            return JsonResponse(
+                {
+                    "ok": False,
+                    "error": "Die Tabelle wurde inzwischen geändert. Bitte neu laden.",
+                    "revision": data_table.revision,
+                },
+                status=409,
+            )
+        if _apply_group_table_patch(data_table, payload):
+            _bump_table_revision(data_table)
+    return JsonResponse({"ok": True, "revision": data_table.revision})
+
+
 @login_required
 @require_POST
 def update_group_table_layout(request, group_id: int, table_id: int):
@@ -2458,6 +2684,7 @@ def add_group_table_row(request, group_id: int, table_id: int):
                 for column in data_table.columns.all()
             ]
         )
+        _bump_table_revision(data_table)
     return _table_screen_redirect(group_id, edit_table_id=data_table.id)
 
 
@@ -2485,6 +2712,7 @@ def add_group_table_column(request, group_id: int, table_id: int):
                 for row in data_table.rows.all()
             ]
         )
+        _bump_table_revision(data_table)
     return _table_screen_redirect(group_id, edit_table_id=data_table.id)
 
 
@@ -2501,6 +2729,7 @@ def delete_group_table_row(request, group_id: int, table_id: int, row_id: int):
             raise GroupError("last_table_row", "Eine Tabelle benötigt mindestens eine Zeile.")
         row = get_object_or_404(GameGroupTableRow, pk=row_id, table=data_table)
         row.delete()
+        _bump_table_revision(data_table)
     return _table_screen_redirect(group_id, edit_table_id=data_table.id)
 
 
@@ -2517,6 +2746,7 @@ def delete_group_table_column(request, group_id: int, table_id: int, column_id:
             raise GroupError("last_table_column", "Eine Tabelle benötigt mindestens eine Spalte.")
         column = get_object_or_404(GameGroupTableColumn, pk=column_id, table=data_table)
         column.delete()
+        _bump_table_revision(data_table)
     return _table_screen_redirect(group_id, edit_table_id=data_table.id)
 
 
@@ -2587,68 +2817,106 @@ def hide_group_note(request, group_id: int):
     return _table_screen_redirect(group_id)
 
 
+def _delete_expired_screen_changes(group: GameGroup) -> None:
+    """Drop change-log entries older than the retention window."""
+    group.screen_changes.filter(
+        created_at__lt=timezone.now() - timedelta(seconds=GROUP_SCREEN_CHANGE_RETENTION_SECONDS)
+    ).delete()
+
+
+def _prune_screen_changes(group: GameGroup) -> int:
+    """Drop expired change-log entries and return the group's current cursor."""
+    _delete_expired_screen_changes(group)
+    return group.screen_changes.aggregate(cursor=Max("id"))["cursor"] or 0
+
+
+def _prune_screen_changes_if_due(group: GameGroup) -> None:
+    """Drop expired change-log entries unless another poll did so within the prune interval."""
+    if cache.add(
+        f"charsheet:screen-changes:pruned:{group.pk}",
+        1,
+        timeout=GROUP_SCREEN_CHANGE_PRUNE_INTERVAL_SECONDS,
+    ):
+        _delete_expired_screen_changes(group)
+
+
+def _screen_change_cursor_expired(group: GameGroup, cursor: int) -> bool:
+    """Return whether the entry a cursor points at, and maybe later ones, were already pruned."""
+    if not cursor:
+        return False
+    # Cursors are ids of this group's entries, so a cursor below the oldest
+    # retained entry has lost rows that the screen never saw.
+    oldest = group.screen_changes.aggregate(oldest=Min("id"))["oldest"]
+    return oldest is None or cursor < oldest
+
+
+def _screen_change_payload(group: GameGroup, cursor: int, changes: list[tuple[int, str, int | None]]) -> dict:
+    """Translate raw change-log rows into card ids the SL screen can refresh in place."""
+    reload = len(changes) >= GROUP_SCREEN_CHANGE_BATCH_SIZE
+    character_ids: set[int] = set()
+    card_ids: set[str] = set()
+    for _change_id, kind, object_id in changes:
+        if kind == GameGroupScreenChange.Kind.CHARACTER:
+            character_ids.add(object_id)
+        elif kind == GameGroupScreenChange.Kind.CREATURE:
+            card_ids.add(f"creature:{object_id}")
+        else:
+            reload = True
+    if character_ids and not reload:
+        card_ids.update(
+            f"character:{membership_id}"
+            for membership_id in _screen_membership_queryset(group)
+            .filter(character_id__in=character_ids)
+            .values_list("id", flat=True)
+        )
+    return {
+        "cursor": max((change[0] for change in changes), default=cursor),
+        "cards": [] if reload else sorted(card_ids),
+        "reload": reload,
+    }
+
+
 @login_required
 @require_GET
-def group_inventory_transfer_state(request, group_id: int):
+def group_screen_changes(request, group_id: int):
+    """Long-poll the group's change log until new entries arrive or the wait times out."""
     group = get_object_or_404(GameGroup, pk=group_id)
     require_game_master(request.user, group)
-    pending_ids = list(
-        ItemTransfer.objects.filter(
-            sender_group=group,
-            status=ItemTransfer.Status.PENDING,
-        )
-        .order_by("-created_at")
-        .values_list("id", flat=True)
-    )
-    active_memberships = GameGroupMembership.objects.filter(
-        group=group,
-        status=GameGroupMembership.Status.ACTIVE,
-        character__is_archived=False,
-    ).select_related("character").order_by(
-        F("screen_position").asc(nulls_last=True),
-        "character__name",
-        "id",
-    )
-    character_states = []
-    for membership in active_memberships:
-        character = membership.character
-        runtime_attribute_adjustments = _temporary_attribute_adjustments(request, character.pk)
-        engine = character.get_engine(
-            refresh=True,
-            runtime_attribute_adjustments=runtime_attribute_adjustments,
-        )
-        character_states.append(
-            (
-                character.id,
-                character.current_stun_damage,
-                character.current_lethal_damage,
-                character.current_arcane_power,
-                character.vampire_intelligent_blood,
-                character.vampire_animal_blood,
-                int(engine.load_penalty())
-                + (
-                    int(ItemEngine.carry_state_for_character(character)["penalty"])
-                    if character.carry_load_enabled
-                    else 0
-                ),
-                engine.get_grs(),
-                int(character.carry_load_enabled),
-                ",".join(
-                    f"{key}={value}"
-                    for key, value in sorted(runtime_attribute_adjustments.items())
-                ),
-            )
-        )
-    return JsonResponse(
-        {
-            "signature": "|".join(
-                [
-                    ",".join(str(transfer_id) for transfer_id in pending_ids),
-                    ";".join(":".join(str(value) for value in row) for row in character_states),
-                ]
-            )
-        }
-    )
+    try:
+        cursor = max(0, int(request.GET.get("after") or 0))
+    except (TypeError, ValueError):
+        cursor = 0
+    # Open screens poll for hours without re-rendering, so the polls prune too.
+    _prune_screen_changes_if_due(group)
+    if _screen_change_cursor_expired(group, cursor):
+        return JsonResponse({"cursor": cursor, "cards": [], "reload": True})
+    deadline = time.monotonic() + max(0, int(settings.GROUP_SCREEN_LONG_POLL_SECONDS))
+    while True:
+        changes = list(
+            group.screen_changes.filter(id__gt=cursor)
+            .order_by("id")
+            .values_list("id", "kind", "object_id")[:GROUP_SCREEN_CHANGE_BATCH_SIZE]
+        )
+        if changes or time.monotonic() >= deadline:
+            break
+        time.sleep(GROUP_SCREEN_CHANGE_POLL_INTERVAL_SECONDS)
+    return JsonResponse(_screen_change_payload(group, cursor, changes))
+
+
+@login_required
+@require_GET
+def group_screen_card(request, group_id: int, card_kind: str, card_id: int):
+    """Render one SL-screen card so open screens can replace it without reloading."""
+    group = get_object_or_404(GameGroup, pk=group_id)
+    require_game_master(request.user, group)
+    if card_kind == "character":
+        membership = get_object_or_404(_screen_membership_queryset(group), pk=card_id)
+        row = _character_screen_cards(request, group, [membership])[0]
+    elif card_kind == "creature":
+        row = _creature_screen_card(group, get_object_or_404(_screen_creature_queryset(group), pk=card_id))
+    else:
+        raise Http404
+    return render(request, "charsheet/partials/_gm_screen_card.html", {"group": group, "row": row})
 
 
 @login_required
@@ -2657,6 +2925,11 @@ def game_master_character_sheet(request, group_id: int, character_id: int):
     group = get_object_or_404(GameGroup, pk=group_id)
     character = get_object_or_404(Character, pk=character_id)
     require_sl_character_access(request.user, group, character)
+    revision = current_sheet_revision(character.pk)
+    etag = _sheet_etag_for_request(request, character, revision, read_only=True, variant=("group", group.pk))
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
     context = _build_sheet_context_for_request(request, character, read_only=True)
     context["temporary_attribute_update_url"] = reverse(
         "update_game_master_temporary_attribute",
@@ -2665,7 +2938,20 @@ def game_master_character_sheet(request, group_id: int, character_id: int):
     context["read_only_diary_url"] = reverse(
         "game_master_character_diary", args=[group.pk, character.pk]
     )
-    return render(request, "charsheet/charsheet.html", context)
+    context["sheet_tooltip_url"] = reverse(
+        "game_master_character_sheet_tooltip", args=[group.pk, character.pk]
+    )
+    return _tag_sheet_response(render(request, "charsheet/charsheet.html", context), character, revision, etag)
+
+
+@login_required
+@require_GET
+def game_master_character_sheet_tooltip(request, group_id: int, character_id: int):
+    """Return one sheet tooltip body for an authorized SL sheet view."""
+    group = get_object_or_404(GameGroup, pk=group_id)
+    character = get_object_or_404(Character, pk=character_id)
+    require_sl_character_access(request.user, group, character)
+    return _sheet_tooltip_response(request, character, read_only=True, variant=("group", group.pk))
 
 
 @login_required
@@ -2693,11 +2979,21 @@ def game_master_character_diary(request, group_id: int, character_id: int):
     group = get_object_or_404(GameGroup, pk=group_id)
     character = get_object_or_404(Character, pk=character_id)
     require_sl_character_access(request.user, group, character)
+    revision = current_sheet_revision(character.pk)
+    etag = sheet_etag(character.pk, revision, read_only=True, variant=("diary",))
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
     entries = [
         _serialize_diary_entry(entry)
         for entry in CharacterDiaryEntry.objects.filter(character=character).order_by("order_index", "id")
     ]
-    return JsonResponse({"ok": True, "entries": entries, "current_entry_id": entries[-1]["id"] if entries else None})
+    return _tag_sheet_response(
+        JsonResponse({"ok": True, "entries": entries, "current_entry_id": entries[-1]["id"] if entries else None}),
+        character,
+        revision,
+        etag,
+    )
 
 
 @login_required
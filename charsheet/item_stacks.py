@@ -0,0 +1,216 @@
+"""Persisted stack signatures of owned items, cleared by signals and recomputed on demand."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+from .models import CharacterItem
+
+# Rewired onto the surviving stack by a merge, so never part of the signature.
+STACK_HISTORY_ACCESSORS = frozenset({"transfers", "ownership_events"})
+# Stored for items whose related state could not be read; such stacks never merge.
+UNMERGEABLE_STACK_SIGNATURE = "-"
+
+
+def _signature_value(value):
+    if hasattr(value, "name"):
+        return str(value.name or "")
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _row_signature(row, *, excluded_fields=()):
+    return tuple(
+        (field.name, _signature_value(getattr(row, field.attname)))
+        for field in row._meta.concrete_fields
+        if not field.primary_key and field.name not in set(excluded_fields)
+    )
+
+
+def _stack_relations():
+    """Return the reverse relations whose rows belong to an item's stack state."""
+    return [
+        relation
+        for relation in CharacterItem._meta.related_objects
+        if relation.get_accessor_name() and relation.get_accessor_name() not in STACK_HISTORY_ACCESSORS
+    ]
+
+
+def _generic_stack_relations():
+    return [field for field in CharacterItem._meta.private_fields if isinstance(field, GenericRelation)]
+
+
+def related_stack_signature(item: CharacterItem):
+    """Build a defensive signature from all discoverable instance state.
+
+    History relations are intentionally excluded because they are rewired on a
+    merge. Unknown related state is included by default, so future instance
+    fields cannot silently disappear from merge comparison.
+    """
+    components = []
+
+    try:
+        for field in item._meta.many_to_many:
+            through = field.remote_field.through
+            source_field_name = field.m2m_field_name()
+            rows = through._default_manager.filter(**{source_field_name: item})
+            components.append(
+                (
+                    f"m2m:{field.name}",
+                    tuple(
+                        sorted(
+                            (
+                                _row_signature(row, excluded_fields={source_field_name})
+                                for row in rows
+                            ),
+                            key=repr,
+                        )
+                    ),
+                )
+            )
+
+        for relation in _stack_relations():
+            accessor = relation.get_accessor_name()
+            if relation.one_to_one:
+                try:
+                    manager = getattr(item, accessor)
+                except relation.related_model.DoesNotExist:
+                    manager = None
+                rows = [manager] if manager is not None else []
+            else:
+                manager = getattr(item, accessor)
+                rows = list(manager.all())
+            row_signatures = tuple(
+                sorted(
+                    (
+                        _row_signature(
+                            row,
+                            excluded_fields={
+                                relation.field.name,
+                                "granted_at",
+                                "created_at",
+                                "updated_at",
+                            },
+                        )
+                        for row in rows
+                    ),
+                    key=repr,
+                )
+            )
+            components.append((f"related:{accessor}", row_signatures))
+
+        for relation in _generic_stack_relations():
+            rows = getattr(item, relation.name).all()
+            components.append(
+                (
+                    f"generic-relation:{relation.name}",
+                    tuple(
+                        sorted(
+                            (
+                                _row_signature(
+                                    row,
+                                    excluded_fields={
+                                        relation.content_type_field_name,
+                                        relation.object_id_field_name,
+                                        "created_at",
+                                        "updated_at",
+                                    },
+                                )
+                                for row in rows
+                            ),
+                            key=repr,
+                        )
+                    ),
+                )
+            )
+    except (AttributeError, ObjectDoesNotExist, TypeError, ValueError):
+        return None
+    return tuple(sorted(components, key=lambda entry: entry[0]))
+
+
+def compute_stack_signature(item: CharacterItem) -> str:
+    """Hash the item's related state into the value stored on the row."""
+    signature = related_stack_signature(item)
+    if signature is None:
+        return UNMERGEABLE_STACK_SIGNATURE
+    return hashlib.blake2b(repr(signature).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def refresh_stack_signature(item: CharacterItem) -> str:
+    """Recompute and store one item's stack signature."""
+    item.stack_signature = compute_stack_signature(item)
+    CharacterItem.objects.filter(pk=item.pk).update(stack_signature=item.stack_signature)
+    return item.stack_signature
+
+
+def clear_stack_signatures(*item_ids) -> None:
+    """Mark items for recomputation after their related state changed."""
+    ids = {int(item_id) for item_id in item_ids if item_id}
+    if ids:
+        CharacterItem.objects.filter(pk__in=ids).exclude(stack_signature="").update(stack_signature="")
+
+
+def _clear_on_full_save(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Drop the loaded signature on full saves, which would otherwise write back a stale value."""
+    if not raw and update_fields is None:
+        instance.stack_signature = ""
+
+
+def _clear_for_related_row(sender, instance, raw=False, **kwargs):
+    """Clear the signature of the item owning a changed related row."""
+    if raw:
+        return
+    clear_stack_signatures(getattr(instance, _RELATED_ITEM_ATTNAMES[sender._meta.label], None))
+
+
+def _clear_for_generic_row(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    for relation in _generic_stack_relations():
+        if relation.related_model is not sender:
+            continue
+        content_type_id = getattr(instance, f"{relation.content_type_field_name}_id", None)
+        if content_type_id == ContentType.objects.get_for_model(CharacterItem).pk:
+            clear_stack_signatures(getattr(instance, relation.object_id_field_name, None))
+
+
+def _clear_for_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """Clear signatures when many-to-many links of an item are added or removed."""
+    if action not in {"post_add", "post_remove", "post_clear", "pre_clear"}:
+        return
+    if not reverse:
+        clear_stack_signatures(instance.pk)
+    elif action == "pre_clear":
+        field = next(field for field in CharacterItem._meta.many_to_many if field.remote_field.through is sender)
+        clear_stack_signatures(
+            *sender._default_manager.filter(**{field.m2m_reverse_field_name(): instance}).values_list(
+                field.m2m_field_name() + "_id", flat=True
+            )
+        )
+    elif pk_set:
+        clear_stack_signatures(*pk_set)
+
+
+_RELATED_ITEM_ATTNAMES = {relation.related_model._meta.label: relation.field.attname for relation in _stack_relations()}
+
+pre_save.connect(_clear_on_full_save, sender=CharacterItem, dispatch_uid="item_stack_full_save")
+for _label in _RELATED_ITEM_ATTNAMES:
+    post_save.connect(_clear_for_related_row, sender=_label, dispatch_uid=f"item_stack_save:{_label}")
+    post_delete.connect(_clear_for_related_row, sender=_label, dispatch_uid=f"item_stack_delete:{_label}")
+for _relation in _generic_stack_relations():
+    _label = _relation.related_model._meta.label
+    post_save.connect(_clear_for_generic_row, sender=_label, dispatch_uid=f"item_stack_generic_save:{_label}")
+    post_delete.connect(_clear_for_generic_row, sender=_label, dispatch_uid=f"item_stack_generic_delete:{_label}")
+for _field in CharacterItem._meta.many_to_many:
+    m2m_changed.connect(
+        _clear_for_m2m,
+        sender=_field.remote_field.through,
+        dispatch_uid=f"item_stack_m2m:{_field.name}",
+    )
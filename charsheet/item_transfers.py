@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-import json
+from datetime import datetime, timedelta
+import time
 
-from django.contrib.contenttypes.fields import GenericRelation
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import F
+from django.db.models import F, Min, Q
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 from .models import (
@@ -25,6 +25,18 @@ from .models import (
     ItemTransfer,
     ItemTransferNotification,
 )
+from .cache_counters import increment_cache_counter
+from .item_stacks import UNMERGEABLE_STACK_SIGNATURE, refresh_stack_signature
+from .models.character import bump_sheet_revision
+
+TRANSFER_LIFETIME = timedelta(days=7)
+TRANSFER_EXPIRY_BATCH_SIZE = 250
+TRANSFER_EXPIRY_INLINE_LIMIT = 20
+TRANSFER_EXPIRY_STAT_KEYS = {
+    "runs": "charsheet:transfer-expiry:stats:runs",
+    "expired": "charsheet:transfer-expiry:stats:expired",
+    "duration_ms": "charsheet:transfer-expiry:stats:duration-ms",
+}
 
 
 class TransferError(Exception):
@@ -35,6 +47,12 @@ class TransferError(Exception):
         self.status = status
 
 
+def _set_item_creatures_active(item: CharacterItem, active: bool) -> None:
+    """Toggle the creature cards bound to an item and refresh the holder's sheet."""
+    CharacterCreature.objects.filter(source_character_item=item).update(active=active)
+    bump_sheet_revision(item.owner_id)
+
+
 def pending_transfer_for_item(item: CharacterItem):
     prefetched = getattr(item, "_prefetched_objects_cache", {}).get("transfers")
     if prefetched is not None:
@@ -287,142 +305,17 @@ def _move_item(item: CharacterItem, destination: Character, *, activate_creature
         owner=destination,
         active=activate_creatures,
     )
+    bump_sheet_revision(getattr(previous, "pk", None))
     return previous or previous_group
 
 
-def _signature_value(value):
-    if hasattr(value, "name"):
-        return str(value.name or "")
-    if isinstance(value, (dict, list, tuple)):
-        return json.dumps(value, sort_keys=True, default=str)
-    return value
-
-
-def _row_signature(row, *, excluded_fields=()):
-    return tuple(
-        (field.name, _signature_value(getattr(row, field.attname)))
-        for field in row._meta.concrete_fields
-        if not field.primary_key and field.name not in set(excluded_fields)
-    )
-
-
-def _related_stack_signature(item: CharacterItem):
-    """Build a defensive signature from all discoverable instance state.
-
-    History relations are intentionally excluded because they are rewired on a
-    merge. Unknown related state is included by default, so future instance
-    fields cannot silently disappear from merge comparison.
-    """
-    components = []
-
-    try:
-        for field in item._meta.many_to_many:
-            through = field.remote_field.through
-            source_field_name = field.m2m_field_name()
-            rows = through._default_manager.filter(**{source_field_name: item})
-            components.append(
-                (
-                    f"m2m:{field.name}",
-                    tuple(
-                        sorted(
-                            (
-                                _row_signature(row, excluded_fields={source_field_name})
-                                for row in rows
-                            ),
-                            key=repr,
-                        )
-                    ),
-                )
-            )
-
-        history_accessors = {"transfers", "ownership_events"}
-        for relation in item._meta.related_objects:
-            accessor = relation.get_accessor_name()
-            if not accessor or accessor in history_accessors:
-                continue
-            if relation.one_to_one:
-                try:
-                    manager = getattr(item, accessor)
-                except relation.related_model.DoesNotExist:
-                    manager = None
-                rows = [manager] if manager is not None else []
-            else:
-                manager = getattr(item, accessor)
-                rows = list(manager.all())
-            row_signatures = tuple(
-                sorted(
-                    (
-                        _row_signature(
-                            row,
-                            excluded_fields={
-                                relation.field.name,
-                                "granted_at",
-                                "created_at",
-                                "updated_at",
-                            },
-                        )
-                        for row in rows
-                    ),
-                    key=repr,
-                )
-            )
-            components.append((f"related:{accessor}", row_signatures))
-
-        for relation in (
-            field for field in item._meta.private_fields if isinstance(field, GenericRelation)
-        ):
-            rows = getattr(item, relation.name).all()
-            components.append(
-                (
-                    f"generic-relation:{relation.name}",
-                    tuple(
-                        sorted(
-                            (
-                                _row_signature(
-                                    row,
-                                    excluded_fields={
-                                        relation.content_type_field_name,
-                                        relation.object_id_field_name,
-                                        "created_at",
-                                        "updated_at",
-                                    },
-                                )
-                                for row in rows
-                            ),
-                            key=repr,
-                        )
-                    ),
-                )
-            )
-
-        components.append(
-            (
-                "related:semantic_effects",
-                tuple(
-                    sorted(
-                        (
-                            _row_signature(
-                                row,
-                                excluded_fields={"character_item"},
-                            )
-                            for row in item.semantic_effects.all()
-                        ),
-                        key=repr,
-                    )
-                ),
-            )
-        )
-    except (AttributeError, ObjectDoesNotExist, TypeError, ValueError):
-        return None
-    return tuple(sorted(components, key=lambda entry: entry[0]))
-
-
 def _concrete_stack_signature(item: CharacterItem):
     ignored_fields = {
         "id",
         "amount",
         "provenance_id",
         "ownership_version",
+        "stack_signature",
     }
     values = []
     for field in CharacterItem._meta.concrete_fields:
@@ -440,9 +333,11 @@ def _merge_compatible_stack(item: CharacterItem) -> CharacterItem:
     if item.creatures.exists():
         return item
 
+    item_signature = refresh_stack_signature(item)
+    if item_signature == UNMERGEABLE_STACK_SIGNATURE:
+        return item
     candidates = (
-        CharacterItem.objects.select_for_update()
-        .filter(
+        CharacterItem.objects.filter(
             item_id=item.item_id,
             owner_id=item.owner_id,
             group_owner_id=item.group_owner_id,
@@ -454,21 +349,20 @@ def _merge_compatible_stack(item: CharacterItem) -> CharacterItem:
                 item_id__isnull=False,
             ).values("item_id")
         )
-        .select_related("item")
-        .order_by("pk")
     )
+    # Stacks changed since their last comparison carry an empty signature until recomputed here.
+    for stale in candidates.filter(stack_signature="").select_related("item").order_by("pk"):
+        refresh_stack_signature(stale)
     item_concrete_signature = _concrete_stack_signature(item)
-    item_signature = _related_stack_signature(item)
-    if item_signature is None:
-        return item
     target = next(
         (
             candidate
-            for candidate in candidates
-            if not candidate.creatures.exists()
-            and _concrete_stack_signature(candidate) == item_concrete_signature
-            and (candidate_signature := _related_stack_signature(candidate)) is not None
-            and candidate_signature == item_signature
+            for candidate in candidates.select_for_update()
+            .filter(stack_signature=item_signature)
+            .select_related("item")
+            .order_by("pk")
+            if _concrete_stack_signature(candidate) == item_concrete_signature
+            and not candidate.creatures.exists()
         ),
         None,
     )
@@ -571,9 +465,9 @@ def create_transfer(
         item_snapshot=item_snapshot,
         sender_snapshot=_character_snapshot(sender),
         recipient_snapshot=_character_snapshot(recipient),
-        expires_at=now + timedelta(days=7),
+        expires_at=now + TRANSFER_LIFETIME,
     )
-    CharacterCreature.objects.filter(source_character_item=item).update(active=False)
+    _set_item_creatures_active(item, False)
     _event(item, ItemOwnershipEvent.EventType.CREATED, transfer=transfer, actor=sender, from_character=sender, to_character=recipient, details={"message": message})
     _notify(recipient.owner, item, "offer", f"{sender.name} möchte dir {item.effective_name} übergeben.", transfer)
     return transfer
@@ -635,7 +529,7 @@ def create_gm_edit_transfer(
         item_snapshot=item_snapshot,
         sender_snapshot=_character_snapshot(sender),
         recipient_snapshot={"type": "gm_group", "id": locked_group.pk, "name": f"SL @ {locked_group.name}"},
-        expires_at=now + timedelta(days=7),
+        expires_at=now + TRANSFER_LIFETIME,
     )
     _event(
         item,
@@ -766,7 +660,7 @@ def create_group_transfer(
         item_snapshot=item_snapshot,
         sender_snapshot={"type": "group", "id": locked_group.pk, "name": locked_group.name},
         recipient_snapshot=_character_snapshot(recipient),
-        expires_at=now + timedelta(days=7),
+        expires_at=now + TRANSFER_LIFETIME,
     )
     _event(
         item,
@@ -842,12 +736,16 @@ def accept_transfer(*, transfer_id: int, recipient: Character):
             revoked_at__isnull=True,
             invalidated_at__isnull=True,
         )
+        grantee_ids = list(active_grants.values_list("grantee_id", flat=True))
         active_grants.update(invalidated_at=now)
         CharacterItem.objects.filter(pk=item.pk).update(
             original_owner_character=recipient,
             original_owner_group=None,
             group_origin_finalized=bool(previous_original_group),
         )
+        # Queryset updates skip the revision signals; the old original owner and
+        # the former grantees show this item's rights on their sheets.
+        bump_sheet_revision(getattr(previous_original_owner, "pk", None), recipient.pk, *grantee_ids)
         item.original_owner_character = recipient
         item.original_owner_character_id = recipient.pk
         item.original_owner_group = None
@@ -906,7 +804,7 @@ def decline_transfer(*, transfer_id: int, recipient: Character):
     transfer.status = ItemTransfer.Status.DECLINED
     transfer.resolved_at = timezone.now()
     transfer.save(update_fields=["status", "resolved_at"])
-    CharacterCreature.objects.filter(source_character_item=item).update(active=True)
+    _set_item_creatures_active(item, True)
     _event(
         item,
         ItemOwnershipEvent.EventType.DECLINED,
@@ -956,7 +854,7 @@ def recall_transfer(*, transfer_id: int, sender: Character):
     transfer.status = ItemTransfer.Status.RECALLED
     transfer.resolved_at = timezone.now()
     transfer.save(update_fields=["status", "resolved_at"])
-    CharacterCreature.objects.filter(source_character_item=item).update(active=True)
+    _set_item_creatures_active(item, True)
     _event(
         item,
         ItemOwnershipEvent.EventType.RECALLED,
@@ -1077,7 +975,7 @@ def _expire_locked(transfer: ItemTransfer):
     transfer.status = ItemTransfer.Status.EXPIRED
     transfer.resolved_at = timezone.now()
     transfer.save(update_fields=["status", "resolved_at"])
-    CharacterCreature.objects.filter(source_character_item=item).update(active=True)
+    _set_item_creatures_active(item, True)
     if transfer.transfer_kind == ItemTransfer.TransferKind.GM_EDIT:
         _event(
             item,
@@ -1122,9 +1020,12 @@ def _expire_locked(transfer: ItemTransfer):
     return True
 
 
-def expire_due_transfers(*, limit=250):
+def expire_due_transfers(*, limit=TRANSFER_EXPIRY_BATCH_SIZE, character_ids=None):
     expired = 0
-    due_ids = list(ItemTransfer.objects.filter(status=ItemTransfer.Status.PENDING, expires_at__lte=timezone.now()).values_list("pk", flat=True)[:limit])
+    due = ItemTransfer.objects.filter(status=ItemTransfer.Status.PENDING, expires_at__lte=timezone.now())
+    if character_ids is not None:
+        due = due.filter(Q(sender_id__in=character_ids) | Q(recipient_id__in=character_ids))
+    due_ids = list(due.values_list("pk", flat=True)[:limit])
     for transfer_id in due_ids:
         with transaction.atomic():
             transfer = ItemTransfer.objects.select_for_update().filter(pk=transfer_id).first()
@@ -1133,6 +1034,120 @@ def expire_due_transfers(*, limit=250):
     return expired
 
 
+_next_expiry_at: datetime | None = None
+# Next-due time per character shown by a request in this process.
+_next_expiry_by_character: dict[int, datetime] = {}
+
+
+def next_transfer_expiry() -> datetime:
+    """Return the earliest moment a pending transfer can be due.
+
+    Transfers created later expire one full lifetime after their creation, so
+    the horizon stays valid in every process without shared state.
+    """
+    horizon = timezone.now() + TRANSFER_LIFETIME
+    earliest = (
+        ItemTransfer.objects.filter(status=ItemTransfer.Status.PENDING)
+        .aggregate(earliest=Min("expires_at"))["earliest"]
+    )
+    return horizon if earliest is None else min(earliest, horizon)
+
+
+def _count_expiry(stat: str, amount: int) -> None:
+    """Add to one expiry monitoring counter."""
+    increment_cache_counter(TRANSFER_EXPIRY_STAT_KEYS[stat], amount)
+
+
+def run_transfer_expiry(*, limit=TRANSFER_EXPIRY_BATCH_SIZE) -> int:
+    """Expire one batch of due transfers, record throughput, and move the next-due time."""
+    global _next_expiry_at
+    started = time.perf_counter()
+    expired = expire_due_transfers(limit=limit)
+    _count_expiry("runs", 1)
+    _count_expiry("expired", expired)
+    _count_expiry("duration_ms", round((time.perf_counter() - started) * 1000))
+    # A full batch may leave more due rows behind; check again on the next request.
+    _next_expiry_at = timezone.now() if expired >= limit else next_transfer_expiry()
+    return expired
+
+
+def next_transfer_expiry_for_characters(character_ids) -> dict[int, datetime]:
+    """Return the earliest moment a pending transfer of each given character can be due."""
+    horizon = timezone.now() + TRANSFER_LIFETIME
+    next_due = dict.fromkeys(character_ids, horizon)
+    pending = ItemTransfer.objects.filter(status=ItemTransfer.Status.PENDING)
+    for column in ("sender_id", "recipient_id"):
+        rows = (
+            pending.filter(**{f"{column}__in": next_due})
+            .order_by()
+            .values(column)
+            .annotate(earliest=Min("expires_at"))
+            .values_list(column, "earliest")
+        )
+        for character_id, earliest in rows:
+            next_due[character_id] = min(next_due[character_id], earliest)
+    return next_due
+
+
+def expire_due_transfers_if_due(character_ids) -> int:
+    """Expire the due transfers of the given characters once their next-due time has passed."""
+    now = timezone.now()
+    due_ids = [
+        character_id
+        for character_id in dict.fromkeys(character_ids)
+        if _next_expiry_by_character.get(character_id, now) <= now
+    ]
+    if not due_ids:
+        return 0
+    # Requests only settle the transfers they display; full batches belong to
+    # the expire_item_transfers worker. Overdue transfers of other characters
+    # therefore must not keep this gate open.
+    expired = expire_due_transfers(limit=TRANSFER_EXPIRY_INLINE_LIMIT, character_ids=due_ids)
+    if expired < TRANSFER_EXPIRY_INLINE_LIMIT:
+        _next_expiry_by_character.update(next_transfer_expiry_for_characters(due_ids))
+    return expired
+
+
+def seconds_until_next_transfer_expiry() -> float:
+    """Return how long a background worker may sleep before the next expiry run."""
+    next_due = _next_expiry_at or next_transfer_expiry()
+    return max(0.0, (next_due - timezone.now()).total_seconds())
+
+
+def transfer_expiry_stats() -> dict[str, float | int]:
+    """Return expiry counters plus the derived throughput in transfers per second."""
+    stats = {name: int(cache.get(key) or 0) for name, key in TRANSFER_EXPIRY_STAT_KEYS.items()}
+    stats["expired_per_second"] = (
+        round(stats["expired"] * 1000 / stats["duration_ms"], 2) if stats["duration_ms"] else 0.0
+    )
+    return stats
+
+
+def reset_transfer_expiry_stats() -> None:
+    """Drop all expiry monitoring counters."""
+    cache.delete_many(list(TRANSFER_EXPIRY_STAT_KEYS.values()))
+
+
+def _pull_next_expiry_forward(sender, instance, raw=False, **kwargs):
+    """Move the in-memory next-due times forward when a pending transfer expires earlier."""
+    global _next_expiry_at
+    if raw or instance.status != ItemTransfer.Status.PENDING or instance.expires_at is None:
+        return
+    if _next_expiry_at is not None and instance.expires_at < _next_expiry_at:
+        _next_expiry_at = instance.expires_at
+    for character_id in (instance.sender_id, instance.recipient_id):
+        next_due = _next_expiry_by_character.get(character_id)
+        if next_due is not None and instance.expires_at < next_due:
+            _next_expiry_by_character[character_id] = instance.expires_at
+
+
+post_save.connect(
+    _pull_next_expiry_forward,
+    sender=ItemTransfer,
+    dispatch_uid="item_transfer_next_expiry",
+)
+
+
 @transaction.atomic
 def enforce_original_ownership(*, item_id: int, original_owner: Character):
     item = CharacterItem.objects.select_for_update(of=("self",)).select_related("owner__owner", "original_owner_character__owner").get(pk=item_id)
@@ -1146,7 +1161,7 @@ def enforce_original_ownership(*, item_id: int, original_owner: Character):
         _event(item, ItemOwnershipEvent.EventType.RECALLED, transfer=pending, actor=original_owner, from_character=pending.sender, to_character=original_owner)
         _notify(pending.recipient.owner, item, "recalled", f"Das Angebot für {item.effective_name} wurde zurückgezogen.", pending)
         if item.owner_id == original_owner.pk:
-            CharacterCreature.objects.filter(source_character_item=item).update(active=True)
+            _set_item_creatures_active(item, True)
             return _merge_compatible_stack(item)
     if item.owner_id == original_owner.pk:
         raise TransferError("already_home", "Das Item befindet sich bereits beim Ursprungsbesitzer.", status=409)
@@ -1161,6 +1176,18 @@ def has_item_permission(item: CharacterItem, permission: str, character: Charact
     character = character or item.owner
     if character.pk == item.original_owner_character_id:
         return True
+    prefetched = getattr(item, "_prefetched_objects_cache", {}).get("permission_grants")
+    if prefetched is not None:
+        return any(
+            grant.active
+            and grant.permission == permission
+            and (
+                grant.grantee_id is None
+                if permission == ItemPermissionGrant.Permission.CONSUME_FINAL
+                else grant.grantee_id == character.pk and grant.ownership_version == item.ownership_version
+            )
+            for grant in prefetched
+        )
     grants = ItemPermissionGrant.objects.filter(item=item, permission=permission, revoked_at__isnull=True, invalidated_at__isnull=True)
     if permission == ItemPermissionGrant.Permission.CONSUME_FINAL:
         return grants.filter(grantee__isnull=True).exists()
@@ -10,11 +10,14 @@ from django.db import transaction
 from charsheet.learning_progression import build_learning_progression_context
 from charsheet.learning_progression import build_learning_magic_groups
 from charsheet.learning_rules import (
+    ASPECT_LEVEL_COST_EP,
     DEFAULT_SCHOOL_MAX_LEVEL,
+    SCHOOL_LEVEL_COST_EP,
     calc_attribute_total_cost,
     calc_language_total_cost,
     calc_skill_total_cost,
     school_max_levels,
+    skill_rank_limits,
 )
 from charsheet.models import (
     Aspect,
@@ -108,6 +111,12 @@ def _has_progression_inputs(post_data) -> bool:
     return any(str(key).startswith(prefixes) for key in post_data.keys())
 
 
+def _current_engine(character: Character, *mutations: str):
+    """Return the submission's engine after dropping only the caches of the given persisted mutations."""
+    character.invalidate_engine(*mutations)
+    return character.get_engine()
+
+
 def _build_progression_context_with_creatures(character: Character, *, engine=None) -> dict:
     """Build learning progression including pending creature-card trait choices."""
     progression_context = build_learning_progression_context(character, engine=engine)
@@ -142,13 +151,13 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         "daemonic_powers": 0,
     }
 
-    def _rebuild_if(dirty: bool) -> tuple:
+    def _rebuild_if(dirty: bool, *mutations: str) -> tuple:
         if not dirty:
             return engine, progression_context
-        new_engine = character.get_engine(refresh=True)
+        new_engine = _current_engine(character, *mutations)
         return new_engine, _build_progression_context_with_creatures(character, engine=new_engine)
 
-    engine = character.get_engine(refresh=True)
+    engine = character.get_engine()
     progression_context = _build_progression_context_with_creatures(character, engine=engine)
 
     for row in progression_context["learn_school_path_rows"]:
@@ -167,7 +176,7 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         path_entry.save()
         summary["paths"] += 1
 
-    engine, progression_context = _rebuild_if(summary["paths"] > 0)
+    engine, progression_context = _rebuild_if(summary["paths"] > 0, "schools")
 
     for row in progression_context["learn_technique_rows"]:
         if not _is_checked(post_data, row["field_name"]):
@@ -180,7 +189,7 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         technique_entry.save()
         summary["techniques"] += 1
 
-    engine, progression_context = _rebuild_if(summary["techniques"] > 0)
+    engine, progression_context = _rebuild_if(summary["techniques"] > 0, "techniques")
 
     picked_specializations_by_school: dict[int, set[int]] = {}
     for row in progression_context["learn_specialization_rows"]:
@@ -205,7 +214,7 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         school_picks.add(specialization_id)
         summary["specializations"] += 1
 
-    engine, progression_context = _rebuild_if(summary["specializations"] > 0)
+    engine, progression_context = _rebuild_if(summary["specializations"] > 0, "specializations")
 
     weapon_decisions_by_slot: dict[tuple[int, int], dict[str, object]] = {}
     side_decisions_by_slot: dict[tuple[int, int], dict[str, object]] = {}
@@ -250,8 +259,7 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         mastery_entry.save()
         summary["choices"] += 1
 
-    engine = character.get_engine(refresh=True)
-    progression_context = _build_progression_context_with_creatures(character, engine=engine)
+    engine, progression_context = _rebuild_if(summary["choices"] > 0, "weapon_masteries")
 
     daemonic_decisions = [
         decision
@@ -302,7 +310,7 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
             raise LearningSubmissionError(
                 f"{decision['title']}: Technik oder Kraft nicht gefunden."
             )
-        state = character.get_engine(refresh=True).technique_state(technique)
+        state = _current_engine(character, "daemonic_powers").technique_state(technique)
         if not state["learned"] or not state["available"]:
             raise LearningSubmissionError(
                 f"{technique.name}: Die gewährende Technik ist nicht aktiv."
@@ -487,23 +495,36 @@ def _apply_progression_choices(character: Character, post_data, *, magic_engine)
         choice_entry.save()
         summary["choices"] += 1
 
+    if summary["choices"] or summary["daemonic_powers"]:
+        character.invalidate_engine(
+            "daemonic_powers",
+            "race_choices",
+            "technique_choices",
+            "trait_choices",
+            "weapon_masteries",
+        )
     return summary
 
 
 def _reset_invalid_school_progression(character: Character) -> None:
     """Drop school-bound progression data that is no longer valid after level reductions."""
     learned_school_ids = set(character.schools.values_list("school_id", flat=True))
-    CharacterSchoolPath.objects.filter(character=character).exclude(
+    stale: set[str] = set()
+    if CharacterSchoolPath.objects.filter(character=character).exclude(
         school_id__in=learned_school_ids
-    ).delete()
-    CharacterTechniqueChoice.objects.filter(character=character).exclude(
+    ).delete()[0]:
+        stale.add("schools")
+    if CharacterTechniqueChoice.objects.filter(character=character).exclude(
         technique__school_id__in=learned_school_ids
-    ).delete()
-    CharacterTechnique.objects.filter(character=character).exclude(
+    ).delete()[0]:
+        stale.add("technique_choices")
+    if CharacterTechnique.objects.filter(character=character).exclude(
         technique__school_id__in=learned_school_ids
-    ).delete()
+    ).delete()[0]:
+        stale.add("techniques")
 
-    engine = character.get_engine(refresh=True)
+    engine = _current_engine(character, *stale)
+    stale.clear()
     while True:
         invalid_technique_ids = [
             state["technique_id"]
@@ -525,9 +546,9 @@ def _reset_invalid_school_progression(character: Character) -> None:
             character=character,
             technique_id__in=invalid_technique_ids,
         ).delete()
-        engine = character.get_engine(refresh=True)
+        engine.invalidate("techniques", "technique_choices", "daemonic_powers")
 
-    refreshed_engine = character.get_engine(refresh=True)
+    refreshed_engine = engine
     permanently_lost_grant_technique_ids = []
     for ownership in CharacterDaemonicPower.objects.filter(
         character=character
@@ -550,16 +571,21 @@ def _reset_invalid_school_progression(character: Character) -> None:
             character=character,
             granting_technique_id__in=permanently_lost_grant_technique_ids,
         ).delete()
+        stale.add("daemonic_powers")
 
-    CharacterSpecialization.objects.filter(character=character).exclude(
+    if CharacterSpecialization.objects.filter(character=character).exclude(
         specialization__school_id__in=learned_school_ids
-    ).delete()
-    CharacterWeaponMastery.objects.filter(character=character).exclude(
+    ).delete()[0]:
+        stale.add("specializations")
+    deleted_masteries = CharacterWeaponMastery.objects.filter(character=character).exclude(
         school_id__in=learned_school_ids
-    ).delete()
-    CharacterWeaponMasteryArcana.objects.filter(character=character).exclude(
+    ).delete()[0]
+    deleted_arcana = CharacterWeaponMasteryArcana.objects.filter(character=character).exclude(
         school_id__in=learned_school_ids
-    ).delete()
+    ).delete()[0]
+    if deleted_masteries or deleted_arcana:
+        stale.add("weapon_masteries")
+    character.invalidate_engine(*stale)
     CharacterSpell.objects.filter(
         character=character,
         spell__school_id__isnull=False,
@@ -610,7 +636,7 @@ def _reset_invalid_school_progression(character: Character) -> None:
         ).update(religion="")
         if religion_cleared:
             character.religion = ""
-    magic_engine = character.get_magic_engine(refresh=True)
+    magic_engine = character.get_magic_engine()
     magic_engine.sync_character_magic()
     school_level_map = magic_engine._school_level_map()
     for school_id in learned_school_ids:
@@ -629,24 +655,27 @@ def _reset_invalid_school_progression(character: Character) -> None:
             spell__aspect__isnull=True,
         ).delete()
 
-    engine = character.get_engine(refresh=True)
+    engine = character.get_engine()
+    removable_ids = []
     for school_id in learned_school_ids:
         allowed_count = engine.specialization_slot_count(school_id)
         specialization_entries = engine.character_specializations(school_id)
         if len(specialization_entries) <= allowed_count:
             continue
-        removable_ids = [entry.id for entry in specialization_entries[allowed_count:]]
+        removable_ids.extend(entry.id for entry in specialization_entries[allowed_count:])
+    if removable_ids:
         CharacterSpecialization.objects.filter(id__in=removable_ids).delete()
+        character.invalidate_engine("specializations")
 
     weapon_master_school = School.objects.filter(name__iexact="Waffenmeister").first()
     if weapon_master_school and weapon_master_school.id in learned_school_ids:
         school_entry = CharacterSchool.objects.filter(character=character, school=weapon_master_school).first()
         allowed_count = min(int(getattr(school_entry, "level", 0) or 0), 10)
-        CharacterWeaponMastery.objects.filter(
+        deleted_masteries = CharacterWeaponMastery.objects.filter(
             character=character,
             school=weapon_master_school,
             pick_order__gt=allowed_count,
-        ).delete()
+        ).delete()[0]
         arcana_entries = list(
             CharacterWeaponMasteryArcana.objects.filter(character=character, school=weapon_master_school).order_by("id")
         )
@@ -654,6 +683,9 @@ def _reset_invalid_school_progression(character: Character) -> None:
             CharacterWeaponMasteryArcana.objects.filter(
                 id__in=[entry.id for entry in arcana_entries[allowed_count:]]
             ).delete()
+            deleted_masteries += len(arcana_entries) - allowed_count
+        if deleted_masteries:
+            character.invalidate_engine("weapon_masteries")
 
 
 def process_learning_submission(character: Character, post_data) -> tuple[str, str]:
@@ -809,10 +841,7 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
             return "error", "Eine Vampirkraft kann nicht gleichzeitig gesteigert und verlernt werden."
 
     def _skill_rank_payload(skill, specification: str | None = None) -> tuple[int, int]:
-        max_level = int(engine.skill_rank_max(skill.slug, specification=specification))
-        metadata = engine.skill_rank_cap_metadata(skill.slug, specification=specification)
-        above_base_cost = int(metadata.get("above_base_cap_cost_ep") or metadata.get("above_base_cost_ep") or 2)
-        return max(10, max_level), max(0, above_base_cost)
+        return skill_rank_limits(engine, skill.slug, specification)
 
     def _skill_delta_cost(skill, base_value: int, target_value: int, specification: str | None = None) -> int:
         _max_level, above_base_cost = _skill_rank_payload(skill, specification)
@@ -1038,7 +1067,7 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
             continue
         if add > 0 and int(school.id) in vampire_disallowed_school_ids:
             return "error", f"{school.name}: Diese Schule ist durch einen Vampir-Effekt gesperrt."
-        total_cost += add * 8
+        total_cost += add * SCHOOL_LEVEL_COST_EP
         school_plan[school_id] = add
 
     lesson_plan: dict[int, int] = {}
@@ -1183,7 +1212,7 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
             min_add = -base_level
             if add < min_add or add > max_add:
                 return "error", "Ungueltige Aspekt-Auswahl."
-            total_cost += add * 4
+            total_cost += add * ASPECT_LEVEL_COST_EP
             magic_aspect_plan[aspect_id] = add
 
     has_ep_changes = any((
@@ -1426,8 +1455,27 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
                     aspect_entry.full_clean()
                     aspect_entry.save(update_fields=["level"])
 
-            character.get_engine(refresh=True)
-            magic_engine = character.get_magic_engine(refresh=True)
+            character.invalidate_engine(
+                *(
+                    mutation
+                    for mutation, changed in (
+                        ("attributes", attr_plan),
+                        ("traits", trait_plan),
+                        ("skills", skill_plan or cs_skill_plan or new_spec_plan),
+                        ("languages", language_plan),
+                        ("schools", school_plan),
+                        (
+                            "vampire",
+                            vampire_age_add
+                            or vampire_capacity_add
+                            or vampire_power_plan
+                            or vampire_power_remove_plan
+                            or vampire_buyoff_plan,
+                        ),
+                    )
+                    if changed
+                )
+            )
             magic_engine.sync_character_magic()
 
             if magic_spell_selection:
@@ -1530,7 +1578,7 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
             }
             removal_ids = set(direct_removals)
             target_lesson_ids = (set(current_lesson_entries) - removal_ids) | addition_ids
-            lesson_engine = character.get_engine(refresh=True)
+            lesson_engine = character.get_engine()
 
             changed = True
             while changed:
@@ -1594,11 +1642,11 @@ def process_learning_submission(character: Character, post_data) -> tuple[str, s
             character.current_experience = max(0, int(character.current_experience) - total_cost)
             character.save(update_fields=["current_experience"])
             progression_summary = _apply_progression_choices(character, post_data, magic_engine=magic_engine)
-            refreshed_magic_engine = character.get_magic_engine(refresh=True)
-            refreshed_magic_engine.sync_character_magic()
-            refreshed_magic_engine.normalize_current_arcane_power(
+            magic_engine.sync_character_magic()
+            magic_engine.normalize_current_arcane_power(
                 previous_max=previous_arcane_power_max,
                 persist=True,
+                engine=character.get_engine(),
             )
     except LearningSubmissionError as exc:
         return "error", str(exc)
@@ -0,0 +1,300 @@
+"""Compiled learning cost table of one character for planning in the learning window."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+
+from django.core.cache import cache
+
+from codex_arcana.versioning import get_application_version
+
+from .constants import ATTR_ST, LANGUAGE_LITERACY_MIN_LEVEL, VAMPIRE_ANCHOR_TRAIT_SLUG
+from .learning_progression import build_learning_magic_groups
+from .learning_rules import (
+    ASPECT_LEVEL_COST_EP,
+    DEFAULT_SCHOOL_MAX_LEVEL,
+    SCHOOL_LEVEL_COST_EP,
+    calc_attribute_total_cost,
+    calc_language_total_cost,
+    calc_skill_total_cost,
+    school_max_levels,
+    skill_rank_limits,
+)
+from .models import (
+    Character,
+    CharacterAttribute,
+    CharacterLanguage,
+    CharacterSchool,
+    CharacterSkill,
+    CharacterTrait,
+    Language,
+    School,
+    Skill,
+    Technique,
+    Trait,
+)
+from .sheet_cache import sheet_catalog_versions, sheet_context_cache_timeout
+
+LEARNING_COST_TABLE_SCHEMA = 1
+LEARNING_COST_CACHE_PREFIX = "charsheet:learning-costs"
+
+
+def _cost_entry(base: int, low: int, high: int, total_cost: Callable[[int], int], **extra) -> dict[str, object]:
+    """Return one entry whose costs[i] is the EP delta for target level low + i."""
+    base_total = total_cost(base)
+    return {
+        "base": int(base),
+        "min": int(low),
+        "costs": [total_cost(level) - base_total for level in range(low, max(low, high) + 1)],
+        **extra,
+    }
+
+
+def _attribute_entries(character: Character, engine) -> dict[str, dict[str, object]]:
+    vampire_strength_extension = False
+    if character.is_vampire:
+        from .engine.vampire_engine import VampireRules
+
+        vampire_strength_extension = VampireRules(character).can_exceed_strength_race_maximum()
+    base_values = {
+        row.attribute.short_name: int(row.base_value)
+        for row in CharacterAttribute.objects.filter(character=character).select_related("attribute")
+    }
+    entries = {}
+    for limit in character.race.raceattributelimit_set.select_related("attribute"):
+        short_name = limit.attribute.short_name
+        max_value = int(limit.max_value) + int(engine.resolve_attribute_cap_bonus(short_name))
+        threshold = (
+            int(limit.max_value) - 2 if vampire_strength_extension and short_name == ATTR_ST else None
+        )
+        entries[f"attr:{short_name}"] = _cost_entry(
+            base_values.get(short_name, 0),
+            int(limit.min_value),
+            max_value,
+            lambda level, max_value=max_value, threshold=threshold: calc_attribute_total_cost(
+                level, max_value, premium_threshold=threshold
+            ),
+        )
+    return entries
+
+
+def _trait_entries(character: Character, engine) -> dict[str, dict[str, object]]:
+    levels = {row.trait_id: int(row.trait_level) for row in CharacterTrait.objects.filter(owner=character)}
+    entries = {}
+    for trait in Trait.objects.order_by("trait_type", "name"):
+        base = levels.get(trait.id, 0)
+        if trait.slug == VAMPIRE_ANCHOR_TRAIT_SLUG and base <= 0:
+            # Only granted through a confirmed blood baptism, which stays a server-side check.
+            continue
+        entry = _cost_entry(
+            base,
+            0,
+            int(trait.max_level),
+            lambda level, trait=trait, base=base: engine.trait_learning_delta_cost(trait, base, level),
+            type=trait.trait_type,
+        )
+        for level in range(1, int(trait.min_level)):
+            entry["costs"][level] = None
+        entries[f"trait:{trait.slug}"] = entry
+    return entries
+
+
+def _skill_entries(character: Character, engine) -> dict[str, dict[str, object]]:
+    entries = {}
+
+    def skill_entry(skill, base: int, specification: str | None = None) -> dict[str, object]:
+        max_level, above_base_cost = skill_rank_limits(engine, skill.slug, specification)
+        return _cost_entry(
+            base, 0, max_level, lambda level: calc_skill_total_cost(level, above_base_cost=above_base_cost)
+        )
+
+    rows_by_skill: dict[int, list] = {}
+    for row in CharacterSkill.objects.filter(character=character):
+        rows_by_skill.setdefault(row.skill_id, []).append(row)
+    for skill in Skill.objects.order_by("name"):
+        rows = rows_by_skill.get(skill.id, [])
+        if skill.requires_specification:
+            for row in rows:
+                specification = (row.specification or "").strip()
+                if specification and specification != "*":
+                    entries[f"skill-cs:{row.id}"] = skill_entry(skill, int(row.level), specification)
+            entries[f"skill-new-spec:{skill.slug}"] = skill_entry(skill, 0)
+        else:
+            entries[f"skill:{skill.slug}"] = skill_entry(skill, int(rows[0].level) if rows else 0)
+    return entries
+
+
+def _language_entries(character: Character) -> dict[str, dict[str, object]]:
+    rows = {row.language_id: row for row in CharacterLanguage.objects.filter(owner=character)}
+    entries = {}
+    for language in Language.objects.order_by("name"):
+        row = rows.get(language.id)
+        base = int(row.levels) if row else 0
+        write = bool(row.can_write) if row else False
+        mother = bool(row.is_mother_tongue) if row else False
+        max_level = int(language.max_level)
+        # Mother tongues stay at their maximum; only literacy can change.
+        low = max_level if mother else 0
+        entries[f"lang:{language.slug}"] = _cost_entry(
+            base,
+            low,
+            max_level,
+            lambda level, write=write, mother=mother: calc_language_total_cost(level, write, mother),
+            write=write,
+        )
+    return entries
+
+
+def _school_entries(character: Character) -> dict[str, dict[str, object]]:
+    levels = dict(CharacterSchool.objects.filter(character=character).values_list("school_id", "level"))
+    disallowed_school_ids: set[int] = set()
+    if character.is_vampire:
+        from .engine.vampire_engine import VampireRules
+
+        disallowed_school_ids = VampireRules(character).disallowed_school_ids()
+    caps = school_max_levels()
+    entries = {}
+    for school_id in School.objects.order_by("name").values_list("id", flat=True):
+        base = int(levels.get(school_id, 0))
+        max_level = max(base, int(caps.get(school_id, DEFAULT_SCHOOL_MAX_LEVEL)))
+        if school_id in disallowed_school_ids:
+            max_level = base
+        entries[f"school:{school_id}"] = _cost_entry(
+            base, 0, max_level, lambda level: level * SCHOOL_LEVEL_COST_EP
+        )
+    return entries
+
+
+def _magic_entries(character: Character) -> tuple[dict[str, dict[str, object]], dict[str, int]]:
+    entries: dict[str, dict[str, object]] = {}
+    slot_sources: dict[str, int] = {}
+    for group in build_learning_magic_groups(character, magic_engine=character.get_magic_engine(), synchronize=False):
+        for row in group["rows"]:
+            if row["kind"] == "magic_aspect":
+                entries[f"magic-aspect:{row['aspect_id']}"] = _cost_entry(
+                    int(row.get("base_level", 0) or 0),
+                    0,
+                    int(row.get("max_level", 0) or 0),
+                    lambda level: level * ASPECT_LEVEL_COST_EP,
+                )
+            elif row["kind"] == "magic_spell":
+                source_key = str(row.get("slot_source_key") or "")
+                entries[f"magic-spell:{row.get('cart_key') or row['spell_id']}"] = {
+                    "spell": int(row["spell_id"]),
+                    "slot_cost": int(row.get("slot_cost", 1) or 0),
+                    "slot_source": source_key,
+                }
+                slot_sources[source_key] = int(row.get("slot_source_remaining", 0) or 0)
+    return entries, slot_sources
+
+
+def _technique_unlocks(engine) -> dict[str, list[dict[str, object]]]:
+    """Group not yet learned techniques of the learned schools by the level that unlocks them."""
+    unlocks: dict[str, list[dict[str, object]]] = {}
+    for state in engine.technique_states():
+        if state["learned"] or not state["school_known"]:
+            continue
+        unlocks.setdefault(f"school:{state['school_id']}", []).append(
+            {
+                "technique": int(state["technique_id"]),
+                "name": state["technique_name"],
+                "level": int(state["required_level"] or 0),
+                "choice": state["acquisition_type"] == Technique.AcquisitionType.CHOICE,
+            }
+        )
+    for rows in unlocks.values():
+        rows.sort(key=lambda row: (row["level"], row["name"]))
+    return unlocks
+
+
+def build_learning_cost_table(character: Character, *, engine=None) -> dict[str, object]:
+    """Compile every learnable rank of one character into a JSON cost and requirement table."""
+    engine = engine or character.get_engine()
+    magic_entries, slot_sources = _magic_entries(character)
+    return {
+        "schema": LEARNING_COST_TABLE_SCHEMA,
+        "budget": int(character.current_experience or 0),
+        "language_literacy_min_level": LANGUAGE_LITERACY_MIN_LEVEL,
+        "entries": {
+            **_attribute_entries(character, engine),
+            **_trait_entries(character, engine),
+            **_skill_entries(character, engine),
+            **_language_entries(character),
+            **_school_entries(character),
+            **magic_entries,
+        },
+        "slot_sources": slot_sources,
+        "unlocks": _technique_unlocks(engine),
+    }
+
+
+def learning_cost_cache_key(character_id: int, revision: int) -> str:
+    """Return the cache key of one compiled table for a character revision, catalogs, and deployment."""
+    return (
+        f"{LEARNING_COST_CACHE_PREFIX}:{int(character_id)}:{int(revision)}:"
+        f"{sheet_catalog_versions()}:{get_application_version()}"
+    )
+
+
+def get_learning_cost_table(character: Character, *, revision: int | None) -> dict[str, object]:
+    """Return the compiled table for the given revision, building it once per revision."""
+    timeout = sheet_context_cache_timeout()
+    if revision is None or not timeout:
+        return build_learning_cost_table(character)
+    key = learning_cost_cache_key(character.pk, revision)
+    table = cache.get(key)
+    if table is None:
+        table = build_learning_cost_table(character)
+        cache.set(key, table, timeout=timeout)
+    return table
+
+
+def entry_cost(entry: Mapping[str, object], target: int) -> int | None:
+    """Return the EP delta for one target level, or None when the target is not learnable."""
+    index = int(target) - int(entry["min"])
+    costs = entry["costs"]
+    if index < 0 or index >= len(costs):
+        return None
+    return costs[index]
+
+
+def validate_learning_plan(table: Mapping[str, object], plan: Mapping[str, object]) -> dict[str, object]:
+    """Price a planned cart against a compiled table; static/js/charsheet/learning_costs.js mirrors this."""
+    entries = table["entries"]
+    cost = 0
+    errors: list[str] = []
+    slots_used: dict[str, int] = {}
+    unlocked: list[dict[str, object]] = []
+    for key, change in plan.items():
+        entry = entries.get(key)
+        if entry is None:
+            errors.append(f"{key}: nicht lernbar.")
+            continue
+        if "slot_source" in entry:
+            if int(change or 0) > 0:
+                source = str(entry["slot_source"])
+                slots_used[source] = slots_used.get(source, 0) + int(entry["slot_cost"])
+            continue
+        write = None
+        if isinstance(change, Mapping):
+            write = change.get("write")
+            change = change.get("add", 0)
+        target = int(entry["base"]) + int(change or 0)
+        step_cost = entry_cost(entry, target)
+        if step_cost is None:
+            errors.append(f"{key}: Zielwert {target} ist nicht erlaubt.")
+            continue
+        cost += step_cost
+        if write is not None and "write" in entry:
+            if write and target < int(table["language_literacy_min_level"]):
+                errors.append(f"{key}: Lesen und Schreiben benoetigt Sprachlevel {table['language_literacy_min_level']}.")
+            cost += int(bool(write)) - int(bool(entry["write"]))
+        unlocked.extend(
+            row for row in table["unlocks"].get(key, ()) if int(entry["base"]) < row["level"] <= target
+        )
+    for source, used in slots_used.items():
+        if used > int(table["slot_sources"].get(source, 0)):
+            errors.append(f"{source}: Nicht genug verfuegbare Zauber-Slots.")
+    if cost > int(table["budget"]):
+        errors.append("Nicht genug aktuelle EP fuer diese Lernkosten.")
+    return {"cost": cost, "remaining": int(table["budget"]) - cost, "errors": errors, "unlocks": unlocked}
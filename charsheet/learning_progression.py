@@ -8,6 +8,7 @@ from charsheet.constants import (
     RESOURCE_KEY_CHOICES,
     is_allowed_trait_attribute_choice,
 )
+from charsheet.learning_rules import ASPECT_LEVEL_COST_EP
 from charsheet.models import (
     Attribute,
     CharacterDaemonicPower,
@@ -369,7 +370,7 @@ def build_learning_magic_groups(
                 "base_level": int(entry.level),
                 "max_level": school_level,
                 "remaining_levels": remaining_levels,
-                "cost_per_level": 4,
+                "cost_per_level": ASPECT_LEVEL_COST_EP,
                 "description": (entry.aspect.description or "").replace("\r\n", "\n").replace("\r", "\n"),
                 "search_tokens": f"{entry.aspect.name.lower()} aspekt klerikal magie bonus gekauft",
             }
@@ -383,7 +384,7 @@ def build_learning_magic_groups(
                 "base_level": 0,
                 "max_level": int(bonus_aspects["school_level"]),
                 "remaining_levels": int(bonus_aspects["school_level"]),
-                "cost_per_level": 4,
+                "cost_per_level": ASPECT_LEVEL_COST_EP,
                 "description": (aspect.description or "").replace("\r\n", "\n").replace("\r", "\n"),
                 "search_tokens": f"{aspect.name.lower()} aspekt klerikal magie",
             }
@@ -8,6 +8,8 @@ from charsheet.models import School, Technique
 
 
 DEFAULT_SCHOOL_MAX_LEVEL = 10
+SCHOOL_LEVEL_COST_EP = 8
+ASPECT_LEVEL_COST_EP = 4
 
 
 def calc_skill_total_cost(level: int, *, base_cap: int = 10, above_base_cost: int = 2) -> int:
@@ -23,6 +25,14 @@ def calc_skill_total_cost(level: int, *, base_cap: int = 10, above_base_cost: in
     return cost
 
 
+def skill_rank_limits(engine, skill_slug: str, specification: str | None = None) -> tuple[int, int]:
+    """Return the learnable rank maximum and the EP per rank above the base cap for one skill."""
+    max_level = int(engine.skill_rank_max(skill_slug, specification=specification))
+    metadata = engine.skill_rank_cap_metadata(skill_slug, specification=specification)
+    above_base_cost = int(metadata.get("above_base_cap_cost_ep") or metadata.get("above_base_cost_ep") or 2)
+    return max(10, max_level), max(0, above_base_cost)
+
+
 def calc_language_total_cost(level: int, can_write: bool, is_mother_tongue: bool) -> int:
     """Return cumulative language cost for one language state."""
     base = 0 if is_mother_tongue else max(0, level)
@@ -0,0 +1,64 @@
+"""Shared version token for the admin-edited spell, lesson, and aspect catalog."""
+
+from __future__ import annotations
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .cache_versions import bump_cache_versions, cache_version
+from .models import ShamanPatron
+
+MAGIC_CATALOG_VERSION_KEY = "charsheet:magic-catalog:version"
+
+# Admin-edited magic tables shown on sheets; saving or deleting a row bumps the catalog version.
+MAGIC_CATALOG_SOURCES = (
+    "charsheet.Spell",
+    "charsheet.Lesson",
+    "charsheet.LessonCost",
+    "charsheet.LessonRequirementGroup",
+    "charsheet.LessonRequirement",
+    "charsheet.Aspect",
+    "charsheet.DivineEntity",
+    "charsheet.DivineEntityAspect",
+    "charsheet.DruidCult",
+    "charsheet.DruidCultAspect",
+    "charsheet.ShamanPatron",
+)
+
+# Catalog M2M relations that change sheet data without a row save.
+MAGIC_CATALOG_M2M_SOURCES = (ShamanPatron.aspects,)
+
+
+def magic_catalog_version() -> int:
+    """Return the shared magic catalog version, seeding it on first use."""
+    return cache_version(MAGIC_CATALOG_VERSION_KEY)
+
+
+def bump_magic_catalog_version() -> None:
+    """Invalidate every cache built from the magic catalog once the change commits."""
+    bump_cache_versions(MAGIC_CATALOG_VERSION_KEY)
+
+
+def _bump_magic_catalog_for_instance(sender, raw=False, **kwargs):
+    """Bump the catalog version after an admin-edited magic row changed."""
+    if raw:
+        return
+    bump_magic_catalog_version()
+
+
+for _sender_label in MAGIC_CATALOG_SOURCES:
+    post_save.connect(
+        _bump_magic_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"magic_catalog_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _bump_magic_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"magic_catalog_delete:{_sender_label}",
+    )
+for _relation in MAGIC_CATALOG_M2M_SOURCES:
+    m2m_changed.connect(
+        _bump_magic_catalog_for_instance,
+        sender=_relation.through,
+        dispatch_uid=f"magic_catalog_m2m:{_relation.through._meta.label}",
+    )
@@ -0,0 +1,92 @@
+"""Mutation-driven magic synchronization tracked by a per-character dirty marker."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .models import Character
+
+logger = logging.getLogger(__name__)
+
+# Character-owned rows that decide automatic aspects, base spells, and bonus
+# spell sources, mapped to the attribute holding the owning character's id.
+MAGIC_DIRTY_SOURCES = {
+    "charsheet.CharacterSchool": "character_id",
+    "charsheet.CharacterAspect": "character_id",
+    "charsheet.CharacterTrait": "owner_id",
+    "charsheet.CharacterDivineEntity": "character_id",
+    "charsheet.CharacterDruidCult": "character_id",
+}
+
+_local = threading.local()
+
+
+def _reconciling_ids() -> set[int]:
+    """Return the character ids currently synchronized by this thread."""
+    if not hasattr(_local, "character_ids"):
+        _local.character_ids = set()
+    return _local.character_ids
+
+
+def mark_magic_dirty(*character_ids) -> None:
+    """Flag characters for magic synchronization and reconcile them after commit."""
+    ids = {int(character_id) for character_id in character_ids if character_id} - _reconciling_ids()
+    if not ids:
+        return
+    Character.objects.filter(pk__in=ids).update(magic_dirty=True)
+    for character_id in sorted(ids):
+        transaction.on_commit(partial(_reconcile_after_commit, character_id))
+
+
+def reconcile_character_magic(character_id: int) -> bool:
+    """Synchronize one flagged character's magic and clear its marker; return whether rows changed."""
+    character_id = int(character_id)
+    reconciling = _reconciling_ids()
+    if character_id in reconciling:
+        return False
+    character = Character.objects.filter(pk=character_id, magic_dirty=True).first()
+    if character is None:
+        return False
+    reconciling.add(character_id)
+    try:
+        with transaction.atomic():
+            magic_engine = character.get_magic_engine(refresh=True)
+            changed = any(magic_engine.sync_character_magic().values())
+            magic_engine.normalize_current_arcane_power(persist=True)
+            Character.objects.filter(pk=character_id).update(magic_dirty=False)
+    finally:
+        reconciling.discard(character_id)
+    return changed
+
+
+def _reconcile_after_commit(character_id: int) -> None:
+    """Run one deferred reconciliation, leaving the marker for the command on failure."""
+    try:
+        reconcile_character_magic(character_id)
+    except Exception:
+        logger.exception("Magic synchronization failed for character %s", character_id)
+
+
+def _mark_magic_dirty_for_instance(sender, instance, raw=False, **kwargs):
+    """Flag the owner after a magic-relevant row changed."""
+    if raw:
+        return
+    mark_magic_dirty(getattr(instance, MAGIC_DIRTY_SOURCES[sender._meta.label], None))
+
+
+for _sender_label in MAGIC_DIRTY_SOURCES:
+    post_save.connect(
+        _mark_magic_dirty_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"magic_dirty_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _mark_magic_dirty_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"magic_dirty_delete:{_sender_label}",
+    )
@@ -0,0 +1,219 @@
+"""Compare indexed modifier resolution against the former linear scan."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from charsheet.constants import MELEE_MANEUVERS, WEAPON_DAMAGE, WEAPON_MANEUVER_DAMAGE
+from charsheet.models import Character
+from charsheet.modifiers.definitions import BaseModifier, ModifierOperator, StackBehavior, TargetDomain
+from charsheet.modifiers.engine import ModifierEngine, modifier_resolution_order
+from charsheet.modifiers.targets import TargetResolver
+
+SKILL_SLUGS = tuple(f"skill_{index:02d}" for index in range(60))
+DERIVED_STATS = ("initiative", "arcane_power", "potential", "vw", "gw", "sr", "rs", "defense", "parry", "dodge")
+RESISTANCES = ("fire", "cold", "poison", "acid", "lightning", "holy", "shadow")
+WEAPON_TYPES = ("sword", "axe", "bow", "dagger", "spear")
+
+
+def synthetic_modifiers(*, schools: int, items: int) -> list[BaseModifier]:
+    """Build the modifier set of a heavily equipped character with many magic schools."""
+    modifiers: list[BaseModifier] = []
+    for school in range(schools):
+        for level in range(12):
+            skill_slug = SKILL_SLUGS[(school * 7 + level) % len(SKILL_SLUGS)]
+            modifiers.append(
+                BaseModifier(
+                    source_type="school",
+                    source_id=f"{school}-{level}",
+                    target_domain=TargetDomain.SKILL,
+                    target_key=skill_slug,
+                    value=1,
+                    priority=level % 3,
+                )
+            )
+            modifiers.append(
+                BaseModifier(
+                    source_type="technique",
+                    source_id=f"{school}-{level}",
+                    target_domain=TargetDomain.DERIVED_STAT,
+                    target_key=DERIVED_STATS[(school + level) % len(DERIVED_STATS)],
+                    value=level % 4,
+                    stack_behavior=StackBehavior.UNIQUE_BY_SOURCE,
+                )
+            )
+        modifiers.append(
+            BaseModifier(
+                source_type="school",
+                source_id=f"{school}-focus",
+                target_domain=TargetDomain.SKILL_RANK_CAP,
+                target_key=SKILL_SLUGS[school % len(SKILL_SLUGS)],
+                value=1,
+                metadata={"target_skill_slugs": list(SKILL_SLUGS[school : school + 3])},
+            )
+        )
+    for item in range(items):
+        weapon_type = WEAPON_TYPES[item % len(WEAPON_TYPES)]
+        modifiers.extend(
+            [
+                BaseModifier(
+                    source_type="characteritem",
+                    source_id=str(item),
+                    target_domain=TargetDomain.COMBAT,
+                    target_key=WEAPON_DAMAGE,
+                    value=1 + item % 3,
+                ),
+                BaseModifier(
+                    source_type="item_rune",
+                    source_id=str(item),
+                    target_domain=TargetDomain.COMBAT,
+                    target_key=MELEE_MANEUVERS,
+                    value=1,
+                    metadata={"target_weapon_type": weapon_type},
+                ),
+                BaseModifier(
+                    source_type="technique",
+                    source_id=f"weapon-{item}",
+                    target_domain=TargetDomain.COMBAT,
+                    target_key=WEAPON_MANEUVER_DAMAGE,
+                    value=1,
+                    metadata={"target_weapon_type": weapon_type},
+                ),
+                BaseModifier(
+                    source_type="item",
+                    source_id=str(item),
+                    target_domain=TargetDomain.RESISTANCE,
+                    target_key=RESISTANCES[item % len(RESISTANCES)],
+                    value=1,
+                ),
+                BaseModifier(
+                    source_type="item",
+                    source_id=str(item),
+                    target_domain=TargetDomain.DERIVED_STAT,
+                    target_key="defense",
+                    value=-1,
+                    operator=ModifierOperator.FLAT_SUB if item % 2 else ModifierOperator.FLAT_ADD,
+                ),
+            ]
+        )
+    return modifiers
+
+
+def linear_numeric_total(engine: ModifierEngine, target_domain: str, target_key: str, context=None) -> int:
+    """Resolve one target with the former full scan over all active modifiers."""
+    relevant_modifiers = [
+        modifier
+        for modifier in engine.collect_active_modifiers(context=context)
+        if modifier.target_domain == target_domain
+        and engine._modifier_matches_target_key(modifier, target_domain=target_domain, target_key=target_key, context=context)
+        and engine._modifier_matches_skill_specification(modifier, target_domain=target_domain, specification=None)
+        and engine._modifier_matches_item_context(modifier, target_domain=target_domain, context=context)
+        and engine._modifier_matches_condition_text(modifier, context)
+        and TargetResolver.matches_context(modifier, context)
+    ]
+    return _apply_sorted(engine, sorted(relevant_modifiers, key=modifier_resolution_order))
+
+
+def _apply_sorted(engine: ModifierEngine, modifiers: list[BaseModifier]) -> int:
+    total = 0
+    seen_unique_sources: set[tuple[str, str, str, str]] = set()
+    for modifier in modifiers:
+        if modifier.stack_behavior == StackBehavior.UNIQUE_BY_SOURCE:
+            dedupe_key = (modifier.source_type, modifier.source_id, modifier.target_domain, modifier.target_key)
+            if dedupe_key in seen_unique_sources:
+                continue
+            seen_unique_sources.add(dedupe_key)
+        resolved_value = engine._resolve_numeric_modifier(modifier)
+        if resolved_value is None:
+            continue
+        if modifier.operator == ModifierOperator.OVERRIDE:
+            total = int(resolved_value)
+        elif modifier.operator == ModifierOperator.MULTIPLY:
+            total = int(total * resolved_value)
+        elif modifier.operator == ModifierOperator.FLOOR_DIVIDE:
+            total = int(total // resolved_value) if resolved_value else total
+        elif modifier.operator == ModifierOperator.MIN_VALUE:
+            total = max(total, int(resolved_value))
+        elif modifier.operator == ModifierOperator.MAX_VALUE:
+            total = min(total, int(resolved_value))
+        else:
+            total += int(resolved_value)
+    return total
+
+
+def benchmark_targets(engine: ModifierEngine) -> list[tuple[str, str, dict | None]]:
+    """Return every indexed target plus weapon-context combat lookups, like one sheet render."""
+    targets: list[tuple[str, str, dict | None]] = [
+        (target_domain, target_key, None) for target_domain, target_key in engine.modifier_index.by_target
+    ]
+    for weapon_type in WEAPON_TYPES:
+        context = {"weapon_types": [weapon_type]}
+        targets.append((TargetDomain.COMBAT, WEAPON_DAMAGE, context))
+        targets.append((TargetDomain.COMBAT, MELEE_MANEUVERS, context))
+    return targets
+
+
+class Command(BaseCommand):
+    """Time one full round of numeric target resolution with and without the modifier index."""
+
+    help = "Benchmark indexed modifier resolution against the former linear scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--character", type=int, default=None, help="Use a persisted character instead of synthetic data.")
+        parser.add_argument("--schools", type=int, default=8)
+        parser.add_argument("--items", type=int, default=40)
+        parser.add_argument("--iterations", type=int, default=5)
+        parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+
+    def handle(self, *args, **options):
+        if options["character"] is not None:
+            character = Character.objects.filter(pk=options["character"]).first()
+            if character is None:
+                raise CommandError(f"Character {options['character']} does not exist.")
+            engine = character.get_engine(refresh=True).modifier_engine
+        else:
+            engine = ModifierEngine(modifiers=synthetic_modifiers(schools=options["schools"], items=options["items"]))
+
+        targets = benchmark_targets(engine)
+        iterations = max(1, int(options["iterations"]))
+        linear_seconds = self._time(lambda: [linear_numeric_total(engine, *target) for target in targets], iterations)
+        indexed_seconds = self._time(
+            lambda: [engine.resolve_numeric_total(domain, key, context=context) for domain, key, context in targets],
+            iterations,
+        )
+        mismatches = [
+            f"{domain}:{key}"
+            for domain, key, context in targets
+            if linear_numeric_total(engine, domain, key, context) != engine.resolve_numeric_total(domain, key, context=context)
+        ]
+
+        result = {
+            "modifiers": len(engine.modifier_index.modifiers),
+            "targets": len(targets),
+            "iterations": iterations,
+            "linear_ms": round(linear_seconds * 1000, 3),
+            "indexed_ms": round(indexed_seconds * 1000, 3),
+            "speedup": round(linear_seconds / indexed_seconds, 2) if indexed_seconds else None,
+            "mismatches": mismatches,
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(result, sort_keys=True))
+        else:
+            for name, value in result.items():
+                self.stdout.write(f"{name}: {value}")
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} targets resolved differently.")
+
+    @staticmethod
+    def _time(callback, iterations: int) -> float:
+        """Return the best wall time per render over several iterations."""
+        best = None
+        for _ in range(iterations):
+            started = time.perf_counter()
+            callback()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best or 0.0
@@ -0,0 +1,305 @@
+"""Time sheet rendering hot paths on reproducible synthetic characters."""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from importlib import import_module
+from pathlib import Path
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from charsheet.constants import SCHOOL_ARCANE, VAMPIRE_ANCHOR_TRAIT_SLUG
+from charsheet.engine import CharacterEngine
+from charsheet.engine.battle_calculator_engine import BattleCalculatorEngine
+from charsheet.game_groups import create_group
+from charsheet.group_views import game_master_screen
+from charsheet.learning import process_learning_submission
+from charsheet.magic_sync import reconcile_character_magic
+from charsheet.models import (
+    Attribute,
+    Character,
+    CharacterAttribute,
+    CharacterCreature,
+    CharacterItem,
+    CharacterSchool,
+    CharacterSkill,
+    CharacterTrait,
+    Creature,
+    GameGroupMembership,
+    Item,
+    Race,
+    Rune,
+    School,
+    Skill,
+    Trait,
+)
+from charsheet.shop import apply_rune_to_item
+from charsheet.sheet_context import _build_skill_rows, _build_weapon_rows, build_character_sheet_context
+from codex_arcana.versioning import get_application_version
+
+BENCHMARK_SCHEMA_VERSION = 1
+PERSONAS = ("novice", "mage", "vampire", "warrior")
+GROUP_SIZE = 6
+
+
+class _Rollback(Exception):
+    """Abort the outer transaction once every measurement ran."""
+
+
+def _measure(callback, iterations: int, setup=None) -> dict[str, object]:
+    """Run one callback several times and return wall-time spread plus the last query count."""
+    timings: list[float] = []
+    queries = 0
+    for _ in range(iterations):
+        argument = setup() if setup is not None else None
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            callback(argument)
+            elapsed = time.perf_counter() - started
+        timings.append(elapsed * 1000)
+        queries = len(captured)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "queries": queries,
+    }
+
+
+class Command(BaseCommand):
+    """Seed synthetic characters inside a rolled-back transaction and time the sheet hot paths."""
+
+    help = "Benchmark sheet context, engines, battle calculator, SL screen and learning on synthetic characters."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=3)
+        parser.add_argument("--json", action="store_true", help="Print the result as JSON.")
+        parser.add_argument("--output", default="", help="Also write the JSON result to this file.")
+        parser.add_argument("--baseline", default="", help="Compare medians against an earlier JSON result.")
+
+    def handle(self, *args, **options):
+        iterations = max(1, int(options["iterations"]))
+        result: dict[str, object] = {}
+        try:
+            with transaction.atomic():
+                result = self._run(iterations)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if options["baseline"]:
+            self._compare(result, Path(options["baseline"]))
+        payload = json.dumps(result, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{payload}\n", encoding="utf-8")
+        if options["json"]:
+            self.stdout.write(payload)
+            return
+        for row in result["results"]:
+            line = (
+                f"{row['benchmark']:<22} {row['persona']:<8} "
+                f"median {row['median_ms']:>9.3f} ms  min {row['min_ms']:>9.3f} ms  queries {row['queries']:>4}"
+            )
+            if "median_change" in row:
+                line += f"  vs baseline {row['median_change']:+.1%}"
+            self.stdout.write(line)
+
+    def _run(self, iterations: int) -> dict[str, object]:
+        user = get_user_model().objects.create_user(username=f"benchmark-{uuid4().hex[:12]}")
+        characters = {persona: self._seed(persona, user) for persona in PERSONAS}
+        group = self._seed_group(user, list(characters.values()))
+
+        results: list[dict[str, object]] = []
+        for persona, character in characters.items():
+            fresh = lambda character_id=character.pk: Character.objects.select_related("race").get(pk=character_id)
+            results.append(
+                {
+                    "benchmark": "character_engine",
+                    "persona": persona,
+                    **_measure(lambda c: CharacterEngine(c).attributes(), iterations, fresh),
+                }
+            )
+            results.append(
+                {
+                    "benchmark": "modifier_resolution",
+                    "persona": persona,
+                    **_measure(
+                        self._resolve_modifiers,
+                        iterations,
+                        lambda c=character: CharacterEngine(c).modifier_engine,
+                    ),
+                }
+            )
+            results.append(
+                {
+                    "benchmark": "battle_calculator",
+                    "persona": persona,
+                    **_measure(self._build_battle_calculator, iterations, fresh),
+                }
+            )
+            results.append(
+                {
+                    "benchmark": "sheet_context",
+                    "persona": persona,
+                    **_measure(build_character_sheet_context, iterations, fresh),
+                }
+            )
+            results.append(
+                {
+                    "benchmark": "learning_submission",
+                    "persona": persona,
+                    **_measure(self._learn_one_skill_level, iterations, fresh),
+                }
+            )
+        results.append(
+            {
+                "benchmark": "game_master_screen",
+                "persona": f"group{GROUP_SIZE}",
+                **_measure(lambda request: game_master_screen(request, group.pk), iterations, lambda: self._request(user, group)),
+            }
+        )
+        return {
+            "schema": BENCHMARK_SCHEMA_VERSION,
+            "app_version": get_application_version(),
+            "database": connection.vendor,
+            "iterations": iterations,
+            "personas": {persona: self._describe(character) for persona, character in characters.items()},
+            "results": results,
+        }
+
+    def _seed(self, persona: str, user, *, name: str = "") -> Character:
+        """Create one persona from the first matching catalog rows, so runs stay comparable."""
+        race = Race.objects.order_by("pk").first()
+        if race is None:
+            raise CommandError("The rules catalog has no race; load the game data first.")
+        character = Character.objects.create(
+            owner=user,
+            name=name or f"Benchmark {persona}",
+            race=race,
+            money=5000,
+            overall_experience=500,
+            current_experience=500,
+        )
+        base_value = 4 if persona == "novice" else 7
+        CharacterAttribute.objects.bulk_create(
+            CharacterAttribute(character=character, attribute=attribute, base_value=base_value)
+            for attribute in Attribute.objects.order_by("pk")
+        )
+        skill_count, skill_level = (6, 1) if persona == "novice" else (16, 4)
+        CharacterSkill.objects.bulk_create(
+            CharacterSkill(character=character, skill=skill, level=skill_level)
+            for skill in Skill.objects.filter(requires_specification=False).order_by("pk")[:skill_count]
+        )
+
+        if persona == "mage":
+            for school in School.objects.filter(type__slug=SCHOOL_ARCANE).order_by("pk")[:4]:
+                CharacterSchool.objects.create(character=character, school=school, level=4)
+        elif persona == "vampire":
+            anchor = Trait.objects.filter(slug=VAMPIRE_ANCHOR_TRAIT_SLUG).first()
+            if anchor is not None:
+                CharacterTrait.objects.create(owner=character, trait=anchor, trait_level=1)
+            for creature in Creature.objects.order_by("pk")[:3]:
+                CharacterCreature.objects.create(owner=character, creature=creature)
+        elif persona == "warrior":
+            self._seed_runed_weapons(character)
+        # Outside a committed transaction the deferred magic sync never runs, so do it here.
+        reconcile_character_magic(character.pk)
+        return Character.objects.get(pk=character.pk)
+
+    def _seed_runed_weapons(self, character: Character) -> None:
+        """Give the warrior several weapons with every applicable rune attached."""
+        runes = list(Rune.objects.order_by("pk")[:6])
+        weapons = Item.objects.filter(weaponstats__isnull=False, catalog_group__isnull=True).order_by("pk")[:6]
+        for index, item in enumerate(weapons):
+            character_item = CharacterItem.objects.create(owner=character, item=item, equipped=index < 2)
+            for rune in runes:
+                try:
+                    apply_rune_to_item(item=character_item, rune=rune, crafter_level=3)
+                except ValidationError:
+                    continue
+
+    def _seed_group(self, user, characters: list[Character]):
+        """Create a group led by the benchmark user with the personas plus novices up to the group size."""
+        # Saving a new group grants its creator the leader role.
+        group = create_group(creator=user, name=f"Benchmark {uuid4().hex[:12]}")
+        members = list(characters)
+        while len(members) < GROUP_SIZE:
+            members.append(self._seed("novice", user, name=f"Benchmark novice {len(members)}"))
+        for character in members:
+            GameGroupMembership.objects.create(group=group, character=character)
+        return group
+
+    @staticmethod
+    def _resolve_modifiers(modifier_engine) -> None:
+        """Resolve every indexed target once, like one full sheet render does."""
+        for target_domain, target_key in modifier_engine.modifier_index.by_target:
+            modifier_engine.resolve_numeric_total(target_domain, target_key)
+
+    @staticmethod
+    def _build_battle_calculator(character: Character) -> None:
+        """Build the skill and weapon rows the calculator reads, then its payload, like the sheet does."""
+        engine = CharacterEngine(character)
+        skill_rows, _character_skills, _manager_rows = _build_skill_rows(
+            character,
+            engine,
+            load_penalty=engine.load_penalty(),
+        )
+        BattleCalculatorEngine.build_payload(engine, skill_rows, _build_weapon_rows(engine))
+
+    @staticmethod
+    def _learn_one_skill_level(character: Character) -> None:
+        """Submit one skill raise and undo it, so every iteration learns the same level."""
+        skill_row = CharacterSkill.objects.filter(character=character).select_related("skill").order_by("pk").first()
+        post_data = QueryDict(mutable=True)
+        if skill_row is not None:
+            post_data[f"learn_skill_add_{skill_row.skill.slug}"] = "1"
+        with transaction.atomic():
+            process_learning_submission(character, post_data)
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _request(user, group):
+        request = RequestFactory().get(reverse("game_master_screen", args=[group.pk]))
+        request.user = user
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        request._messages = FallbackStorage(request)
+        return request
+
+    @staticmethod
+    def _describe(character: Character) -> dict[str, int]:
+        return {
+            "skills": CharacterSkill.objects.filter(character=character).count(),
+            "schools": CharacterSchool.objects.filter(character=character).count(),
+            "items": CharacterItem.objects.filter(owner=character).count(),
+            "runes": sum(item.item_runes.count() for item in CharacterItem.objects.filter(owner=character)),
+            "creatures": CharacterCreature.objects.filter(owner=character).count(),
+            "vampire": int(character.is_vampire),
+        }
+
+    @staticmethod
+    def _compare(result: dict[str, object], baseline_path: Path) -> None:
+        """Annotate each row with the relative median change against a stored run."""
+        try:
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            raise CommandError(f"Baseline {baseline_path} could not be read: {exc}") from exc
+        previous = {(row["benchmark"], row["persona"]): row for row in baseline.get("results", [])}
+        for row in result["results"]:
+            earlier = previous.get((row["benchmark"], row["persona"]))
+            if not earlier or not earlier.get("median_ms"):
+                continue
+            row["baseline_median_ms"] = earlier["median_ms"]
+            row["baseline_queries"] = earlier["queries"]
+            row["median_change"] = round(row["median_ms"] / earlier["median_ms"] - 1, 4)
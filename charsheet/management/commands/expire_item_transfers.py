@@ -1,16 +1,71 @@
+import json
+import time
+
 from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 
-from charsheet.item_transfers import expire_due_transfers
+from charsheet.item_transfers import (
+    TRANSFER_EXPIRY_BATCH_SIZE,
+    reset_transfer_expiry_stats,
+    run_transfer_expiry,
+    seconds_until_next_transfer_expiry,
+    transfer_expiry_stats,
+)
 
 
 class Command(BaseCommand):
     help = "Expire pending item transfers whose seven-day deadline has elapsed."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running and sleep until the next transfer is due.",
+        )
+        parser.add_argument(
+            "--max-sleep",
+            type=int,
+            default=300,
+            help="Upper bound in seconds for one worker sleep.",
+        )
+        parser.add_argument("--stats", action="store_true", help="Print the expiry throughput counters.")
+        parser.add_argument("--json", action="store_true", help="Print the counters as JSON.")
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+
     def handle(self, *args, **options):
+        if options["stats"]:
+            self._print_stats(options)
+            return
+        if options["loop"]:
+            self._run_worker(max(1, options["max_sleep"]))
+            return
+        total = self._expire_all()
+        self.stdout.write(self.style.SUCCESS(f"Expired {total} item transfer(s)."))
+
+    def _expire_all(self) -> int:
         total = 0
         while True:
-            count = expire_due_transfers()
+            count = run_transfer_expiry()
             total += count
-            if count < 250:
-                break
-        self.stdout.write(self.style.SUCCESS(f"Expired {total} item transfer(s)."))
+            if count < TRANSFER_EXPIRY_BATCH_SIZE:
+                return total
+
+    def _run_worker(self, max_sleep: int) -> None:
+        while True:
+            close_old_connections()
+            total = self._expire_all()
+            if total:
+                self.stdout.write(f"Expired {total} item transfer(s).")
+            # Sleeping in bounded steps keeps admin-edited deadlines from waiting a full week.
+            time.sleep(min(max_sleep, max(1.0, seconds_until_next_transfer_expiry())))
+
+    def _print_stats(self, options) -> None:
+        stats = transfer_expiry_stats()
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, sort_keys=True))
+        else:
+            for name, value in stats.items():
+                self.stdout.write(f"{name}: {value}")
+        if options["reset"]:
+            reset_transfer_expiry_stats()
+            self.stdout.write(self.style.SUCCESS("Transfer expiry counters reset."))
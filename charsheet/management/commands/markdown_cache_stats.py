@@ -0,0 +1,34 @@
+import json
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from charsheet.markdown_cache import markdown_cache_stats, reset_markdown_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Print hit/miss counters of the rendered-markdown cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Print the counters as JSON.")
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+
+    def handle(self, *args, **options):
+        # The counters live in the cache; a process-local backend only ever shows this command's own empty process.
+        if isinstance(caches["default"], (LocMemCache, DummyCache)):
+            raise CommandError(
+                "The markdown cache counters need a shared cache backend; set DJANGO_REDIS_URL for the web workers and this command."
+            )
+        stats = markdown_cache_stats()
+        # The entry count belongs to this command's process, not to the web workers.
+        stats.pop("entries", None)
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, sort_keys=True))
+        else:
+            for name, value in stats.items():
+                self.stdout.write(f"{name}: {value}")
+        if options["reset"]:
+            reset_markdown_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Markdown cache counters reset."))
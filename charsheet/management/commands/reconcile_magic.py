@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from charsheet.magic_sync import reconcile_character_magic
+from charsheet.models import Character
+
+
+class Command(BaseCommand):
+    help = "Synchronize magic for characters whose magic-dirty marker is still set."
+
+    def handle(self, *args, **options):
+        character_ids = list(Character.objects.filter(magic_dirty=True).order_by("pk").values_list("pk", flat=True))
+        changed = sum(1 for character_id in character_ids if reconcile_character_magic(character_id))
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled {len(character_ids)} character(s), {changed} with magic changes.")
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from charsheet.models import Character, CharacterWeightLedger
+from charsheet.weight_ledger import WEIGHT_LEDGER_FIELDS, compute_weight_totals
+
+
+class Command(BaseCommand):
+    help = "Compare every character weight ledger with a fresh inventory sum and repair drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report drift without writing.")
+
+    def handle(self, *args, **options):
+        ledgers = CharacterWeightLedger.objects.in_bulk()
+        drifted = 0
+        for character_id in Character.objects.order_by("pk").values_list("pk", flat=True):
+            with transaction.atomic():
+                totals = compute_weight_totals(character_id)
+                ledger = ledgers.get(character_id)
+                if ledger is None:
+                    if not options["dry_run"]:
+                        CharacterWeightLedger.objects.get_or_create(character_id=character_id, defaults=totals)
+                    continue
+                stale = {
+                    field: (getattr(ledger, field), totals[field])
+                    for field in WEIGHT_LEDGER_FIELDS
+                    if getattr(ledger, field) != totals[field]
+                }
+                if not stale:
+                    continue
+                drifted += 1
+                details = ", ".join(f"{field} {old} -> {new}" for field, (old, new) in stale.items())
+                self.stdout.write(self.style.WARNING(f"Character {character_id}: {details}"))
+                if not options["dry_run"]:
+                    CharacterWeightLedger.objects.filter(pk=character_id).update(**totals)
+        action = "Found" if options["dry_run"] else "Repaired"
+        self.stdout.write(self.style.SUCCESS(f"{action} {drifted} drifted weight ledger(s)."))
@@ -0,0 +1,32 @@
+import json
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+
+from charsheet.sheet_cache import reset_sheet_context_cache_stats, sheet_context_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Print hit/miss counters of the character-sheet context cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Print the counters as JSON.")
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+
+    def handle(self, *args, **options):
+        # The counters live in the cache; a process-local backend only ever shows this command's own empty process.
+        if isinstance(caches["default"], (LocMemCache, DummyCache)):
+            raise CommandError(
+                "The sheet cache counters need a shared cache backend; set DJANGO_REDIS_URL for the web workers and this command."
+            )
+        stats = sheet_context_cache_stats()
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, sort_keys=True))
+        else:
+            for name, value in stats.items():
+                self.stdout.write(f"{name}: {value}")
+        if options["reset"]:
+            reset_sheet_context_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Sheet cache counters reset."))
@@ -0,0 +1,87 @@
+"""Process-local cache of rendered markdown keyed by renderer and content hash."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from django.core.cache import cache
+
+from .cache_counters import increment_cache_counter
+
+MARKDOWN_CACHE_MAX_ENTRIES = 2048
+# Lookups are counted locally and pushed to the shared counters in batches.
+MARKDOWN_STATS_FLUSH_EVERY = 200
+MARKDOWN_CACHE_PREFIX = "charsheet:markdown-cache"
+MARKDOWN_CACHE_STAT_KEYS = {
+    "hits": f"{MARKDOWN_CACHE_PREFIX}:stats:hits",
+    "misses": f"{MARKDOWN_CACHE_PREFIX}:stats:misses",
+}
+
+_lock = threading.Lock()
+_rendered: OrderedDict[tuple[str, str], str] = OrderedDict()
+_pending = {stat: 0 for stat in MARKDOWN_CACHE_STAT_KEYS}
+
+
+def _content_key(renderer_name: str, value: str) -> tuple[str, str]:
+    return renderer_name, hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _flush_pending() -> None:
+    """Add the locally counted lookups to the shared counters."""
+    with _lock:
+        pending = dict(_pending)
+        for stat in _pending:
+            _pending[stat] = 0
+    for stat, amount in pending.items():
+        if amount:
+            increment_cache_counter(MARKDOWN_CACHE_STAT_KEYS[stat], amount)
+
+
+def render_markdown_cached(renderer_name: str, value: str, renderer: Callable[[str], str]) -> str:
+    """Return the rendered HTML for one text, rendering it only on the first lookup."""
+    key = _content_key(renderer_name, value)
+    with _lock:
+        html = _rendered.get(key)
+        if html is not None:
+            _rendered.move_to_end(key)
+            _pending["hits"] += 1
+        else:
+            _pending["misses"] += 1
+        should_flush = sum(_pending.values()) >= MARKDOWN_STATS_FLUSH_EVERY
+    if html is None:
+        html = renderer(value)
+        with _lock:
+            _rendered[key] = html
+            while len(_rendered) > MARKDOWN_CACHE_MAX_ENTRIES:
+                _rendered.popitem(last=False)
+    if should_flush:
+        _flush_pending()
+    return html
+
+
+def markdown_cache_stats() -> dict[str, object]:
+    """Return shared hit/miss counters, the hit rate, and this process's entry count."""
+    _flush_pending()
+    values = cache.get_many(list(MARKDOWN_CACHE_STAT_KEYS.values()))
+    stats: dict[str, object] = {stat: int(values.get(key) or 0) for stat, key in MARKDOWN_CACHE_STAT_KEYS.items()}
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    stats["entries"] = len(_rendered)
+    return stats
+
+
+def reset_markdown_cache_stats() -> None:
+    """Reset the shared and local monitoring counters."""
+    with _lock:
+        for stat in _pending:
+            _pending[stat] = 0
+    cache.delete_many(list(MARKDOWN_CACHE_STAT_KEYS.values()))
+
+
+def clear_markdown_cache() -> None:
+    """Drop every rendered entry of this process."""
+    with _lock:
+        _rendered.clear()
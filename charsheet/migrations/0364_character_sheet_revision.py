@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0363_alter_gamegroupmembership_invitation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='character',
+            name='sheet_revision',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Incremented whenever sheet-relevant character data changes.'),
+        ),
+    ]
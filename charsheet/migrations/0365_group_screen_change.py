@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0364_character_sheet_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameGroupScreenChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('character', 'Charakterkarte'), ('creature', 'Kreaturenkarte'), ('inventory', 'SL-Inventar'), ('roster', 'Kartenliste')], max_length=16)),
+                ('object_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='screen_changes', to='charsheet.gamegroup')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['group', 'id'], name='group_screen_change_cursor')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0365_group_screen_change'),
+    ]
+
+    operations = [
+        # Existing characters were last synchronized on a sheet load; mark them once for reconciliation.
+        migrations.AddField(
+            model_name='character',
+            name='magic_dirty',
+            field=models.BooleanField(default=True, editable=False, help_text='Set when magic-relevant data changed and aspects or spells still need synchronization.'),
+        ),
+        migrations.AlterField(
+            model_name='character',
+            name='magic_dirty',
+            field=models.BooleanField(default=False, editable=False, help_text='Set when magic-relevant data changed and aspects or spells still need synchronization.'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0366_character_magic_dirty'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CharacterWeightLedger',
+            fields=[
+                ('character', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='weight_ledger', serialize=False, to='charsheet.character')),
+                ('carried_weight', models.DecimalField(decimal_places=3, default=0, max_digits=12)),
+                ('equipped_weight', models.DecimalField(decimal_places=3, default=0, max_digits=12)),
+                ('stored_weight', models.DecimalField(decimal_places=3, default=0, max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
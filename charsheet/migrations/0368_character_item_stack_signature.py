@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0367_character_weight_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='characteritem',
+            name='stack_signature',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Hash of the related instance state compared when stacks merge; empty until computed.', max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name='characteritem',
+            index=models.Index(fields=['item', 'owner', 'group_owner', 'stack_signature'], name='character_item_stack_lookup'),
+        ),
+    ]
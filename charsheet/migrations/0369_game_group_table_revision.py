@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0368_character_item_stack_signature'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamegrouptable',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Incremented by every content edit so concurrent editors can detect conflicts.'),
+        ),
+    ]
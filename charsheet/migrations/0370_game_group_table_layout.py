@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('charsheet', '0369_game_group_table_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamegrouptable',
+            name='layout',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resolved column widths and cell spans of the current revision.'),
+        ),
+    ]
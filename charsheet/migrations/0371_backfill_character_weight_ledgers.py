@@ -0,0 +1,26 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def backfill_weight_ledgers(apps, schema_editor):
+    # The ledger module owns the weight sum, so existing characters get
+    # exactly the totals the item signals would have maintained.
+    from charsheet.weight_ledger import create_weight_ledgers
+
+    Character = apps.get_model("charsheet", "Character")
+
+    character_ids = list(Character.objects.filter(weight_ledger__isnull=True).order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(character_ids), BATCH_SIZE):
+        create_weight_ledgers(*character_ids[start:start + BATCH_SIZE])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("charsheet", "0370_game_group_table_layout"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_weight_ledgers, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,7 @@ from .character import (
     CharacterSkill,
     CharacterTraitChoice,
     CharacterTrait,
+    CharacterWeightLedger,
     TraitChoiceDefinition,
 )
 from .core import (
@@ -108,6 +109,7 @@ from .groups import (
     GameGroupInvitation,
     GameGroupMembership,
     GameGroupRole,
+    GameGroupScreenChange,
     GameGroupTable,
     GameGroupTableCell,
     GameGroupTableColumn,
@@ -183,6 +185,7 @@ __all__ = [
     "CharacterVampirePower",
     "CharacterVampireTrait",
     "CharacterItem",
+    "CharacterWeightLedger",
     "ItemRune",
     "CharacterItemRuneSpec",
     "CharacterLanguage",
@@ -240,6 +243,7 @@ __all__ = [
     "GameGroupInvitation",
     "GameGroupMembership",
     "GameGroupRole",
+    "GameGroupScreenChange",
     "GameGroupTable",
     "GameGroupTableCell",
     "GameGroupTableColumn",
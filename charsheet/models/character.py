@@ -2,9 +2,10 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 from uuid import uuid4
 
 from ..constants import (
@@ -22,9 +23,13 @@ from ..constants import (
     WIELD_MODES,
 )
 from .core import Attribute, DamageSource, Language, Race, Skill, SkillCategory, Trait
+from .groups import GameGroupScreenChange
 from .items import Item, Rune
 from .progression import Specialization
 
+# Character fields whose updates never change the rendered sheet.
+SHEET_REVISION_NEUTRAL_FIELDS = frozenset({"last_opened_at", "magic_dirty"})
+
 
 class Character(models.Model):
     """A persisted player character with progression and status data."""
@@ -84,6 +89,16 @@ class Character(models.Model):
     spent_spell_learning_slots = models.PositiveIntegerField(default=0)
     is_archived = models.BooleanField(default=False)
     last_opened_at = models.DateTimeField(null=True, blank=True)
+    sheet_revision = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Incremented whenever sheet-relevant character data changes.",
+    )
+    magic_dirty = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Set when magic-relevant data changed and aspects or spells still need synchronization.",
+    )
 
     personal_fame_point = models.PositiveIntegerField(default=0, validators=[MaxValueValidator(10)])
     personal_fame_rank = models.PositiveIntegerField(default=0)
@@ -103,6 +118,22 @@ class Character(models.Model):
     def __str__(self):
         return f"{self.name} ({self.race.name})"
 
+    def save(self, *args, **kwargs):
+        """Persist the character and bump the sheet revision for relevant changes."""
+        update_fields = kwargs.get("update_fields")
+        bumps_revision = not self._state.adding and (
+            update_fields is None or not set(update_fields) <= SHEET_REVISION_NEUTRAL_FIELDS
+        )
+        if bumps_revision:
+            self.sheet_revision = models.F("sheet_revision") + 1
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "sheet_revision"}
+        super().save(*args, **kwargs)
+        if bumps_revision:
+            # Leave the field deferred so later saves never write back a stale value.
+            self.__dict__.pop("sheet_revision", None)
+            GameGroupScreenChange.record_for_characters([self.pk])
+
     @property
     def is_vampire(self) -> bool:
         """Return whether the dedicated acquisition-anchor trait is owned."""
@@ -231,6 +262,12 @@ class Character(models.Model):
             )
         return self.__dict__[cache_key]
 
+    def invalidate_engine(self, *mutations: str) -> None:
+        """Drop only the cached engine state affected by the given mutation kinds."""
+        cached_engine = self.__dict__.get("_character_engine")
+        if cached_engine is not None:
+            cached_engine.invalidate(*mutations)
+
     def get_magic_engine(self, *, refresh: bool = False):
         """Return a reusable magic engine instance for spell, aspect, and casting rules."""
         cache_key = "_character_magic_engine"
@@ -342,6 +379,13 @@ class CharacterItem(models.Model):
     group_origin_finalized = models.BooleanField(default=False, editable=False)
     provenance_id = models.UUIDField(default=uuid4, unique=True, editable=False)
     ownership_version = models.PositiveIntegerField(default=1, editable=False)
+    stack_signature = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Hash of the related instance state compared when stacks merge; empty until computed.",
+    )
     amount = models.PositiveIntegerField(default=1)
     equipped = models.BooleanField(default=False)
     equip_locked = models.BooleanField(default=False)
@@ -408,6 +452,9 @@ class CharacterItem(models.Model):
     shield_min_st_override = models.PositiveIntegerField(null=True, blank=True)
 
     class Meta:
+        indexes = [
+            models.Index(fields=["item", "owner", "group_owner", "stack_signature"], name="character_item_stack_lookup"),
+        ]
         constraints = [
             models.CheckConstraint(
                 condition=(
@@ -525,6 +572,29 @@ class CharacterItem(models.Model):
         return getattr(self.item, item_field)
 
 
+class CharacterWeightLedger(models.Model):
+    """Maintained inventory weight totals of one character, split by item location."""
+
+    character = models.OneToOneField(
+        Character,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="weight_ledger",
+    )
+    carried_weight = models.DecimalField(max_digits=12, decimal_places=3, default=0)
+    equipped_weight = models.DecimalField(max_digits=12, decimal_places=3, default=0)
+    stored_weight = models.DecimalField(max_digits=12, decimal_places=3, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Gewicht {self.character_id}"
+
+    @property
+    def active_weight(self):
+        """Return the weight of everything not stored away, equipped items included."""
+        return self.carried_weight + self.equipped_weight
+
+
 class ItemRune(models.Model):
     """Concrete rune assignment on one owned item, used as modifier source."""
 
@@ -1067,3 +1137,110 @@ class CharacterCreationDraft(models.Model):
     race = models.ForeignKey(Race, on_delete=models.CASCADE)
     current_phase = models.PositiveIntegerField(default=1, validators=[MaxValueValidator(4)])
     state = models.JSONField(default=dict, blank=True)
+
+
+# Character-owned rows that feed the engine or sheet panels, mapped to the
+# attribute path resolving the owning character's primary key.
+SHEET_REVISION_SOURCES = {
+    "charsheet.CharacterAttribute": ("character_id",),
+    "charsheet.CharacterSkill": ("character_id",),
+    "charsheet.CharacterItem": ("owner_id",),
+    "charsheet.CharacterItemSemanticEffect": ("character_item", "owner_id"),
+    "charsheet.CharacterItemRuneSpec": ("character_item", "owner_id"),
+    "charsheet.ItemRune": ("item", "owner_id"),
+    "charsheet.CharacterTrait": ("owner_id",),
+    "charsheet.CharacterTraitChoice": ("character_trait", "owner_id"),
+    "charsheet.CharacterLanguage": ("owner_id",),
+    "charsheet.CharacterDiaryEntry": ("character_id",),
+    "charsheet.CharacterSchool": ("character_id",),
+    "charsheet.CharacterSchoolPath": ("character_id",),
+    "charsheet.CharacterSpecialization": ("character_id",),
+    "charsheet.CharacterWeaponMastery": ("character_id",),
+    "charsheet.CharacterWeaponMasteryArcana": ("character_id",),
+    "charsheet.CharacterLesson": ("character_id",),
+    "charsheet.CharacterTechnique": ("character_id",),
+    "charsheet.CharacterTechniqueChoice": ("character_id",),
+    "charsheet.CharacterRaceChoice": ("character_id",),
+    "charsheet.CharacterAspect": ("character_id",),
+    "charsheet.CharacterDivineEntity": ("character_id",),
+    "charsheet.CharacterDruidCult": ("character_id",),
+    "charsheet.CharacterShamanPatron": ("character_id",),
+    "charsheet.CharacterSpellSource": ("character_id",),
+    "charsheet.CharacterSpell": ("character_id",),
+    "charsheet.CharacterDaemonicPower": ("character_id",),
+    "charsheet.CharacterVampireTrait": ("character_id",),
+    "charsheet.CharacterVampirePower": ("character_id",),
+    "charsheet.CharacterCreature": ("owner_id",),
+    "charsheet.CharacterCreatureItem": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureSkill": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureSpecialSkill": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureLanguage": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureTrait": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureTraitChoice": ("character_creature_trait", "creature", "owner_id"),
+    "charsheet.CharacterCreatureCommand": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureAttributeIncrease": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureDaemonicPower": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureVampireTrait": ("creature", "owner_id"),
+    "charsheet.CharacterCreatureVampirePower": ("creature", "owner_id"),
+}
+
+# Rows shown on the sheets of several characters at once (holder, sender,
+# recipient, original owner), mapped to one attribute path per character.
+SHEET_REVISION_MULTI_SOURCES = {
+    "charsheet.ItemTransfer": (
+        ("sender_id",),
+        ("recipient_id",),
+        ("item", "owner_id"),
+        ("item", "original_owner_character_id"),
+    ),
+    "charsheet.ItemPermissionGrant": (("item", "owner_id"), ("granted_by_id",), ("grantee_id",)),
+}
+
+
+def bump_sheet_revision(*character_ids) -> None:
+    """Invalidate cached sheet state for the given characters."""
+    ids = {int(character_id) for character_id in character_ids if character_id}
+    if ids:
+        Character.objects.filter(pk__in=ids).update(sheet_revision=models.F("sheet_revision") + 1)
+        GameGroupScreenChange.record_for_characters(ids)
+
+
+def _sheet_revision_character_id(instance, path: tuple[str, ...]):
+    """Resolve the owning character id of one sheet-relevant row."""
+    value = instance
+    try:
+        for attribute in path:
+            value = getattr(value, attribute)
+            if value is None:
+                return None
+    except ObjectDoesNotExist:
+        return None
+    return value
+
+
+def _bump_sheet_revision_for_instance(sender, instance, raw=False, **kwargs):
+    """Bump the owner's sheet revision after a sheet-relevant row changed."""
+    if raw:
+        return
+    label = sender._meta.label
+    if label in SHEET_REVISION_MULTI_SOURCES:
+        bump_sheet_revision(
+            *(_sheet_revision_character_id(instance, path) for path in SHEET_REVISION_MULTI_SOURCES[label])
+        )
+        return
+    path = SHEET_REVISION_SOURCES.get(label)
+    if path is not None:
+        bump_sheet_revision(_sheet_revision_character_id(instance, path))
+
+
+for _sender_label in (*SHEET_REVISION_SOURCES, *SHEET_REVISION_MULTI_SOURCES):
+    post_save.connect(
+        _bump_sheet_revision_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"sheet_revision_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _bump_sheet_revision_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"sheet_revision_delete:{_sender_label}",
+    )
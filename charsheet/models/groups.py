@@ -1,10 +1,13 @@
 """Persistent game-group, game-master, invitation, and membership models."""
 
+from functools import partial
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.db.models.functions import Lower
 
 from ..constants import (
@@ -360,6 +363,74 @@ class GameGroupCreature(models.Model):
         self.current_kp = current
 
 
+class GameGroupScreenChange(models.Model):
+    """Append-only change log that tells open SL screens which cards are stale."""
+
+    class Kind(models.TextChoices):
+        CHARACTER = "character", "Charakterkarte"
+        CREATURE = "creature", "Kreaturenkarte"
+        INVENTORY = "inventory", "SL-Inventar"
+        ROSTER = "roster", "Kartenliste"
+
+    group = models.ForeignKey(
+        GameGroup,
+        on_delete=models.CASCADE,
+        related_name="screen_changes",
+    )
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["group", "id"], name="group_screen_change_cursor")]
+
+    def __str__(self):
+        return f"{self.group_id}: {self.kind} {self.object_id or ''}".strip()
+
+    # Entries are inserted after the surrounding transaction commits: the poll
+    # advances an ``id`` cursor, so a row whose id was allocated inside a long
+    # transaction would otherwise become visible behind a cursor that already
+    # moved past it and never reach the open screens.
+    @classmethod
+    def record(cls, group_ids, kind: str, object_id: int | None = None) -> None:
+        """Append one change entry for every given group once the current transaction commits."""
+        group_ids = sorted(set(group_ids))
+        if group_ids:
+            transaction.on_commit(partial(cls._insert, group_ids, kind, object_id))
+
+    @classmethod
+    def _insert(cls, group_ids, kind: str, object_id: int | None) -> None:
+        """Write the change entries collected by ``record(...)``."""
+        cls.objects.bulk_create([cls(group_id=group_id, kind=kind, object_id=object_id) for group_id in group_ids])
+
+    @classmethod
+    def record_for_characters(cls, character_ids) -> None:
+        """Mark the character cards and owned creature cards of the given characters as stale after commit."""
+        ids = {int(character_id) for character_id in character_ids if character_id}
+        if ids:
+            transaction.on_commit(partial(cls._insert_for_characters, ids))
+
+    @classmethod
+    def _insert_for_characters(cls, ids: set[int]) -> None:
+        """Write the change entries collected by ``record_for_characters(...)``."""
+        entries = [
+            cls(group_id=group_id, kind=cls.Kind.CHARACTER, object_id=character_id)
+            for group_id, character_id in GameGroupMembership.objects.filter(
+                character_id__in=ids,
+                status=GameGroupMembership.Status.ACTIVE,
+            ).values_list("group_id", "character_id")
+        ]
+        entries.extend(
+            cls(group_id=group_id, kind=cls.Kind.CREATURE, object_id=card_id)
+            for group_id, card_id in GameGroupCreature.objects.filter(
+                character_creature__owner_id__in=ids,
+            ).values_list("group_id", "id")
+        )
+        if entries:
+            cls.objects.bulk_create(entries)
+
+
 class GameGroupTable(models.Model):
     """A freely configurable data table shown in a group's SL screen."""
 
@@ -386,6 +457,17 @@ class GameGroupTable(models.Model):
         blank=True,
         validators=[MinValueValidator(320), MaxValueValidator(6000)],
     )
+    revision = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Incremented by every content edit so concurrent editors can detect conflicts.",
+    )
+    layout = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Resolved column widths and cell spans of the current revision.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -521,3 +603,50 @@ class GameGroupTableCell(models.Model):
 
     def __str__(self):
         return str(self.value)
+
+
+def _record_membership_screen_change(sender, instance, raw=False, **kwargs):
+    """Reload SL screens after characters join or leave a group."""
+    if not raw:
+        GameGroupScreenChange.record([instance.group_id], GameGroupScreenChange.Kind.ROSTER)
+
+
+def _record_creature_card_screen_change(sender, instance, raw=False, created=False, **kwargs):
+    """Refresh one creature card, or the whole roster when cards appear or vanish."""
+    if raw:
+        return
+    if created or kwargs.get("signal") is post_delete:
+        GameGroupScreenChange.record([instance.group_id], GameGroupScreenChange.Kind.ROSTER)
+    else:
+        GameGroupScreenChange.record([instance.group_id], GameGroupScreenChange.Kind.CREATURE, instance.pk)
+
+
+def _record_group_inventory_screen_change(sender, instance, raw=False, **kwargs):
+    """Refresh the SL inventory after group-owned items or group transfers changed."""
+    if raw:
+        return
+    group_ids = {
+        getattr(instance, field_name, None)
+        for field_name in ("group_owner_id", "sender_group_id", "recipient_group_id")
+    } - {None}
+    if group_ids:
+        GameGroupScreenChange.record(group_ids, GameGroupScreenChange.Kind.INVENTORY)
+
+
+for _signal_name, _signal in (("save", post_save), ("delete", post_delete)):
+    _signal.connect(
+        _record_membership_screen_change,
+        sender=GameGroupMembership,
+        dispatch_uid=f"group_screen_membership_{_signal_name}",
+    )
+    _signal.connect(
+        _record_creature_card_screen_change,
+        sender=GameGroupCreature,
+        dispatch_uid=f"group_screen_creature_{_signal_name}",
+    )
+    for _sender_label in ("charsheet.CharacterItem", "charsheet.ItemTransfer"):
+        _signal.connect(
+            _record_group_inventory_screen_change,
+            sender=_sender_label,
+            dispatch_uid=f"group_screen_inventory_{_signal_name}:{_sender_label}",
+        )
@@ -5,8 +5,8 @@ from __future__ import annotations
 import json
 import math
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field, replace
-from functools import cached_property
 from typing import Any
 
 from charsheet.modifiers.definitions import AttributeCapModifier, BaseModifier, ModifierOperator, RuleFlagModifier, StackBehavior, TargetDomain
@@ -19,18 +19,14 @@ from charsheet.constants import (
     WEAPON_MANEUVER_DAMAGE,
 )
 from charsheet.modifiers.migration import ModifierResolutionMode, NumericResolutionComparison
+from charsheet.profiling import profiled, profiled_cached_property
 from charsheet.modifiers.registry import build_trait_semantic_modifiers
 from charsheet.modifiers.targets import TargetResolver
 from charsheet.models import (
     CharacterDaemonicPower,
     CharacterItemSemanticEffect,
-    DaemonicPowerSemanticEffect,
     ItemSemanticEffect,
-    RaceSemanticEffect,
-    RuneSemanticEffect,
-    SchoolSemanticEffect,
     Skill,
-    TechniqueSemanticEffect,
     VampireTraitSemanticEffect,
 )
 
@@ -92,6 +88,73 @@ class SocialProfile:
     tags: set[str] = field(default_factory=set)
 
 
+CONTEXT_MODIFIER_CACHE_SIZE = 64
+SKILL_TARGET_DOMAINS = frozenset({TargetDomain.SKILL, TargetDomain.SKILL_RANK, TargetDomain.SKILL_RANK_CAP})
+WEAPON_MANEUVER_DAMAGE_ALIAS_KEYS = (MELEE_MANEUVERS, WEAPON_DAMAGE)
+
+
+def modifier_resolution_order(modifier: BaseModifier) -> tuple[Any, str, str]:
+    """Return the stable order in which numeric modifiers are applied."""
+    return (int(modifier.priority or 0), str(modifier.source_type or ""), str(modifier.source_id or ""))
+
+
+def compile_trait_entry_modifiers(trait_entries, catalog) -> list[BaseModifier]:
+    """Build semantic modifiers for purchased traits, preferring persisted catalog effects."""
+    modifiers: list[BaseModifier] = []
+    for entry in trait_entries:
+        persisted = catalog.trait_modifiers_by_trait_id.get(entry.trait_id)
+        if persisted:
+            modifiers.extend(persisted)
+            continue
+        modifiers.extend(
+            build_trait_semantic_modifiers(
+                trait_slug=entry.trait.slug,
+                level=int(entry.trait_level),
+                allow_persisted_lookup=False,
+            )
+        )
+    return modifiers
+
+
+@dataclass(slots=True)
+class ModifierIndex:
+    """Context-independent modifiers bucketed by every target they can match."""
+
+    modifiers: list[BaseModifier]
+    by_target: dict[tuple[str, str], list[BaseModifier]] = field(default_factory=dict)
+    by_domain: dict[str, list[BaseModifier]] = field(default_factory=dict)
+
+    @classmethod
+    @profiled("ModifierIndex.build")
+    def build(cls, modifiers: list[BaseModifier]) -> "ModifierIndex":
+        """Bucket modifiers once, pre-sorted by resolution order inside each bucket."""
+        index = cls(modifiers=list(modifiers))
+        # A stable pre-sort keeps every bucket in the order a filtered sort would produce.
+        for modifier in sorted(index.modifiers, key=modifier_resolution_order):
+            index.by_domain.setdefault(modifier.target_domain, []).append(modifier)
+            for target_key in cls._candidate_keys(modifier):
+                index.by_target.setdefault((modifier.target_domain, target_key), []).append(modifier)
+        return index
+
+    @staticmethod
+    def _candidate_keys(modifier: BaseModifier) -> set[str]:
+        """Return the direct key plus every alias key the modifier may resolve for."""
+        keys = {modifier.target_key}
+        if modifier.target_domain in SKILL_TARGET_DOMAINS:
+            keys.update(str(slug) for slug in (modifier.metadata.get("target_skill_slugs") or []))
+        if modifier.target_domain == TargetDomain.COMBAT and modifier.target_key == WEAPON_MANEUVER_DAMAGE:
+            keys.update(WEAPON_MANEUVER_DAMAGE_ALIAS_KEYS)
+        return keys
+
+    def candidates(self, target_domain: str, target_key: str) -> list[BaseModifier]:
+        """Return modifiers that may match one target, already in resolution order."""
+        return self.by_target.get((target_domain, target_key), [])
+
+    def domain(self, target_domain: str) -> list[BaseModifier]:
+        """Return all modifiers of one target domain in resolution order."""
+        return self.by_domain.get(target_domain, [])
+
+
 class ModifierEngine:
     """Collect, resolve, and explain character modifiers in one place."""
 
@@ -111,64 +174,61 @@ class ModifierEngine:
         )
         self._comparison_log: list[NumericResolutionComparison] = []
         self._active_modifiers_cache: list[BaseModifier] | None = None
+        self._modifier_index_cache: ModifierIndex | None = None
+        self._context_modifiers_cache: OrderedDict[tuple, list[BaseModifier]] = OrderedDict()
+        self._context_cache_hits = 0
+        self._context_cache_misses = 0
+
+    def invalidate_cache(self, name: str) -> None:
+        """Drop one cached modifier layer or the collected modifier list."""
+        if name != "_active_modifiers_cache":
+            self.__dict__.pop(name, None)
+        self._active_modifiers_cache = None
+        self._modifier_index_cache = None
+        self._context_modifiers_cache.clear()
+
+    def context_cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters of the context-sensitive modifier memo."""
+        return {
+            "hits": self._context_cache_hits,
+            "misses": self._context_cache_misses,
+            "entries": len(self._context_modifiers_cache),
+        }
+
+    @property
+    def modifier_index(self) -> ModifierIndex:
+        """Return the target index over all context-independent modifiers."""
+        if self._modifier_index_cache is None:
+            self._modifier_index_cache = ModifierIndex.build(self._collect_candidate_modifiers())
+        return self._modifier_index_cache
 
-    @cached_property
+    @profiled_cached_property
     def _active_race_semantic_modifiers(self) -> list[BaseModifier]:
         """Build semantic modifiers from the character's race."""
         if self.character_engine is None or not self.character_engine.character.race_id:
             return []
-        effects = (
-            RaceSemanticEffect.objects.filter(
-                race_id=self.character_engine.character.race_id,
-                active_flag=True,
-            )
-            .select_related("race")
-            .prefetch_related("condition_races")
-            .order_by("race_id", "sort_order", "id")
-        )
-        return [effect.to_modifier() for effect in effects]
+        catalog = self.character_engine._rules_catalog
+        return list(catalog.race_modifiers_by_race_id.get(self.character_engine.character.race_id, ()))
 
-    @cached_property
+    @profiled_cached_property
     def _active_school_semantic_modifiers(self) -> list[BaseModifier]:
         """Build semantic modifiers from learned schools."""
         if self.character_engine is None:
             return []
-        school_ids = list(self.character_engine._school_entries.keys())
-        if not school_ids:
-            return []
-        effects = (
-            SchoolSemanticEffect.objects.filter(
-                school_id__in=school_ids,
-                active_flag=True,
-            )
-            .select_related("school")
-            .prefetch_related("condition_races")
-            .order_by("school_id", "sort_order", "id")
-        )
-        return [effect.to_modifier() for effect in effects]
+        catalog = self.character_engine._rules_catalog
+        return catalog.modifiers_for(catalog.school_modifiers_by_school_id, self.character_engine._school_entries)
 
-    @cached_property
+    @profiled_cached_property
     def _active_trait_modifiers(self) -> list[BaseModifier]:
         """Build semantic trait modifiers from purchased character traits."""
         if self.character_engine is None:
             return []
-        modifiers: list[BaseModifier] = []
-        trait_entries = (
-            self.character_engine.character.charactertrait_set.select_related("trait")
-            .prefetch_related("trait__semantic_effects", "trait__semantic_effects__condition_races")
-            .order_by("trait__slug")
+        return compile_trait_entry_modifiers(
+            self.character_engine.character.charactertrait_set.select_related("trait").order_by("trait__slug"),
+            self.character_engine._rules_catalog,
         )
-        for entry in trait_entries:
-            modifiers.extend(
-                build_trait_semantic_modifiers(
-                    trait_slug=entry.trait.slug,
-                    level=int(entry.trait_level),
-                    trait=entry.trait,
-                )
-            )
-        return modifiers
 
-    @cached_property
+    @profiled_cached_property
     def _active_item_rune_modifiers(self) -> list[BaseModifier]:
         """Resolve active equipped ItemRune assignments into semantic modifiers."""
         if self.character_engine is None:
@@ -182,8 +242,7 @@ class ModifierEngine:
                 first_item_id_by_rune_id[rune.id] = item_rune.item_id
             elif first_item_id != item_rune.item_id:
                 continue
-            for effect in rune.semantic_effects.filter(active_flag=True).prefetch_related("condition_races").order_by("sort_order", "id"):
-                modifier = effect.to_modifier()
+            for modifier in self.character_engine._rules_catalog.rune_modifiers_by_rune_id.get(rune.id, ()):
                 scaling = dict(modifier.scaling)
                 mode = modifier.mode
                 if rune.is_level_scaled and str(mode or "flat") == "scaled":
@@ -210,7 +269,7 @@ class ModifierEngine:
                 )
         return modifiers
 
-    @cached_property
+    @profiled_cached_property
     def _active_item_semantic_modifiers(self) -> list[BaseModifier]:
         """Build semantic modifiers from equipped magic base items and item instances."""
         if self.character_engine is None:
@@ -266,7 +325,7 @@ class ModifierEngine:
             *(effect.to_modifier() for effect in instance_effects if effect.active_flag),
         ]
 
-    @cached_property
+    @profiled_cached_property
     def _active_technique_semantic_modifiers(self) -> list[BaseModifier]:
         """Build semantic modifiers from learned, available computed techniques."""
         if self.character_engine is None:
@@ -300,19 +359,10 @@ class ModifierEngine:
         }
         if not active_technique_ids:
             return []
+        catalog = self.character_engine._rules_catalog
+        return catalog.modifiers_for(catalog.technique_modifiers_by_technique_id, active_technique_ids)
 
-        effects = (
-            TechniqueSemanticEffect.objects.filter(
-                technique_id__in=active_technique_ids,
-                active_flag=True,
-            )
-            .select_related("technique", "target_choice_definition")
-            .prefetch_related("target_skills", "condition_races")
-            .order_by("technique_id", "sort_order", "id")
-        )
-        return [effect.to_modifier() for effect in effects]
-
-    @cached_property
+    @profiled_cached_property
     def _active_daemonic_power_modifiers(self) -> list[BaseModifier]:
         """Build modifiers from valid power choices whose granting techniques are active."""
         if self.character_engine is None:
@@ -334,22 +384,10 @@ class ModifierEngine:
                 active_power_ids.add(ownership.power_id)
         if not active_power_ids:
             return []
-        effects = (
-            DaemonicPowerSemanticEffect.objects.filter(
-                power_id__in=active_power_ids,
-                active_flag=True,
-                application_scope__in=(
-                    DaemonicPowerSemanticEffect.ApplicationScope.CHARACTER,
-                    DaemonicPowerSemanticEffect.ApplicationScope.BOTH,
-                ),
-            )
-            .select_related("power")
-            .prefetch_related("target_skills", "condition_races")
-            .order_by("power_id", "sort_order", "id")
-        )
-        return [effect.to_modifier() for effect in effects]
+        catalog = self.character_engine._rules_catalog
+        return catalog.modifiers_for(catalog.daemonic_power_modifiers_by_power_id, active_power_ids)
 
-    @cached_property
+    @profiled_cached_property
     def _active_vampire_trait_modifiers(self) -> list[BaseModifier]:
         """Build passive modifiers from the shared vampire-trait catalogue."""
         if self.character_engine is None:
@@ -419,6 +457,50 @@ class ModifierEngine:
             if self._active_modifiers_cache is not None:
                 return self._active_modifiers_cache
         context = context or {}
+        cache_key = self._context_cache_key(context) if context else None
+        if cache_key is not None:
+            cached = self._context_modifiers_cache.get(cache_key)
+            if cached is not None:
+                self._context_modifiers_cache.move_to_end(cache_key)
+                self._context_cache_hits += 1
+                return cached
+            self._context_cache_misses += 1
+        result = [
+            modifier
+            for modifier in self.modifier_index.modifiers
+            if modifier.applies(context) and TargetResolver.matches_context(modifier, context)
+        ]
+        if not context:
+            self._active_modifiers_cache = result
+        elif cache_key is not None:
+            self._context_modifiers_cache[cache_key] = result
+            if len(self._context_modifiers_cache) > CONTEXT_MODIFIER_CACHE_SIZE:
+                self._context_modifiers_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def _context_cache_key(cls, context: dict[str, Any]) -> tuple | None:
+        """Return a canonical hashable form of a context, or None when it cannot be memoized."""
+        try:
+            return cls._canonical_context_value(context)
+        except TypeError:
+            return None
+
+    @classmethod
+    def _canonical_context_value(cls, value: Any) -> Any:
+        # Lists and tuples compare equal because context gates only test membership.
+        if isinstance(value, dict):
+            return tuple(sorted((str(key), cls._canonical_context_value(item)) for key, item in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._canonical_context_value(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted((cls._canonical_context_value(item) for item in value), key=repr))
+        hash(value)
+        return value
+
+    @profiled("ModifierEngine.collect_candidates")
+    def _collect_candidate_modifiers(self) -> list[BaseModifier]:
+        """Collect and expand all modifiers before context-dependent filtering."""
         collected = list(self._injected_modifiers)
         if self.character_engine is not None:
             collected.extend(self._active_race_semantic_modifiers)
@@ -430,15 +512,11 @@ class ModifierEngine:
             collected.extend(self._active_item_semantic_modifiers)
             collected.extend(self._active_item_rune_modifiers)
         expanded = self._expand_choice_bound_modifiers(collected)
-        result = [
+        return [
             modifier
             for modifier in expanded
-            if modifier is not None and modifier.applies(context) and TargetResolver.matches_context(modifier, context)
-            and self._modifier_matches_race_condition(modifier)
+            if modifier is not None and self._modifier_matches_race_condition(modifier)
         ]
-        if not context:
-            self._active_modifiers_cache = result
-        return result
 
     def resolve_numeric_total(
         self,
@@ -889,10 +967,11 @@ class ModifierEngine:
         specification: str | None = None,
     ) -> int:
         """Resolve one numeric target from migrated typed modifiers."""
+        context = context or {}
         relevant_modifiers = [
             modifier
-            for modifier in self.collect_active_modifiers(context=context)
-            if modifier.target_domain == target_domain
+            for modifier in self.modifier_index.candidates(target_domain, target_key)
+            if modifier.applies(context)
             and self._modifier_matches_target_key(
                 modifier,
                 target_domain=target_domain,
@@ -911,7 +990,7 @@ class ModifierEngine:
 
         resolved_total = 0
         seen_unique_sources: set[tuple[str, str, str, str]] = set()
-        for modifier in sorted(relevant_modifiers, key=lambda entry: (entry.priority, entry.source_type, entry.source_id)):
+        for modifier in relevant_modifiers:
             if modifier.stack_behavior == StackBehavior.UNIQUE_BY_SOURCE:
                 dedupe_key = (modifier.source_type, modifier.source_id, modifier.target_domain, modifier.target_key)
                 if dedupe_key in seen_unique_sources:
@@ -1053,9 +1132,10 @@ class ModifierEngine:
         if self.character_engine is None:
             return 0
 
+        context = context or {}
         total = 0
-        for modifier in self.collect_active_modifiers(context=context):
-            if modifier.target_domain != TargetDomain.SKILL:
+        for modifier in self.modifier_index.domain(TargetDomain.SKILL):
+            if not modifier.applies(context) or not TargetResolver.matches_context(modifier, context):
                 continue
             choice_binding = modifier.metadata.get("choice_binding")
             if not choice_binding:
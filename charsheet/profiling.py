@@ -0,0 +1,152 @@
+"""Opt-in per-request timing of sheet sections, engine fills, and partial renders."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property, wraps
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+PROFILE_QUERY_PARAMETER = "profile"
+SERVER_TIMING_MAX_ENTRIES = 30
+
+_active_profile: ContextVar["SheetProfile | None"] = ContextVar("charsheet_sheet_profile", default=None)
+
+
+class SheetProfile:
+    """Accumulated wall time, call count, and SQL queries per named section of one request."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.sections: dict[str, list[float]] = {}
+
+    def count_query(self, execute, sql, params, many, context):
+        """Database execute wrapper counting every statement of the request."""
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def record(self, name: str, elapsed_ms: float, queries: int) -> None:
+        """Add one timed run of a section; nested sections stay inclusive."""
+        entry = self.sections.setdefault(name, [0.0, 0, 0])
+        entry[0] += elapsed_ms
+        entry[1] += 1
+        entry[2] += queries
+
+    def rows(self) -> list[dict[str, object]]:
+        """Return the sections ordered by total time, slowest first."""
+        return [
+            {"section": name, "ms": round(total_ms, 3), "calls": calls, "queries": queries}
+            for name, (total_ms, calls, queries) in sorted(
+                self.sections.items(), key=lambda item: item[1][0], reverse=True
+            )
+        ]
+
+    def server_timing(self) -> str:
+        """Format the slowest sections as a Server-Timing header value."""
+        entries = []
+        for row in self.rows()[:SERVER_TIMING_MAX_ENTRIES]:
+            # Metric names are HTTP tokens; dots and underscores are allowed, other separators are not.
+            name = "".join(char if char.isalnum() or char in "._-" else "-" for char in row["section"])
+            entries.append(f'{name};dur={row["ms"]};desc="{row["calls"]}x {row["queries"]}q"')
+        return ", ".join(entries)
+
+
+def active_profile() -> SheetProfile | None:
+    """Return the profile of the current request, if profiling is on."""
+    return _active_profile.get()
+
+
+@contextmanager
+def profile_section(name: str):
+    """Time one named block and its SQL queries while a profile is active."""
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+    queries_before = profile.queries
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record(name, (time.perf_counter() - started) * 1000, profile.queries - queries_before)
+
+
+def profiled(name: str):
+    """Decorate a function so each call is recorded as one profile section."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_profile.get() is None:
+                return func(*args, **kwargs)
+            with profile_section(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class profiled_cached_property(cached_property):
+    """A cached_property whose first computation is recorded as a profile section."""
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        self.section = f"{owner.__name__}.{name}"
+
+    def __get__(self, instance, owner=None):
+        # Filled values live in the instance dict and bypass this descriptor entirely.
+        if instance is None or _active_profile.get() is None:
+            return super().__get__(instance, owner)
+        with profile_section(self.section):
+            return super().__get__(instance, owner)
+
+
+def profiling_requested(request) -> bool:
+    """Return whether this request should be profiled."""
+    if getattr(settings, "SHEET_PROFILING", False):
+        return True
+    if request.GET.get(PROFILE_QUERY_PARAMETER) != "1":
+        return False
+    user = getattr(request, "user", None)
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+class SheetProfilingMiddleware:
+    """Attach a Server-Timing header and a structured log line to profiled requests."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not profiling_requested(request):
+            return self.get_response(request)
+        profile = SheetProfile()
+        token = _active_profile.set(profile)
+        try:
+            with connection.execute_wrapper(profile.count_query), profile_section("total"):
+                response = self.get_response(request)
+        finally:
+            _active_profile.reset(token)
+        response["Server-Timing"] = profile.server_timing()
+        logger.info(
+            "sheet profile %s",
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "queries": profile.queries,
+                    "sections": profile.rows(),
+                },
+                sort_keys=True,
+            ),
+        )
+        return response
@@ -0,0 +1,273 @@
+"""Process-wide catalog of admin-edited rule data shared by all engines."""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from django.db.models import Prefetch
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .cache_versions import bump_cache_versions, cache_version
+from .models import (
+    DaemonicPowerSemanticEffect,
+    Quality,
+    RaceSemanticEffect,
+    RaceTechnique,
+    RuneSemanticEffect,
+    School,
+    SchoolSemanticEffect,
+    Skill,
+    Technique,
+    TechniqueChoiceDefinition,
+    TechniqueExclusion,
+    TechniqueRequirement,
+    TechniqueSemanticEffect,
+    TraitSemanticEffect,
+)
+
+RULES_CATALOG_VERSION_KEY = "charsheet:rules-catalog:version"
+
+# Admin-edited rule tables; saving or deleting a row bumps the catalog version.
+RULES_CATALOG_SOURCES = (
+    "charsheet.Attribute",
+    "charsheet.SkillCategory",
+    "charsheet.Skill",
+    "charsheet.Quality",
+    "charsheet.Race",
+    "charsheet.RaceTechnique",
+    "charsheet.RaceSemanticEffect",
+    "charsheet.SchoolType",
+    "charsheet.School",
+    "charsheet.SchoolPath",
+    "charsheet.SchoolSemanticEffect",
+    "charsheet.Technique",
+    "charsheet.TechniqueChoiceBlock",
+    "charsheet.TechniqueChoiceDefinition",
+    "charsheet.TechniqueRequirement",
+    "charsheet.TechniqueExclusion",
+    "charsheet.TechniqueSemanticEffect",
+    "charsheet.Trait",
+    "charsheet.TraitSemanticEffect",
+    "charsheet.Rune",
+    "charsheet.RuneSemanticEffect",
+    "charsheet.DaemonicPower",
+    "charsheet.DaemonicPowerSemanticEffect",
+)
+
+# Semantic effect M2M relations that change compiled modifiers without a row save.
+RULES_CATALOG_M2M_SOURCES = (
+    RaceSemanticEffect.condition_races,
+    SchoolSemanticEffect.condition_races,
+    TechniqueSemanticEffect.condition_races,
+    TechniqueSemanticEffect.target_skills,
+    TraitSemanticEffect.condition_races,
+    TraitSemanticEffect.target_skills,
+    RuneSemanticEffect.condition_races,
+    DaemonicPowerSemanticEffect.condition_races,
+    DaemonicPowerSemanticEffect.target_skills,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RulesCatalog:
+    """Immutable lookups over static rule tables, compiled once per catalog version."""
+
+    version: int
+    skills_by_slug: Mapping[str, Skill]
+    schools: tuple[School, ...]
+    weapon_master_school: School | None
+    qualities: tuple[Quality, ...]
+    school_techniques: tuple[Technique, ...]
+    race_techniques_by_race_id: Mapping[int, tuple[Technique, ...]]
+    race_modifiers_by_race_id: Mapping[int, tuple]
+    school_modifiers_by_school_id: Mapping[int, tuple]
+    trait_modifiers_by_trait_id: Mapping[int, tuple]
+    technique_modifiers_by_technique_id: Mapping[int, tuple]
+    rune_modifiers_by_rune_id: Mapping[int, tuple]
+    daemonic_power_modifiers_by_power_id: Mapping[int, tuple]
+
+    def techniques_for_schools(self, school_ids: Iterable[int]) -> list[Technique]:
+        """Return the techniques of the given schools in catalog order."""
+        school_ids = set(school_ids)
+        if not school_ids:
+            return []
+        return [technique for technique in self.school_techniques if technique.school_id in school_ids]
+
+    def modifiers_for(self, modifiers_by_id: Mapping[int, tuple], ids: Iterable[int]) -> list:
+        """Concatenate compiled modifiers of several sources ordered by source id."""
+        return [modifier for source_id in sorted(set(ids)) for modifier in modifiers_by_id.get(source_id, ())]
+
+
+def _compiled_modifiers(effects, key) -> Mapping[int, tuple]:
+    """Compile effect rows into immutable modifier tuples grouped by source id."""
+    grouped: dict[int, list] = defaultdict(list)
+    for effect in effects:
+        grouped[key(effect)].append(effect.to_modifier())
+    return MappingProxyType({source_id: tuple(modifiers) for source_id, modifiers in grouped.items()})
+
+
+def _school_technique_queryset():
+    """Return all school techniques with requirement relations eagerly loaded."""
+    requirement_queryset = TechniqueRequirement.objects.select_related(
+        "required_technique__school",
+        "required_technique__path",
+        "required_path",
+        "required_skill",
+        "required_trait",
+    )
+    exclusions_queryset = TechniqueExclusion.objects.select_related(
+        "excluded_technique__school",
+        "excluded_technique__path",
+    )
+    excluded_by_queryset = TechniqueExclusion.objects.select_related(
+        "technique__school",
+        "technique__path",
+    )
+    choice_definition_queryset = TechniqueChoiceDefinition.objects.order_by("sort_order", "name", "id")
+
+    return (
+        Technique.objects.filter(school__isnull=False)
+        .select_related(
+            "school",
+            "path",
+            "choice_block",
+            "choice_block__path",
+            "granted_daemonic_power_tier",
+        )
+        .prefetch_related(
+            Prefetch("requirements", queryset=requirement_queryset),
+            Prefetch("exclusions", queryset=exclusions_queryset),
+            Prefetch("excluded_by", queryset=excluded_by_queryset),
+            Prefetch("choice_definitions", queryset=choice_definition_queryset),
+        )
+        .order_by("school__name", "level", "name")
+    )
+
+
+def build_rules_catalog(version: int) -> RulesCatalog:
+    """Load every static rule table once and compile its semantic effects."""
+    race_techniques: dict[int, list[Technique]] = defaultdict(list)
+    for relation in RaceTechnique.objects.select_related("technique").order_by("technique__name"):
+        race_techniques[relation.race_id].append(relation.technique)
+    schools = tuple(School.objects.select_related("type"))
+    return RulesCatalog(
+        version=version,
+        skills_by_slug=MappingProxyType(
+            {skill.slug: skill for skill in Skill.objects.select_related("category", "attribute").order_by("slug")}
+        ),
+        schools=schools,
+        weapon_master_school=next(
+            (school for school in schools if school.name.casefold() == "waffenmeister"),
+            None,
+        ),
+        qualities=tuple(Quality.objects.all()),
+        school_techniques=tuple(_school_technique_queryset()),
+        race_techniques_by_race_id=MappingProxyType(
+            {race_id: tuple(techniques) for race_id, techniques in race_techniques.items()}
+        ),
+        race_modifiers_by_race_id=_compiled_modifiers(
+            RaceSemanticEffect.objects.filter(active_flag=True)
+            .select_related("race")
+            .prefetch_related("condition_races")
+            .order_by("race_id", "sort_order", "id"),
+            lambda effect: effect.race_id,
+        ),
+        school_modifiers_by_school_id=_compiled_modifiers(
+            SchoolSemanticEffect.objects.filter(active_flag=True)
+            .select_related("school")
+            .prefetch_related("condition_races")
+            .order_by("school_id", "sort_order", "id"),
+            lambda effect: effect.school_id,
+        ),
+        trait_modifiers_by_trait_id=_compiled_modifiers(
+            TraitSemanticEffect.objects.filter(active_flag=True)
+            .select_related("trait")
+            .prefetch_related("target_skills", "condition_races")
+            .order_by("trait_id", "sort_order", "id"),
+            lambda effect: effect.trait_id,
+        ),
+        technique_modifiers_by_technique_id=_compiled_modifiers(
+            TechniqueSemanticEffect.objects.filter(active_flag=True)
+            .select_related("technique", "target_choice_definition")
+            .prefetch_related("target_skills", "condition_races")
+            .order_by("technique_id", "sort_order", "id"),
+            lambda effect: effect.technique_id,
+        ),
+        rune_modifiers_by_rune_id=_compiled_modifiers(
+            RuneSemanticEffect.objects.filter(active_flag=True)
+            .select_related("rune")
+            .prefetch_related("condition_races")
+            .order_by("rune_id", "sort_order", "id"),
+            lambda effect: effect.rune_id,
+        ),
+        daemonic_power_modifiers_by_power_id=_compiled_modifiers(
+            DaemonicPowerSemanticEffect.objects.filter(
+                active_flag=True,
+                application_scope__in=(
+                    DaemonicPowerSemanticEffect.ApplicationScope.CHARACTER,
+                    DaemonicPowerSemanticEffect.ApplicationScope.BOTH,
+                ),
+            )
+            .select_related("power")
+            .prefetch_related("target_skills", "condition_races")
+            .order_by("power_id", "sort_order", "id"),
+            lambda effect: effect.power_id,
+        ),
+    )
+
+
+_catalog: RulesCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def rules_catalog_version() -> int:
+    """Return the shared catalog version, seeding it on first use."""
+    return cache_version(RULES_CATALOG_VERSION_KEY)
+
+
+def bump_rules_catalog_version() -> None:
+    """Invalidate the compiled catalog in every process sharing the cache once the change commits."""
+    bump_cache_versions(RULES_CATALOG_VERSION_KEY)
+
+
+def get_rules_catalog() -> RulesCatalog:
+    """Return the compiled catalog for the current version, rebuilding it when stale."""
+    global _catalog
+    version = rules_catalog_version()
+    catalog = _catalog
+    if catalog is not None and catalog.version == version:
+        return catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.version != version:
+            _catalog = build_rules_catalog(version)
+        return _catalog
+
+
+def _bump_rules_catalog_for_instance(sender, raw=False, **kwargs):
+    """Bump the catalog version after an admin-edited rule row changed."""
+    if raw:
+        return
+    bump_rules_catalog_version()
+
+
+for _sender_label in RULES_CATALOG_SOURCES:
+    post_save.connect(
+        _bump_rules_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"rules_catalog_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _bump_rules_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"rules_catalog_delete:{_sender_label}",
+    )
+for _relation in RULES_CATALOG_M2M_SOURCES:
+    m2m_changed.connect(
+        _bump_rules_catalog_for_instance,
+        sender=_relation.through,
+        dispatch_uid=f"rules_catalog_m2m:{_relation.through._meta.label}",
+    )
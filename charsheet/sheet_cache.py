@@ -0,0 +1,236 @@
+"""Versioned cache for fully built character-sheet contexts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pickle
+
+from django.conf import settings
+from django.core.cache import cache
+
+from codex_arcana.versioning import get_application_version
+
+from .cache_counters import increment_cache_counter
+from .cache_versions import cache_versions
+from .creature_stat_blocks import CREATURE_CATALOG_VERSION_KEY
+from .magic_catalog import MAGIC_CATALOG_VERSION_KEY
+from .models import Character
+from .rules_catalog import RULES_CATALOG_VERSION_KEY
+from .shop_catalog import SHOP_CATALOG_VERSION_KEY
+from .sheet_context import build_sheet_instance_context, build_sheet_tooltip
+
+logger = logging.getLogger(__name__)
+
+SHEET_CONTEXT_CACHE_PREFIX = "charsheet:sheet-context"
+SHEET_CONTEXT_STAT_KEYS = {
+    "hits": f"{SHEET_CONTEXT_CACHE_PREFIX}:stats:hits",
+    "misses": f"{SHEET_CONTEXT_CACHE_PREFIX}:stats:misses",
+    "stores": f"{SHEET_CONTEXT_CACHE_PREFIX}:stats:stores",
+    "skipped": f"{SHEET_CONTEXT_CACHE_PREFIX}:stats:skipped",
+}
+DEFAULT_SHEET_CONTEXT_CACHE_TIMEOUT = 900
+# Admin-edited catalogs a rendered sheet reads besides the character's own rows.
+SHEET_CATALOG_VERSION_KEYS = (
+    RULES_CATALOG_VERSION_KEY,
+    SHOP_CATALOG_VERSION_KEY,
+    MAGIC_CATALOG_VERSION_KEY,
+    CREATURE_CATALOG_VERSION_KEY,
+)
+
+
+def sheet_context_cache_timeout() -> int:
+    """Return the configured cache lifetime in seconds; zero disables the cache."""
+    return max(0, int(getattr(settings, "SHEET_CONTEXT_CACHE_TIMEOUT", DEFAULT_SHEET_CONTEXT_CACHE_TIMEOUT)))
+
+
+def current_sheet_revision(character_id: int) -> int | None:
+    """Read the persisted sheet revision without trusting a possibly stale instance."""
+    return (
+        Character.objects.filter(pk=character_id)
+        .values_list("sheet_revision", flat=True)
+        .first()
+    )
+
+
+def sheet_catalog_versions() -> str:
+    """Return the combined rules, item, magic, and creature catalog versions of a sheet."""
+    versions = cache_versions(SHEET_CATALOG_VERSION_KEYS)
+    return "-".join(str(versions[key]) for key in SHEET_CATALOG_VERSION_KEYS)
+
+
+def sheet_context_cache_key(
+    character_id: int,
+    revision: int,
+    *,
+    read_only: bool,
+    runtime_attribute_adjustments: dict[str, int] | None = None,
+    catalog_versions: str = "",
+) -> str:
+    """Return the cache key for one character revision, catalog versions, and view variant."""
+    adjustments = {
+        str(short_name): int(value)
+        for short_name, value in (runtime_attribute_adjustments or {}).items()
+        if int(value) != 0
+    }
+    adjustment_hash = (
+        hashlib.sha1(json.dumps(adjustments, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        if adjustments
+        else "none"
+    )
+    mode = "read" if read_only else "edit"
+    return (
+        f"{SHEET_CONTEXT_CACHE_PREFIX}:{int(character_id)}:{int(revision)}:{catalog_versions or '0'}:{mode}:{adjustment_hash}"
+    )
+
+
+def sheet_etag(
+    character_id: int,
+    revision: int | None,
+    *,
+    read_only: bool,
+    runtime_attribute_adjustments: dict[str, int] | None = None,
+    variant: tuple = (),
+) -> str | None:
+    """Return a strong validator for one rendered sheet revision, or None without a revision."""
+    if revision is None:
+        return None
+    parts = (
+        sheet_context_cache_key(
+            character_id,
+            revision,
+            read_only=read_only,
+            runtime_attribute_adjustments=runtime_attribute_adjustments,
+            catalog_versions=sheet_catalog_versions(),
+        ),
+        # Deployments change templates and asset URLs without touching any revision.
+        get_application_version(),
+        *(str(part) for part in variant),
+    )
+    return f'"{hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()}"'
+
+
+def _count(stat: str) -> None:
+    """Increment one monitoring counter."""
+    increment_cache_counter(SHEET_CONTEXT_STAT_KEYS[stat])
+
+
+def get_cached_sheet_context(
+    character: Character,
+    *,
+    revision: int | None,
+    read_only: bool = False,
+    close_learn_window_once: bool = False,
+    runtime_attribute_adjustments: dict[str, int] | None = None,
+) -> dict[str, object] | None:
+    """Return a cached sheet context for the given revision, or None on a miss."""
+    if revision is None or not sheet_context_cache_timeout():
+        return None
+    cached = cache.get(
+        sheet_context_cache_key(
+            character.pk,
+            revision,
+            read_only=read_only,
+            runtime_attribute_adjustments=runtime_attribute_adjustments,
+            catalog_versions=sheet_catalog_versions(),
+        )
+    )
+    if cached is None:
+        _count("misses")
+        return None
+    _count("hits")
+    return {
+        **cached,
+        **build_sheet_instance_context(
+            character,
+            close_learn_window_once=close_learn_window_once,
+            read_only=read_only,
+        ),
+    }
+
+
+def store_sheet_context(
+    character: Character,
+    context: dict[str, object],
+    *,
+    revision: int | None,
+    read_only: bool = False,
+    runtime_attribute_adjustments: dict[str, int] | None = None,
+) -> bool:
+    """Cache a freshly built context when the revision did not move during the build."""
+    timeout = sheet_context_cache_timeout()
+    if revision is None or not timeout:
+        return False
+    if current_sheet_revision(character.pk) != revision:
+        # The build itself synchronized rows; the next request rebuilds from the new state.
+        _count("skipped")
+        return False
+    # Instance-bound entries are rebuilt from the live character on every hit.
+    instance_keys = build_sheet_instance_context(character, read_only=read_only).keys()
+    payload = {key: value for key, value in context.items() if key not in instance_keys}
+    try:
+        cache.set(
+            sheet_context_cache_key(
+                character.pk,
+                revision,
+                read_only=read_only,
+                runtime_attribute_adjustments=runtime_attribute_adjustments,
+                catalog_versions=sheet_catalog_versions(),
+            ),
+            payload,
+            timeout=timeout,
+        )
+    except (pickle.PicklingError, TypeError, AttributeError):
+        logger.warning("Sheet context for character %s could not be cached.", character.pk, exc_info=True)
+        _count("skipped")
+        return False
+    _count("stores")
+    return True
+
+
+def get_sheet_tooltip(
+    character: Character,
+    tooltip_key: str,
+    *,
+    revision: int | None,
+    read_only: bool = False,
+    runtime_attribute_adjustments: dict[str, int] | None = None,
+) -> str:
+    """Return one sheet tooltip, reusing the body cached for the same sheet revision."""
+    timeout = sheet_context_cache_timeout()
+    cache_key = None
+    if revision is not None and timeout:
+        cache_key = "{}:tooltip:{}".format(
+            sheet_context_cache_key(
+                character.pk,
+                revision,
+                read_only=read_only,
+                runtime_attribute_adjustments=runtime_attribute_adjustments,
+                catalog_versions=sheet_catalog_versions(),
+            ),
+            hashlib.sha1(str(tooltip_key).encode("utf-8")).hexdigest()[:16],
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    # A freshly loaded character has no engine yet; build it once with the viewer's adjustments.
+    character.get_engine(runtime_attribute_adjustments=runtime_attribute_adjustments)
+    tooltip = build_sheet_tooltip(character, tooltip_key)
+    if cache_key is not None and current_sheet_revision(character.pk) == revision:
+        cache.set(cache_key, tooltip, timeout=timeout)
+    return tooltip
+
+
+def sheet_context_cache_stats() -> dict[str, object]:
+    """Return the hit/miss counters and the resulting hit rate."""
+    values = cache.get_many(list(SHEET_CONTEXT_STAT_KEYS.values()))
+    stats = {stat: int(values.get(key) or 0) for stat, key in SHEET_CONTEXT_STAT_KEYS.items()}
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    return stats
+
+
+def reset_sheet_context_cache_stats() -> None:
+    """Reset the monitoring counters."""
+    cache.delete_many(list(SHEET_CONTEXT_STAT_KEYS.values()))
@@ -8,7 +8,7 @@ import json
 import math
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.urls import reverse
 
 from charsheet.constants import (
@@ -71,6 +71,7 @@ from charsheet.lesson_rules import (
     format_lesson_requirements,
     lesson_requirements_met,
 )
+from charsheet.profiling import profiled
 from charsheet.religion_rules import is_clerical_school, is_divine_entity_school, selected_divine_entity
 from charsheet.models import (
     Aspect,
@@ -111,6 +112,7 @@ from charsheet.models import (
     CreatureTraitDefinition,
     DamageSource,
     Item,
+    ItemPermissionGrant,
     ItemSemanticEffect,
     ItemTransfer,
     Language,
@@ -3523,81 +3525,155 @@ def _build_skill_modifier_rows(
     return rows
 
 
-def _build_skill_rows(
-    character: Character,
-    engine,
-    *,
-    load_penalty: int,
-) -> tuple[list[dict], list[object], list[dict]]:
-    """Build visible skill rows plus skill-manager state for the sheet."""
+def _skill_condition_tooltip(condition_text: str) -> str:
+    """Phrase one daemonic condition for skill tooltips."""
+    normalized = " ".join(str(condition_text or "").split())
+    if normalized.casefold().startswith("im "):
+        return f"bei {normalized[3:]}"
+    return normalized
 
-    def _condition_tooltip(condition_text: str) -> str:
-        normalized = " ".join(str(condition_text or "").split())
-        if normalized.casefold().startswith("im "):
-            return f"bei {normalized[3:]}"
-        return normalized
 
-    def _conditional_encumbrance_variants() -> list[dict[str, object]]:
-        """Return conditional daemonic encumbrance as skill-value deltas."""
-        modifier_engine = engine.modifier_engine
-        conditions: OrderedDict[str, str] = OrderedDict()
-        for modifier in modifier_engine._active_daemonic_power_modifiers:
-            if str(modifier.target_domain or "") != "derived_stat":
-                continue
-            if not modifier_engine._modifier_matches_target_key(
-                modifier,
-                target_domain="derived_stat",
-                target_key="encumbrance",
-            ):
-                continue
-            condition_text = " ".join(
-                str(modifier.metadata.get("condition_text") or "").split()
-            )
-            normalized = modifier_engine._normalize_condition_text(condition_text)
-            if normalized:
-                conditions.setdefault(normalized, condition_text)
+def _conditional_encumbrance_variants(engine) -> list[dict[str, object]]:
+    """Return conditional daemonic encumbrance as skill-value deltas."""
+    modifier_engine = engine.modifier_engine
+    conditions: OrderedDict[str, str] = OrderedDict()
+    for modifier in modifier_engine._active_daemonic_power_modifiers:
+        if str(modifier.target_domain or "") != "derived_stat":
+            continue
+        if not modifier_engine._modifier_matches_target_key(
+            modifier,
+            target_domain="derived_stat",
+            target_key="encumbrance",
+        ):
+            continue
+        condition_text = " ".join(
+            str(modifier.metadata.get("condition_text") or "").split()
+        )
+        normalized = modifier_engine._normalize_condition_text(condition_text)
+        if normalized:
+            conditions.setdefault(normalized, condition_text)
+
+    variants: list[dict[str, object]] = []
+    for condition_text in conditions.values():
+        context = {"condition_text": condition_text}
+        conditional_encumbrance = modifier_engine.resolve_numeric_total(
+            "derived_stat",
+            "encumbrance",
+            context=context,
+        ) - modifier_engine.resolve_numeric_total(
+            "derived_stat",
+            "encumbrance",
+        )
+        skill_value_delta = -int(conditional_encumbrance)
+        if skill_value_delta == 0:
+            continue
+        variants.append(
+            {
+                "condition_text": condition_text,
+                "tooltip": _skill_condition_tooltip(condition_text),
+                "value_delta": skill_value_delta,
+            }
+        )
+    return variants
 
-        variants: list[dict[str, object]] = []
-        for condition_text in conditions.values():
-            context = {"condition_text": condition_text}
-            conditional_encumbrance = modifier_engine.resolve_numeric_total(
-                "derived_stat",
-                "encumbrance",
-                context=context,
-            ) - modifier_engine.resolve_numeric_total(
-                "derived_stat",
-                "encumbrance",
-            )
-            skill_value_delta = -int(conditional_encumbrance)
-            if skill_value_delta == 0:
-                continue
-            variants.append(
-                {
-                    "condition_text": condition_text,
-                    "tooltip": _condition_tooltip(condition_text),
-                    "value_delta": skill_value_delta,
-                }
-            )
-        return variants
 
-    conditional_encumbrance_variants = _conditional_encumbrance_variants()
+def _skill_conditional_modifier_lines(
+    engine,
+    skill: Skill,
+    specification: str | None,
+    encumbrance_variants: list[dict[str, object]],
+) -> list[str]:
+    """Return the deduplicated conditional modifier lines shown for one skill row."""
+    entries = [
+        *_conditional_modifier_lines(
+            engine,
+            "skill",
+            skill.slug,
+            specification=specification,
+        ),
+        *_conditional_modifier_lines(engine, "skill_category", skill.category.slug),
+    ]
+    seen: OrderedDict[str, str] = OrderedDict()
+    for entry in entries:
+        normalized = " ".join(entry.casefold().split())
+        if normalized:
+            seen.setdefault(normalized, entry)
+    lines = list(seen.values())
+    for variant in encumbrance_variants:
+        lines.append(
+            f"{format_modifier(int(variant['value_delta']))} {_skill_condition_tooltip(str(variant['condition_text']))}"
+        )
+    return lines
+
 
-    def _skill_conditional_modifier_lines(skill: Skill, specification: str | None) -> list[str]:
-        entries = [
-            *_conditional_modifier_lines(
+def _skill_size_modifier(engine, skill: Skill) -> int:
+    """Return the size-class modifier that applies to one skill."""
+    if skill.category.slug == SKILL_COMBAT:
+        return int(engine.size_modifier())
+    if skill.slug == "skill_evasion":
+        return int(engine.size_modifier())
+    if skill.slug == "skill_hide":
+        return int(engine.size_modifier()) * 2
+    return 0
+
+
+def _build_skill_calculation_tooltip(
+    engine,
+    skill: Skill,
+    *,
+    base_rank: int,
+    specification: str,
+    load_penalty: int,
+    conditional_modifiers: list[str],
+) -> str:
+    """Build the calculation breakdown shown when hovering one skill total."""
+    attribute_modifier = int(engine.attribute_modifier(skill.attribute.short_name))
+    raw_modifiers = int(engine._skill_modifiers(skill.slug, specification=specification))
+    rank_bonus = int(engine.skill_rank_bonus(skill.slug, specification=specification))
+    size_modifier = _skill_size_modifier(engine, skill)
+    total_with_load = base_rank + rank_bonus + attribute_modifier + raw_modifiers + size_modifier
+    return _build_core_stat_tooltip(
+        [
+            {"label": "Eigenschaft", "value": format_modifier(attribute_modifier), "source": skill.attribute.short_name},
+            {"label": "Rang", "value": base_rank},
+            *(
+                [{"label": "Rang-Bonus", "value": format_modifier(rank_bonus), "source": "Effekt"}]
+                if rank_bonus
+                else []
+            ),
+            {
+                "label": "Wundmalus",
+                "value": format_modifier(engine.current_wound_penalty()),
+            },
+            *(
+                [{"label": "GK", "value": format_modifier(size_modifier), "source": engine.size_class()}]
+                if size_modifier
+                else []
+            ),
+            *_build_skill_modifier_rows(
                 engine,
-                "skill",
                 skill.slug,
+                skill_name=skill.name,
+                category_slug=skill.category.slug,
+                skill_id=skill.id,
                 specification=specification,
             ),
-            *_conditional_modifier_lines(engine, "skill_category", skill.category.slug),
-        ]
-        seen: OrderedDict[str, str] = OrderedDict()
-        for entry in entries:
-            normalized = " ".join(entry.casefold().split())
-            if normalized:
-                seen.setdefault(normalized, entry)
-        return list(seen.values())
+            {"label": "Belastung", "value": format_modifier(load_penalty)},
+            {"label": "= Gesamt", "value": total_with_load, "tone": "total"},
+        ],
+        conditional_modifiers=conditional_modifiers,
+    )
+
+
+@profiled("sheet.skills")
+def _build_skill_rows(
+    character: Character,
+    engine,
+    *,
+    load_penalty: int,
+) -> tuple[list[dict], list[object], list[dict]]:
+    """Build visible skill rows plus skill-manager state for the sheet."""
+    conditional_encumbrance_variants = _conditional_encumbrance_variants(engine)
 
     def _build_display_name(skill: Skill, specification: str) -> str:
         normalized_spec = (specification or "").strip()
@@ -3609,15 +3685,6 @@ def _build_skill_rows(
             return f"{display_name} {normalized_spec}"
         return display_name
 
-    def _skill_size_modifier(skill: Skill) -> int:
-        if skill.category.slug == SKILL_COMBAT:
-            return int(engine.size_modifier())
-        if skill.slug == "skill_evasion":
-            return int(engine.size_modifier())
-        if skill.slug == "skill_hide":
-            return int(engine.size_modifier()) * 2
-        return 0
-
     def _build_row(skill: Skill, character_skill=None, *, specification_override: str | None = None) -> dict:
         attribute_modifier = int(engine.attribute_modifier(skill.attribute.short_name))
         if specification_override is not None:
@@ -3628,13 +3695,14 @@ def _build_skill_rows(
         base_rank = int(character_skill.level) if character_skill is not None else 0
         rank_bonus = int(engine.skill_rank_bonus(skill.slug, specification=specification))
         rank = base_rank + rank_bonus
-        size_modifier = _skill_size_modifier(skill)
+        size_modifier = _skill_size_modifier(engine, skill)
         total_with_load = rank + attribute_modifier + raw_modifiers + size_modifier
-        conditional_modifiers = _skill_conditional_modifier_lines(skill, specification)
-        for variant in conditional_encumbrance_variants:
-            conditional_modifiers.append(
-                f"{format_modifier(int(variant['value_delta']))} {_condition_tooltip(str(variant['condition_text']))}"
-            )
+        conditional_modifiers = _skill_conditional_modifier_lines(
+            engine,
+            skill,
+            specification,
+            conditional_encumbrance_variants,
+        )
         origin = " ".join(str(character.country_of_origin or "").split())
         is_origin_local_knowledge = (
             bool(origin)
@@ -3667,37 +3735,9 @@ def _build_skill_rows(
             "total_value": total_with_load - load_penalty,
             "with_load_total": total_with_load,
             "with_load_total_value": total_with_load,
-            "calculation_tooltip": _build_core_stat_tooltip(
-                [
-                    {"label": "Eigenschaft", "value": format_modifier(attribute_modifier), "source": skill.attribute.short_name},
-                    {"label": "Rang", "value": base_rank},
-                    *(
-                        [{"label": "Rang-Bonus", "value": format_modifier(rank_bonus), "source": "Effekt"}]
-                        if rank_bonus
-                        else []
-                    ),
-                    {
-                        "label": "Wundmalus",
-                        "value": format_modifier(engine.current_wound_penalty()),
-                    },
-                    *(
-                        [{"label": "GK", "value": format_modifier(size_modifier), "source": engine.size_class()}]
-                        if size_modifier
-                        else []
-                    ),
-                    *_build_skill_modifier_rows(
-                        engine,
-                        skill.slug,
-                        skill_name=skill.name,
-                        category_slug=skill.category.slug,
-                        skill_id=skill.id,
-                        specification=specification,
-                    ),
-                    {"label": "Belastung", "value": format_modifier(load_penalty)},
-                    {"label": "= Gesamt", "value": total_with_load, "tone": "total"},
-                ],
-                conditional_modifiers=conditional_modifiers,
-            ),
+            # The breakdown is fetched on hover through the sheet tooltip endpoint.
+            "calculation_tooltip": "",
+            "tooltip_key": f"skill:{character_skill.id}" if character_skill is not None else "",
             "has_conditional_modifiers": bool(conditional_modifiers),
             "can_edit_specification": (
                 skill.requires_specification
@@ -4082,6 +4122,7 @@ def _build_skill_rows(
     return skill_rows, character_skills, skill_manager_rows
 
 
+@profiled("sheet.traits")
 def _build_trait_rows(character: Character) -> tuple[list[dict], list[dict]]:
     """Build prepared rows for advantages and disadvantages."""
     traits_qs = (
@@ -4126,25 +4167,126 @@ def _character_item_image_url(character_item: CharacterItem) -> str:
     return str(getattr(character_item, "effective_image_url", "") or "")
 
 
-def _build_inventory_rows(character: Character) -> list[dict]:
-    """Build prepared inventory rows for the unequipped inventory list."""
-    inventory_rows: list[dict] = []
+def _build_inventory_item_tooltip(
+    character_item: CharacterItem,
+    item_engine: ItemEngine,
+    *,
+    strength: int,
+    is_race_item: bool,
+    magic_effect_summary: str,
+    magic_modifier_payloads: list[dict[str, object]],
+) -> str:
+    """Build the card tooltip body of one inventory item."""
+    item = character_item.item
+    item_description = character_item.description or item.description or ""
+    shows_quality = not is_race_item and item.item_type in QUALITY_TOOLTIP_TYPES
+    if not shows_quality and not item_description:
+        return ""
+    detail_rows = (
+        _build_item_tooltip_rows(item_engine, item, strength=strength)
+        + _build_weapon_symbol_tooltip_rows(item_engine)
+        + _build_character_item_magic_tooltip_rows(
+            effect_summary=magic_effect_summary,
+            modifier_payloads=magic_modifier_payloads,
+        )
+        + _build_character_item_rune_tooltip_rows(item=item, character_item=character_item)
+    )
+    if not shows_quality:
+        return _format_item_tooltip(description=item_description, detail_rows=detail_rows)
+    quality = quality_payload(item_engine.get_effective_quality())
+    return _format_item_tooltip(
+        description=item_description,
+        quality_label=quality["label"],
+        quality_color=quality["color"],
+        detail_rows=detail_rows,
+    )
+
+
+def _active_inventory_grants(character_item: CharacterItem) -> dict[str, ItemPermissionGrant]:
+    """Return the prefetched grants that currently apply to the item's holder, by permission."""
+    active_grants = {}
+    for grant in character_item.permission_grants.all():
+        if not grant.active:
+            continue
+        if grant.permission == "consume_final":
+            if grant.grantee_id is None:
+                active_grants.setdefault(grant.permission, grant)
+        elif (
+            grant.grantee_id == character_item.owner_id
+            and grant.ownership_version == character_item.ownership_version
+        ):
+            active_grants.setdefault(grant.permission, grant)
+    return active_grants
+
+
+def _load_inventory_entries(character: Character) -> list[dict]:
+    """Load the unequipped and lent-out items with every per-row lookup resolved in bulk."""
     race_item_ids = _race_item_ids()
-    strength = int(character.get_engine().attributes().get(ATTR_ST, 0) or 0)
-    inventory_items = list(
+    inventory_items = (
         CharacterItem.objects
         .filter(
             Q(owner=character, equipped=False)
             | (Q(original_owner_character=character) & ~Q(owner=character))
         )
-        .select_related("item", "original_owner_character", "item__weaponstats", "item__weaponstats__damage_source", "item__rangedweaponstats", "item__armorstats", "item__shieldstats")
-        .prefetch_related("item__runes", "runes", "rune_specs__rune", "item_runes__rune", "transfers__recipient", "permission_grants")
+        .select_related(
+            "item",
+            "owner",
+            "quality",
+            "original_owner_character",
+            "weapon_type_override",
+            "weapon_damage_source_override",
+            "item__weaponstats",
+            "item__weaponstats__damage_source",
+            "item__rangedweaponstats",
+            "item__armorstats",
+            "item__shieldstats",
+        )
+        .prefetch_related(
+            "item__runes",
+            "runes",
+            "rune_specs__rune",
+            "item_runes__rune",
+            Prefetch(
+                "transfers",
+                queryset=ItemTransfer.objects.filter(status=ItemTransfer.Status.PENDING).select_related(
+                    "recipient", "recipient_group", "sender"
+                ),
+            ),
+            "permission_grants",
+        )
     )
-    inventory_items.sort(key=lambda entry: ItemEngine(entry).get_name().lower())
-    modifiers_by_character_item_id = _load_character_item_modifier_payloads(inventory_items)
+    entries = []
     for character_item in inventory_items:
+        item_engine = ItemEngine(character_item)
+        entries.append(
+            {
+                "character_item": character_item,
+                "item_engine": item_engine,
+                "item_name": item_engine.get_name(),
+                "quality": quality_payload(item_engine.get_effective_quality()),
+                "pending_transfer": pending_transfer_for_item(character_item),
+                "active_grants": _active_inventory_grants(character_item),
+                "can_destroy": has_item_permission(character_item, "destroy", character),
+                "can_consume_final": has_item_permission(character_item, "consume_final", character),
+                "is_race_item": character_item.item_id in race_item_ids,
+            }
+        )
+    entries.sort(key=lambda entry: entry["item_name"].lower())
+    return entries
+
+
+@profiled("sheet.inventory")
+def _build_inventory_rows(character: Character) -> list[dict]:
+    """Build prepared inventory rows for the unequipped inventory list."""
+    inventory_rows: list[dict] = []
+    entries = _load_inventory_entries(character)
+    modifiers_by_character_item_id = _load_character_item_modifier_payloads(
+        [entry["character_item"] for entry in entries]
+    )
+    for entry in entries:
+        character_item = entry["character_item"]
         item = character_item.item
-        pending_transfer = pending_transfer_for_item(character_item)
+        pending_transfer = entry["pending_transfer"]
         is_gm_edit_pending = bool(
             pending_transfer
             and pending_transfer.transfer_kind == ItemTransfer.TransferKind.GM_EDIT
@@ -4154,59 +4296,21 @@ def _build_inventory_rows(character: Character) -> list[dict]:
         is_foreign_held = is_original_owner and not is_current_holder
         is_borrowed = is_current_holder and not is_original_owner
         can_use_item = is_current_holder and pending_transfer is None
-        active_grants = {}
-        for grant in character_item.permission_grants.all():
-            if not grant.active:
-                continue
-            if grant.permission == "consume_final":
-                if grant.grantee_id is None:
-                    active_grants.setdefault(grant.permission, grant)
-            elif (
-                grant.grantee_id == character_item.owner_id
-                and grant.ownership_version == character_item.ownership_version
-            ):
-                active_grants.setdefault(grant.permission, grant)
-        can_destroy = has_item_permission(character_item, "destroy", character)
-        can_consume_final = has_item_permission(character_item, "consume_final", character)
-        is_race_item = item.id in race_item_ids
-        item_engine = ItemEngine(character_item)
-        item_name = item_engine.get_name()
-        quality = quality_payload(item_engine.get_effective_quality())
+        active_grants = entry["active_grants"]
+        can_destroy = entry["can_destroy"]
+        can_consume_final = entry["can_consume_final"]
+        is_race_item = entry["is_race_item"]
+        item_engine = entry["item_engine"]
+        item_name = entry["item_name"]
+        quality = entry["quality"]
         stored_modifier_payloads = modifiers_by_character_item_id.get(character_item.id, [])
         visible_magic_effect_summary, magic_modifier_payloads = _merge_magic_effect_payloads(
             effect_summary=character_item.magic_effect_summary or "",
             modifier_payloads=stored_modifier_payloads,
         )
-        tooltip_text = ""
-        item_description = character_item.description or item.description or ""
-        if not is_race_item and item.item_type in QUALITY_TOOLTIP_TYPES:
-            tooltip_text = _format_item_tooltip(
-                description=item_description,
-                quality_label=quality["label"],
-                quality_color=quality["color"],
-                detail_rows=(
-                    _build_item_tooltip_rows(item_engine, item, strength=strength)
-                    + _build_weapon_symbol_tooltip_rows(item_engine)
-                    + _build_character_item_magic_tooltip_rows(
-                        effect_summary=visible_magic_effect_summary,
-                        modifier_payloads=magic_modifier_payloads,
-                    )
-                    + _build_character_item_rune_tooltip_rows(item=item, character_item=character_item)
-                ),
-            )
-        elif item_description:
-            tooltip_text = _format_item_tooltip(
-                description=item_description,
-                detail_rows=(
-                    _build_item_tooltip_rows(item_engine, item, strength=strength)
-                    + _build_weapon_symbol_tooltip_rows(item_engine)
-                    + _build_character_item_magic_tooltip_rows(
-                        effect_summary=visible_magic_effect_summary,
-                        modifier_payloads=magic_modifier_payloads,
-                    )
-                    + _build_character_item_rune_tooltip_rows(item=item, character_item=character_item)
-                ),
-            )
+        has_tooltip = (
+            not is_race_item and item.item_type in QUALITY_TOOLTIP_TYPES
+        ) or bool(character_item.description or item.description)
         active_rune_ids = [
             item_rune.rune_id
             for item_rune in character_item.item_runes.all()
@@ -4238,7 +4342,8 @@ def _build_inventory_rows(character: Character) -> list[dict]:
                     part for part in [item.get_item_type_display(), "" if is_race_item else quality["label"]] if part
                 ),
                 "item_image_url": item_image_url,
-                "tooltip_text": "" if is_gm_edit_pending else tooltip_text,
+                # The card body is fetched on first hover through the sheet tooltip endpoint.
+                "tooltip_key": f"item:{character_item.id}" if has_tooltip and not is_gm_edit_pending else "",
                 "is_stored": bool(character_item.stored) if is_current_holder else False,
                 "is_foreign_held": is_foreign_held,
                 "is_borrowed": is_borrowed,
@@ -4359,6 +4464,7 @@ def _build_inventory_total_weight_display(character: Character) -> str:
     return format_compact_number(total_weight)
 
 
+@profiled("sheet.weapons")
 def _build_weapon_rows(engine) -> list[dict]:
     """Build prepared weapon rows with flattened display profiles."""
     weapon_rows: list[dict] = []
@@ -4509,6 +4615,7 @@ def _equipment_icon_key(row: dict) -> str:
     return "item"
 
 
+@profiled("sheet.armor")
 def _build_armor_rows(engine) -> list[dict]:
     """Build prepared armor, clothing, and shield rows for the equipment panel."""
     armor_rows: list[dict] = []
@@ -4711,6 +4818,7 @@ def _support_icon(support_level: str) -> tuple[str, str]:
     return _SUPPORT_ICON_COMPUTED, _SUPPORT_TOOLTIP_COMPUTED
 
 
+@profiled("sheet.school_techniques")
 def _build_school_technique_rows(character: Character, engine) -> tuple[list[dict], dict[int, int]]:
     """Build visible learned technique rows for the school panel."""
     schools = list(
@@ -5158,6 +5266,7 @@ def _build_weapon_mastery_arcana_panel(engine) -> dict | None:
     }
 
 
+@profiled("sheet.languages")
 def _build_language_rows(character: Character) -> tuple[list[dict], object]:
     """Build the compact language display rows and keep the queryset for learning data."""
     engine = character.engine
@@ -5182,107 +5291,6 @@ def _build_language_rows(character: Character) -> tuple[list[dict], object]:
     return language_rows, language_entries
 
 
-def _build_shop_item_groups() -> list[dict]:
-    """Build grouped shop rows from all buyable items."""
-    grouped_items: dict[str, list[dict]] = {}
-    race_item_ids = _race_item_ids()
-    buyable_items = (
-        Item.objects
-        .filter(catalog_group__isnull=True)
-        .select_related("weaponstats", "armorstats", "shieldstats", "magicitemstats")
-        .prefetch_related("runes")
-        .order_by("item_type", "name")
-    )
-    for item in buyable_items:
-        if item.id in race_item_ids or item.not_buyable:
-            continue
-        item_engine = ItemEngine(item)
-        quality = quality_payload(item_engine.get_effective_quality())
-        stats_payload: dict[str, object] = {
-            "item_type": item.item_type,
-            "size_class": item.size_class,
-            "weight": str(item.weight),
-            "min_st": None,
-        }
-        weapon_stats = getattr(item, "weaponstats", None)
-        if weapon_stats is not None:
-            stats_payload.update(
-                {
-                    "damage_dice_amount": weapon_stats.damage_dice_amount,
-                    "damage_dice_faces": weapon_stats.damage_dice_faces,
-                    "damage_flat_bonus": weapon_stats.damage_flat_bonus,
-                    "damage_flat_operator": weapon_stats.damage_flat_operator,
-                    "h2_dice_amount": weapon_stats.h2_dice_amount,
-                    "h2_dice_faces": weapon_stats.h2_dice_faces,
-                    "h2_flat_bonus": weapon_stats.h2_flat_bonus,
-                    "h2_flat_operator": weapon_stats.h2_flat_operator,
-                    "h2_damage_type": weapon_stats.h2_damage_type,
-                    "wield_mode": weapon_stats.wield_mode,
-                    "min_st": weapon_stats.min_st,
-                    "damage_type": weapon_stats.damage_type,
-                }
-            )
-        armor_stats = getattr(item, "armorstats", None)
-        if armor_stats is not None:
-            stats_payload.update(
-                {
-                    "armor_rs": item_engine.get_armor_rs_raw() or 0,
-                    "armor_bel": armor_stats.encumbrance,
-                    "armor_min_st": armor_stats.min_st,
-                    "min_st": armor_stats.min_st,
-                }
-            )
-        shield_stats = getattr(item, "shieldstats", None)
-        if shield_stats is not None:
-            stats_payload.update(
-                {
-                    "shield_rs": shield_stats.rs,
-                    "shield_bel": shield_stats.encumbrance,
-                    "shield_min_st": shield_stats.min_st,
-                    "shield_parade_bonus": shield_stats.parade_bonus,
-                    "min_st": shield_stats.min_st,
-                }
-            )
-        magic_item_stats = getattr(item, "magicitemstats", None)
-        if magic_item_stats is not None:
-            stats_payload.update(
-                {
-                    "effect_summary": magic_item_stats.effect_summary,
-                }
-            )
-        group_key = (
-            SHOP_ARMOR_COMPONENT_GROUP
-            if armor_stats is not None and armor_stats.parent_set_id
-            else item.item_type
-        )
-        grouped_items.setdefault(group_key, []).append(
-            {
-                "id": item.id,
-                "name": item.name,
-                "description": item.description or "",
-                "item_type": item.item_type,
-                "stackable": bool(item.stackable),
-                "base_price": int(item.price),
-                "default_price": item_engine.get_price(),
-                "default_quality": quality["value"],
-                "default_quality_label": quality["label"],
-                "default_quality_color": quality["color"],
-                "stats": stats_payload,
-                "rune_ids": [rune.id for rune in item.runes.all()],
-            }
-        )
-
-    return [
-        {
-            "key": item_type,
-            "label": SHOP_GROUP_LABELS[item_type],
-            "items": grouped_items[item_type],
-        }
-        for item_type in SHOP_GROUP_ORDER
-        if grouped_items.get(item_type)
-    ]
-
-
 def _build_shop_sell_item_groups(character: Character) -> list[dict]:
     """Build grouped sell rows from the character inventory."""
     grouped_items: dict[str, list[dict]] = {}
@@ -5332,6 +5340,7 @@ def _build_shop_sell_item_groups(character: Character) -> list[dict]:
     ]
 
 
+@profiled("sheet.lessons")
 def _build_lesson_context(
     character: Character,
     *,
@@ -5468,6 +5477,7 @@ def _build_lesson_context(
     }
 
 
+@profiled("sheet.learning")
 def _build_learning_rows(
     character: Character,
     attributes: dict[str, int],
@@ -5885,6 +5895,7 @@ def _build_learning_rows(
     }
 
 
+@profiled("sheet.temporary_attributes")
 def build_temporary_attribute_context(
     character: Character,
     *,
@@ -6183,151 +6194,276 @@ def build_temporary_attribute_context(
     }
 
 
-def build_item_semantic_effect_partial_context(
+def _combat_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build attribute, skill, weapon, core-stat, and damage data for partial refreshes."""
+    return build_temporary_attribute_context(character, read_only=read_only)
+
+
+def _inventory_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build inventory rows and carry-load data for the inventory panel."""
+    carry_state = ItemEngine.carry_state_for_character(character)
+    inventory_rows = _build_inventory_rows(character)
+    inventory_total_weight_display = _build_inventory_total_weight_display(character)
+    return {
+        "inventory_rows": [row for row in inventory_rows if not row.get("is_stored")],
+        "stored_inventory_rows": [row for row in inventory_rows if row.get("is_stored")],
+        "inventory_total_weight_display": inventory_total_weight_display,
+        "carry_load": {
+            "enabled": bool(character.carry_load_enabled),
+            "weight": str(carry_state["weight"]),
+            "weight_display": inventory_total_weight_display,
+            "penalty": int(carry_state["penalty"]),
+            "state_label": str(carry_state["state_label"]),
+            "tooltip": _build_carry_load_tooltip(carry_state, active=False),
+            "tooltip_active": _build_carry_load_tooltip(carry_state, active=True),
+        },
+    }
+
+
+def _armor_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build armor rows and the armor summary for the armor panel."""
+    engine = character.engine
+    return {
+        "armor_rows": _build_armor_rows(engine),
+        "armor_summary": {
+            "total_rs": engine.get_grs(),
+            "total_rs_tooltip": _build_total_armor_tooltip(engine),
+            "load_value": engine.load_penalty(),
+            "load_tooltip": _build_load_tooltip(engine),
+            "minimum_strength": engine.get_ms(),
+            "minimum_strength_tooltip": _build_minimum_strength_tooltip(engine),
+        },
+        "body_armor": {
+            "shield": engine.shield_protection(),
+            **engine.armor_zone_protection(),
+        },
+    }
+
+
+def _wallet_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build the coin breakdown for the wallet panel."""
+    wallet_gold, wallet_silver, wallet_copper = character.engine.km_to_coins()
+    return {
+        "wallet_total_ks": format_thousands(character.money),
+        "wallet_gold_display": format_thousands(wallet_gold),
+        "wallet_silver_display": format_thousands(wallet_silver),
+        "wallet_copper_display": format_thousands(wallet_copper),
+    }
+
+
+def _fame_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build personal, artefact, and progression fame for the fame panel."""
+    engine = character.engine
+    manual_personal_fame_point = max(
+        0,
+        int(character.personal_fame_point) + int(engine.resolve_resource("personal_fame_point")),
+    )
+    manual_personal_fame_total = max(
+        0,
+        (int(character.personal_fame_rank) * 10) + int(character.personal_fame_point),
+    )
+    base_personal_fame_rank = max(
+        0,
+        int(character.personal_fame_rank) + int(engine.resolve_resource("personal_fame_rank")),
+    )
+    effective_artefact_rank = max(
+        0,
+        int(character.artefact_rank) + int(engine.resolve_resource("artefact_rank")),
+    )
+    auto_school_fame_point = engine.auto_school_fame_points()
+    auto_lesson_fame_point = engine.auto_lesson_fame_points()
+    auto_progression_fame_point = auto_school_fame_point + auto_lesson_fame_point
+    total_personal_fame_point = manual_personal_fame_point + auto_progression_fame_point
+    effective_personal_fame_point = total_personal_fame_point % 10
+    effective_personal_fame_rank = base_personal_fame_rank + (total_personal_fame_point // 10)
+    return {
+        "effective_personal_fame_point": effective_personal_fame_point,
+        "effective_personal_fame_rank": effective_personal_fame_rank,
+        "effective_artefact_rank": effective_artefact_rank,
+        "auto_school_fame_point": auto_school_fame_point,
+        "manual_personal_fame_total": manual_personal_fame_total,
+        "auto_lesson_fame_point": auto_lesson_fame_point,
+        "auto_progression_fame_point": auto_progression_fame_point,
+        "fame_total_rank": effective_personal_fame_rank + int(character.sacrifice_rank) + effective_artefact_rank,
+    }
+
+
+def _spell_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build the grouped castable entries for the spell panel."""
+    spell_panel_data = character.get_magic_engine().get_spell_panel_data()
+    return {
+        "spell_panel_enabled": bool(spell_panel_data["spell_panel_enabled"]),
+        "spell_and_lessons_panel_enabled": bool(spell_panel_data["spell_and_lessons_panel_enabled"]),
+        "has_castable_entries": bool(spell_panel_data["has_castable_entries"]),
+        "spell_panel_groups": spell_panel_data["groups"],
+        "spell_panel_filter_groups": spell_panel_data.get("filter_groups", []),
+    }
+
+
+def _lesson_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build the lesson panel rows."""
+    return _build_lesson_context(character, engine=character.get_engine(), read_only=read_only)
+
+
+def _learning_budget_partial_section(character: Character, *, read_only: bool) -> dict[str, object]:
+    """Build the spell-slot summary shown next to the learning budget."""
+    return {"learn_magic_slot_summary": character.get_magic_engine().get_spell_learning_slot_summary()}
+
+
+# Context sections in build order; each returns only the keys its partials read.
+SHEET_PARTIAL_SECTION_BUILDERS = {
+    "combat": _combat_partial_section,
+    "inventory": _inventory_partial_section,
+    "armor": _armor_partial_section,
+    "wallet": _wallet_partial_section,
+    "fame": _fame_partial_section,
+    "spells": _spell_partial_section,
+    "lessons": _lesson_partial_section,
+    "learning_budget": _learning_budget_partial_section,
+}
+
+# Sections each sheet partial depends on. Partials missing here (header, secondary
+# page, card hand, religion field) embed most of the sheet and need the full build.
+SHEET_PARTIAL_CONTEXT_SECTIONS = {
+    "attribute_panel": ("combat",),
+    "skills_panel": ("combat",),
+    "load_panel": ("combat",),
+    "core_stats_panel": ("combat",),
+    "damage_panel": ("combat",),
+    "weapon_panel": ("combat",),
+    "battle_calculator": ("combat",),
+    "wallet_panel": ("wallet",),
+    "experience_panel": (),
+    "fame_panel": ("fame",),
+    "inventory_panel": ("inventory",),
+    "armor_panel": ("armor",),
+    "spell_panel": ("spells",),
+    "lesson_panel": ("lessons",),
+    "learning_budget": ("learning_budget",),
+}
+
+
+def sheet_partial_sections(partial_keys) -> tuple[str, ...] | None:
+    """Return the ordered context sections for these partials, or None if one needs the full sheet."""
+    needed: set[str] = set()
+    for key in partial_keys:
+        sections = SHEET_PARTIAL_CONTEXT_SECTIONS.get(key)
+        if sections is None:
+            return None
+        needed.update(sections)
+    return tuple(name for name in SHEET_PARTIAL_SECTION_BUILDERS if name in needed)
+
+
+def build_sheet_partial_context(
     character: Character,
     partial_keys,
     *,
     read_only: bool = False,
-) -> dict[str, object]:
-    """Build only the sheet data needed after item semantic-effect toggles."""
-    partial_key_set = set(partial_keys)
-    context = build_temporary_attribute_context(character, read_only=read_only)
-    engine = character.engine
-    carry_state = ItemEngine.carry_state_for_character(character)
-    carry_penalty = int(carry_state["penalty"])
-    load_penalty = engine.load_penalty()
+) -> dict[str, object] | None:
+    """Build only the context sections the given partials read, or None when they need the full sheet."""
+    sections = sheet_partial_sections(partial_keys)
+    if sections is None:
+        return None
+    context: dict[str, object] = {"character": character, "read_only": read_only}
+    for name in sections:
+        context.update(SHEET_PARTIAL_SECTION_BUILDERS[name](character, read_only=read_only))
+    return context
 
-    if "inventory_panel" in partial_key_set:
-        inventory_rows = _build_inventory_rows(character)
-        inventory_total_weight_display = _build_inventory_total_weight_display(character)
-        context.update(
-            {
-                "inventory_rows": [row for row in inventory_rows if not row.get("is_stored")],
-                "stored_inventory_rows": [row for row in inventory_rows if row.get("is_stored")],
-                "inventory_total_weight_display": inventory_total_weight_display,
-                "carry_load": {
-                    "enabled": bool(character.carry_load_enabled),
-                    "weight": str(carry_state["weight"]),
-                    "weight_display": inventory_total_weight_display,
-                    "penalty": carry_penalty,
-                    "state_label": str(carry_state["state_label"]),
-                    "tooltip": _build_carry_load_tooltip(carry_state, active=False),
-                    "tooltip_active": _build_carry_load_tooltip(carry_state, active=True),
-                },
-            }
-        )
 
-    if "armor_panel" in partial_key_set:
-        armor_zone_protection = engine.armor_zone_protection()
-        load_tooltip = _build_load_tooltip(engine)
-        context.update(
-            {
-                "armor_rows": _build_armor_rows(engine),
-                "armor_summary": {
-                    "total_rs": engine.get_grs(),
-                    "total_rs_tooltip": _build_total_armor_tooltip(engine),
-                    "load_value": load_penalty,
-                    "load_tooltip": load_tooltip,
-                    "minimum_strength": engine.get_ms(),
-                    "minimum_strength_tooltip": _build_minimum_strength_tooltip(engine),
-                },
-                "body_armor": {
-                    "shield": engine.shield_protection(),
-                    **armor_zone_protection,
-                },
-            }
-        )
+def _skill_sheet_tooltip(character: Character, target: str) -> str:
+    """Build the calculation breakdown of one learned skill row."""
+    character_skill = (
+        character.characterskill_set
+        .select_related("skill", "skill__attribute", "skill__category")
+        .filter(pk=int(target))
+        .first()
+    )
+    if character_skill is None:
+        raise LookupError(target)
+    engine = character.get_engine()
+    skill = character_skill.skill
+    specification = (character_skill.specification or "").strip()
+    return _build_skill_calculation_tooltip(
+        engine,
+        skill,
+        base_rank=int(character_skill.level),
+        specification=specification,
+        load_penalty=engine.load_penalty(),
+        conditional_modifiers=_skill_conditional_modifier_lines(
+            engine,
+            skill,
+            specification,
+            _conditional_encumbrance_variants(engine),
+        ),
+    )
 
-    if "wallet_panel" in partial_key_set:
-        wallet_gold, wallet_silver, wallet_copper = engine.km_to_coins()
-        context.update(
-            {
-                "wallet_total_ks": format_thousands(character.money),
-                "wallet_gold_display": format_thousands(wallet_gold),
-                "wallet_silver_display": format_thousands(wallet_silver),
-                "wallet_copper_display": format_thousands(wallet_copper),
-            }
-        )
 
-    if "fame_panel" in partial_key_set:
-        manual_personal_fame_point = max(
-            0,
-            int(character.personal_fame_point) + int(engine.resolve_resource("personal_fame_point")),
-        )
-        manual_personal_fame_total = max(
-            0,
-            (int(character.personal_fame_rank) * 10) + int(character.personal_fame_point),
-        )
-        base_personal_fame_rank = max(
-            0,
-            int(character.personal_fame_rank) + int(engine.resolve_resource("personal_fame_rank")),
-        )
-        effective_artefact_rank = max(
-            0,
-            int(character.artefact_rank) + int(engine.resolve_resource("artefact_rank")),
-        )
-        auto_school_fame_point = engine.auto_school_fame_points()
-        auto_lesson_fame_point = engine.auto_lesson_fame_points()
-        auto_progression_fame_point = auto_school_fame_point + auto_lesson_fame_point
-        total_personal_fame_point = manual_personal_fame_point + auto_progression_fame_point
-        effective_personal_fame_point = total_personal_fame_point % 10
-        effective_personal_fame_rank = base_personal_fame_rank + (total_personal_fame_point // 10)
-        context.update(
-            {
-                "effective_personal_fame_point": effective_personal_fame_point,
-                "effective_personal_fame_rank": effective_personal_fame_rank,
-                "effective_artefact_rank": effective_artefact_rank,
-                "auto_school_fame_point": auto_school_fame_point,
-                "manual_personal_fame_total": manual_personal_fame_total,
-                "auto_lesson_fame_point": auto_lesson_fame_point,
-                "auto_progression_fame_point": auto_progression_fame_point,
-                "fame_total_rank": effective_personal_fame_rank + int(character.sacrifice_rank) + effective_artefact_rank,
-            }
-        )
+def _item_sheet_tooltip(character: Character, target: str) -> str:
+    """Build the card tooltip body of one item held or owned by the character."""
+    character_item = (
+        CharacterItem.objects
+        .filter(Q(owner=character) | Q(original_owner_character=character), pk=int(target))
+        .select_related("item", "item__weaponstats", "item__weaponstats__damage_source", "item__rangedweaponstats", "item__armorstats", "item__shieldstats")
+        .prefetch_related("item__runes", "runes", "rune_specs__rune", "item_runes__rune")
+        .first()
+    )
+    if character_item is None:
+        raise LookupError(target)
+    magic_effect_summary, magic_modifier_payloads = _merge_magic_effect_payloads(
+        effect_summary=character_item.magic_effect_summary or "",
+        modifier_payloads=_load_character_item_modifier_payloads([character_item]).get(character_item.id, []),
+    )
+    return _build_inventory_item_tooltip(
+        character_item,
+        ItemEngine(character_item),
+        strength=int(character.get_engine().attributes().get(ATTR_ST, 0) or 0),
+        is_race_item=RaceStartingItem.objects.filter(item_id=character_item.item_id).exists(),
+        magic_effect_summary=magic_effect_summary,
+        magic_modifier_payloads=magic_modifier_payloads,
+    )
 
-    if "spell_panel" in partial_key_set:
-        spell_panel_data = character.get_magic_engine().get_spell_panel_data()
-        context.update(
-            {
-                "spell_panel_enabled": bool(spell_panel_data["spell_panel_enabled"]),
-                "spell_and_lessons_panel_enabled": bool(spell_panel_data["spell_and_lessons_panel_enabled"]),
-                "has_castable_entries": bool(spell_panel_data["has_castable_entries"]),
-                "spell_panel_groups": spell_panel_data["groups"],
-                "spell_panel_filter_groups": spell_panel_data.get("filter_groups", []),
-            }
-        )
 
-    if "lesson_panel" in partial_key_set:
-        context.update(_build_lesson_context(character, engine=CharacterEngine(character), read_only=read_only))
+# Tooltip kinds the sheet fetches on hover, keyed by the prefix of a row's tooltip_key.
+SHEET_TOOLTIP_BUILDERS = {
+    "skill": _skill_sheet_tooltip,
+    "item": _item_sheet_tooltip,
+}
 
-    if "learning_budget" in partial_key_set:
-        context["learn_magic_slot_summary"] = character.get_magic_engine().get_spell_learning_slot_summary()
 
-    return context
+@profiled("sheet.tooltip")
+def build_sheet_tooltip(character: Character, tooltip_key: str) -> str:
+    """Build one lazily loaded sheet tooltip; raise LookupError for unknown keys or targets."""
+    kind, _separator, target = str(tooltip_key or "").partition(":")
+    builder = SHEET_TOOLTIP_BUILDERS.get(kind)
+    if builder is None or not target.isdigit():
+        raise LookupError(tooltip_key)
+    return builder(character, target)
 
 
 def build_inventory_partial_context(character: Character) -> dict[str, object]:
     """Build the minimal context needed to redraw the inventory panel."""
-    inventory_rows = _build_inventory_rows(character)
-    inventory_total_weight_display = _build_inventory_total_weight_display(character)
-    carry_state = ItemEngine.carry_state_for_character(character)
+    return {"character": character, **_inventory_partial_section(character, read_only=False)}
+
+
+def build_sheet_instance_context(
+    character: Character,
+    *,
+    close_learn_window_once: bool = False,
+    read_only: bool = False,
+) -> dict[str, object]:
+    """Build the sheet context entries bound to the live character instance and request."""
     return {
         "character": character,
-        "inventory_rows": [row for row in inventory_rows if not row.get("is_stored")],
-        "stored_inventory_rows": [row for row in inventory_rows if row.get("is_stored")],
-        "inventory_total_weight_display": inventory_total_weight_display,
-        "carry_load": {
-            "enabled": bool(character.carry_load_enabled),
-            "weight": str(carry_state["weight"]),
-            "weight_display": inventory_total_weight_display,
-            "penalty": int(carry_state["penalty"]),
-            "state_label": str(carry_state["state_label"]),
-            "tooltip": _build_carry_load_tooltip(carry_state, active=False),
-            "tooltip_active": _build_carry_load_tooltip(carry_state, active=True),
-        },
+        "read_only": read_only,
+        "close_learn_window_once": close_learn_window_once,
+        "char_info_form": CharacterInfoInlineForm(instance=character),
+        "skill_specification_form": CharacterSkillSpecificationForm(),
+        "technique_specification_form": CharacterTechniqueSpecificationForm(),
+        "trait_specification_form": CharacterTraitSpecificationForm(),
     }
 
 
+@profiled("sheet.sheet_context")
 def build_character_sheet_context(
     character: Character,
     *,
@@ -6864,10 +7000,11 @@ def build_character_sheet_context(
             )
         )
     )
+    from charsheet.creature_stat_blocks import get_creature_card_contexts
+
     creature_card_contexts = []
     character_creature_card_rows = []
-    for card in active_creature_cards:
-        card_context = CreatureEngine(card).card_context()
+    for card, card_context in zip(active_creature_cards, get_creature_card_contexts(active_creature_cards)):
         card_context["adjust_damage_url"] = reverse("adjust_creature_damage", kwargs={"pk": card.pk})
         card_context["training_update_url"] = reverse("update_character_creature_training", kwargs={"pk": card.pk})
         if (
@@ -6956,8 +7093,11 @@ def build_character_sheet_context(
         shaman_card_update_url = ""
 
     return {
-        "character": character,
-        "read_only": read_only,
+        **build_sheet_instance_context(
+            character,
+            close_learn_window_once=close_learn_window_once,
+            read_only=read_only,
+        ),
         "cultist_corruption_level": cultist_corruption_level,
         "effective_personal_fame_point": effective_personal_fame_point,
         "effective_personal_fame_rank": effective_personal_fame_rank,
@@ -6967,7 +7107,6 @@ def build_character_sheet_context(
         "manual_personal_fame_total": manual_personal_fame_total,
         "auto_lesson_fame_point": auto_lesson_fame_point,
         "auto_progression_fame_point": auto_progression_fame_point,
-        "char_info_form": CharacterInfoInlineForm(instance=character),
         "selected_divine_entity": divine_entity,
         "selected_divine_binding": divine_binding,
         "selected_divine_symbol_url": divine_symbol_url,
@@ -7019,9 +7158,6 @@ def build_character_sheet_context(
         "selected_shaman_card_holo_kind": shaman_card_holo_kind,
         "creature_card_contexts": creature_card_contexts,
         "character_creature_card_rows": character_creature_card_rows,
-        "skill_specification_form": CharacterSkillSpecificationForm(),
-        "technique_specification_form": CharacterTechniqueSpecificationForm(),
-        "trait_specification_form": CharacterTraitSpecificationForm(),
         "fame_total_rank": fame_total_rank,
         "attributes": attributes,
         "attr_mods": attr_mods,
@@ -7204,7 +7340,6 @@ def build_character_sheet_context(
         "size_class_mod": size_class_mod,
         "movement_ground": movement_ground,
         "language_rows": language_rows,
-        "shop_item_groups": _build_shop_item_groups(),
         "shop_sell_item_groups": _build_shop_sell_item_groups(character),
         "shop_quality_choices": shop_quality_choices,
         "shop_item_form_type_choices": [
@@ -7321,7 +7456,6 @@ def build_character_sheet_context(
             }
             for rune in Rune.objects.order_by("name")
         ],
-        "close_learn_window_once": close_learn_window_once,
         "learn_skill_count": sum(len(group["rows"]) for group in learning_context["learn_skill_groups"]),
         "learn_trait_count": sum(len(group["rows"]) for group in learning_context["learn_trait_groups"]),
         "learn_school_count": sum(len(group["rows"]) for group in learning_context["learn_school_groups"]),
@@ -0,0 +1,195 @@
+"""Versioned cache for the character-independent shop catalog and group catalogs."""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from codex_arcana.versioning import get_application_version
+
+from .cache_versions import bump_cache_versions, cache_version
+from .engine import ItemEngine
+from .models import Item, RaceStartingItem
+from .sheet_context import SHOP_ARMOR_COMPONENT_GROUP, SHOP_GROUP_LABELS, SHOP_GROUP_ORDER
+from .view_utils import quality_payload
+
+SHOP_CATALOG_CACHE_PREFIX = "charsheet:shop-catalog"
+SHOP_CATALOG_VERSION_KEY = f"{SHOP_CATALOG_CACHE_PREFIX}:version"
+SHOP_CATALOG_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Item tables that feed shop rows; saving or deleting a row bumps the catalog version.
+SHOP_CATALOG_SOURCES = (
+    "charsheet.Item",
+    "charsheet.WeaponStats",
+    "charsheet.ArmorStats",
+    "charsheet.ShieldStats",
+    "charsheet.MagicItemStats",
+    "charsheet.RaceStartingItem",
+    "charsheet.Quality",
+)
+
+
+def shop_catalog_version() -> int:
+    """Return the shared item-catalog version, seeding it on first use."""
+    return cache_version(SHOP_CATALOG_VERSION_KEY)
+
+
+def bump_shop_catalog_version() -> None:
+    """Invalidate every cached shop and group catalog once the change commits."""
+    bump_cache_versions(SHOP_CATALOG_VERSION_KEY)
+
+
+def shop_catalog_cache_key(version: int, scope: str) -> str:
+    """Return the cache key for one catalog scope under one item-catalog version."""
+    return f"{SHOP_CATALOG_CACHE_PREFIX}:{int(version)}:{scope}"
+
+
+def shop_catalog_etag() -> str:
+    """Return a strong validator for the rendered global catalog."""
+    return f'"shop-{shop_catalog_version()}-{get_application_version()}"'
+
+
+def build_shop_item_groups() -> list[dict]:
+    """Build grouped shop rows from all buyable items."""
+    grouped_items: dict[str, list[dict]] = {}
+    race_item_ids = set(RaceStartingItem.objects.values_list("item_id", flat=True))
+    buyable_items = (
+        Item.objects
+        .filter(catalog_group__isnull=True)
+        .select_related("weaponstats", "armorstats", "shieldstats", "magicitemstats")
+        .prefetch_related("runes")
+        .order_by("item_type", "name")
+    )
+    for item in buyable_items:
+        if item.id in race_item_ids or item.not_buyable:
+            continue
+        item_engine = ItemEngine(item)
+        quality = quality_payload(item_engine.get_effective_quality())
+        stats_payload: dict[str, object] = {
+            "item_type": item.item_type,
+            "size_class": item.size_class,
+            "weight": str(item.weight),
+            "min_st": None,
+        }
+        weapon_stats = getattr(item, "weaponstats", None)
+        if weapon_stats is not None:
+            stats_payload.update(
+                {
+                    "damage_dice_amount": weapon_stats.damage_dice_amount,
+                    "damage_dice_faces": weapon_stats.damage_dice_faces,
+                    "damage_flat_bonus": weapon_stats.damage_flat_bonus,
+                    "damage_flat_operator": weapon_stats.damage_flat_operator,
+                    "h2_dice_amount": weapon_stats.h2_dice_amount,
+                    "h2_dice_faces": weapon_stats.h2_dice_faces,
+                    "h2_flat_bonus": weapon_stats.h2_flat_bonus,
+                    "h2_flat_operator": weapon_stats.h2_flat_operator,
+                    "h2_damage_type": weapon_stats.h2_damage_type,
+                    "wield_mode": weapon_stats.wield_mode,
+                    "min_st": weapon_stats.min_st,
+                    "damage_type": weapon_stats.damage_type,
+                }
+            )
+        armor_stats = getattr(item, "armorstats", None)
+        if armor_stats is not None:
+            stats_payload.update(
+                {
+                    "armor_rs": item_engine.get_armor_rs_raw() or 0,
+                    "armor_bel": armor_stats.encumbrance,
+                    "armor_min_st": armor_stats.min_st,
+                    "min_st": armor_stats.min_st,
+                }
+            )
+        shield_stats = getattr(item, "shieldstats", None)
+        if shield_stats is not None:
+            stats_payload.update(
+                {
+                    "shield_rs": shield_stats.rs,
+                    "shield_bel": shield_stats.encumbrance,
+                    "shield_min_st": shield_stats.min_st,
+                    "shield_parade_bonus": shield_stats.parade_bonus,
+                    "min_st": shield_stats.min_st,
+                }
+            )
+        magic_item_stats = getattr(item, "magicitemstats", None)
+        if magic_item_stats is not None:
+            stats_payload.update(
+                {
+                    "effect_summary": magic_item_stats.effect_summary,
+                }
+            )
+        group_key = (
+            SHOP_ARMOR_COMPONENT_GROUP
+            if armor_stats is not None and armor_stats.parent_set_id
+            else item.item_type
+        )
+        grouped_items.setdefault(group_key, []).append(
+            {
+                "id": item.id,
+                "name": item.name,
+                "description": item.description or "",
+                "item_type": item.item_type,
+                "stackable": bool(item.stackable),
+                "base_price": int(item.price),
+                "default_price": item_engine.get_price(),
+                "default_quality": quality["value"],
+                "default_quality_label": quality["label"],
+                "default_quality_color": quality["color"],
+                "stats": stats_payload,
+                "rune_ids": [rune.id for rune in item.runes.all()],
+            }
+        )
+
+    return [
+        {
+            "key": item_type,
+            "label": SHOP_GROUP_LABELS[item_type],
+            "items": grouped_items[item_type],
+        }
+        for item_type in SHOP_GROUP_ORDER
+        if grouped_items.get(item_type)
+    ]
+
+
+def get_shop_item_groups() -> list[dict]:
+    """Return the grouped global shop catalog, building it once per catalog version."""
+    key = shop_catalog_cache_key(shop_catalog_version(), "global")
+    groups = cache.get(key)
+    if groups is None:
+        groups = build_shop_item_groups()
+        cache.set(key, groups, timeout=SHOP_CATALOG_CACHE_TIMEOUT)
+    return groups
+
+
+def get_group_catalog_items(group_id: int) -> list[Item]:
+    """Return one group's own catalog items, cached per group and catalog version."""
+    key = shop_catalog_cache_key(shop_catalog_version(), f"group:{int(group_id)}")
+    items = cache.get(key)
+    if items is None:
+        items = list(Item.objects.filter(catalog_group_id=group_id).order_by("name"))
+        cache.set(key, items, timeout=SHOP_CATALOG_CACHE_TIMEOUT)
+    return items
+
+
+def _bump_shop_catalog_for_instance(sender, raw=False, **kwargs):
+    """Bump the catalog version after an item definition changed."""
+    if raw:
+        return
+    bump_shop_catalog_version()
+
+
+for _sender_label in SHOP_CATALOG_SOURCES:
+    post_save.connect(
+        _bump_shop_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"shop_catalog_save:{_sender_label}",
+    )
+    post_delete.connect(
+        _bump_shop_catalog_for_instance,
+        sender=_sender_label,
+        dispatch_uid=f"shop_catalog_delete:{_sender_label}",
+    )
+m2m_changed.connect(
+    _bump_shop_catalog_for_instance,
+    sender=Item.runes.through,
+    dispatch_uid="shop_catalog_m2m:item_runes",
+)
@@ -5,6 +5,8 @@ from django import template
 from django.utils.safestring import mark_safe
 from markdown_it import MarkdownIt
 
+from charsheet.markdown_cache import render_markdown_cached
+
 
 register = template.Library()
 
@@ -239,11 +241,15 @@ def _render_card_markdown(value: str) -> str:
     return "\n".join(output)
 
 
+def _render_standard_markdown(value: str) -> str:
+    return _markdown.render(_escape_parenthesized_ordered_list_markers(value))
+
+
 @register.filter(name="card_markdown")
 def card_markdown(value):
     if not value:
         return ""
-    return mark_safe(_render_card_markdown(str(value)))
+    return mark_safe(render_markdown_cached("card_markdown", str(value), _render_card_markdown))
 
 
 @register.filter(name="standard_markdown")
@@ -251,8 +257,7 @@ def standard_markdown(value):
     """Render safe, standard Markdown without allowing embedded HTML."""
     if not value:
         return ""
-    normalized_value = _escape_parenthesized_ordered_list_markers(str(value))
-    return mark_safe(_markdown.render(normalized_value))
+    return mark_safe(render_markdown_cached("standard_markdown", str(value), _render_standard_markdown))
 
 
 @register.filter(name="compact_number_de")
@@ -286,12 +291,8 @@ def _render_fluff_lines(value: str) -> str:
     return "<br>".join(_markdown.renderInline(line) for line in value.splitlines())
 
 
-@register.filter(name="card_fluff")
-def card_fluff(value):
-    """Render card fluff, with content after a standalone --- outside the quote."""
-    if not value:
-        return ""
-    lines = str(value).splitlines()
+def _render_card_fluff(value: str) -> str:
+    lines = value.splitlines()
     separator_index = next((index for index, line in enumerate(lines) if line.strip() == "---"), None)
     if separator_index is None:
         quote_text = "\n".join(lines).strip()
@@ -306,11 +307,7 @@ def card_fluff(value):
     if outside_text:
         html.append(f'<div class="card-vow-outside">{_render_fluff_lines(outside_text)}</div>')
     html.append("</div>")
-    return mark_safe("".join(html))
-
-
-def _render_fluff_lines(value: str) -> str:
-    return "<br>".join(_markdown.renderInline(line) for line in value.splitlines())
+    return "".join(html)
 
 
 @register.filter(name="card_fluff")
@@ -318,19 +315,4 @@ def card_fluff(value):
     """Render card fluff, with content after a standalone --- outside the quote."""
     if not value:
         return ""
-    lines = str(value).splitlines()
-    separator_index = next((index for index, line in enumerate(lines) if line.strip() == "---"), None)
-    if separator_index is None:
-        quote_text = "\n".join(lines).strip()
-        outside_text = ""
-    else:
-        quote_text = "\n".join(lines[:separator_index]).strip()
-        outside_text = "\n".join(lines[separator_index + 1:]).strip()
-
-    html: list[str] = ['<div class="card-vow-group">']
-    if quote_text:
-        html.append(f'<blockquote class="card-vow">&bdquo;{_render_fluff_lines(quote_text)}&ldquo;</blockquote>')
-    if outside_text:
-        html.append(f'<div class="card-vow-outside">{_render_fluff_lines(outside_text)}</div>')
-    html.append("</div>")
-    return mark_safe("".join(html))
+    return mark_safe(render_markdown_cached("card_fluff", str(value), _render_card_fluff))
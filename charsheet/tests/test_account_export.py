@@ -0,0 +1,149 @@
+"""Tests for the account export format, its parser, and the import round trip."""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.account_export import (
+    ACCOUNT_EXPORT_SCHEMA_VERSION,
+    ACCOUNT_EXPORT_SECTIONS,
+    AccountImportError,
+    import_account_rows,
+    iter_account_json,
+    parse_account_export,
+)
+from charsheet.game_groups import create_group
+from charsheet.models import (
+    Attribute,
+    Character,
+    CharacterAttribute,
+    CharacterItem,
+    CharacterSkill,
+    CharacterWeightLedger,
+    Item,
+    Quality,
+    Race,
+    Skill,
+    SkillCategory,
+)
+
+
+class AccountExportFormatTests(SimpleTestCase):
+    def test_links_are_not_exported_as_plain_columns(self):
+        sections = {section.name: section for section in ACCOUNT_EXPORT_SECTIONS}
+
+        item_fields = sections["items"].value_fields()
+        self.assertIn("amount", item_fields)
+        self.assertNotIn("provenance_id", item_fields)
+        self.assertNotIn("image_override", item_fields)
+        self.assertNotIn("sheet_revision", sections["characters"].value_fields())
+
+    def test_parents_are_exported_before_their_children(self):
+        order = [section.name for section in ACCOUNT_EXPORT_SECTIONS]
+
+        for section in ACCOUNT_EXPORT_SECTIONS:
+            for parent in section.parents.values():
+                self.assertLess(order.index(parent), order.index(section.name))
+
+    def test_json_and_ndjson_parse_to_the_same_sections(self):
+        header = {"schema": ACCOUNT_EXPORT_SCHEMA_VERSION, "user": {"username": "a"}}
+        character = {"id": 3, "name": "Ilva", "race": "Mensch"}
+        skill = {"id": 9, "character": 3, "skill": "klettern", "level": 2}
+        document = json.dumps({**header, "characters": [character], "skills": [skill]})
+        lines = "\n".join(
+            json.dumps(record)
+            for record in (
+                {"section": "account", "data": header},
+                {"section": "characters", "data": character},
+                {"section": "skills", "data": skill},
+                {"section": "unknown", "data": {}},
+            )
+        )
+
+        from_json = parse_account_export(document.encode())
+        from_ndjson = parse_account_export(lines.encode())
+
+        self.assertEqual(from_json, from_ndjson)
+        self.assertEqual(from_json["skills"], [skill])
+
+    def test_unknown_schema_or_garbage_is_rejected(self):
+        for raw in (b"", b"not json", json.dumps({"schema": 1}).encode(), b"\xff\xfe"):
+            with self.subTest(raw=raw), self.assertRaises(AccountImportError):
+                parse_account_export(raw)
+
+
+
+class AccountImportRoundTripTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username="quelle")
+        cls.other_user = get_user_model().objects.create(username="ziel")
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        strength = Attribute.objects.create(name="Stärke", short_name="ST")
+        skill = Skill.objects.create(
+            name="Klettern",
+            slug="klettern",
+            category=SkillCategory.objects.create(name="Körper", slug="koerper"),
+            attribute=strength,
+        )
+        character = Character.objects.create(
+            owner=cls.user,
+            name="Alrik",
+            race=Race.objects.create(name="Mensch"),
+            money=42,
+            personal_fame_point=3,
+        )
+        CharacterAttribute.objects.update_or_create(character=character, attribute=strength, defaults={"base_value": 2})
+        CharacterSkill.objects.create(character=character, skill=skill, level=4)
+        CharacterItem.objects.create(
+            owner=character,
+            item=Item.objects.create(name="Seil", item_type=Item.ItemType.MISC),
+            amount=3,
+        )
+
+    def _sections(self):
+        return parse_account_export("".join(iter_account_json(self.user)).encode())
+
+    def test_exported_account_imports_unchanged(self):
+        counts = import_account_rows(self.other_user, self._sections())
+
+        self.assertEqual(counts["skipped"], 0)
+        imported = Character.objects.get(owner=self.other_user)
+        self.assertEqual((imported.name, imported.money, imported.personal_fame_point), ("Alrik", 42, 3))
+        self.assertEqual(
+            list(imported.characterattribute_set.values_list("attribute__short_name", "base_value")),
+            [("ST", 2)],
+        )
+        self.assertEqual(list(imported.characterskill_set.values_list("skill__slug", "level")), [("klettern", 4)])
+        self.assertEqual(list(CharacterItem.objects.filter(owner=imported).values_list("item__name", "amount")), [("Seil", 3)])
+        self.assertTrue(CharacterWeightLedger.objects.filter(character=imported).exists())
+
+    def test_invalid_values_are_skipped_instead_of_stored(self):
+        for overrides, section in (
+            ({"money": "abc"}, "characters"),
+            ({"money": -5}, "characters"),
+            ({"personal_fame_point": 11}, "characters"),
+            ({"level": 11}, "skills"),
+            ({"amount": -1}, "items"),
+        ):
+            with self.subTest(overrides=overrides):
+                sections = self._sections()
+                sections[section][0].update(overrides)
+
+                counts = import_account_rows(self.other_user, sections)
+
+                self.assertGreater(counts["skipped"], 0)
+                self.assertFalse(Character.objects.filter(owner=self.other_user, money__lt=0).exists())
+                self.assertFalse(CharacterSkill.objects.filter(character__owner=self.other_user, level__gt=10).exists())
+
+    def test_items_from_foreign_group_catalogs_are_skipped(self):
+        group = create_group(creator=get_user_model().objects.create(username="sl"), name="Fremde Runde")
+        private_item = Item.objects.create(name="Geheimklinge", item_type=Item.ItemType.MISC, catalog_group=group)
+        sections = self._sections()
+        sections["items"][0]["item"] = private_item.pk
+
+        counts = import_account_rows(self.other_user, sections)
+
+        self.assertEqual((counts["items"], counts["skipped"]), (0, 1))
+        self.assertFalse(CharacterItem.objects.filter(item=private_item).exists())
@@ -0,0 +1,79 @@
+"""Tests for the sheet-render benchmark command and its result comparison."""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.management.commands.benchmark_sheet_render import Command
+from charsheet.models import Attribute, Character, Quality, Race, Skill, SkillCategory
+
+
+class BenchmarkBaselineTests(SimpleTestCase):
+    def _baseline(self, payload) -> Path:
+        handle = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8")
+        with handle:
+            json.dump(payload, handle)
+        self.addCleanup(Path(handle.name).unlink)
+        return Path(handle.name)
+
+    def test_rows_are_annotated_with_the_relative_median_change(self):
+        baseline = self._baseline(
+            {"results": [{"benchmark": "sheet_context", "persona": "mage", "median_ms": 200.0, "queries": 180}]}
+        )
+        result = {
+            "results": [
+                {"benchmark": "sheet_context", "persona": "mage", "median_ms": 150.0, "queries": 170},
+                {"benchmark": "sheet_context", "persona": "novice", "median_ms": 90.0, "queries": 120},
+            ]
+        }
+
+        Command._compare(result, baseline)
+
+        self.assertEqual(result["results"][0]["median_change"], -0.25)
+        self.assertEqual(result["results"][0]["baseline_queries"], 180)
+        self.assertNotIn("median_change", result["results"][1])
+
+    def test_unreadable_baseline_is_a_command_error(self):
+        with self.assertRaises(CommandError):
+            Command._compare({"results": []}, Path("/nonexistent/benchmark.json"))
+
+
+class BenchmarkCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        strength = Attribute.objects.create(name="Stärke", short_name="ST")
+        Race.objects.create(name="Mensch")
+        Skill.objects.create(
+            name="Klettern",
+            slug="klettern",
+            category=SkillCategory.objects.create(name="Körper", slug="koerper"),
+            attribute=strength,
+        )
+
+    def test_every_scenario_runs_and_is_rolled_back(self):
+        out = StringIO()
+
+        call_command("benchmark_sheet_render", "--iterations", "1", "--json", stdout=out)
+
+        result = json.loads(out.getvalue())
+        benchmarks = {row["benchmark"] for row in result["results"]}
+        self.assertEqual(
+            benchmarks,
+            {
+                "character_engine",
+                "modifier_resolution",
+                "battle_calculator",
+                "sheet_context",
+                "learning_submission",
+                "game_master_screen",
+            },
+        )
+        battle_calculator = next(row for row in result["results"] if row["benchmark"] == "battle_calculator")
+        self.assertGreater(battle_calculator["queries"], 0)
+        self.assertFalse(Character.objects.exists())
@@ -0,0 +1,103 @@
+"""Tests that bulk-loaded character engines match lazily built ones."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from charsheet.engine import load_character_engines
+from charsheet.engine.character_engine import CharacterEngine
+from charsheet.models import (
+    ArmorStats,
+    Attribute,
+    Character,
+    CharacterAttribute,
+    CharacterItem,
+    CharacterLanguage,
+    CharacterSchool,
+    CharacterSkill,
+    CharacterTrait,
+    Item,
+    Language,
+    Quality,
+    Race,
+    School,
+    SchoolType,
+    Skill,
+    SkillCategory,
+    Trait,
+)
+
+# Row caches the bulk loader seeds directly instead of letting the engine query them.
+SEEDED_CACHES = (
+    "_attributes_map",
+    "_skills_map",
+    "_skill_levels_by_id",
+    "_languages_map",
+    "_school_entries",
+    "_selected_paths",
+    "_manual_learned_technique_ids",
+    "_learned_techniques_by_id",
+    "_technique_choices_by_technique_id",
+    "_race_choices_by_definition_id",
+    "_trait_choices_by_definition_id",
+    "_trait_levels",
+    "_trait_levels_by_slug",
+    "_equipped_item_runes",
+    "_equipped_rune_ids",
+    "_equipped_items_for_semantic_effects",
+)
+
+
+class CharacterBulkLoaderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create(username="spieler")
+        race = Race.objects.create(name="Mensch")
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        strength = Attribute.objects.create(name="Stärke", short_name="ST")
+        category = SkillCategory.objects.create(name="Körper", slug="koerper")
+        climbing = Skill.objects.create(name="Klettern", slug="klettern", category=category, attribute=strength)
+        swimming = Skill.objects.create(name="Schwimmen", slug="schwimmen", category=category, attribute=strength)
+        trait = Trait.objects.create(name="Zäh", slug="zaeh", trait_type=Trait.TraitType.ADV, description="")
+        language = Language.objects.create(name="Garethi", slug="garethi")
+        school = School.objects.create(name="Schwertkampf", type=SchoolType.objects.create(name="Kampf", slug="kampf"))
+        armor = Item.objects.create(name="Kettenhemd", item_type=Item.ItemType.ARMOR, stackable=False)
+        ArmorStats.objects.create(item=armor, rs_total=2, encumbrance=1)
+
+        cls.characters = []
+        for index, name in enumerate(("Alrik", "Bosper")):
+            character = Character.objects.create(owner=user, name=name, race=race)
+            CharacterAttribute.objects.update_or_create(
+                character=character,
+                attribute=strength,
+                defaults={"base_value": index + 1},
+            )
+            CharacterSkill.objects.create(character=character, skill=climbing, level=index + 2)
+            CharacterTrait.objects.create(owner=character, trait=trait, trait_level=index + 1)
+            CharacterLanguage.objects.create(owner=character, language=language)
+            cls.characters.append(character)
+        CharacterSkill.objects.create(character=cls.characters[0], skill=swimming, level=1)
+        CharacterSchool.objects.create(character=cls.characters[0], school=school, level=1)
+        CharacterItem.objects.create(owner=cls.characters[1], item=armor, equipped=True)
+
+    def test_seeded_caches_match_lazily_built_engines(self):
+        characters = list(Character.objects.filter(pk__in=[character.pk for character in self.characters]))
+        engines = load_character_engines(characters)
+
+        for character in characters:
+            bulk = engines[character.pk]
+            fresh = CharacterEngine(Character.objects.get(pk=character.pk))
+            for name in SEEDED_CACHES:
+                with self.subTest(character=character.name, cache=name):
+                    expected = getattr(fresh, name)
+                    actual = bulk.__dict__[name]
+                    if name in ("_equipped_item_runes", "_equipped_items_for_semantic_effects"):
+                        expected, actual = list(expected), list(actual)
+                    self.assertEqual(actual, expected)
+            with self.subTest(character=character.name, cache="modifier_engine._active_trait_modifiers"):
+                self.assertEqual(
+                    [repr(modifier) for modifier in bulk.modifier_engine._active_trait_modifiers],
+                    [repr(modifier) for modifier in fresh.modifier_engine._active_trait_modifiers],
+                )
+            self.assertEqual(bulk.equipped_armor_items(), fresh.equipped_armor_items())
+            self.assertEqual((bulk.get_grs(), bulk.get_bel()), (fresh.get_grs(), fresh.get_bel()))
+            self.assertEqual(bulk.skill_total("klettern"), fresh.skill_total("klettern"))
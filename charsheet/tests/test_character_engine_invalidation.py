@@ -0,0 +1,93 @@
+"""Tests for dependency-tracked CharacterEngine cache invalidation."""
+
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from charsheet.engine.character_engine import ENGINE_CACHE_DEPENDENTS, ENGINE_MUTATION_ROOTS, CharacterEngine
+from charsheet.learning import _current_engine
+from charsheet.models import Character
+
+
+class CharacterEngineInvalidationTests(SimpleTestCase):
+    def setUp(self):
+        self.engine = CharacterEngine(SimpleNamespace(pk=1))
+        for name in (
+            "_school_entries",
+            "_trait_levels",
+            "_learned_techniques_by_id",
+            "_equipped_item_runes",
+            "_equipped_rune_ids",
+            "_equipped_items_for_semantic_effects",
+            "_equipment_cache",
+            "_technique_states_cache",
+        ):
+            self.engine.__dict__[name] = object()
+        modifier_engine = self.engine.modifier_engine
+        for name in (
+            "_active_item_rune_modifiers",
+            "_active_item_semantic_modifiers",
+            "_active_school_semantic_modifiers",
+            "_active_trait_modifiers",
+        ):
+            modifier_engine.__dict__[name] = []
+        modifier_engine._active_modifiers_cache = []
+
+    def test_equipment_keeps_school_technique_and_trait_caches(self):
+        self.engine.invalidate("equipment")
+
+        for name in ("_equipped_item_runes", "_equipped_rune_ids", "_equipped_items_for_semantic_effects", "_equipment_cache"):
+            self.assertNotIn(name, self.engine.__dict__)
+        for name in ("_school_entries", "_trait_levels", "_learned_techniques_by_id", "_technique_states_cache"):
+            self.assertIn(name, self.engine.__dict__)
+        modifier_engine = self.engine.modifier_engine
+        self.assertNotIn("_active_item_rune_modifiers", modifier_engine.__dict__)
+        self.assertNotIn("_active_item_semantic_modifiers", modifier_engine.__dict__)
+        self.assertIn("_active_school_semantic_modifiers", modifier_engine.__dict__)
+        self.assertIn("_active_trait_modifiers", modifier_engine.__dict__)
+        self.assertIsNone(modifier_engine._active_modifiers_cache)
+
+    def test_damage_drops_nothing(self):
+        self.assertEqual(self.engine.invalidate("damage"), set())
+        self.assertIn("_equipment_cache", self.engine.__dict__)
+        self.assertEqual(self.engine.modifier_engine._active_modifiers_cache, [])
+
+    def test_technique_mutation_clears_memo_dictionaries(self):
+        self.engine._technique_available_cache[5] = True
+
+        self.engine.invalidate("techniques")
+
+        self.assertEqual(self.engine._technique_available_cache, {})
+        self.assertNotIn("_technique_states_cache", self.engine.__dict__)
+        self.assertIn("_equipped_item_runes", self.engine.__dict__)
+
+    def test_unknown_mutation_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.engine.invalidate("unknown")
+
+    def test_graph_only_references_existing_engine_attributes(self):
+        nodes = set(ENGINE_CACHE_DEPENDENTS)
+        for targets in (*ENGINE_CACHE_DEPENDENTS.values(), *ENGINE_MUTATION_ROOTS.values()):
+            nodes.update(targets)
+        for node in nodes:
+            if node.startswith("modifier_engine."):
+                name = node.split(".", 1)[1]
+                self.assertTrue(
+                    name == "_active_modifiers_cache" or hasattr(type(self.engine.modifier_engine), name),
+                    node,
+                )
+            elif node.startswith("character.") or node == "_equipment_cache":
+                continue
+            else:
+                self.assertTrue(hasattr(type(self.engine), node) or node in vars(self.engine), node)
+
+    def test_learning_steps_reuse_the_cached_engine(self):
+        character = Character()
+        character.__dict__["_character_engine"] = self.engine
+
+        engine = _current_engine(character, "schools")
+
+        self.assertIs(engine, self.engine)
+        self.assertNotIn("_school_entries", self.engine.__dict__)
+        self.assertIn("_trait_levels", self.engine.__dict__)
+        self.assertIn("_equipped_item_runes", self.engine.__dict__)
@@ -0,0 +1,96 @@
+"""Tests for the versioned creature stat block cache."""
+
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.creature_stat_blocks import (
+    bump_creature_catalog_version,
+    compile_creature_stat_block,
+    creature_catalog_versions,
+    creature_stat_block_cache_key,
+    creature_template_version_key,
+)
+from charsheet.cache_versions import cache_version
+from charsheet.models import Attribute, CharacterCreature, Creature, CreatureAttribute, CreatureType, Quality
+
+
+def _engine(**values):
+    return SimpleNamespace(
+        creature=SimpleNamespace(has_bp=False),
+        wound_rows=lambda: [{"label": "Angeschlagen", "threshold": 5, "penalty": -1}],
+        incapacitating_wound_stages=lambda: ["Koma"],
+        attribute_rows=lambda: [
+            {"label": "ST", "value": 2, "display": "+2"},
+            {"label": "INT", "value": None, "display": "-"},
+        ],
+        movement_display=lambda: {"combat": "8"},
+        kp=lambda: values.get("kp"),
+        potential=lambda: None,
+        size_class=lambda: "M",
+        vw=lambda: 11,
+        gw=lambda: 12,
+        sr=lambda: 13,
+        armor_totals=lambda: SimpleNamespace(total_rs=3),
+        initiative=lambda: values.get("initiative", 4),
+    )
+
+
+class CreatureStatBlockTests(SimpleTestCase):
+    def test_character_creature_keys_follow_owner_and_revision(self):
+        creature = CharacterCreature(pk=5, owner_id=2)
+        key = creature_stat_block_cache_key(creature, 7, 1, "screen", "v")
+
+        self.assertNotEqual(key, creature_stat_block_cache_key(creature, 8, 1, "screen", "v"))
+        self.assertNotEqual(key, creature_stat_block_cache_key(creature, 7, 2, "screen", "v"))
+        self.assertNotEqual(key, creature_stat_block_cache_key(creature, 7, 1, "card", "v"))
+        self.assertNotEqual(key, creature_stat_block_cache_key(CharacterCreature(pk=5, owner_id=3), 7, 1, "screen", "v"))
+        self.assertEqual(
+            creature_stat_block_cache_key(Creature(pk=5), 0, 1, "screen", "v"),
+            creature_stat_block_cache_key(Creature(pk=5), 9, 1, "screen", "v"),
+        )
+
+    def test_template_changes_bump_the_catalog_version(self):
+        versions = creature_catalog_versions()
+        bump_creature_catalog_version()
+        self.assertNotEqual(versions, creature_catalog_versions())
+
+    def test_stat_block_resolves_attribute_values_and_initiative(self):
+        block = compile_creature_stat_block(_engine(kp=6, initiative=-1))
+
+        self.assertEqual(
+            block["attributes"],
+            {"ST": {"value": 7, "modifier": "+2"}, "INT": {"value": "-", "modifier": "-"}},
+        )
+        self.assertEqual((block["kp"], block["initiative_display"], block["total_armor"]), (6, "-1", 3))
+        self.assertEqual(block["incapacitating_wound_stages"], ["Koma"])
+
+
+class CreatureTemplateVersionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        cls.wolf = Creature.objects.create(name="Wolf", slug="wolf")
+        cls.bear = Creature.objects.create(name="Bär", slug="baer")
+        cls.strength = Attribute.objects.create(name="Stärke", short_name="ST")
+
+    def _template_versions(self):
+        return [cache_version(creature_template_version_key(creature.pk)) for creature in (self.wolf, self.bear)]
+
+    def test_template_rows_bump_only_their_creature_after_commit(self):
+        versions = creature_catalog_versions()
+        wolf, bear = self._template_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            CreatureAttribute.objects.create(creature=self.wolf, attribute=self.strength)
+            self.assertEqual(self._template_versions(), [wolf, bear])
+
+        self.assertNotEqual(self._template_versions()[0], wolf)
+        self.assertEqual(self._template_versions()[1], bear)
+        self.assertEqual(creature_catalog_versions(), versions)
+
+    def test_shared_definitions_bump_the_catalog_version(self):
+        versions = creature_catalog_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            CreatureType.objects.create(name="Tier", slug="tier")
+
+        self.assertNotEqual(creature_catalog_versions(), versions)
@@ -0,0 +1,104 @@
+"""Tests for the SL-screen change log and its translation into card refreshes."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from charsheet.game_groups import create_group
+from charsheet.group_views import (
+    GROUP_SCREEN_CHANGE_BATCH_SIZE,
+    GROUP_SCREEN_CHANGE_RETENTION_SECONDS,
+    _screen_change_payload,
+)
+from charsheet.models import GameGroupScreenChange
+
+
+class ScreenChangePayloadTests(SimpleTestCase):
+    group = SimpleNamespace(pk=1)
+
+    def test_creature_changes_refresh_single_cards(self):
+        payload = _screen_change_payload(
+            self.group,
+            4,
+            [
+                (5, GameGroupScreenChange.Kind.CREATURE, 9),
+                (6, GameGroupScreenChange.Kind.CREATURE, 9),
+                (7, GameGroupScreenChange.Kind.CREATURE, 3),
+            ],
+        )
+
+        self.assertEqual(payload, {"cursor": 7, "cards": ["creature:3", "creature:9"], "reload": False})
+
+    def test_roster_and_inventory_changes_request_reload(self):
+        for kind in (GameGroupScreenChange.Kind.ROSTER, GameGroupScreenChange.Kind.INVENTORY):
+            payload = _screen_change_payload(self.group, 0, [(1, GameGroupScreenChange.Kind.CREATURE, 2), (2, kind, None)])
+
+            self.assertTrue(payload["reload"])
+            self.assertEqual(payload["cards"], [])
+
+    def test_full_batch_requests_reload(self):
+        changes = [(index, GameGroupScreenChange.Kind.CREATURE, 1) for index in range(1, GROUP_SCREEN_CHANGE_BATCH_SIZE + 1)]
+
+        self.assertTrue(_screen_change_payload(self.group, 0, changes)["reload"])
+
+    def test_timeout_keeps_cursor(self):
+        self.assertEqual(_screen_change_payload(self.group, 12, []), {"cursor": 12, "cards": [], "reload": False})
+
+
+class ScreenChangeLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username="spielleitung")
+        cls.group = create_group(creator=cls.user, name="Runde")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_entries_are_written_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            GameGroupScreenChange.record([self.group.pk], GameGroupScreenChange.Kind.ROSTER)
+            self.assertFalse(self.group.screen_changes.exists())
+
+        self.assertEqual(self.group.screen_changes.count(), 1)
+
+    @override_settings(GROUP_SCREEN_LONG_POLL_SECONDS=0)
+    def test_poll_prunes_expired_entries(self):
+        expired = GameGroupScreenChange.objects.create(group=self.group, kind=GameGroupScreenChange.Kind.ROSTER)
+        GameGroupScreenChange.objects.filter(pk=expired.pk).update(
+            created_at=timezone.now() - timedelta(seconds=GROUP_SCREEN_CHANGE_RETENTION_SECONDS + 1)
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("group_screen_changes", args=[self.group.pk]), {"after": expired.pk})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.group.screen_changes.exists())
+        self.assertTrue(response.json()["reload"])
+
+    @override_settings(GROUP_SCREEN_LONG_POLL_SECONDS=0)
+    def test_polls_prune_at_most_once_per_interval(self):
+        self.client.force_login(self.user)
+        url = reverse("group_screen_changes", args=[self.group.pk])
+        self.client.get(url)
+        expired = GameGroupScreenChange.objects.create(group=self.group, kind=GameGroupScreenChange.Kind.ROSTER)
+        GameGroupScreenChange.objects.filter(pk=expired.pk).update(
+            created_at=timezone.now() - timedelta(seconds=GROUP_SCREEN_CHANGE_RETENTION_SECONDS + 1)
+        )
+
+        self.client.get(url, {"after": expired.pk})
+
+        self.assertTrue(self.group.screen_changes.exists())
+
+    @override_settings(GROUP_SCREEN_LONG_POLL_SECONDS=0)
+    def test_retained_cursor_does_not_reload(self):
+        change = GameGroupScreenChange.objects.create(group=self.group, kind=GameGroupScreenChange.Kind.CREATURE, object_id=3)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("group_screen_changes", args=[self.group.pk]), {"after": change.pk})
+
+        self.assertEqual(response.json(), {"cursor": change.pk, "cards": [], "reload": False})
@@ -0,0 +1,57 @@
+"""Tests for the stored span and width layout of SL-screen data tables."""
+
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from charsheet.group_table_layout import compute_table_layout, layout_matches
+
+
+def _table(spans, *, widths=(None, None, None)):
+    columns = [SimpleNamespace(id=10 + index, width=width) for index, width in enumerate(widths)]
+    rows = [SimpleNamespace(id=20 + index) for index in range(len(spans))]
+    cells_by_row = {
+        row.id: [
+            SimpleNamespace(id=row.id * 100 + column.id, column_id=column.id, row_span=row_span, column_span=column_span)
+            for column, (row_span, column_span) in zip(columns, row_spans)
+        ]
+        for row, row_spans in zip(rows, spans)
+    }
+    return columns, rows, cells_by_row
+
+
+class GroupTableLayoutTests(SimpleTestCase):
+    def test_spans_are_clipped_and_cover_later_cells(self):
+        columns, rows, cells_by_row = _table(
+            [
+                [(2, 2), (1, 1), (5, 9)],
+                [(1, 1), (1, 3), (1, 1)],
+            ]
+        )
+
+        cells = compute_table_layout(3, columns, rows, cells_by_row)["cells"]
+
+        self.assertEqual(cells["2010"], [0, 0, 2, 2])
+        self.assertEqual(cells["2011"], [0, 1, 0, 0])
+        self.assertEqual(cells["2012"], [0, 2, 2, 1])
+        self.assertEqual(cells["2110"], [1, 0, 0, 0])
+        self.assertEqual(cells["2111"], [1, 1, 0, 0])
+
+    def test_widths_fall_back_to_defaults(self):
+        columns, rows, cells_by_row = _table([[(1, 1)] * 3], widths=(None, 90, 400))
+
+        layout = compute_table_layout(1, columns, rows, cells_by_row)
+
+        self.assertEqual(layout["columns"], [[10, 140, 180], [11, 90, 180], [12, 400, 400]])
+        self.assertEqual((layout["preview_width"], layout["editor_width"]), (630, 852))
+
+    def test_layout_is_stale_after_revision_or_structure_changes(self):
+        columns, rows, cells_by_row = _table([[(1, 1)] * 3])
+        layout = compute_table_layout(4, columns, rows, cells_by_row)
+
+        self.assertTrue(layout_matches(layout, 4, columns, rows, cells_by_row))
+        self.assertFalse(layout_matches(layout, 5, columns, rows, cells_by_row))
+        self.assertFalse(layout_matches(layout, 4, columns[:2], rows, cells_by_row))
+        self.assertFalse(layout_matches({}, 4, columns, rows, cells_by_row))
+        cells_by_row[rows[0].id].append(SimpleNamespace(id=999))
+        self.assertFalse(layout_matches(layout, 4, columns, rows, cells_by_row))
@@ -0,0 +1,147 @@
+"""Tests for the group table patch endpoint, its payload checks, and the markdown import."""
+
+import json
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from charsheet.game_groups import GroupError, create_group
+from charsheet.group_views import _set_table_cell_value, _table_patch_entries, _table_patch_id
+from charsheet.models import GameGroupTable, GameGroupTableCell, GameGroupTableColumn, GameGroupTableRow
+
+
+class GroupTablePatchTests(SimpleTestCase):
+    def test_cell_values_switch_between_numbers_and_text(self):
+        cell = GameGroupTableCell()
+
+        _set_table_cell_value(cell, "+2,5 EP")
+        self.assertEqual(
+            (cell.value_type, cell.number_value, cell.number_show_plus, cell.number_suffix, cell.text_value),
+            (GameGroupTableCell.ValueType.NUMBER, Decimal("2.5"), True, "EP", ""),
+        )
+
+        _set_table_cell_value(cell, "1 Zusatzaktion")
+        self.assertEqual(
+            (cell.value_type, cell.number_value, cell.number_suffix, cell.text_value),
+            (GameGroupTableCell.ValueType.TEXT, None, "", "1 Zusatzaktion"),
+        )
+
+    def test_patch_lists_must_hold_objects(self):
+        self.assertEqual(_table_patch_entries({}, "cells"), [])
+        self.assertEqual(_table_patch_entries({"cells": [{"row": 1}]}, "cells"), [{"row": 1}])
+        for payload in ({"cells": {"row": 1}}, {"cells": [1, 2]}):
+            with self.assertRaises(GroupError):
+                _table_patch_entries(payload, "cells")
+
+    def test_patch_ids_ignore_garbage(self):
+        self.assertEqual(_table_patch_id("7"), 7)
+        self.assertIsNone(_table_patch_id(None))
+        self.assertIsNone(_table_patch_id("sieben"))
+
+
+class GroupTableEndpointTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(username="spielleitung")
+        cls.group = create_group(creator=cls.user, name="Runde")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.table = GameGroupTable.objects.create(group=self.group, creator=self.user, title="Initiative")
+        self.columns = GameGroupTableColumn.objects.bulk_create(
+            GameGroupTableColumn(table=self.table, heading=f"Spalte {position + 1}", position=position)
+            for position in range(2)
+        )
+        self.rows = GameGroupTableRow.objects.bulk_create(
+            GameGroupTableRow(table=self.table, position=position) for position in range(3)
+        )
+        GameGroupTableCell.objects.bulk_create(
+            GameGroupTableCell(row=row, column=column, text_value=f"{row.position}/{column.position}")
+            for row in self.rows[:2]
+            for column in self.columns
+        )
+
+    def _patch(self, payload):
+        return self.client.post(
+            reverse("patch_group_table", args=[self.group.pk, self.table.pk]),
+            data=json.dumps({"revision": self.table.revision, **payload}),
+            content_type="application/json",
+        )
+
+    def _import(self, markdown):
+        return self.client.post(
+            reverse("update_group_table", args=[self.group.pk, self.table.pk]),
+            {"title": "Initiative", "_table_action": "import_markdown", "markdown_table": markdown},
+        )
+
+    def _grid(self):
+        return [
+            [
+                cell.text_value
+                for cell in GameGroupTableCell.objects.filter(row=row).order_by("column__position")
+            ]
+            for row in self.table.rows.order_by("position")
+        ]
+
+    def test_patch_updates_and_creates_cells_and_bumps_the_revision(self):
+        revision = self.table.revision
+        response = self._patch(
+            {
+                "columns": [{"id": self.columns[0].pk, "heading": "Name"}],
+                "cells": [
+                    {"row": self.rows[0].pk, "column": self.columns[1].pk, "value": "+2 EP"},
+                    {"row": self.rows[2].pk, "column": self.columns[0].pk, "value": "Ork"},
+                ],
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"ok": True, "revision": revision + 1})
+        updated = GameGroupTableCell.objects.get(row=self.rows[0], column=self.columns[1])
+        self.assertEqual(
+            (updated.value_type, updated.number_value, updated.number_suffix),
+            (GameGroupTableCell.ValueType.NUMBER, Decimal("2"), "EP"),
+        )
+        self.assertEqual(GameGroupTableCell.objects.get(row=self.rows[2], column=self.columns[0]).text_value, "Ork")
+        self.assertEqual(GameGroupTableColumn.objects.get(pk=self.columns[0].pk).heading, "Name")
+
+    def test_stale_revision_is_rejected_without_writing(self):
+        self.table.revision += 1
+        response = self._patch({"cells": [{"row": self.rows[0].pk, "column": self.columns[0].pk, "value": "neu"}]})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["revision"], self.table.revision - 1)
+        self.assertEqual(GameGroupTableCell.objects.get(row=self.rows[0], column=self.columns[0]).text_value, "0/0")
+
+    def test_row_moves_renumber_positions(self):
+        response = self._patch({"row_moves": [{"row": self.rows[2].pk, "position": 0}]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(self.table.rows.order_by("position").values_list("pk", flat=True)),
+            [self.rows[2].pk, self.rows[0].pk, self.rows[1].pk],
+        )
+
+    def test_shrinking_markdown_import_reuses_rows(self):
+        revision = self.table.revision
+
+        self._import("| Name |\n| --- |\n| Alrik |")
+
+        self.table.refresh_from_db()
+        self.assertEqual(self.table.revision, revision + 1)
+        self.assertEqual(list(self.table.columns.values_list("pk", "heading")), [(self.columns[0].pk, "Name")])
+        self.assertEqual(list(self.table.rows.values_list("pk", "position")), [(self.rows[0].pk, 0)])
+        self.assertEqual(self._grid(), [["Alrik"]])
+
+    def test_growing_markdown_import_adds_rows_columns_and_cells(self):
+        self._import("| Name | INI | LeP |\n| --- | --- | --- |\n| Alrik | 12 | 30 |\n| Bosper | 9 | |\n| Ork | 7 | 25 |\n| Wolf | 14 | 18 |")
+
+        self.assertEqual(list(self.table.columns.order_by("position").values_list("heading", flat=True)), ["Name", "INI", "LeP"])
+        self.assertEqual(list(self.table.rows.order_by("position").values_list("position", flat=True)), [0, 1, 2, 3])
+        self.assertEqual(
+            self._grid(),
+            [["Alrik", "12", "30"], ["Bosper", "9", ""], ["Ork", "7", "25"], ["Wolf", "14", "18"]],
+        )
+        self.assertEqual(self.table.rows.order_by("position").first().pk, self.rows[0].pk)
@@ -0,0 +1,37 @@
+"""Tests for item permission checks on prefetched grants."""
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from charsheet.item_transfers import has_item_permission
+from charsheet.models import Character, CharacterItem, ItemPermissionGrant
+
+
+class PrefetchedItemPermissionTests(SimpleTestCase):
+    def _item(self, *grants):
+        item = CharacterItem(owner_id=2, original_owner_character_id=1, ownership_version=3)
+        item._prefetched_objects_cache = {"permission_grants": list(grants)}
+        return item
+
+    def test_prefetched_grants_answer_without_queries(self):
+        holder = Character(pk=2)
+        item = self._item(
+            ItemPermissionGrant(permission="destroy", grantee_id=2, ownership_version=3),
+            ItemPermissionGrant(permission="consume_final", grantee_id=None),
+        )
+
+        # SimpleTestCase rejects database access, so any fallback query would fail here.
+        self.assertTrue(has_item_permission(item, "destroy", holder))
+        self.assertTrue(has_item_permission(item, "consume_final", holder))
+        self.assertFalse(has_item_permission(item, "sell", holder))
+
+    def test_stale_or_inactive_grants_do_not_count(self):
+        holder = Character(pk=2)
+        item = self._item(
+            ItemPermissionGrant(permission="destroy", grantee_id=2, ownership_version=2),
+            ItemPermissionGrant(permission="sell", grantee_id=2, ownership_version=3, revoked_at=timezone.now()),
+        )
+
+        self.assertFalse(has_item_permission(item, "destroy", holder))
+        self.assertFalse(has_item_permission(item, "sell", holder))
+        self.assertTrue(has_item_permission(item, "sell", Character(pk=1)))
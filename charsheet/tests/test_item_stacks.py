@@ -0,0 +1,100 @@
+"""Tests for the stack signature maintenance of owned items."""
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.item_stacks import (
+    _RELATED_ITEM_ATTNAMES,
+    STACK_HISTORY_ACCESSORS,
+    _stack_relations,
+    compute_stack_signature,
+    refresh_stack_signature,
+)
+from charsheet.item_transfers import _merge_compatible_stack
+from charsheet.models import (
+    Character,
+    CharacterItem,
+    CharacterItemSemanticEffect,
+    Item,
+    ItemPermissionGrant,
+    ItemRune,
+    Quality,
+    Race,
+    Rune,
+)
+
+
+class StackSignatureRelationTests(SimpleTestCase):
+    def test_history_relations_never_clear_or_enter_the_signature(self):
+        accessors = {relation.get_accessor_name() for relation in _stack_relations()}
+
+        self.assertFalse(accessors & STACK_HISTORY_ACCESSORS)
+        self.assertNotIn("charsheet.ItemTransfer", _RELATED_ITEM_ATTNAMES)
+        self.assertNotIn("charsheet.ItemOwnershipEvent", _RELATED_ITEM_ATTNAMES)
+
+    def test_instance_state_rows_clear_the_owning_item(self):
+        self.assertEqual(_RELATED_ITEM_ATTNAMES["charsheet.ItemRune"], "item_id")
+        self.assertEqual(_RELATED_ITEM_ATTNAMES["charsheet.CharacterItemSemanticEffect"], "character_item_id")
+        self.assertEqual(_RELATED_ITEM_ATTNAMES["charsheet.ItemPermissionGrant"], "item_id")
+
+
+class StackSignatureMergeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        cls.character = Character.objects.create(
+            owner=get_user_model().objects.create(username="spieler"),
+            name="Alrik",
+            race=Race.objects.create(name="Mensch"),
+        )
+        cls.arrows = Item.objects.create(name="Pfeile", item_type=Item.ItemType.MISC, stackable=True)
+        cls.rune = Rune.objects.create(name="Feuer", slug="feuer")
+
+    def _stack(self, amount=2):
+        return CharacterItem.objects.create(
+            owner=self.character,
+            original_owner_character=self.character,
+            item=self.arrows,
+            amount=amount,
+        )
+
+    def _stored_signature(self, item):
+        return CharacterItem.objects.values_list("stack_signature", flat=True).get(pk=item.pk)
+
+    def test_merge_finds_its_target_by_the_stored_signature(self):
+        target, returned = self._stack(), self._stack(3)
+        refresh_stack_signature(target)
+        CharacterItem.objects.filter(pk=target.pk).update(stack_signature="veraltet")
+
+        self.assertEqual(_merge_compatible_stack(returned), returned)
+
+        CharacterItem.objects.filter(pk=target.pk).update(stack_signature=self._stored_signature(returned))
+        merged = _merge_compatible_stack(returned)
+        self.assertEqual((merged.pk, merged.amount), (target.pk, 5))
+        self.assertFalse(CharacterItem.objects.filter(pk=returned.pk).exists())
+
+    def test_empty_signatures_are_recomputed_before_matching(self):
+        target, returned = self._stack(), self._stack(3)
+        self.assertEqual(self._stored_signature(target), "")
+
+        merged = _merge_compatible_stack(returned)
+
+        self.assertEqual((merged.pk, merged.amount), (target.pk, 5))
+        self.assertEqual(self._stored_signature(target), compute_stack_signature(merged))
+
+    def test_rune_effect_and_permission_changes_clear_the_signature(self):
+        item = self._stack()
+        for change in (
+            lambda: ItemRune.objects.create(item=item, rune=self.rune),
+            lambda: CharacterItemSemanticEffect.objects.create(character_item=item, target_key="feuer"),
+            lambda: ItemPermissionGrant.objects.create(
+                item=item,
+                permission=ItemPermissionGrant.Permission.SELL,
+                granted_by=self.character,
+            ),
+        ):
+            with self.subTest(change=change):
+                refresh_stack_signature(item)
+                self.assertNotEqual(self._stored_signature(item), "")
+                change()
+                self.assertEqual(self._stored_signature(item), "")
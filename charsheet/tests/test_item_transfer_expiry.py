@@ -0,0 +1,60 @@
+"""Tests for the request-side item transfer expiry."""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from charsheet import item_transfers
+from charsheet.item_transfers import create_transfer, expire_due_transfers_if_due
+from charsheet.models import Character, CharacterItem, Item, ItemTransfer, Quality, Race
+
+
+class InlineTransferExpiryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create(username="owner")
+        race = Race.objects.create(name="Mensch")
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        dagger = Item.objects.create(name="Dolch", item_type=Item.ItemType.MISC, stackable=False)
+        cls.alrik, cls.bosper, cls.cella, cls.dajin = (
+            Character.objects.create(owner=user, name=name, race=race)
+            for name in ("Alrik", "Bosper", "Cella", "Dajin")
+        )
+        cls.transfers = [
+            create_transfer(
+                item_id=CharacterItem.objects.create(owner=sender, item=dagger).pk,
+                sender=sender,
+                recipient=recipient,
+                quantity=1,
+            )
+            for sender, recipient in ((cls.alrik, cls.bosper), (cls.cella, cls.dajin))
+        ]
+        ItemTransfer.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+
+    def setUp(self):
+        item_transfers._next_expiry_by_character.clear()
+        self.addCleanup(item_transfers._next_expiry_by_character.clear)
+
+    def test_requests_only_expire_their_own_characters_transfers(self):
+        self.assertEqual(expire_due_transfers_if_due([self.bosper.pk]), 1)
+
+        statuses = dict(ItemTransfer.objects.values_list("pk", "status"))
+        self.assertEqual(statuses[self.transfers[0].pk], ItemTransfer.Status.EXPIRED)
+        self.assertEqual(statuses[self.transfers[1].pk], ItemTransfer.Status.PENDING)
+
+    def test_other_characters_overdue_transfers_do_not_keep_the_gate_open(self):
+        expire_due_transfers_if_due([self.bosper.pk])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(expire_due_transfers_if_due([self.bosper.pk]), 0)
+        self.assertEqual(expire_due_transfers_if_due([self.dajin.pk]), 1)
+
+    def test_new_transfers_pull_the_next_due_time_forward(self):
+        expire_due_transfers_if_due([self.bosper.pk])
+        ItemTransfer.objects.filter(pk=self.transfers[0].pk).update(status=ItemTransfer.Status.PENDING)
+        transfer = ItemTransfer.objects.get(pk=self.transfers[0].pk)
+        transfer.save(update_fields=["status"])
+
+        self.assertEqual(expire_due_transfers_if_due([self.bosper.pk]), 1)
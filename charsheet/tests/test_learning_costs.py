@@ -0,0 +1,55 @@
+"""Tests for pricing learning plans against a compiled cost table."""
+
+from django.test import SimpleTestCase
+
+from charsheet.learning_costs import _cost_entry, entry_cost, validate_learning_plan
+from charsheet.learning_rules import calc_language_total_cost, calc_skill_total_cost
+
+
+def _table():
+    return {
+        "budget": 12,
+        "language_literacy_min_level": 3,
+        "entries": {
+            "skill:klettern": _cost_entry(2, 0, 12, calc_skill_total_cost),
+            "lang:elfisch": _cost_entry(
+                1, 0, 4, lambda level: calc_language_total_cost(level, False, False), write=False
+            ),
+            "school:3": _cost_entry(0, 0, 2, lambda level: level * 8),
+            "magic-spell:7": {"spell": 7, "slot_cost": 1, "slot_source": "school:3"},
+            "magic-spell:8": {"spell": 8, "slot_cost": 1, "slot_source": "school:3"},
+        },
+        "slot_sources": {"school:3": 1},
+        "unlocks": {"school:3": [{"technique": 5, "name": "Funke", "level": 1, "choice": False}]},
+    }
+
+
+class LearningCostTableTests(SimpleTestCase):
+    def test_entry_costs_are_deltas_from_the_base_level(self):
+        entry = _cost_entry(2, 0, 12, calc_skill_total_cost)
+        self.assertEqual(entry_cost(entry, 2), 0)
+        self.assertEqual(entry_cost(entry, 0), -2)
+        self.assertEqual(entry_cost(entry, 7), calc_skill_total_cost(7) - calc_skill_total_cost(2))
+        self.assertIsNone(entry_cost(entry, 13))
+        self.assertIsNone(entry_cost(entry, -1))
+
+    def test_plan_sums_costs_and_reports_unlocked_techniques(self):
+        result = validate_learning_plan(_table(), {"skill:klettern": 1, "school:3": 1})
+        self.assertEqual(result["errors"], [])
+        self.assertEqual((result["cost"], result["remaining"]), (9, 3))
+        self.assertEqual([row["technique"] for row in result["unlocks"]], [5])
+
+    def test_plan_rejects_invalid_targets_budget_and_slots(self):
+        result = validate_learning_plan(
+            _table(),
+            {
+                "lang:elfisch": {"add": 0, "write": True},
+                "school:3": 2,
+                "magic-spell:7": 1,
+                "magic-spell:8": 1,
+                "trait:unbekannt": 1,
+            },
+        )
+        self.assertEqual(result["cost"], 17)
+        self.assertEqual(len(result["errors"]), 4)
+        self.assertIn("Nicht genug aktuelle EP fuer diese Lernkosten.", result["errors"])
@@ -0,0 +1,87 @@
+"""Tests that learning submissions leave the character's cached engine consistent."""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from charsheet.constants import VAMPIRE_ANCHOR_TRAIT_SLUG
+from charsheet.engine.character_engine import CharacterEngine
+from charsheet.engine.magic_engine import MagicEngine
+from charsheet.learning import process_learning_submission
+from charsheet.models import (
+    Attribute,
+    Character,
+    CharacterAttribute,
+    CharacterTrait,
+    Race,
+    RaceAttributeLimit,
+    Trait,
+    VampirePower,
+    VampireTraitSemanticEffect,
+)
+
+
+class LearningSubmissionEngineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        race = Race.objects.create(name="Mensch")
+        strength = Attribute.objects.create(name="Stärke", short_name="ST")
+        RaceAttributeLimit.objects.create(race=race, attribute=strength, min_value=0, max_value=5)
+        cls.character = Character.objects.create(
+            owner=get_user_model().objects.create(username="spieler"),
+            name="Vana",
+            race=race,
+            current_experience=200,
+            overall_experience=200,
+        )
+        CharacterAttribute.objects.update_or_create(
+            character=cls.character,
+            attribute=strength,
+            defaults={"base_value": 1},
+        )
+        CharacterTrait.objects.create(
+            owner=cls.character,
+            trait=Trait.objects.create(
+                name="Vampir",
+                slug=VAMPIRE_ANCHOR_TRAIT_SLUG,
+                trait_type=Trait.TraitType.ADV,
+                description="",
+            ),
+        )
+        cls.power = VampirePower.objects.create(name="Bluthunger", slug="bluthunger", weakness="Durst")
+        VampireTraitSemanticEffect.objects.create(
+            power=cls.power,
+            target_domain="attribute",
+            target_key="ST",
+            operator="flat_add",
+            value="1",
+        )
+
+    def test_mixed_submission_matches_a_fresh_engine(self):
+        character = Character.objects.get(pk=self.character.pk)
+        normalize = MagicEngine.normalize_current_arcane_power
+        seen = {}
+
+        # Arcane power normalization receives the submission's engine right after
+        # its caches were invalidated; later vampire lookups rebuild the engine.
+        def compare_engines(magic_engine, *args, engine=None, **kwargs):
+            fresh = CharacterEngine(Character.objects.get(pk=character.pk))
+            seen["cached"] = [repr(modifier) for modifier in engine.modifier_engine.collect_active_modifiers()]
+            seen["fresh"] = [repr(modifier) for modifier in fresh.modifier_engine.collect_active_modifiers()]
+            seen["attributes"] = (engine.attributes(), fresh.attributes())
+            return normalize(magic_engine, *args, engine=engine, **kwargs)
+
+        with mock.patch.object(MagicEngine, "normalize_current_arcane_power", compare_engines):
+            level, message = process_learning_submission(
+                character,
+                {
+                    "learn_attr_add_ST": "1",
+                    "learn_vampire_age_add": "1",
+                    f"learn_vampire_power_{self.power.pk}": "1",
+                },
+            )
+
+        self.assertEqual(level, "success", message)
+        self.assertEqual(seen["cached"], seen["fresh"])
+        self.assertEqual(*seen["attributes"])
@@ -0,0 +1,50 @@
+"""Tests for the rendered-markdown cache behind the card filters."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from charsheet.markdown_cache import (
+    clear_markdown_cache,
+    markdown_cache_stats,
+    render_markdown_cached,
+    reset_markdown_cache_stats,
+)
+from charsheet.templatetags.card_markdown import card_fluff, standard_markdown
+
+
+class MarkdownCacheTests(SimpleTestCase):
+    def setUp(self):
+        clear_markdown_cache()
+        reset_markdown_cache_stats()
+
+    def test_renders_each_text_once_and_counts_hits(self):
+        calls = []
+
+        def renderer(value):
+            calls.append(value)
+            return f"<p>{value}</p>"
+
+        for _ in range(3):
+            self.assertEqual(render_markdown_cached("test", "Feuer", renderer), "<p>Feuer</p>")
+        render_markdown_cached("other", "Feuer", renderer)
+
+        stats = markdown_cache_stats()
+        self.assertEqual(calls, ["Feuer", "Feuer"])
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_filters_return_identical_html_from_the_cache(self):
+        first = standard_markdown("1) **Eis**")
+        self.assertEqual(standard_markdown("1) **Eis**"), first)
+        self.assertIn("1)", first)
+        self.assertEqual(card_fluff("Schwur\n---\nNachsatz"), card_fluff("Schwur\n---\nNachsatz"))
+        self.assertEqual(markdown_cache_stats()["hits"], 2)
+
+
+class MarkdownCacheStatsCommandTests(SimpleTestCase):
+    def test_process_local_cache_is_refused(self):
+        with self.assertRaises(CommandError):
+            call_command("markdown_cache_stats", stdout=StringIO())
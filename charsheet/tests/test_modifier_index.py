@@ -0,0 +1,102 @@
+"""Tests for the target index used by numeric modifier resolution."""
+
+from django.test import SimpleTestCase
+
+from charsheet.constants import MELEE_MANEUVERS, WEAPON_MANEUVER_DAMAGE
+from charsheet.management.commands.benchmark_modifier_resolution import (
+    benchmark_targets,
+    linear_numeric_total,
+    synthetic_modifiers,
+)
+from charsheet.modifiers.definitions import BaseModifier, ModifierOperator, TargetDomain
+from charsheet.modifiers.engine import ModifierEngine
+
+
+class ModifierIndexTests(SimpleTestCase):
+    def test_indexed_totals_match_linear_scan(self):
+        engine = ModifierEngine(modifiers=synthetic_modifiers(schools=4, items=10))
+
+        for target_domain, target_key, context in benchmark_targets(engine):
+            self.assertEqual(
+                engine.resolve_numeric_total(target_domain, target_key, context=context),
+                linear_numeric_total(engine, target_domain, target_key, context),
+                f"{target_domain}:{target_key}",
+            )
+
+    def test_buckets_keep_priority_order(self):
+        engine = ModifierEngine(
+            modifiers=[
+                BaseModifier("trait", "b", TargetDomain.DERIVED_STAT, "gw", value=3, priority=5),
+                BaseModifier("trait", "a", TargetDomain.DERIVED_STAT, "gw", value=10, operator=ModifierOperator.OVERRIDE),
+            ]
+        )
+
+        self.assertEqual(engine.resolve_numeric_total(TargetDomain.DERIVED_STAT, "gw"), 13)
+
+    def test_alias_and_skill_slug_candidates(self):
+        engine = ModifierEngine(
+            modifiers=[
+                BaseModifier("technique", "1", TargetDomain.COMBAT, WEAPON_MANEUVER_DAMAGE, value=1),
+                BaseModifier(
+                    "school",
+                    "2",
+                    TargetDomain.SKILL,
+                    "athletik",
+                    value=2,
+                    metadata={"target_skill_slugs": ["klettern"]},
+                ),
+            ]
+        )
+        index = engine.modifier_index
+
+        self.assertEqual(len(index.candidates(TargetDomain.COMBAT, MELEE_MANEUVERS)), 1)
+        self.assertEqual(engine.resolve_numeric_total(TargetDomain.COMBAT, MELEE_MANEUVERS), 0)
+        self.assertEqual(
+            engine.resolve_numeric_total(TargetDomain.COMBAT, MELEE_MANEUVERS, context={"weapon_types": ["sword"]}),
+            1,
+        )
+        self.assertEqual(engine.resolve_numeric_total(TargetDomain.SKILL, "klettern"), 2)
+
+    def test_invalidate_cache_drops_index(self):
+        engine = ModifierEngine(modifiers=[])
+        index = engine.modifier_index
+
+        engine.invalidate_cache("_active_modifiers_cache")
+
+        self.assertIsNot(engine.modifier_index, index)
+
+
+class ContextModifierMemoTests(SimpleTestCase):
+    def setUp(self):
+        self.engine = ModifierEngine(
+            modifiers=[
+                BaseModifier(
+                    "technique",
+                    "1",
+                    TargetDomain.COMBAT,
+                    MELEE_MANEUVERS,
+                    value=1,
+                    metadata={"target_weapon_type": "sword"},
+                ),
+            ]
+        )
+
+    def test_equal_contexts_share_one_filtered_list(self):
+        first = self.engine.collect_active_modifiers(context={"weapon_types": ("sword",), "character_item_id": 3})
+        second = self.engine.collect_active_modifiers(context={"character_item_id": 3, "weapon_types": ["sword"]})
+
+        self.assertIs(first, second)
+        self.assertEqual(len(first), 1)
+        self.assertEqual(self.engine.context_cache_stats(), {"hits": 1, "misses": 1, "entries": 1})
+
+    def test_unhashable_context_is_not_memoized(self):
+        self.engine.collect_active_modifiers(context={"weapon_types": ["sword"], "extra": [{}, bytearray()]})
+
+        self.assertEqual(self.engine.context_cache_stats()["entries"], 0)
+
+    def test_invalidate_cache_clears_memo(self):
+        self.engine.collect_active_modifiers(context={"weapon_types": ["axe"]})
+
+        self.engine.invalidate_cache("_active_modifiers_cache")
+
+        self.assertEqual(self.engine.context_cache_stats()["entries"], 0)
@@ -0,0 +1,49 @@
+"""Tests for the opt-in sheet profiling sections."""
+
+from django.test import SimpleTestCase
+
+from charsheet.profiling import SheetProfile, _active_profile, profile_section, profiled_cached_property
+
+
+class _Engine:
+    fills = 0
+
+    @profiled_cached_property
+    def totals(self):
+        self.fills += 1
+        return 3
+
+
+class SheetProfileTests(SimpleTestCase):
+    def test_sections_are_noops_without_an_active_profile(self):
+        with profile_section("sheet.skills"):
+            pass
+
+        self.assertEqual(_Engine().totals, 3)
+        self.assertIsNone(_active_profile.get())
+
+    def test_records_calls_queries_and_cached_property_fills_once(self):
+        profile = SheetProfile()
+        token = _active_profile.set(profile)
+        try:
+            engine = _Engine()
+            with profile_section("sheet.skills"):
+                profile.count_query(lambda *args: None, "SELECT 1", (), False, {})
+                engine.totals
+                engine.totals
+            with profile_section("sheet.skills"):
+                pass
+        finally:
+            _active_profile.reset(token)
+
+        sections = {row["section"]: row for row in profile.rows()}
+        self.assertEqual(sections["sheet.skills"]["calls"], 2)
+        self.assertEqual(sections["sheet.skills"]["queries"], 1)
+        self.assertEqual(sections["_Engine.totals"]["calls"], 1)
+        self.assertEqual(engine.fills, 1)
+
+    def test_server_timing_uses_token_safe_metric_names(self):
+        profile = SheetProfile()
+        profile.record("render.skills panel", 1.23456, 2)
+
+        self.assertEqual(profile.server_timing(), 'render.skills-panel;dur=1.235;desc="1x 2q"')
@@ -0,0 +1,86 @@
+"""Tests for the process-wide rules catalog and its version token."""
+
+from types import MappingProxyType, SimpleNamespace
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.modifiers.definitions import BaseModifier, TargetDomain
+from charsheet.modifiers.engine import compile_trait_entry_modifiers
+from charsheet.rules_catalog import RulesCatalog, bump_rules_catalog_version, rules_catalog_version
+
+
+def _catalog(**overrides) -> RulesCatalog:
+    empty = MappingProxyType({})
+    values = {
+        "version": 1,
+        "skills_by_slug": empty,
+        "schools": (),
+        "weapon_master_school": None,
+        "qualities": (),
+        "school_techniques": (),
+        "race_techniques_by_race_id": empty,
+        "race_modifiers_by_race_id": empty,
+        "school_modifiers_by_school_id": empty,
+        "trait_modifiers_by_trait_id": empty,
+        "technique_modifiers_by_technique_id": empty,
+        "rune_modifiers_by_rune_id": empty,
+        "daemonic_power_modifiers_by_power_id": empty,
+    }
+    values.update(overrides)
+    return RulesCatalog(**values)
+
+
+def _modifier(source_id: str) -> BaseModifier:
+    return BaseModifier(source_type="technique", source_id=source_id, target_domain=TargetDomain.SKILL, target_key="x")
+
+
+class RulesCatalogLookupTests(SimpleTestCase):
+    def test_school_techniques_keep_catalog_order(self):
+        techniques = tuple(SimpleNamespace(id=index, school_id=school_id) for index, school_id in enumerate((2, 1, 2, 3)))
+        catalog = _catalog(school_techniques=techniques)
+
+        self.assertEqual([technique.id for technique in catalog.techniques_for_schools({2: None, 3: None})], [0, 2, 3])
+        self.assertEqual(catalog.techniques_for_schools([]), [])
+
+    def test_modifiers_are_concatenated_by_source_id(self):
+        modifiers = MappingProxyType({1: (_modifier("1a"), _modifier("1b")), 4: (_modifier("4"),)})
+
+        result = _catalog().modifiers_for(modifiers, [4, 2, 1, 4])
+
+        self.assertEqual([modifier.source_id for modifier in result], ["1a", "1b", "4"])
+
+    def test_trait_modifiers_prefer_persisted_effects(self):
+        catalog = _catalog(trait_modifiers_by_trait_id=MappingProxyType({5: (_modifier("persisted"),)}))
+        entries = [
+            SimpleNamespace(trait_id=5, trait=SimpleNamespace(slug="blind"), trait_level=1),
+            SimpleNamespace(trait_id=6, trait=SimpleNamespace(slug="blind"), trait_level=1),
+        ]
+
+        modifiers = compile_trait_entry_modifiers(entries, catalog)
+
+        self.assertEqual(modifiers[0].source_id, "persisted")
+        self.assertTrue(all(modifier.source_id == "blind" for modifier in modifiers[1:]))
+        self.assertGreater(len(modifiers), 1)
+
+
+class RulesCatalogVersionTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_version_is_stable_until_bumped(self):
+        version = rules_catalog_version()
+
+        self.assertEqual(rules_catalog_version(), version)
+        bump_rules_catalog_version()
+        self.assertNotEqual(rules_catalog_version(), version)
+
+
+class RulesCatalogVersionCommitTests(TestCase):
+    def test_bump_waits_for_commit(self):
+        version = rules_catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_rules_catalog_version()
+            self.assertEqual(rules_catalog_version(), version)
+
+        self.assertNotEqual(rules_catalog_version(), version)
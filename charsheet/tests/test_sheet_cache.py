@@ -0,0 +1,124 @@
+"""Tests for the versioned character-sheet context cache."""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.creature_stat_blocks import bump_creature_catalog_version
+from charsheet.magic_catalog import bump_magic_catalog_version
+from charsheet.models import Character, Race
+from charsheet.sheet_cache import (
+    _count,
+    get_sheet_tooltip,
+    reset_sheet_context_cache_stats,
+    sheet_context_cache_key,
+    sheet_context_cache_stats,
+    sheet_etag,
+)
+from charsheet.shop_catalog import bump_shop_catalog_version
+
+
+class SheetContextCacheKeyTests(SimpleTestCase):
+    def test_key_changes_with_revision_and_mode(self):
+        edit_key = sheet_context_cache_key(7, 3, read_only=False)
+
+        self.assertNotEqual(edit_key, sheet_context_cache_key(7, 4, read_only=False))
+        self.assertNotEqual(edit_key, sheet_context_cache_key(7, 3, read_only=True))
+
+    def test_key_changes_with_catalog_versions(self):
+        self.assertNotEqual(
+            sheet_context_cache_key(7, 3, read_only=False, catalog_versions="1-1-1-1"),
+            sheet_context_cache_key(7, 3, read_only=False, catalog_versions="1-2-1-1"),
+        )
+
+    def test_zero_adjustments_share_the_plain_key(self):
+        self.assertEqual(
+            sheet_context_cache_key(7, 3, read_only=False, runtime_attribute_adjustments={"ST": 0}),
+            sheet_context_cache_key(7, 3, read_only=False),
+        )
+
+    def test_adjustment_order_does_not_change_the_key(self):
+        self.assertEqual(
+            sheet_context_cache_key(7, 3, read_only=False, runtime_attribute_adjustments={"ST": 1, "GE": -2}),
+            sheet_context_cache_key(7, 3, read_only=False, runtime_attribute_adjustments={"GE": -2, "ST": 1}),
+        )
+
+
+class SheetEtagTests(SimpleTestCase):
+    def test_etag_is_quoted_and_follows_revision_and_variant(self):
+        etag = sheet_etag(7, 3, read_only=False, variant=("diary",))
+
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertEqual(etag, sheet_etag(7, 3, read_only=False, variant=("diary",)))
+        self.assertNotEqual(etag, sheet_etag(7, 4, read_only=False, variant=("diary",)))
+        self.assertNotEqual(etag, sheet_etag(7, 3, read_only=False, variant=("sheet",)))
+
+    def test_runtime_adjustments_change_the_etag(self):
+        self.assertNotEqual(
+            sheet_etag(7, 3, read_only=False),
+            sheet_etag(7, 3, read_only=False, runtime_attribute_adjustments={"ST": 1}),
+        )
+
+    def test_missing_revision_has_no_etag(self):
+        self.assertIsNone(sheet_etag(7, None, read_only=False))
+
+
+class SheetCatalogEtagTests(TestCase):
+    def test_catalog_bumps_change_the_etag(self):
+        for bump in (bump_shop_catalog_version, bump_magic_catalog_version, bump_creature_catalog_version):
+            with self.subTest(bump=bump.__name__):
+                etag = sheet_etag(7, 3, read_only=False)
+                with self.captureOnCommitCallbacks(execute=True):
+                    bump()
+                self.assertNotEqual(etag, sheet_etag(7, 3, read_only=False))
+
+
+class SheetTooltipCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        owner = get_user_model().objects.create_user(username="tooltip", password="pw")
+        self.character = Character.objects.create(owner=owner, name="Alrik", race=Race.objects.create(name="Mensch"))
+
+    def _tooltip(self, revision):
+        return get_sheet_tooltip(Character.objects.get(pk=self.character.pk), "skill:1", revision=revision)
+
+    def test_same_revision_reuses_the_built_tooltip(self):
+        with mock.patch("charsheet.sheet_cache.build_sheet_tooltip", return_value="Klettern") as build:
+            self.assertEqual(self._tooltip(self.character.sheet_revision), "Klettern")
+            self.assertEqual(self._tooltip(self.character.sheet_revision), "Klettern")
+
+        self.assertEqual(build.call_count, 1)
+
+    def test_revision_change_rebuilds_the_tooltip(self):
+        with mock.patch("charsheet.sheet_cache.build_sheet_tooltip", return_value="Klettern") as build:
+            self._tooltip(self.character.sheet_revision)
+            Character.objects.filter(pk=self.character.pk).update(sheet_revision=self.character.sheet_revision + 1)
+            self._tooltip(self.character.sheet_revision + 1)
+
+        self.assertEqual(build.call_count, 2)
+
+
+class SheetContextCacheStatsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_hit_rate_is_derived_from_counters(self):
+        _count("hits")
+        _count("hits")
+        _count("hits")
+        _count("misses")
+
+        stats = sheet_context_cache_stats()
+
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.75)
+
+    def test_reset_clears_counters(self):
+        _count("misses")
+        reset_sheet_context_cache_stats()
+
+        self.assertEqual(sheet_context_cache_stats()["misses"], 0)
+        self.assertEqual(sheet_context_cache_stats()["hit_rate"], 0.0)
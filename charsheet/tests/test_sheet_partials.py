@@ -0,0 +1,39 @@
+"""Tests for the partial-refresh context dependency map."""
+
+from django.test import SimpleTestCase
+
+from charsheet.sheet_context import (
+    SHEET_PARTIAL_CONTEXT_SECTIONS,
+    SHEET_PARTIAL_SECTION_BUILDERS,
+    build_sheet_tooltip,
+    sheet_partial_sections,
+)
+from charsheet.views import SHEET_PARTIAL_TEMPLATES
+
+
+class SheetPartialSectionTests(SimpleTestCase):
+    def test_every_declared_section_has_a_builder(self):
+        for key, sections in SHEET_PARTIAL_CONTEXT_SECTIONS.items():
+            self.assertIn(key, SHEET_PARTIAL_TEMPLATES)
+            for section in sections:
+                self.assertIn(section, SHEET_PARTIAL_SECTION_BUILDERS)
+
+    def test_sections_are_deduplicated_in_build_order(self):
+        self.assertEqual(
+            sheet_partial_sections(("wallet_panel", "damage_panel", "skills_panel")),
+            ("combat", "wallet"),
+        )
+
+    def test_money_refresh_skips_combat_and_learning(self):
+        self.assertEqual(sheet_partial_sections(("wallet_panel",)), ("wallet",))
+        self.assertEqual(sheet_partial_sections(("experience_panel",)), ())
+
+    def test_unmapped_partial_needs_the_full_sheet(self):
+        self.assertIsNone(sheet_partial_sections(("wallet_panel", "secondary_page")))
+
+
+class SheetTooltipKeyTests(SimpleTestCase):
+    def test_malformed_or_unknown_keys_are_rejected_before_any_query(self):
+        for key in ("", "skill", "skill:", "skill:abc", "weapon:3", "item:1:2"):
+            with self.subTest(key=key), self.assertRaises(LookupError):
+                build_sheet_tooltip(None, key)
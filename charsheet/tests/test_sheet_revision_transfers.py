@@ -0,0 +1,79 @@
+"""Tests that item transfers and item rights invalidate the sheets they appear on."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from charsheet.game_groups import create_group
+from charsheet.item_transfers import accept_transfer, create_gm_edit_transfer, create_transfer, set_item_permission
+from charsheet.models import Character, CharacterItem, GameGroupMembership, Item, ItemPermissionGrant, Quality, Race
+
+
+def _revisions(*characters):
+    return list(
+        Character.objects.filter(pk__in=[character.pk for character in characters])
+        .order_by("pk")
+        .values_list("sheet_revision", flat=True)
+    )
+
+
+class TransferSheetRevisionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create(username="owner")
+        other_user = get_user_model().objects.create(username="recipient")
+        race = Race.objects.create(name="Mensch")
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        cls.owner = Character.objects.create(owner=user, name="Alrik", race=race)
+        cls.recipient = Character.objects.create(owner=other_user, name="Bosper", race=race)
+        cls.item = CharacterItem.objects.create(
+            owner=cls.owner,
+            original_owner_character=cls.owner,
+            item=Item.objects.create(name="Dolch", item_type=Item.ItemType.MISC, stackable=False),
+        )
+        cls.group = create_group(creator=user, name="Runde")
+        GameGroupMembership.objects.update_or_create(
+            group=cls.group,
+            character=cls.owner,
+            defaults={"status": GameGroupMembership.Status.ACTIVE},
+        )
+
+    def test_gm_edit_handoff_bumps_the_holder(self):
+        before = _revisions(self.owner)
+        create_gm_edit_transfer(item_id=self.item.pk, sender=self.owner, group=self.group)
+        self.assertGreater(_revisions(self.owner), before)
+
+    def test_permission_changes_bump_holder_and_original_owner(self):
+        self.item.owner = self.recipient
+        self.item.save(update_fields=["owner"])
+        before = _revisions(self.owner, self.recipient)
+        set_item_permission(
+            item_id=self.item.pk,
+            original_owner=self.owner,
+            permission=ItemPermissionGrant.Permission.SELL,
+            enabled=True,
+        )
+        granted = _revisions(self.owner, self.recipient)
+        self.assertTrue(all(after > prior for after, prior in zip(granted, before)))
+        set_item_permission(
+            item_id=self.item.pk,
+            original_owner=self.owner,
+            permission=ItemPermissionGrant.Permission.SELL,
+            enabled=False,
+        )
+        self.assertTrue(all(after > prior for after, prior in zip(_revisions(self.owner, self.recipient), granted)))
+
+    def test_original_ownership_transfer_bumps_both_original_owners(self):
+        offered = _revisions(self.recipient)
+        transfer = create_transfer(
+            item_id=self.item.pk,
+            sender=self.owner,
+            recipient=self.recipient,
+            quantity=1,
+            transfer_original_ownership=True,
+        )
+        self.assertGreater(_revisions(self.recipient), offered)
+        before = _revisions(self.owner, self.recipient)
+        accept_transfer(transfer_id=transfer.pk, recipient=self.recipient)
+        self.assertTrue(all(after > prior for after, prior in zip(_revisions(self.owner, self.recipient), before)))
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.original_owner_character_id, self.recipient.pk)
@@ -0,0 +1,33 @@
+"""Tests for the versioned shop catalog cache."""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from charsheet.models import Item, Quality
+from charsheet.shop_catalog import bump_shop_catalog_version, shop_catalog_cache_key, shop_catalog_version
+
+
+class ShopCatalogCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_key_separates_global_and_group_scopes(self):
+        self.assertNotEqual(shop_catalog_cache_key(1, "global"), shop_catalog_cache_key(1, "group:3"))
+
+    def test_bump_moves_to_a_new_key(self):
+        key = shop_catalog_cache_key(shop_catalog_version(), "global")
+
+        bump_shop_catalog_version()
+
+        self.assertNotEqual(shop_catalog_cache_key(shop_catalog_version(), "global"), key)
+
+
+class ShopCatalogVersionCommitTests(TestCase):
+    def test_item_save_bumps_after_commit(self):
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        version = shop_catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(name="Seil", item_type=Item.ItemType.MISC)
+            self.assertEqual(shop_catalog_version(), version)
+
+        self.assertNotEqual(shop_catalog_version(), version)
@@ -0,0 +1,56 @@
+"""Tests for the maintained per-character weight ledger."""
+
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps as global_apps
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from charsheet.models import Character, CharacterItem, CharacterWeightLedger, Item, Quality, Race
+from charsheet.weight_ledger import weight_ledger_for
+
+
+class WeightLedgerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Quality.objects.create(code="common", name="Gewöhnlich")
+        cls.user = get_user_model().objects.create(username="spieler")
+        cls.race = Race.objects.create(name="Mensch")
+        cls.rope = Item.objects.create(name="Seil", item_type=Item.ItemType.MISC, weight=Decimal("1.500"))
+
+    def test_new_characters_start_with_a_ledger(self):
+        character = Character.objects.create(owner=self.user, name="Alrik", race=self.race)
+
+        ledger = CharacterWeightLedger.objects.get(character=character)
+        self.assertEqual(ledger.active_weight, 0)
+
+    def test_item_writes_refresh_the_ledger(self):
+        character = Character.objects.create(owner=self.user, name="Alrik", race=self.race)
+        item = CharacterItem.objects.create(owner=character, item=self.rope, amount=2)
+
+        self.assertEqual(weight_ledger_for(character.pk).carried_weight, Decimal("3.000"))
+        item.stored = True
+        item.save(update_fields=["stored"])
+        ledger = weight_ledger_for(character.pk)
+        self.assertEqual((ledger.carried_weight, ledger.stored_weight), (Decimal("0.000"), Decimal("3.000")))
+
+    def test_reads_without_a_ledger_do_not_write(self):
+        character = Character.objects.create(owner=self.user, name="Alrik", race=self.race)
+        CharacterItem.objects.create(owner=character, item=self.rope)
+        CharacterWeightLedger.objects.filter(character=character).delete()
+
+        ledger = weight_ledger_for(character.pk)
+
+        self.assertEqual(ledger.carried_weight, Decimal("1.500"))
+        self.assertFalse(CharacterWeightLedger.objects.filter(character=character).exists())
+
+    def test_migration_backfills_missing_ledgers(self):
+        character = Character.objects.create(owner=self.user, name="Alrik", race=self.race)
+        CharacterItem.objects.create(owner=character, item=self.rope, amount=2)
+        CharacterWeightLedger.objects.filter(character=character).delete()
+        migration = import_module("charsheet.migrations.0371_backfill_character_weight_ledgers")
+
+        migration.backfill_weight_ledgers(global_apps, None)
+
+        self.assertEqual(CharacterWeightLedger.objects.get(character=character).carried_weight, Decimal("3.000"))
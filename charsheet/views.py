@@ -2,6 +2,7 @@ from __future__ import annotations
 import base64
 import binascii
 import json
+import logging
 import random
 from urllib.parse import urlencode
 from uuid import uuid4
@@ -9,7 +10,7 @@ from datetime import date as date_cls
 from django.core.files.base import ContentFile
 from django.conf import settings
 from django.http import JsonResponse
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib import messages
@@ -18,18 +19,31 @@ from django.contrib.auth import update_session_auth_hash
 from django.contrib.sessions.models import Session
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import LogoutView
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.deletion import ProtectedError
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
-from .engine import CharacterCreationEngine
+from .account_export import (
+    ACCOUNT_EXPORT_FORMATS,
+    ACCOUNT_IMPORT_MAX_BYTES,
+    AccountImportError,
+    import_account_rows,
+    iter_account_json,
+    iter_account_ndjson,
+    parse_account_export,
+)
+from .creature_stat_blocks import get_creature_card_context
+from .engine import CharacterCreationEngine, load_character_engines
 from .engine.creature_engine import CreatureEngine, sync_character_creatures
 from .engine.dice_engine import DiceEngine
 from .engine.item_engine import ItemEngine
 from .learning_progression import weapon_mastery_weapon_type_definitions
+from .magic_sync import mark_magic_dirty
+from .profiling import profile_section
 from .models import (
     Character,
     CharacterDiaryEntry,
@@ -112,14 +126,23 @@ from .constants import (
 )
 from .models.creatures import CREATURE_CARD_QUALITY_TRAINING_BUDGETS
 from .learning import process_learning_submission
+from .learning_costs import get_learning_cost_table
 from .lesson_rules import LessonRuleError, activate_lesson, format_lesson_costs, format_lesson_requirements
+from .sheet_cache import (
+    current_sheet_revision,
+    get_cached_sheet_context,
+    get_sheet_tooltip,
+    sheet_etag,
+    store_sheet_context,
+)
 from .sheet_context import (
     _divine_entity_card_kind_label,
     build_character_sheet_context,
     build_creature_card_training_context,
     build_inventory_partial_context,
-    build_item_semantic_effect_partial_context,
+    build_sheet_partial_context,
     build_temporary_attribute_context,
+    sheet_partial_sections,
 )
 from .shop import (
     apply_character_item_modifications,
@@ -128,6 +151,7 @@ from .shop import (
     trade_shop_cart as trade_shop_cart_payload,
 )
 from .shop import create_custom_shop_item
+from .shop_catalog import get_shop_item_groups, shop_catalog_etag
 from .view_utils import format_modifier, format_thousands
 from .item_transfers import (
     TransferError,
@@ -136,7 +160,7 @@ from .item_transfers import (
     create_transfer as create_item_transfer_service,
     decline_transfer as decline_item_transfer,
     enforce_original_ownership,
-    expire_due_transfers,
+    expire_due_transfers_if_due,
     has_item_permission,
     item_is_pending,
     record_item_destruction,
@@ -146,6 +170,8 @@ from .item_transfers import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 DIARY_ENTRY_CHAR_LIMIT = 2200
 SHEET_PARTIAL_TEMPLATES = {
     "attribute_panel": ("sheetAttributePanel", "charsheet/partials/_attribute_panel.html"),
@@ -183,6 +209,13 @@ SHEET_MAIN_PARTIAL_KEYS = (
     "secondary_page",
     "card_hand",
 )
+SHEET_DAMAGE_PARTIAL_KEYS = (
+    "skills_panel",
+    "core_stats_panel",
+    "damage_panel",
+    "weapon_panel",
+    "battle_calculator",
+)
 SHEET_INVENTORY_PARTIAL_KEYS = SHEET_MAIN_PARTIAL_KEYS
 SHEET_LEARNING_PARTIAL_KEYS = SHEET_MAIN_PARTIAL_KEYS + (
     "learning_budget",
@@ -390,7 +423,12 @@ def _equipment_action_partials_response(
     partial_keys: tuple[str, ...],
 ) -> JsonResponse:
     """Render targeted equipment-action partials with the lightweight sheet context."""
-    context = _build_item_semantic_effect_partial_context_for_request(request, character, partial_keys)
+    context = _build_sheet_partial_context_for_request(
+        request,
+        character,
+        partial_keys,
+        mutations=("equipment",),
+    )
     return JsonResponse(
         {
             "ok": True,
@@ -497,49 +535,43 @@ def logout_other_sessions(request):
 
 @login_required
 def export_account_data(request):
-    payload = {
-        "exported_at": timezone.now().isoformat(),
-        "user": {
-            "username": request.user.get_username(),
-            "email": request.user.email or "",
-        },
-        "characters": [],
-    }
-    characters = Character.objects.filter(owner=request.user).select_related("race").order_by("name", "id")
-    for character in characters:
-        payload["characters"].append(
-            {
-                "id": character.id,
-                "name": character.name,
-                "race": character.race.name if character.race_id else "",
-                "gender": character.gender,
-                "is_archived": character.is_archived,
-                "money": character.money,
-                "overall_experience": character.overall_experience,
-                "current_experience": character.current_experience,
-                "current_damage": character.current_damage,
-                "created_at": character.created_at.isoformat() if getattr(character, "created_at", None) else None,
-                "items": list(
-                    CharacterItem.objects.filter(owner=character)
-                    .select_related("item", "quality")
-                    .order_by("item__name", "id")
-                    .values("item__name", "amount", "equipped", "quality__name", "notes")
-                ),
-                "diary_entries": list(
-                    CharacterDiaryEntry.objects.filter(character=character)
-                    .order_by("created_at", "id")
-                    .values("title", "content", "created_at", "updated_at")
-                ),
-            }
-        )
-    response = HttpResponse(
-        json.dumps(payload, ensure_ascii=False, indent=2, default=str),
-        content_type="application/json; charset=utf-8",
-    )
-    response["Content-Disposition"] = 'attachment; filename="codex-arcana-account-export.json"'
+    """Stream the full character graph of the account as JSON or NDJSON."""
+    export_format = request.GET.get("format", "json")
+    if export_format not in ACCOUNT_EXPORT_FORMATS:
+        return HttpResponseBadRequest("Unbekanntes Exportformat.")
+    if export_format == "ndjson":
+        chunks, content_type = iter_account_ndjson(request.user), "application/x-ndjson; charset=utf-8"
+    else:
+        chunks, content_type = iter_account_json(request.user), "application/json; charset=utf-8"
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="codex-arcana-account-export.{export_format}"'
     return response
 
 
+@login_required
+@require_POST
+def import_account_data(request):
+    """Create the characters of an uploaded account export for the current user."""
+    upload = request.FILES.get("account_file")
+    if upload is None:
+        messages.error(request, "Bitte eine Exportdatei auswählen.")
+        return redirect("dashboard")
+    if upload.size > ACCOUNT_IMPORT_MAX_BYTES:
+        messages.error(request, "Die Datei ist zu groß.")
+        return redirect("dashboard")
+    try:
+        counts = import_account_rows(request.user, parse_account_export(upload.read()))
+    except AccountImportError as exc:
+        messages.error(request, str(exc))
+        return redirect("dashboard")
+    imported = counts["characters"]
+    summary = f"{imported} Charakter{'' if imported == 1 else 'e'} importiert."
+    if counts["skipped"]:
+        summary += f" {counts['skipped']} Einträge ohne passende Regeldaten wurden übersprungen."
+    messages.success(request, summary)
+    return redirect("dashboard")
+
+
 @require_POST
 def roll_dice_view(request):
     try:
@@ -822,27 +854,51 @@ def _build_sheet_context_for_request(
     character: Character,
     *,
     close_learn_window_once: bool = False,
-    skip_magic_sync: bool = False,
     read_only: bool = False,
+    engine_mutations: tuple[str, ...] | None = None,
 ) -> dict[str, object]:
     """Build the full sheet context including request-specific dice settings."""
     if not read_only:
-        expire_due_transfers()
-    skip_magic_sync = skip_magic_sync or request.session.pop("skip_magic_sync_once", False)
+        expire_due_transfers_if_due([character.pk])
+    # Magic is synchronized by the mutations themselves (see magic_sync), so loads stay read-only.
     magic_engine = character.get_magic_engine(refresh=True)
-    if not skip_magic_sync and not read_only:
-        magic_engine.sync_character_magic()
-    magic_engine.normalize_current_arcane_power(persist=not read_only)
+    magic_engine.normalize_current_arcane_power(persist=not read_only and request.method != "GET")
     runtime_attribute_adjustments = _temporary_attribute_adjustments(request, character.pk)
-    character.get_engine(
-        refresh=True,
-        runtime_attribute_adjustments=runtime_attribute_adjustments,
-    )
-    context = build_character_sheet_context(
+    # Known mutation kinds drop only their dependent engine caches; anything else rebuilds.
+    if engine_mutations is None:
+        character.get_engine(
+            refresh=True,
+            runtime_attribute_adjustments=runtime_attribute_adjustments,
+        )
+    else:
+        character.invalidate_engine(*engine_mutations)
+        character.get_engine(runtime_attribute_adjustments=runtime_attribute_adjustments)
+    sheet_revision = current_sheet_revision(character.pk)
+    context = get_cached_sheet_context(
         character,
-        close_learn_window_once=close_learn_window_once,
+        revision=sheet_revision,
         read_only=read_only,
+        close_learn_window_once=close_learn_window_once,
+        runtime_attribute_adjustments=runtime_attribute_adjustments,
     )
+    if context is None:
+        context = build_character_sheet_context(
+            character,
+            close_learn_window_once=close_learn_window_once,
+            read_only=read_only,
+        )
+        store_sheet_context(
+            character,
+            context,
+            revision=sheet_revision,
+            read_only=read_only,
+            runtime_attribute_adjustments=runtime_attribute_adjustments,
+        )
+        logger.debug(
+            "Sheet build for character %s: modifier context memo %s",
+            character.pk,
+            character.get_engine().modifier_engine.context_cache_stats(),
+        )
     if read_only:
         user_settings = UserSettings.objects.filter(user=request.user).first() or UserSettings(user=request.user)
     else:
@@ -861,6 +917,7 @@ def _build_sheet_context_for_request(
         if read_only
         else reverse("update_temporary_attribute", args=[character.pk])
     )
+    context["sheet_tooltip_url"] = "" if read_only else reverse("character_sheet_tooltip", args=[character.pk])
     context["open_item_transfer_count"] = (
         0
         if read_only
@@ -872,6 +929,66 @@ def _build_sheet_context_for_request(
     return context
 
 
+def _sheet_etag_for_request(
+    request,
+    character: Character,
+    revision: int | None,
+    *,
+    read_only: bool = False,
+    variant: tuple = (),
+) -> str | None:
+    """Return the sheet validator for this viewer, or None when the response carries one-shot state."""
+    if request.method != "GET" or len(messages.get_messages(request)):
+        return None
+    if not read_only:
+        expire_due_transfers_if_due([character.pk])
+    user_settings = UserSettings.objects.filter(user=request.user).first()
+    settings_state = (
+        ()
+        if user_settings is None
+        else tuple(getattr(user_settings, field.attname) for field in user_settings._meta.concrete_fields)
+    )
+    open_item_transfer_count = (
+        0
+        if read_only
+        else ItemTransfer.objects.filter(recipient=character, status=ItemTransfer.Status.PENDING).count()
+    )
+    return sheet_etag(
+        character.pk,
+        revision,
+        read_only=read_only,
+        runtime_attribute_adjustments=_temporary_attribute_adjustments(request, character.pk),
+        variant=(
+            request.user.pk,
+            # Rendered forms embed the CSRF token, so a rotated secret must not revalidate.
+            request.META.get("CSRF_COOKIE", ""),
+            open_item_transfer_count,
+            settings_state,
+            *variant,
+        ),
+    )
+
+
+def _not_modified_response(request, etag: str | None):
+    """Return a 304 response when the client already holds this validator."""
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _tag_sheet_response(response, character: Character, revision: int | None, etag: str | None):
+    """Attach the validator unless the render itself moved the character's revision."""
+    if etag is not None and current_sheet_revision(character.pk) == revision:
+        response["ETag"] = etag
+    # Private and always revalidated: several open tabs re-check instead of trusting a stale copy.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 def _temporary_attribute_response(
     request,
     character: Character,
@@ -936,7 +1053,7 @@ def _temporary_attribute_response(
 
 def _sheet_partials_response(request, character: Character, *partial_keys: str) -> JsonResponse:
     """Render one or more server-truth sheet partials for targeted DOM replacement."""
-    context = _build_sheet_context_for_request(request, character)
+    context = _build_sheet_partial_context_for_request(request, character, partial_keys)
     partials = _render_sheet_partials(request, context, partial_keys)
     return JsonResponse(
         {
@@ -964,20 +1081,29 @@ def _inventory_panel_response(request, character: Character) -> JsonResponse:
     )
 
 
-def _build_item_semantic_effect_partial_context_for_request(
+def _build_sheet_partial_context_for_request(
     request,
     character: Character,
     partial_keys,
+    *,
+    mutations: tuple[str, ...] = (),
 ) -> dict[str, object]:
-    """Build a narrow request-aware context for item semantic-effect refreshes."""
+    """Build a request-aware context holding only the sections the partials read."""
+    if sheet_partial_sections(partial_keys) is None:
+        # Header, secondary page, and card hand embed most panels; reuse the cached full build.
+        return _build_sheet_context_for_request(request, character)
+    expire_due_transfers_if_due([character.pk])
+    if mutations:
+        # The caller names what it wrote; keep the rest of the character's engine cache.
+        character.invalidate_engine(*mutations)
     magic_engine = character.get_magic_engine(refresh=True)
     magic_engine.normalize_current_arcane_power(persist=True)
     runtime_attribute_adjustments = _temporary_attribute_adjustments(request, character.pk)
     character.get_engine(
-        refresh=True,
+        refresh=not mutations,
         runtime_attribute_adjustments=runtime_attribute_adjustments,
     )
-    context = build_item_semantic_effect_partial_context(character, partial_keys)
+    context = build_sheet_partial_context(character, partial_keys)
     context["request"] = request
     context["temporary_attribute_adjustments"] = runtime_attribute_adjustments
     context["temporary_attribute_update_url"] = reverse("update_temporary_attribute", args=[character.pk])
@@ -1016,12 +1142,9 @@ def _render_sheet_partials(request, context: dict[str, object], partial_keys) ->
     partials: list[dict[str, str]] = []
     for key in partial_keys:
         target_id, template_name = SHEET_PARTIAL_TEMPLATES[key]
-        partials.append(
-            {
-                "target": target_id,
-                "html": render_to_string(template_name, context, request=request),
-            }
-        )
+        with profile_section(f"render.{key}"):
+            html = render_to_string(template_name, context, request=request)
+        partials.append({"target": target_id, "html": html})
     return partials
 
 
@@ -1366,13 +1489,21 @@ def character_sheet(request, character_id: int):
     character = _owned_character_or_404(request, character_id)
     character.last_opened_at = timezone.now()
     character.save(update_fields=["last_opened_at"])
+    close_learn_window_once = bool(request.session.pop("close_learn_window_once", False))
+    revision = current_sheet_revision(character.pk)
+    etag = None if close_learn_window_once else _sheet_etag_for_request(request, character, revision)
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
     context = _build_sheet_context_for_request(
         request,
         character,
-        close_learn_window_once=bool(request.session.pop("close_learn_window_once", False)),
+        close_learn_window_once=close_learn_window_once,
     )
 
-    return render(request, "charsheet/charsheet.html", context)
+    with profile_section("render.charsheet"):
+        response = render(request, "charsheet/charsheet.html", context)
+    return _tag_sheet_response(response, character, revision, etag)
 
 
 @login_required
@@ -1383,13 +1514,59 @@ def update_temporary_attribute(request, character_id: int):
     return _temporary_attribute_response(request, character)
 
 
+def _sheet_tooltip_response(request, character: Character, *, read_only: bool = False, variant: tuple = ()):
+    """Answer one lazily loaded sheet tooltip, revalidated like the sheet itself."""
+    tooltip_key = str(request.GET.get("key") or "").strip()
+    revision = current_sheet_revision(character.pk)
+    etag = _sheet_etag_for_request(
+        request,
+        character,
+        revision,
+        read_only=read_only,
+        variant=(*variant, "tooltip", tooltip_key),
+    )
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    try:
+        tooltip = get_sheet_tooltip(
+            character,
+            tooltip_key,
+            revision=revision,
+            read_only=read_only,
+            runtime_attribute_adjustments=_temporary_attribute_adjustments(request, character.pk),
+        )
+    except LookupError:
+        return JsonResponse({"ok": False, "error": "unknown_tooltip"}, status=404)
+    return _tag_sheet_response(
+        JsonResponse({"ok": True, "key": tooltip_key, "tooltip": tooltip}),
+        character,
+        revision,
+        etag,
+    )
+
+
+@login_required
+@require_GET
+def character_sheet_tooltip(request, character_id: int):
+    """Return one sheet tooltip body for an owned character on first hover."""
+    character = _owned_character_or_404(request, character_id)
+    return _sheet_tooltip_response(request, character)
+
+
 @login_required
 def character_diary_entries_api(request, character_id: int):
     """Return normalized diary-roll entries for one owned character as JSON."""
     if request.method != "GET":
         return JsonResponse({"ok": False, "error": "method_not_allowed"}, status=405)
     character = _owned_character_or_404(request, character_id)
-    return JsonResponse(_diary_payload(character))
+    revision = current_sheet_revision(character.pk)
+    # Diary rows bump the sheet revision, so the revision alone validates this payload.
+    etag = sheet_etag(character.pk, revision, read_only=False, variant=("diary",))
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return _tag_sheet_response(JsonResponse(_diary_payload(character)), character, revision, etag)
 
 
 @login_required
@@ -1823,7 +2000,7 @@ def update_druid_cult(request, character_id: int):
         if current_binding is not None and int(current_binding.cult.school_id or 0) == school_id:
             _reset_druid_cult_slot_progress(character, [current_binding.cult_id])
             current_binding.delete()
-            character.get_magic_engine(refresh=True).sync_character_magic()
+            mark_magic_dirty(character.id)
             messages.success(request, "Druidenzirkel entfernt.")
         else:
             messages.info(request, "Keine Aenderung erkannt.")
@@ -1852,7 +2029,7 @@ def update_druid_cult(request, character_id: int):
             }
         )
     CharacterDruidCult.objects.update_or_create(character=character, defaults=defaults)
-    character.get_magic_engine(refresh=True).sync_character_magic()
+    mark_magic_dirty(character.id)
     messages.success(request, "Druidenzirkel gespeichert.")
     return redirect("character_sheet", character_id=character.id)
 
@@ -1915,7 +2092,7 @@ def update_daemonic_patron(request, character_id: int):
     if (character.religion or "") != entity.name:
         character.religion = entity.name
         character.save(update_fields=["religion"])
-    character.get_magic_engine(refresh=True).sync_character_magic()
+    mark_magic_dirty(character.id)
     messages.success(request, "Dämonenfürst gespeichert.")
     return redirect("character_sheet", character_id=character.id)
 
@@ -1929,7 +2106,7 @@ def sheet(request):
 @login_required
 def dashboard(request):
     """Render the user-specific dashboard with owned character overview."""
-    expire_due_transfers()
+    expire_due_transfers_if_due(Character.objects.filter(owner=request.user).values_list("pk", flat=True))
     UserSettings.objects.get_or_create(user=request.user)
     characters_qs = Character.objects.filter(
         owner=request.user,
@@ -1945,6 +2122,7 @@ def dashboard(request):
         total_money=Sum("money"),
         total_current_experience=Sum("current_experience"),
     )
+    load_character_engines(characters)
     character_rows = [
         {
             "character": character,
@@ -3214,7 +3392,7 @@ def update_item_permission(request, pk):
 
 @login_required
 def item_transfer_center(request):
-    expire_due_transfers()
+    expire_due_transfers_if_due(Character.objects.filter(owner=request.user).values_list("pk", flat=True))
     selected_character = None
     character_id = request.GET.get("character")
     if character_id not in (None, ""):
@@ -3405,7 +3583,7 @@ def toggle_character_item_semantic_effects(request, pk):
 
     if _is_partial_request(request):
         partial_keys = _item_semantic_effect_toggle_partial_keys(effects)
-        context = _build_item_semantic_effect_partial_context_for_request(request, ci.owner, partial_keys)
+        context = _build_sheet_partial_context_for_request(request, ci.owner, partial_keys)
         payload = {
             "ok": True,
             "partials": _render_sheet_partials(request, context, partial_keys),
@@ -3458,7 +3636,7 @@ def character_item_semantic_effect_partials(request, pk):
         return JsonResponse({"ok": False, "error": "effect_not_toggleable"}, status=404)
 
     partial_keys = _item_semantic_effect_toggle_partial_keys(effects)
-    context = _build_item_semantic_effect_partial_context_for_request(request, ci.owner, partial_keys)
+    context = _build_sheet_partial_context_for_request(request, ci.owner, partial_keys)
     return JsonResponse(
         {
             "ok": True,
@@ -3649,15 +3827,28 @@ def adjust_current_damage(request, character_id: int):
             VampireRules(character).evaluate_life_state()
 
     if _is_partial_request(request):
-        engine = character.get_engine(refresh=True)
+        character.invalidate_engine("damage", "vampire")
+        engine = character.engine
         current_stage, _raw_penalty = engine.current_wound_stage()
         is_penalty_ignored = engine.is_wound_penalty_ignored()
         can_act_while_out_of_action = engine.can_act_while_out_of_action()
         effective_penalty = engine.current_wound_penalty()
         partials = []
         if request.POST.get("partials") != "0":
-            context = _build_sheet_context_for_request(request, character)
-            partials = _render_sheet_partials(request, context, SHEET_MAIN_PARTIAL_KEYS)
+            from .engine.vampire_engine import VampireRules
+
+            if VampireRules(character).is_vampire():
+                # Blood reserves and the vampire tab live inside the secondary page.
+                partial_keys = SHEET_MAIN_PARTIAL_KEYS
+                context = _build_sheet_context_for_request(
+                    request,
+                    character,
+                    engine_mutations=("damage", "vampire"),
+                )
+            else:
+                partial_keys = SHEET_DAMAGE_PARTIAL_KEYS
+                context = _build_sheet_partial_context_for_request(request, character, partial_keys)
+            partials = _render_sheet_partials(request, context, partial_keys)
         return JsonResponse(
             {
                 "ok": True,
@@ -3958,7 +4149,7 @@ def _commands_with_met_prerequisites(command_ids: set[int]) -> list[CreatureComm
 
 
 def _render_creature_training_payload(request, card: CharacterCreature) -> dict:
-    card_context = CreatureEngine(card).card_context()
+    card_context = get_creature_card_context(card)
     inventory_item_name = ""
     if card.source_character_item_id:
         source_item = CharacterItem.objects.select_related("item").get(pk=card.source_character_item_id)
@@ -5151,6 +5342,20 @@ def adjust_experience(request, character_id: int):
     return redirect("character_sheet", character_id=character_id)
 
 
+@login_required
+@require_GET
+def learning_cost_table(request, character_id: int):
+    """Return the compiled learning cost table that the learning window prices its cart with."""
+    character = _owned_character_or_404(request, character_id)
+    revision = current_sheet_revision(character.pk)
+    etag = _sheet_etag_for_request(request, character, revision, variant=("learning-costs",))
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    table = get_learning_cost_table(character, revision=revision)
+    return _tag_sheet_response(JsonResponse({"ok": True, "table": table}), character, revision, etag)
+
+
 @login_required
 @require_POST
 def apply_learning(request, character_id: int):
@@ -5159,7 +5364,7 @@ def apply_learning(request, character_id: int):
 
     level, message = process_learning_submission(character, request.POST)
     if _is_partial_request(request):
-        context = _build_sheet_context_for_request(request, character, skip_magic_sync=True)
+        context = _build_sheet_context_for_request(request, character)
         partials = _render_sheet_partials(request, context, SHEET_LEARNING_PARTIAL_KEYS)
         return JsonResponse(
             {
@@ -5176,7 +5381,6 @@ def apply_learning(request, character_id: int):
                 "partials": partials,
             }
         )
-    request.session["skip_magic_sync_once"] = True
     if level == "error":
         messages.error(request, message)
     elif level == "info":
@@ -5228,6 +5432,26 @@ def update_character_item_runes(request, pk: int):
     return redirect("character_sheet", character_id=character_item.owner_id)
 
 
+@login_required
+@require_GET
+def shop_catalog(request, character_id: int):
+    """Render the buy panel rows from the cached shop catalog for lazy loading."""
+    _owned_character_or_404(request, character_id)
+    etag = shop_catalog_etag()
+    not_modified = _not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    html = render_to_string(
+        "charsheet/partials/_shop_buy_groups.html",
+        {"shop_item_groups": get_shop_item_groups()},
+        request=request,
+    )
+    response = JsonResponse({"ok": True, "html": html})
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 @login_required
 @require_POST
 def buy_shop_cart(request, character_id: int):
@@ -5412,7 +5636,7 @@ def _debug_render_card_html(request, source, card_type: str) -> str:
     if card_type == "creature":
         return render_to_string(
             "charsheet/partials/_creature_card.html",
-            {"creature_card": CreatureEngine(source).card_context(), "request": request},
+            {"creature_card": get_creature_card_context(source), "request": request},
             request=request,
         )
     return render_to_string(
@@ -0,0 +1,121 @@
+"""Maintained per-character inventory weight totals kept in step by item signals."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_init, post_save
+
+from .models import Character, CharacterItem, CharacterWeightLedger, Item, ItemTransfer
+
+WEIGHT_QUANTUM = Decimal("0.001")
+WEIGHT_LEDGER_FIELDS = ("carried_weight", "equipped_weight", "stored_weight")
+
+_ITEM_WEIGHT = ExpressionWrapper(
+    F("amount") * Coalesce("weight_override", "item__weight"),
+    output_field=DecimalField(max_digits=12, decimal_places=3),
+)
+
+
+def compute_weight_totals(character_id: int) -> dict[str, Decimal]:
+    """Sum one character's inventory weight in the database, excluding pending transfers."""
+    totals = (
+        CharacterItem.objects.filter(owner_id=character_id)
+        .exclude(transfers__status=ItemTransfer.Status.PENDING)
+        .aggregate(
+            carried_weight=Sum(_ITEM_WEIGHT, filter=Q(stored=False, equipped=False)),
+            equipped_weight=Sum(_ITEM_WEIGHT, filter=Q(stored=False, equipped=True)),
+            stored_weight=Sum(_ITEM_WEIGHT, filter=Q(stored=True)),
+        )
+    )
+    return {field: Decimal(totals[field] or 0).quantize(WEIGHT_QUANTUM) for field in WEIGHT_LEDGER_FIELDS}
+
+
+def weight_ledger_for(character_id: int) -> CharacterWeightLedger:
+    """Return the character's ledger, or an unsaved one summed on the fly when the row is missing."""
+    ledger = CharacterWeightLedger.objects.filter(character_id=character_id).first()
+    if ledger is None:
+        # Reads never write: the row is created with the character or by reconcile_weight_ledger.
+        ledger = CharacterWeightLedger(character_id=character_id, **compute_weight_totals(character_id))
+    return ledger
+
+
+def create_weight_ledgers(*character_ids) -> None:
+    """Create the missing ledgers of the given characters from a fresh sum."""
+    ids = {int(character_id) for character_id in character_ids if character_id}
+    ids -= set(CharacterWeightLedger.objects.filter(character_id__in=ids).values_list("character_id", flat=True))
+    CharacterWeightLedger.objects.bulk_create(
+        [
+            CharacterWeightLedger(character_id=character_id, **compute_weight_totals(character_id))
+            for character_id in sorted(ids)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def refresh_weight_ledgers(*character_ids) -> None:
+    """Recompute existing ledgers inside the caller's transaction."""
+    ids = sorted({int(character_id) for character_id in character_ids if character_id})
+    if not ids:
+        return
+    with transaction.atomic():
+        # Lock the rows before summing: a concurrent writer waits here and then
+        # aggregates with this transaction's items, so no update is lost. Update
+        # only, since missing rows would resurrect ledgers during cascade deletes.
+        locked = CharacterWeightLedger.objects.select_for_update().filter(character_id__in=ids).order_by("pk")
+        for character_id in locked.values_list("pk", flat=True):
+            CharacterWeightLedger.objects.filter(pk=character_id).update(**compute_weight_totals(character_id))
+
+
+def _create_for_character(sender, instance, created=False, raw=False, **kwargs):
+    """Start every new character with an empty ledger."""
+    if created and not raw:
+        CharacterWeightLedger.objects.get_or_create(character=instance)
+
+
+def _remember_weight_owner(sender, instance, **kwargs):
+    """Keep the loaded owner so a moved item also refreshes its previous holder."""
+    # Read the raw attribute so deferred loads never trigger a query per row.
+    instance._weight_ledger_owner_id = instance.__dict__.get("owner_id")
+
+
+def _refresh_for_character_item(sender, instance, raw=False, **kwargs):
+    """Refresh the ledgers touched by a saved or deleted inventory row."""
+    if raw:
+        return
+    refresh_weight_ledgers(instance.owner_id, getattr(instance, "_weight_ledger_owner_id", None))
+    instance._weight_ledger_owner_id = instance.owner_id
+
+
+def _refresh_for_transfer(sender, instance, raw=False, **kwargs):
+    """Refresh the holder ledger when a transfer starts or stops excluding its item."""
+    if raw or not instance.item_id:
+        return
+    refresh_weight_ledgers(
+        *CharacterItem.objects.filter(pk=instance.item_id).values_list("owner_id", flat=True)
+    )
+
+
+def _refresh_for_item(sender, instance, raw=False, **kwargs):
+    """Refresh every holder of an item definition after its base weight may have changed."""
+    if raw or instance.pk is None:
+        return
+    refresh_weight_ledgers(
+        *CharacterItem.objects.filter(item_id=instance.pk, weight_override__isnull=True)
+        .values_list("owner_id", flat=True)
+        .distinct()
+    )
+
+
+post_init.connect(_remember_weight_owner, sender=CharacterItem, dispatch_uid="weight_ledger_owner")
+post_save.connect(_create_for_character, sender=Character, dispatch_uid="weight_ledger_create")
+for _receiver, _sender in (
+    (_refresh_for_character_item, CharacterItem),
+    (_refresh_for_transfer, ItemTransfer),
+):
+    post_save.connect(_receiver, sender=_sender, dispatch_uid=f"weight_ledger_save:{_sender._meta.label}")
+    post_delete.connect(_receiver, sender=_sender, dispatch_uid=f"weight_ledger_delete:{_sender._meta.label}")
+post_save.connect(_refresh_for_item, sender=Item, dispatch_uid="weight_ledger_save:charsheet.Item")
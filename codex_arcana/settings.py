@@ -14,6 +14,8 @@ import mimetypes
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 mimetypes.add_type("text/javascript", ".mjs", strict=True)
@@ -85,6 +87,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "charsheet.profiling.SheetProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -125,6 +128,36 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Built sheet contexts and catalog version tokens live in the cache, so every worker
+# process must share it; the process-local fallback is only allowed with DEBUG.
+
+if os.getenv("DJANGO_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("DJANGO_REDIS_URL"),
+        }
+    }
+elif not DEBUG:
+    raise ImproperlyConfigured("DJANGO_REDIS_URL is required when DJANGO_DEBUG is off.")
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "codex-arcana",
+        }
+    }
+
+# Lifetime of cached character-sheet contexts in seconds; 0 disables the cache.
+SHEET_CONTEXT_CACHE_TIMEOUT = int(os.getenv("SHEET_CONTEXT_CACHE_TIMEOUT", "900"))
+# Profile every request with Server-Timing headers; staff can opt in per request with ?profile=1.
+SHEET_PROFILING = _env_bool("SHEET_PROFILING", default=False)
+# Maximum wait of one SL-screen change long-poll request in seconds.
+GROUP_SCREEN_LONG_POLL_SECONDS = int(os.getenv("GROUP_SCREEN_LONG_POLL_SECONDS", "25"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -65,6 +65,7 @@ urlpatterns = [
     path("groups/<int:group_id>/tables/create/", group_views.create_group_table, name="create_group_table"),
     path("groups/<int:group_id>/tables/reorder/", group_views.reorder_group_tables, name="reorder_group_tables"),
     path("groups/<int:group_id>/tables/<int:table_id>/update/", group_views.update_group_table, name="update_group_table"),
+    path("groups/<int:group_id>/tables/<int:table_id>/patch/", group_views.patch_group_table, name="patch_group_table"),
     path("groups/<int:group_id>/tables/<int:table_id>/layout/", group_views.update_group_table_layout, name="update_group_table_layout"),
     path("groups/<int:group_id>/tables/<int:table_id>/rows/add/", group_views.add_group_table_row, name="add_group_table_row"),
     path("groups/<int:group_id>/tables/<int:table_id>/columns/add/", group_views.add_group_table_column, name="add_group_table_column"),
@@ -73,11 +74,12 @@ urlpatterns = [
     path("groups/<int:group_id>/tables/<int:table_id>/delete/", group_views.delete_group_table, name="delete_group_table"),
     path("groups/<int:group_id>/tables/<int:table_id>/show/", group_views.show_group_table, name="show_group_table"),
     path("groups/<int:group_id>/tables/<int:table_id>/hide/", group_views.hide_group_table, name="hide_group_table"),
-    path("groups/<int:group_id>/screen/transfer-state/", group_views.group_inventory_transfer_state, name="group_inventory_transfer_state"),
-    path("groups/<int:group_id>/screen/transfer-state/", group_views.group_inventory_transfer_state, name="group_inventory_transfer_state"),
+    path("groups/<int:group_id>/screen/changes/", group_views.group_screen_changes, name="group_screen_changes"),
+    path("groups/<int:group_id>/screen/cards/<str:card_kind>/<int:card_id>/", group_views.group_screen_card, name="group_screen_card"),
     path("groups/<int:group_id>/characters/<int:character_id>/", group_views.game_master_character_sheet, name="game_master_character_sheet"),
     path("groups/<int:group_id>/characters/<int:character_id>/temporary-attributes/", group_views.update_game_master_temporary_attribute, name="update_game_master_temporary_attribute"),
     path("groups/<int:group_id>/characters/<int:character_id>/diary/", group_views.game_master_character_diary, name="game_master_character_diary"),
+    path("groups/<int:group_id>/characters/<int:character_id>/tooltip/", group_views.game_master_character_sheet_tooltip, name="game_master_character_sheet_tooltip"),
     path("groups/<int:group_id>/inventory/add/", group_views.add_group_inventory_item, name="add_group_inventory_item"),
     path("groups/<int:group_id>/catalog/create/", group_views.create_group_catalog_item, name="create_group_catalog_item"),
     path("groups/<int:group_id>/catalog/<int:catalog_item_id>/edit/", group_views.edit_group_catalog_item, name="edit_group_catalog_item"),
@@ -91,6 +93,7 @@ urlpatterns = [
     path("dashboard/account/update/", views.update_account_settings, name="update_account_settings"),
     path("dashboard/account/logout-other-sessions/", views.logout_other_sessions, name="logout_other_sessions"),
     path("dashboard/account/export/", views.export_account_data, name="export_account_data"),
+    path("dashboard/account/import/", views.import_account_data, name="import_account_data"),
     path("character/new/", views.create_character, name="create_character"),
     path("character/<int:character_id>/edit/", views.edit_character, name="edit_character"),
     path("character/<int:character_id>/archive/", views.archive_character, name="archive_character"),
@@ -101,6 +104,7 @@ urlpatterns = [
     path("sheet/", views.sheet, name="sheet"),
     path("character/<int:character_id>/", views.character_sheet, name="character_sheet"),
     path("character/<int:character_id>/temporary-attributes/", views.update_temporary_attribute, name="update_temporary_attribute"),
+    path("character/<int:character_id>/tooltip/", views.character_sheet_tooltip, name="character_sheet_tooltip"),
     path("character/<int:character_id>/diary/", views.character_diary_entries_api, name="character_diary_entries_api"),
     path("character/<int:character_id>/diary/import-legacy/", views.import_legacy_character_diary, name="import_legacy_character_diary"),
     path("character/<int:character_id>/diary/<int:entry_id>/edit/", views.edit_character_diary_entry, name="edit_character_diary_entry"),
@@ -147,8 +151,10 @@ urlpatterns = [
     ),
     path("character/<int:character_id>/adjust-money/", views.adjust_money, name="adjust_money"),
     path("character/<int:character_id>/adjust-experience/", views.adjust_experience, name="adjust_experience"),
+    path("character/<int:character_id>/learn/costs/", views.learning_cost_table, name="learning_cost_table"),
     path("character/<int:character_id>/learn/apply/", views.apply_learning, name="apply_learning"),
     path("character/<int:character_id>/shop-item/create/", views.create_shop_item, name="create_shop_item"),
+    path("character/<int:character_id>/shop/catalog/", views.shop_catalog, name="shop_catalog"),
     path("character/<int:character_id>/shop/buy/", views.buy_shop_cart, name="buy_shop_cart"),
     path("character/<int:character_id>/shop/sell/", views.sell_shop_cart, name="sell_shop_cart"),
     path("character/<int:character_id>/shop/trade/", views.trade_shop_cart, name="trade_shop_cart"),
@@ -8,9 +8,9 @@ import { initItemForm } from "./item_form.js?v=20260814a";
 import { initSkillSpecModal } from "./skill_spec_modal.js";
 import { initTechniqueSpecModal } from "./technique_spec_modal.js";
 import { initTraitSpecModal } from "./trait_spec_modal.js";
-import { initShopMenu } from "./shop_menu.js?v=20260622a";
-import { initLearningMenu } from "./learning_menu.js?v=20260802b";
-import { initTooltips } from "./tooltip.js?v=20260814a";
+import { initShopMenu } from "./shop_menu.js?v=20261018a";
+import { initLearningMenu } from "./learning_menu.js?v=20261018a";
+import { initTooltips } from "./tooltip.js?v=20261018a";
 import { initInventoryMenu } from "./inventory_menu.js?v=20260820a";
 import { initDamagePanel } from "./damage_panel.js?v=20260801b";
 import { initSpellPanel } from "./spell_panel.js";
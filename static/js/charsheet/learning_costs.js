@@ -0,0 +1,103 @@
+// Client half of charsheet/learning_costs.py: prices a planned cart against the compiled table
+// without a round trip. validateLearningPlan mirrors validate_learning_plan on the server.
+
+const pendingTables = new Map();
+
+export function loadLearningCostTable(url) {
+  if (!url) {
+    return Promise.resolve(null);
+  }
+  if (!pendingTables.has(url)) {
+    // The endpoint revalidates with the sheet ETag, so a reload after learning only refetches on change.
+    const request = fetch(url, {
+      headers: { Accept: "application/json", "X-Requested-With": "XMLHttpRequest" },
+      credentials: "same-origin",
+      cache: "no-cache",
+    })
+      .then((response) => (response.ok ? response.json() : null))
+      .then((payload) => (payload?.ok ? payload.table : null))
+      .catch(() => null)
+      .finally(() => pendingTables.delete(url));
+    pendingTables.set(url, request);
+  }
+  return pendingTables.get(url);
+}
+
+export function entryCost(entry, target) {
+  if (!entry || !Array.isArray(entry.costs)) {
+    return null;
+  }
+  const index = target - entry.min;
+  if (index < 0 || index >= entry.costs.length) {
+    return null;
+  }
+  return entry.costs[index];
+}
+
+export function tableEntryCost(table, key, add, write = null) {
+  const entry = table?.entries?.[key];
+  if (!entry || !Array.isArray(entry.costs)) {
+    return null;
+  }
+  const cost = entryCost(entry, entry.base + add);
+  if (cost === null) {
+    return null;
+  }
+  if (write !== null && typeof entry.write === "boolean") {
+    return cost + Number(Boolean(write)) - Number(entry.write);
+  }
+  return cost;
+}
+
+export function validateLearningPlan(table, plan) {
+  const errors = [];
+  const slotsUsed = new Map();
+  const unlocks = [];
+  let cost = 0;
+  Object.entries(plan).forEach(([key, rawChange]) => {
+    const entry = table.entries[key];
+    if (!entry) {
+      errors.push(`${key}: nicht lernbar.`);
+      return;
+    }
+    if ("slot_source" in entry) {
+      if (Number(rawChange) > 0) {
+        slotsUsed.set(entry.slot_source, (slotsUsed.get(entry.slot_source) || 0) + entry.slot_cost);
+      }
+      return;
+    }
+    let change = rawChange;
+    let write = null;
+    if (rawChange && typeof rawChange === "object") {
+      write = rawChange.write ?? null;
+      change = rawChange.add ?? 0;
+    }
+    const target = entry.base + (Number(change) || 0);
+    const stepCost = entryCost(entry, target);
+    if (stepCost === null) {
+      errors.push(`${key}: Zielwert ${target} ist nicht erlaubt.`);
+      return;
+    }
+    cost += stepCost;
+    if (write !== null && typeof entry.write === "boolean") {
+      if (write && target < table.language_literacy_min_level) {
+        errors.push(`${key}: Lesen und Schreiben benoetigt Sprachlevel ${table.language_literacy_min_level}.`);
+      }
+      cost += Number(Boolean(write)) - Number(entry.write);
+    }
+    (table.unlocks[key] || []).forEach((row) => {
+      if (entry.base < row.level && row.level <= target) {
+        unlocks.push(row);
+      }
+    });
+  });
+  slotsUsed.forEach((used, source) => {
+    if (used > (table.slot_sources[source] || 0)) {
+      errors.push(`${source}: Nicht genug verfuegbare Zauber-Slots.`);
+    }
+  });
+  if (cost > table.budget) {
+    errors.push("Nicht genug aktuelle EP fuer diese Lernkosten.");
+  }
+  return { cost, remaining: table.budget - cost, errors, unlocks };
+}
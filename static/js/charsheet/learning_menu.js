@@ -1,4 +1,5 @@
 import { createChoiceModalController } from "./choice_modal.js";
+import { loadLearningCostTable, tableEntryCost } from "./learning_costs.js?v=20261018a";
 import { clamp, escapeHtml, initPersistentDetails, readInt } from "./utils.js?v=20260622a";
 
 const LANGUAGE_LITERACY_MIN_LEVEL = 3;
@@ -14,6 +15,7 @@ const renderOpenSpellSlotMarkup = (remaining) => {
 function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, validationHint, applyBtn) {
   const getBudget = () => readInt(document.getElementById("learnBudgetPanel")?.getAttribute("data-learn-budget") || "0", 0);
   let newSpecCounter = 0;
+  let costTable = null;
   const getRows = () => Array.from(cartBody.querySelectorAll("[data-learn-cart-item]"));
   const ensureEmptyRow = () => {
     const emptyRow = cartBody.querySelector("[data-learn-empty-row]");
@@ -140,6 +142,10 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
     let value = readInt(valueInput.value, 0);
     let cost = 0;
     let invalidWrite = false;
+    // Prefer the server-compiled cost table; the local formulas only cover the time before it loads.
+    const rowKey = row.getAttribute("data-key") || "";
+    const costKey = kind === "skill-new-spec" ? rowKey.split(":").slice(0, 2).join(":") : rowKey;
+    const compiledCost = (add, write = null) => tableEntryCost(costTable, costKey, add, write);
 
     if (kind === "attr") {
       const base = readInt(row.getAttribute("data-base"), 0);
@@ -150,7 +156,8 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
       const maxAdd = Math.max(0, max - base);
       const hidden = row.querySelector("[data-learn-hidden]");
       value = clamp(value, minAdd, maxAdd);
-      cost = calcAttributeTotalCost(base + value, max, premiumThreshold) - calcAttributeTotalCost(base, max, premiumThreshold);
+      cost = compiledCost(value)
+        ?? calcAttributeTotalCost(base + value, max, premiumThreshold) - calcAttributeTotalCost(base, max, premiumThreshold);
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -168,7 +175,7 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
       const maxAdd = Math.max(0, max - base);
       const hidden = row.querySelector("[data-learn-hidden]");
       value = clamp(value, minAdd, maxAdd);
-      cost = calcTraitDeltaCost(base, value, pointsPerLevel, traitType);
+      cost = compiledCost(value) ?? calcTraitDeltaCost(base, value, pointsPerLevel, traitType);
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -185,7 +192,7 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
       const maxAdd = Math.max(0, max - base);
       const hidden = row.querySelector("[data-learn-hidden]");
       value = clamp(value, minAdd, maxAdd);
-      cost = calcSkillCost(base + value, aboveBaseCost) - calcSkillCost(base, aboveBaseCost);
+      cost = compiledCost(value) ?? calcSkillCost(base + value, aboveBaseCost) - calcSkillCost(base, aboveBaseCost);
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -220,7 +227,8 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
         targetWrite = writeInput.checked;
       }
       invalidWrite = targetWrite && targetLevel < LANGUAGE_LITERACY_MIN_LEVEL;
-      cost = calcLanguageCost(targetLevel, targetWrite, mother) - calcLanguageCost(base, baseWrite, mother);
+      cost = compiledCost(value, targetWrite)
+        ?? calcLanguageCost(targetLevel, targetWrite, mother) - calcLanguageCost(base, baseWrite, mother);
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -239,7 +247,7 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
       const maxAdd = Math.max(0, max - base);
       const hidden = row.querySelector("[data-learn-hidden]");
       value = clamp(value, minAdd, maxAdd);
-      cost = value * 8;
+      cost = compiledCost(value) ?? value * 8;
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -312,7 +320,7 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
       const maxAdd = Math.max(0, Math.min(max - base, remaining - selectedMagicAspectLevels(row)));
       const hidden = row.querySelector("[data-learn-hidden]");
       value = clamp(value, minAdd, maxAdd);
-      cost = value * readInt(row.getAttribute("data-cost-per-level"), 4);
+      cost = compiledCost(value) ?? value * readInt(row.getAttribute("data-cost-per-level"), 4);
       if (hidden instanceof HTMLInputElement) {
         hidden.value = String(value);
       }
@@ -951,7 +959,12 @@ function initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, valida
     refreshTotals();
   };
 
-  return { clearCart, refreshTotals };
+  const setCostTable = (table) => {
+    costTable = table || null;
+    refreshTotals();
+  };
+
+  return { clearCart, refreshTotals, setCostTable };
 }
 
 export function initLearningMenu({ choiceWindowController = null } = {}) {
@@ -978,6 +991,7 @@ export function initLearningMenu({ choiceWindowController = null } = {}) {
   );
 
   const cartController = initLearningCart(form, cartBody, budgetEl, spentEl, remainingEl, validationHint, applyBtn);
+  loadLearningCostTable(form.dataset.learnCostTableUrl || "").then((table) => cartController.setCostTable(table));
   const choiceController = createChoiceModalController({
     hiddenInputContainer,
     windowController: choiceWindowController,
@@ -100,10 +100,11 @@ export function initShopMenu() {
   const cart = new Map();
   let cartCounter = 0;
   let currentMode = "buy";
-  const groupDisclosureState = initPersistentDetails(
-    "#shopWindow [data-shop-group]",
-    "codexArcana.shop.categoryDisclosure.v1",
-  );
+  const shopWindow = document.getElementById("shopWindow");
+  const buyPanel = document.getElementById("shop-panel-buy");
+  const catalogUrl = String(buyPanel?.getAttribute("data-shop-catalog-url") || "");
+  let catalogRequest = null;
+  let groupDisclosureState = null;
 
   const readOptionalInt = (value) => {
     const parsed = Number.parseInt(String(value ?? "").trim(), 10);
@@ -223,7 +224,7 @@ export function initShopMenu() {
       if (query && hasMatch) {
         group.open = true;
       } else if (!query) {
-        groupDisclosureState.restore(group);
+        groupDisclosureState?.restore(group);
       }
     });
   };
@@ -301,6 +302,50 @@ export function initShopMenu() {
     applyFilter();
     render();
   };
+  const bindGroupDisclosure = () => {
+    groupDisclosureState = initPersistentDetails(
+      "#shopWindow [data-shop-group]",
+      "codexArcana.shop.categoryDisclosure.v1",
+    );
+    applyFilter();
+  };
+  const loadCatalog = () => {
+    if (catalogRequest) {
+      return catalogRequest;
+    }
+    if (!catalogUrl || !(buyPanel instanceof HTMLElement)) {
+      bindGroupDisclosure();
+      catalogRequest = Promise.resolve();
+      return catalogRequest;
+    }
+    catalogRequest = fetch(catalogUrl, {
+      credentials: "same-origin",
+      headers: { Accept: "application/json" },
+    })
+      .then((response) => response.json())
+      .then((data) => {
+        if (data?.ok && typeof data.html === "string") {
+          buyPanel.innerHTML = data.html;
+          return;
+        }
+        throw new Error("shop_catalog_failed");
+      })
+      .catch(() => {
+        const status = buyPanel.querySelector("[data-shop-catalog-status]");
+        if (status) {
+          status.textContent = "Sortiment konnte nicht geladen werden.";
+        }
+        catalogRequest = null;
+      })
+      .finally(() => {
+        if (!groupDisclosureState) {
+          bindGroupDisclosure();
+        } else {
+          applyFilter();
+        }
+      });
+    return catalogRequest;
+  };
   const closeShopWindow = () => {
     document.getElementById("shopWindow")?.classList.remove("is-open");
     document.getElementById("shopWindow")?.setAttribute("aria-hidden", "true");
@@ -513,6 +558,16 @@ export function initShopMenu() {
     }
   });
 
+  if (shopWindow) {
+    const loadWhenOpen = () => {
+      if (shopWindow.classList.contains("is-open")) {
+        loadCatalog();
+      }
+    };
+    new MutationObserver(loadWhenOpen).observe(shopWindow, { attributes: true, attributeFilter: ["class"] });
+    loadWhenOpen();
+  }
+
   syncModeFromTabs();
   syncModeUi();
   applyFilter();
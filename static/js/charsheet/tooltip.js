@@ -1003,6 +1003,7 @@ export function initTooltips() {
   const SHOW_DELAY_MS = 1100;
   const HIDE_HOLD_MS = 380;
   const CARD_STORAGE_KEY = "charsheet.tooltipCard";
+  const pendingLazyTooltips = new Map();
   const skillCards = new Map();
   let activeTarget = null;
   let activeCardTarget = null;
@@ -1099,6 +1100,73 @@ export function initTooltips() {
     }
   }, { passive: true });
 
+  const isLazyTooltipPending = (target) => (
+    target instanceof HTMLElement
+    && Boolean(target.getAttribute("data-tooltip-key"))
+    && !String(target.getAttribute("data-tooltip") || "").trim()
+  );
+
+  const loadLazyTooltip = (target) => {
+    if (!isLazyTooltipPending(target)) {
+      return Promise.resolve(target);
+    }
+    const tooltipUrl = String(document.body.dataset.tooltipUrl || "").trim();
+    const key = String(target.getAttribute("data-tooltip-key") || "").trim();
+    if (!tooltipUrl) {
+      return Promise.resolve(target);
+    }
+    if (!pendingLazyTooltips.has(key)) {
+      // Shared per key, so hovering several copies of one row triggers a single request.
+      const request = fetch(`${tooltipUrl}?key=${encodeURIComponent(key)}`, {
+        headers: { Accept: "application/json", "X-Requested-With": "XMLHttpRequest" },
+        credentials: "same-origin",
+      })
+        .then((response) => (response.ok ? response.json() : null))
+        .catch(() => null)
+        .finally(() => pendingLazyTooltips.delete(key));
+      pendingLazyTooltips.set(key, request);
+    }
+    return pendingLazyTooltips.get(key).then((payload) => {
+      if (payload?.ok && target.getAttribute("data-tooltip-key") === key) {
+        target.setAttribute("data-tooltip", String(payload.tooltip || ""));
+        target.removeAttribute("data-tooltip-key");
+      }
+      return target;
+    });
+  };
+
+  document.addEventListener("mouseover", (event) => {
+    const target = event.target instanceof Element ? event.target.closest(".tooltip_target[data-tooltip-key]") : null;
+    if (!isLazyTooltipPending(target)) {
+      return;
+    }
+    loadLazyTooltip(target).then(() => {
+      if (!isLazyTooltipPending(target) && target.matches(":hover")) {
+        target.dispatchEvent(new MouseEvent("mouseover", { bubbles: true }));
+      }
+    });
+  }, { capture: true });
+
+  document.addEventListener("click", (event) => {
+    const target = event.target instanceof Element
+      ? event.target.closest(".tooltip_target[data-tooltip-key][data-tooltip-mode]")
+      : null;
+    if (!isLazyTooltipPending(target)) {
+      return;
+    }
+    const nestedInteractive = event.target.closest("button, a, input, select, textarea, form, details");
+    if (nestedInteractive && nestedInteractive !== target) {
+      return;
+    }
+    event.preventDefault();
+    event.stopPropagation();
+    loadLazyTooltip(target).then(() => {
+      if (!isLazyTooltipPending(target)) {
+        target.click();
+      }
+    });
+  }, { capture: true });
+
   const clearShowTimer = () => {
     if (showTimeoutId) {
       window.clearTimeout(showTimeoutId);
@@ -1640,7 +1708,7 @@ export function initTooltips() {
     );
     const previousLeft = preservePosition ? card.style.left : "";
     const previousTop = preservePosition ? card.style.top : "";
-    openCard(target, { preservePosition, previousLeft, previousTop });
+    loadLazyTooltip(target).then(() => openCard(target, { preservePosition, previousLeft, previousTop }));
   };
 
   restorePersistedCard();
@@ -547,76 +547,196 @@
     }
   };
 
-  document.querySelectorAll(
-    ".gm-creature-damage-controls form, .gm-creature-kp-controls form",
-  ).forEach((form) => {
-    form.addEventListener("submit", async (event) => {
-      event.preventDefault();
-      const card = form.closest(".gm-character-sheet--creature");
-      const controls = form.closest(
-        ".gm-creature-damage-controls, .gm-creature-kp-controls",
-      );
-      const buttons = Array.from(controls?.querySelectorAll("button") || []);
-      if (!card || buttons.some((button) => button.disabled)) {
-        return;
-      }
+  // Delegated so that creature cards refreshed by live updates keep working.
+  rosterContainer?.addEventListener("submit", async (event) => {
+    const form = event.target.closest(
+      ".gm-creature-damage-controls form, .gm-creature-kp-controls form",
+    );
+    if (!form) {
+      return;
+    }
+    event.preventDefault();
+    const card = form.closest(".gm-character-sheet--creature");
+    const controls = form.closest(
+      ".gm-creature-damage-controls, .gm-creature-kp-controls",
+    );
+    const buttons = Array.from(controls?.querySelectorAll("button") || []);
+    if (!card || buttons.some((button) => button.disabled)) {
+      return;
+    }
+
+    buttons.forEach((button) => {
+      button.disabled = true;
+    });
+    card.setAttribute("aria-busy", "true");
 
+    try {
+      const body = new URLSearchParams(new FormData(form));
+      const csrfToken = body.get("csrfmiddlewaretoken");
+      // The hidden input named "action" shadows HTMLFormElement.action.
+      const actionUrl = form.getAttribute("action");
+      if (!actionUrl) {
+        throw new Error("Das Ziel für die Statusänderung fehlt.");
+      }
+      body.set("_response_format", "json");
+      const response = await fetch(actionUrl, {
+        method: "POST",
+        credentials: "same-origin",
+        headers: {
+          "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+          "X-CSRFToken": csrfToken,
+          "X-Requested-With": "XMLHttpRequest",
+          "Accept": "application/json",
+        },
+        body: body.toString(),
+      });
+      const responseType = response.headers.get("content-type") || "";
+      if (!responseType.includes("application/json")) {
+        throw new Error(
+          `Der Server lieferte keine Statusdaten zurück (HTTP ${response.status}).`,
+        );
+      }
+      const result = await response.json();
+      if (!response.ok || !result.ok) {
+        throw new Error(
+          result.error || "Der Kreaturenstatus konnte nicht aktualisiert werden.",
+        );
+      }
+      if (result.kind === "damage") {
+        applyCreatureDamageState(card, result);
+      } else if (result.kind === "kp") {
+        applyCreatureKpState(card, result);
+      }
+    } catch (error) {
+      window.alert(
+        error instanceof Error
+          ? error.message
+          : "Der Kreaturenstatus konnte nicht aktualisiert werden.",
+      );
+    } finally {
       buttons.forEach((button) => {
-        button.disabled = true;
+        button.disabled = false;
       });
-      card.setAttribute("aria-busy", "true");
+      card.removeAttribute("aria-busy");
+    }
+  });
 
-      try {
-        const body = new URLSearchParams(new FormData(form));
-        const csrfToken = body.get("csrfmiddlewaretoken");
-        // The hidden input named "action" shadows HTMLFormElement.action.
-        const actionUrl = form.getAttribute("action");
-        if (!actionUrl) {
-          throw new Error("Das Ziel für die Statusänderung fehlt.");
-        }
-        body.set("_response_format", "json");
-        const response = await fetch(actionUrl, {
-          method: "POST",
-          credentials: "same-origin",
-          headers: {
-            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-            "X-CSRFToken": csrfToken,
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "application/json",
-          },
-          body: body.toString(),
-        });
-        const responseType = response.headers.get("content-type") || "";
-        if (!responseType.includes("application/json")) {
-          throw new Error(
-            `Der Server lieferte keine Statusdaten zurück (HTTP ${response.status}).`,
-          );
-        }
-        const result = await response.json();
-        if (!response.ok || !result.ok) {
-          throw new Error(
-            result.error || "Der Kreaturenstatus konnte nicht aktualisiert werden.",
-          );
+  const refreshScreenCard = async (cardId) => {
+    const card = Array.from(
+      rosterContainer?.querySelectorAll("[data-reorder-card][data-reorder-id]") || [],
+    ).find((candidate) => candidate.dataset.reorderId === cardId);
+    if (!card?.dataset.screenCardUrl) {
+      return false;
+    }
+    if (card.getAttribute("aria-busy") === "true") {
+      return true;
+    }
+    const response = await fetch(card.dataset.screenCardUrl, {
+      credentials: "same-origin",
+      cache: "no-store",
+    });
+    if (!response.ok) {
+      return false;
+    }
+    const template = document.createElement("template");
+    template.innerHTML = (await response.text()).trim();
+    const nextCard = template.content.querySelector("[data-reorder-card]");
+    if (!nextCard) {
+      return false;
+    }
+    // Swap only the rendered values; header, buttons, and drag surface keep their listeners.
+    [
+      ".gm-character-sheet__portrait",
+      ".gm-character-sheet__name",
+      ".gm-character-sheet__footer",
+    ].forEach((selector) => {
+      const current = card.querySelector(selector);
+      const next = nextCard.querySelector(selector);
+      if (current && next) {
+        current.replaceWith(next);
+      }
+    });
+    const currentSections = card.querySelectorAll(".gm-character-section");
+    const nextSections = nextCard.querySelectorAll(".gm-character-section");
+    if (currentSections.length !== nextSections.length) {
+      return false;
+    }
+    currentSections.forEach((section, index) => {
+      section.replaceWith(nextSections[index]);
+    });
+    ["gm-character-sheet--vampire", "gm-character-sheet--dead", "gm-character-sheet--incapacitated"].forEach(
+      (className) => {
+        card.classList.toggle(className, nextCard.classList.contains(className));
+      },
+    );
+    const portrait = Array.from(
+      collapsedRoster?.querySelectorAll("[data-collapsed-card-id]") || [],
+    ).find((candidate) => candidate.dataset.collapsedCardId === cardId);
+    portrait?.classList.toggle(
+      "gm-roster-collapsed__portrait--incapacitated",
+      card.classList.contains("gm-character-sheet--incapacitated"),
+    );
+    portrait?.classList.toggle(
+      "gm-roster-collapsed__portrait--dead",
+      card.classList.contains("gm-character-sheet--dead"),
+    );
+    card.querySelectorAll(".gm-character-sheet__name h2").forEach(fitCharacterName);
+    return true;
+  };
+
+  const screenChangesUrl = rosterContainer?.dataset.screenChangesUrl;
+  if (screenChangesUrl) {
+    let cursor = Number.parseInt(rosterContainer.dataset.screenChangesCursor || "0", 10) || 0;
+    const wait = (milliseconds) => new Promise((resolve) => {
+      window.setTimeout(resolve, milliseconds);
+    });
+    const waitUntilVisible = () => new Promise((resolve) => {
+      if (!document.hidden) {
+        resolve();
+        return;
+      }
+      document.addEventListener("visibilitychange", function onVisible() {
+        if (!document.hidden) {
+          document.removeEventListener("visibilitychange", onVisible);
+          resolve();
         }
-        if (result.kind === "damage") {
-          applyCreatureDamageState(card, result);
-        } else if (result.kind === "kp") {
-          applyCreatureKpState(card, result);
+      });
+    });
+
+    const followScreenChanges = async () => {
+      for (;;) {
+        await waitUntilVisible();
+        try {
+          const url = new URL(screenChangesUrl, window.location.href);
+          url.searchParams.set("after", String(cursor));
+          const response = await fetch(url, {
+            headers: { Accept: "application/json" },
+            credentials: "same-origin",
+            cache: "no-store",
+          });
+          if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+          const changes = await response.json();
+          cursor = Number(changes.cursor) || cursor;
+          if (changes.reload) {
+            window.location.reload();
+            return;
+          }
+          for (const cardId of changes.cards || []) {
+            if (!(await refreshScreenCard(cardId))) {
+              window.location.reload();
+              return;
+            }
+          }
+        } catch (_error) {
+          // Temporäre Verbindungsfehler dürfen keine Anfrageschleife auslösen.
+          await wait(5000);
         }
-      } catch (error) {
-        window.alert(
-          error instanceof Error
-            ? error.message
-            : "Der Kreaturenstatus konnte nicht aktualisiert werden.",
-        );
-      } finally {
-        buttons.forEach((button) => {
-          button.disabled = false;
-        });
-        card.removeAttribute("aria-busy");
       }
-    });
-  });
+    };
+    followScreenChanges();
+  }
 
   document.querySelectorAll(".gm-table-picker").forEach((picker) => {
     const storageKey = picker.dataset.pickerStorageKey;
@@ -818,6 +938,110 @@
         saveButton.click();
       }
     });
+
+    const patchUrl = form.dataset.tablePatchUrl;
+    if (!patchUrl) {
+      return;
+    }
+    const cellPatchKeys = {
+      alignment: "alignment",
+      value: "value",
+      rowspan: "row_span",
+      colspan: "column_span",
+    };
+    const fieldChanged = (field) => {
+      if (field instanceof HTMLSelectElement) {
+        return Array.from(field.options).some(
+          (option) => option.selected !== option.defaultSelected,
+        );
+      }
+      if (field.type === "checkbox") {
+        return field.checked !== field.defaultChecked;
+      }
+      return field.value !== field.defaultValue;
+    };
+    const collectTablePatch = () => {
+      const patch = {
+        revision: Number.parseInt(form.dataset.tableRevision || "0", 10),
+      };
+      const columns = new Map();
+      const cells = new Map();
+      Array.from(form.elements).forEach((field) => {
+        if (!field.name || field.disabled || !fieldChanged(field)) {
+          return;
+        }
+        if (field.name === "title" || field.name === "window_width") {
+          patch[field.name] = field.value;
+          return;
+        }
+        if (field.name === "is_shared") {
+          patch.is_shared = field.checked;
+          return;
+        }
+        const columnMatch = field.name.match(/^column_(\d+)_(heading|width)$/);
+        if (columnMatch) {
+          const column = columns.get(columnMatch[1]) || { id: Number(columnMatch[1]) };
+          column[columnMatch[2]] = field.value;
+          columns.set(columnMatch[1], column);
+          return;
+        }
+        const cellMatch = field.name.match(/^cell_(\d+)_(\d+)_(alignment|value|rowspan|colspan)$/);
+        if (cellMatch) {
+          const key = `${cellMatch[1]}:${cellMatch[2]}`;
+          const cell = cells.get(key) || {
+            row: Number(cellMatch[1]),
+            column: Number(cellMatch[2]),
+          };
+          cell[cellPatchKeys[cellMatch[3]]] = field.value;
+          cells.set(key, cell);
+        }
+      });
+      patch.columns = Array.from(columns.values());
+      patch.cells = Array.from(cells.values());
+      return patch;
+    };
+
+    // Saving sends only the changed fields; row and column actions keep the full form post.
+    form.addEventListener("submit", async (event) => {
+      if (event.submitter !== saveButton) {
+        return;
+      }
+      event.preventDefault();
+      saveButton.disabled = true;
+      try {
+        const response = await fetch(patchUrl, {
+          method: "POST",
+          credentials: "same-origin",
+          headers: {
+            "Content-Type": "application/json",
+            "X-CSRFToken": form.querySelector("[name='csrfmiddlewaretoken']")?.value || "",
+            "X-Requested-With": "XMLHttpRequest",
+          },
+          body: JSON.stringify(collectTablePatch()),
+        });
+        const result = await response.json().catch(() => ({}));
+        if (!response.ok || !result.ok) {
+          throw new Error(result.error || "Die Tabelle konnte nicht gespeichert werden.");
+        }
+        form.dataset.tableRevision = String(result.revision);
+        const screenUrl = new URL(window.location.href);
+        screenUrl.searchParams.delete("edit_table");
+        screenUrl.hash = "sl-tabellen";
+        if (screenUrl.pathname + screenUrl.search === window.location.pathname + window.location.search) {
+          window.location.hash = screenUrl.hash;
+          window.location.reload();
+        } else {
+          window.location.assign(screenUrl.href);
+        }
+      } catch (error) {
+        window.alert(
+          error instanceof Error
+            ? error.message
+            : "Die Tabelle konnte nicht gespeichert werden.",
+        );
+        saveButton.disabled = false;
+      }
+    });
   });
 
   document.querySelectorAll("[data-table-markdown-import]").forEach((button) => {
@@ -808,41 +808,4 @@ document.addEventListener("DOMContentLoaded", () => {
 
     sync();
   });
-
-  const inventory = document.querySelector("[data-sl-transfer-state-url]");
-  const signatureNode = inventory?.querySelector("[data-sl-transfer-signature]");
-  if (inventory && signatureNode) {
-    let signature = signatureNode.textContent.trim();
-    let requestInFlight = false;
-    let reloadStarted = false;
-
-    const updateTransferState = async () => {
-      if (document.hidden || requestInFlight || reloadStarted) return;
-      requestInFlight = true;
-      try {
-        const response = await fetch(inventory.dataset.slTransferStateUrl, {
-          headers: { Accept: "application/json" },
-          credentials: "same-origin",
-          cache: "no-store",
-        });
-        if (!response.ok) return;
-        const state = await response.json();
-        const nextSignature = String(state.signature || "");
-        if (nextSignature !== signature) {
-          signature = nextSignature;
-          reloadStarted = true;
-          window.location.reload();
-        }
-      } catch (_error) {
-        // Temporäre Verbindungsfehler dürfen keine Aktualisierungsschleife auslösen.
-      } finally {
-        requestInFlight = false;
-      }
-    };
-
-    window.setInterval(updateTransferState, 3000);
-    document.addEventListener("visibilitychange", () => {
-      if (!document.hidden) updateTransferState();
-    });
-  }
 });